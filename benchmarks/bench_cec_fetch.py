@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: descarga secuencial vs concurrente de articulos en `fetch_cec_items`, y lectura completa
+vs cortada al terminar el bloque `schema:text`.
+
+Usa un servidor local (benchmarks/fixture_server.py) con latencia artificial por articulo, asi que
+no toca la red. Reporta tiempo de pared y bytes descargados para ventanas de 3, 15 y 60 articulos.
+
+Uso:
+  python3 benchmarks/bench_cec_fetch.py --latency 0.1 --workers 8 --per-host 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import cec_evangelio_scraper as cec  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+START = date(2026, 2, 7)
+
+
+def _run(count: int, workers: int, per_host: int, latency: float, stream: bool) -> tuple[float, int, int, int]:
+    with FixtureServer(START, count, latency=latency) as srv:
+        report: list[cec.ArticleFetch] = []
+        t0 = time.perf_counter()
+        items = cec.fetch_cec_items(
+            START.isoformat(),
+            count - 1,
+            workers=workers,
+            per_host=per_host,
+            rss_url=srv.rss_url,
+            stream_articles=stream,
+            fetch_report=report,
+        )
+        elapsed = time.perf_counter() - t0
+        if len(items) != count:
+            raise RuntimeError(f"Se esperaban {count} items y se obtuvieron {len(items)}.")
+        if [it.iso_date for it in items] != sorted(it.iso_date for it in items):
+            raise RuntimeError("Los items no quedaron ordenados por fecha.")
+        return elapsed, srv.max_in_flight, srv.requests, sum(f.wire_bytes for f in report)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark de descarga concurrente CEC (servidor local).")
+    ap.add_argument("--counts", default="3,15,60", help="CSV con tamaños de ventana")
+    ap.add_argument("--latency", type=float, default=0.1, help="Latencia artificial por articulo (s)")
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--per-host", type=int, default=4)
+    args = ap.parse_args()
+
+    counts = [int(c) for c in args.counts.split(",") if c.strip()]
+    print(f"{'articulos':>9} {'modo':>20} {'segundos':>9} {'max_paralelo':>12} {'requests':>8} {'bytes_articulos':>15}")
+    for count in counts:
+        for label, workers, per_host, stream in (
+            ("secuencial/completo", 1, 1, False),
+            ("secuencial/cortado", 1, 1, True),
+            (f"w={args.workers}/h={args.per_host}/cortado", args.workers, args.per_host, True),
+        ):
+            elapsed, in_flight, reqs, nbytes = _run(count, workers, per_host, args.latency, stream)
+            print(f"{count:>9} {label:>20} {elapsed:>9.3f} {in_flight:>12} {reqs:>8} {nbytes:>15}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
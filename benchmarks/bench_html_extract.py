@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: extraccion del bloque `schema:text` + conversion a texto sobre articulos guardados.
+
+Compara la implementacion anterior (regex DOTALL + seis `re.sub`) con `scripts/html_extract.py`
+(conteo de profundidad de `<div` a nivel de bytes) y reporta paginas/segundo. Tambien indica si cada version recupera el
+bloque completo (la regex no-greedy se corta en el primer `</div>` interno).
+
+Uso:
+  python3 benchmarks/bench_html_extract.py --seconds 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import html
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from html_extract import extract_block  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "cec")
+
+
+def _legacy_extract(html_bytes: bytes) -> tuple[str, str]:
+    # Copia de la version anterior de _extract_schema_text_div + _html_to_text.
+    text = html_bytes.decode("utf-8", errors="ignore")
+    m = re.search(r'<div[^>]+property="schema:text"[^>]*>(.*?)</div>', text, re.DOTALL | re.IGNORECASE)
+    block = m.group(1).strip() if m else ""
+    s = block
+    s = re.sub(r"<\s*br\s*/?\s*>", "\n", s, flags=re.IGNORECASE)
+    s = re.sub(r"</\s*p\s*>", "\n\n", s, flags=re.IGNORECASE)
+    s = re.sub(r"<\s*p[^>]*>", "", s, flags=re.IGNORECASE)
+    s = re.sub(r"<[^>]+>", "", s)
+    s = html.unescape(s)
+    s = re.sub(r"\n{3,}", "\n\n", s).strip()
+    return block, s
+
+
+def _extract(html_bytes: bytes) -> tuple[str, str]:
+    block = extract_block(html_bytes)
+    return block.html, block.text
+
+
+def _throughput(fn, pages: list[bytes], seconds: float) -> float:
+    done = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        for page in pages:
+            fn(page)
+        done += len(pages)
+    return done / (time.perf_counter() - t0)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Throughput de extraccion HTML (paginas/segundo).")
+    ap.add_argument("--seconds", type=float, default=2.0, help="Duracion de cada medicion")
+    ap.add_argument("--fixtures", default=FIXTURES, help="Directorio con articulos .html")
+    args = ap.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.fixtures, "*.html")))
+    if not paths:
+        raise SystemExit(f"No hay fixtures .html en {args.fixtures}")
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read())
+
+    print(f"fixtures={len(pages)} bytes_promedio={sum(map(len, pages)) // len(pages)}")
+    print(f"{'impl':>12} {'paginas/s':>10} {'chars_texto':>12} {'termina_en':>30}")
+    for label, fn in (("regex", _legacy_extract), ("html_extract", _extract)):
+        rate = _throughput(fn, pages, args.seconds)
+        _, text = fn(pages[0])
+        tail = text.splitlines()[-1][-28:] if text else ""
+        print(f"{label:>12} {rate:>10.0f} {len(text):>12} {tail:>30}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
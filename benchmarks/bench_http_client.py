@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Microbenchmark: `urlopen` + contexto SSL por request (implementacion anterior de `_http_get`)
+vs `scripts/http_client.py` (pool keep-alive, contexto SSL unico, gzip).
+
+Levanta un servidor TLS local con certificado autofirmado (requiere el binario `openssl`) y cuenta
+en el servidor los handshakes TLS y los bytes de cuerpo enviados.
+
+Uso:
+  python3 benchmarks/bench_http_client.py --requests 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixture_server import build_article  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+
+
+def _make_cert(tmpdir: str) -> tuple[str, str]:
+    cert = os.path.join(tmpdir, "cert.pem")
+    key = os.path.join(tmpdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return cert, key
+
+
+class _TLSServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, handler, ctx: ssl.SSLContext) -> None:
+        super().__init__(addr, handler)
+        self.ctx = ctx
+        self.handshakes = 0
+        self.body_bytes = 0
+        self.lock = threading.Lock()
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        with self.lock:
+            self.handshakes += 1
+        # El handshake ocurre en el hilo del handler (primer read), no bloquea el accept.
+        return self.ctx.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), addr
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    page = build_article("bench")
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        body = self.page
+        gz = "gzip" in (self.headers.get("Accept-Encoding") or "")
+        if gz:
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if gz:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.body_bytes += len(body)
+
+
+def _legacy_get(url: str, cafile: str) -> bytes:
+    # Replica la version anterior: contexto SSL nuevo (parseo del bundle) y conexion nueva por request.
+    req = urllib.request.Request(url, headers={"User-Agent": "bench", "Accept": "*/*"})
+    ctx = ssl.create_default_context(cafile=cafile)
+    with urllib.request.urlopen(req, timeout=30, context=ctx) as resp:
+        return resp.read()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Microbenchmark del cliente HTTP pooled vs urlopen (TLS local).")
+    ap.add_argument("--requests", type=int, default=30)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _make_cert(tmp)
+        server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_ctx.load_cert_chain(cert, key)
+        httpd = _TLSServer(("127.0.0.1", 0), _Handler, server_ctx)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"https://127.0.0.1:{httpd.server_address[1]}/evangelio-diario/bench"
+
+        rows = []
+        try:
+            t0 = time.perf_counter()
+            for _ in range(args.requests):
+                _legacy_get(url, cert)
+            rows.append(("urlopen", time.perf_counter() - t0, httpd.handshakes, httpd.body_bytes))
+
+            httpd.handshakes = httpd.body_bytes = 0
+            client = HttpClient(ssl_context=ssl.create_default_context(cafile=cert))
+            t0 = time.perf_counter()
+            for _ in range(args.requests):
+                client.get(url)
+            rows.append(("http_client", time.perf_counter() - t0, httpd.handshakes, httpd.body_bytes))
+            client.close()
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    # Costo de parsear el bundle de CA del sistema (lo que antes se pagaba por articulo).
+    t0 = time.perf_counter()
+    for _ in range(args.requests):
+        ssl.create_default_context()
+    ctx_cost = time.perf_counter() - t0
+
+    print(f"requests={args.requests}")
+    print(f"{'modo':>12} {'segundos':>9} {'handshakes':>10} {'bytes_cuerpo':>12}")
+    for label, elapsed, handshakes, nbytes in rows:
+        print(f"{label:>12} {elapsed:>9.3f} {handshakes:>10} {nbytes:>12}")
+    print(f"ssl.create_default_context() x{args.requests}: {ctx_cost:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
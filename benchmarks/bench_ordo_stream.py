@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: lectura de la ventana del Ordo con `json.loads` del año completo vs streaming filtrado.
+
+Cada modo corre en un proceso hijo (para medir el pico de RSS de forma aislada) contra el API local
+(benchmarks/ordo_api_server.py):
+- base: solo importa los modulos (referencia de RSS del interprete).
+- completo: descarga el cuerpo entero, `json.loads` y filtra la ventana.
+- streaming: `ordo_api.iter_window_days` (decodifica solo la ventana y corta al pasarla).
+
+Uso:
+  python3 benchmarks/bench_ordo_stream.py --paragraphs 40 --windows 4,16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ordo_api_server import OrdoApiServer  # noqa: E402
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+_CHILD = r"""
+import json, resource, sys, time
+from datetime import date, timedelta
+sys.path.insert(0, sys.argv[1])
+mode, start, days = sys.argv[2], sys.argv[3], int(sys.argv[4])
+import ordo_api
+from http_client import get_client
+end = (date.fromisoformat(start) + timedelta(days=days)).isoformat()
+t0 = time.perf_counter()
+nbytes = records = 0
+if mode == "completo":
+    body = get_client().get(ordo_api.os.environ["ORDO_API_URL"], headers=ordo_api._api_headers()).body
+    nbytes = len(body)
+    data = json.loads(body)["data"]
+    records = len([r for r in data if start <= r["fecha"] <= end])
+elif mode == "streaming":
+    stats = ordo_api.IngestStats()
+    records = len(list(ordo_api.iter_window_days(start, days, stats=stats)))
+    nbytes = stats.payload_bytes
+elapsed = time.perf_counter() - t0
+# VmHWM (pico del espacio de memoria actual); ru_maxrss en Linux se hereda del padre a traves de exec.
+try:
+    with open("/proc/self/status") as f:
+        peak = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"maxrss_kb": peak, "seconds": elapsed,
+                  "bytes": nbytes, "records": records}))
+"""
+
+
+def _child(mode: str, start: str, days: int, env: dict[str, str]) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, SCRIPTS, mode, start, str(days)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Pico de RSS: json.loads completo vs streaming de la ventana (Ordo).")
+    ap.add_argument("--paragraphs", type=int, default=12, help="Escala de los HTML largos por registro")
+    ap.add_argument("--start-date", default="2026-02-07", help="Inicio de la ventana")
+    ap.add_argument("--windows", default="4,16", help="CSV con dias de ventana (days_ahead)")
+    args = ap.parse_args()
+
+    with OrdoApiServer(date(2025, 11, 30), 364, paragraphs=args.paragraphs) as srv:
+        env = dict(os.environ, ORDO_API_URL=srv.url, ORDO_API_KEY=srv.api_key, ORDO_API_TOKEN=srv.api_token)
+        base = _child("base", args.start_date, 0, env)
+        print(f"payload={len(srv.payload)} bytes  rss_base={base['maxrss_kb']} KB")
+        print(f"{'ventana':>7} {'modo':>10} {'rss_pico_kb':>11} {'+sobre_base':>11} {'segundos':>9} {'bytes_leidos':>12} {'registros':>9}")
+        for days in [int(w) for w in args.windows.split(",") if w.strip()]:
+            for mode in ("completo", "streaming"):
+                r = _child(mode, args.start_date, days, env)
+                extra = r["maxrss_kb"] - base["maxrss_kb"]
+                print(f"{days:>7} {mode:>10} {r['maxrss_kb']:>11} {extra:>11} {r['seconds']:>9.3f} {r['bytes']:>12} {r['records']:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
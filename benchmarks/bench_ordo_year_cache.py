@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: ingesta del año completo del Ordo (API local) y consultas por fecha sobre el cache anual.
+
+Usa benchmarks/ordo_api_server.py como stand-in del API. Reporta:
+- primera apertura (descarga + indexado) y segunda (solo mmap, sin requests al API);
+- tamaño del JSON del API frente al archivo indexado;
+- microsegundos por consulta: cache mmap vs `json.loads` del payload + busqueda lineal.
+
+Uso:
+  python3 benchmarks/bench_ordo_year_cache.py --lookups 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ordo_api  # noqa: E402
+from ordo_api_server import OrdoApiServer  # noqa: E402
+
+START = date(2025, 11, 30)
+
+
+def _json_lookup(payload: bytes, iso: str) -> dict:
+    for record in json.loads(payload)["data"]:
+        if record["fecha"] == iso:
+            return record
+    raise KeyError(iso)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark del cache anual del Ordo (API local).")
+    ap.add_argument("--days", type=int, default=364, help="Dias de la edicion simulada")
+    ap.add_argument("--lookups", type=int, default=2000, help="Consultas aleatorias sobre el cache")
+    args = ap.parse_args()
+
+    dates = [(START + timedelta(days=random.randrange(args.days))).isoformat() for _ in range(args.lookups)]
+    with OrdoApiServer(START, args.days) as srv, tempfile.TemporaryDirectory() as cache_dir:
+        os.environ.update(ORDO_API_URL=srv.url, ORDO_API_KEY=srv.api_key, ORDO_API_TOKEN=srv.api_token)
+
+        stats = ordo_api.IngestStats()
+        t0 = time.perf_counter()
+        cache = ordo_api.open_edition(dates[0], cache_dir, stats=stats)
+        cold = time.perf_counter() - t0
+        cache.close()
+        requests_after_cold = srv.requests
+
+        t0 = time.perf_counter()
+        cache = ordo_api.open_edition(dates[0], cache_dir)
+        warm = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for iso in dates:
+            day = cache.get(iso)
+            assert day is not None
+        per_lookup = (time.perf_counter() - t0) / len(dates) * 1e6
+        file_size = os.path.getsize(cache.path)
+        cache.close()
+
+        sample = dates[: max(1, min(20, len(dates)))]
+        t0 = time.perf_counter()
+        for iso in sample:
+            _json_lookup(srv.payload, iso)
+        per_json = (time.perf_counter() - t0) / len(sample) * 1e6
+
+        print(f"ingesta {stats.summary()}")
+        print(f"apertura fria={cold * 1000:.1f}ms caliente={warm * 1000:.2f}ms requests_api={requests_after_cold}->{srv.requests}")
+        print(f"bytes json={len(srv.payload)} cache={file_size} ({file_size / len(srv.payload):.1%})")
+        print(f"consulta cache={per_lookup:.1f}us json.loads+scan={per_json:.0f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: duracion de punta a punta de una corrida de `import os.py` sin cambios.
+
+Sirve el feed de YouTube de benchmarks/fixtures/youtube/feed.xml en un servidor local
+(DIOCESIS_YOUTUBE_FEED), siembra el registro de corrida (DIOCESIS_RUN_STATE) con el video que el script
+va a elegir para hoy y ejecuta el script como proceso hijo. Reporta el tiempo de pared de cada corrida
+(interprete incluido) y verifica con `-X importtime` que Selenium no se importa.
+
+Con --force se mide tambien la corrida que ignora el registro (necesita Chrome; solo se lanza si se pide).
+
+Uso:
+  python3 benchmarks/bench_panel_noop.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import feedparser  # noqa: E402
+
+from run_state import save_state  # noqa: E402
+from youtube_feed import parse_csv_tokens, select_video_entry  # noqa: E402
+
+SCRIPT = os.path.join(ROOT, "import os.py")
+FEED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "youtube", "feed.xml")
+# Mismos filtros que el workflow.
+TITLE_REGEX = r"gotitas\s+de\s+esperanza"
+TITLE_REQUIRE = "gotitas,esperanza,reflexion"
+
+
+def _serve(body: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):  # silencio en benchmarks
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/atom+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _expected_video_id(body: bytes) -> str:
+    feed = feedparser.parse(body)
+    chosen, _ = select_video_entry(
+        feed.entries, re.compile(TITLE_REGEX, re.IGNORECASE), parse_csv_tokens(TITLE_REQUIRE), []
+    )
+    return chosen.link.split("v=", 1)[1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Duracion de una corrida sin cambios de import os.py.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--force", action="store_true", help="Medir tambien una corrida con --force (abre Chrome)")
+    args = parser.parse_args()
+
+    with open(FEED, "rb") as f:
+        body = f.read()
+    server = _serve(body)
+    tmp = tempfile.mkdtemp(prefix="bench-panel-")
+    state_file = os.path.join(tmp, "estado.json")
+    save_state(state_file, datetime.now().date().isoformat(), _expected_video_id(body))
+    env = dict(
+        os.environ,
+        DIOCESIS_USERNAME="bench",
+        DIOCESIS_PASSWORD="bench",
+        DIOCESIS_LOG_DIR=os.path.join(tmp, "logs"),
+        DIOCESIS_RUN_STATE=state_file,
+        DIOCESIS_FEED_CACHE_DIR=os.path.join(tmp, "http"),
+        DIOCESIS_YOUTUBE_FEED=f"http://127.0.0.1:{server.server_address[1]}/feeds/videos.xml",
+        DIOCESIS_VIDEO_TITLE_REGEX=TITLE_REGEX,
+        DIOCESIS_VIDEO_TITLE_REQUIRE=TITLE_REQUIRE,
+    )
+    env.pop("DIOCESIS_STDOUT_LOG", None)
+    env.pop("GITHUB_ACTIONS", None)
+
+    try:
+        probe = subprocess.run(
+            [sys.executable, "-X", "importtime", SCRIPT], env=env, capture_output=True, text=True, check=True
+        )
+        selenium_loaded = bool(re.search(r"\|\s+selenium\b", probe.stderr))
+        walls = []
+        for _ in range(max(1, args.runs)):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, SCRIPT], env=env, capture_output=True, check=True)
+            walls.append(time.perf_counter() - t0)
+        with open(os.path.join(tmp, "logs", "diocesis.log"), encoding="utf-8") as f:
+            in_process = [float(m) for m in re.findall(r"fin_ejecucion sin_cambios .* ms=(\d+)", f.read())]
+        print(
+            f"sin_cambios corridas={len(walls)} pared_mediana={statistics.median(walls) * 1000:.0f}ms "
+            f"pared_min={min(walls) * 1000:.0f}ms en_proceso_mediana={statistics.median(in_process):.0f}ms "
+            f"selenium_importado={selenium_loaded}"
+        )
+        if args.force:
+            t0 = time.perf_counter()
+            forced = subprocess.run([sys.executable, SCRIPT, "--force"], env=env, capture_output=True, text=True)
+            print(f"force rc={forced.returncode} pared={(time.perf_counter() - t0) * 1000:.0f}ms")
+    finally:
+        server.shutdown()
+    return 1 if selenium_loaded else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
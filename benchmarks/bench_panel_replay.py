@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark + regresion del flujo real de Fase 0 (`panel_selenium.run`, Chrome headless) contra
+paginas grabadas del panel servidas por benchmarks/panel_replay.py.
+
+Por escenario (directorios de benchmarks/fixtures/panel_replay/ con escenario.json) y corrida:
+- tiempo total y por fase (`log_phase` -> traza de run_trace);
+- tiempo por paso del replay: ms desde el evento anterior (pagina servida o paso) hasta que el flujo
+  dispara la transicion, o sea lo que tardan las heuristicas de DOM en encontrar y usar cada control;
+- correccion: que se disparen los `pasos_esperados` en orden y que la reflexion guardada tenga un solo
+  video, el pedido, con el tamano configurado y despues de "Reflexión del día" (`check_reflection`).
+
+Con --sembrar-video la reflexion ya trae el video (sin tamano): mide el camino de normalizacion.
+Con --json se guarda el resultado y con --baseline se compara: sale con codigo 1 si un escenario
+deja de ser correcto o si su mediana es mas lenta que --max-slowdown veces la de referencia.
+
+Necesita Chrome y chromedriver (como `import os.py`).
+
+Uso:
+  python3 benchmarks/bench_panel_replay.py --runs 3 --json /tmp/replay.json
+  python3 benchmarks/bench_panel_replay.py --baseline /tmp/replay.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from collections import defaultdict
+from datetime import date, datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "scripts"))
+
+from panel_replay import ReplayServer, Scenario, check_reflection  # noqa: E402
+
+SCENARIOS = os.path.join(HERE, "fixtures", "panel_replay")
+VIDEO_ID = "dQw4w9WgXcQ"
+VIDEO_URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+SEEDED = (
+    "<h2>Reflexión del día</h2>"
+    f'<p><iframe class="ql-video" frameborder="0" allowfullscreen="true" src="https://www.youtube.com/embed/{VIDEO_ID}">'
+    "</iframe></p><p>En aquel tiempo, los apóstoles volvieron a reunirse con Jesús.</p>"
+)
+
+
+def _configure(srv: ReplayServer, tmp: str) -> None:
+    # panel_config lee el entorno al importarse: hay que fijarlo antes de importar panel_selenium.
+    os.environ["DIOCESIS_PANEL_BASE"] = srv.base_url
+    os.environ["DIOCESIS_USERNAME"] = srv.username
+    os.environ["DIOCESIS_PASSWORD"] = srv.password
+    os.environ["DIOCESIS_LOG_DIR"] = os.path.join(tmp, "logs")
+    # Memoria de rutas propia del benchmark (no la de ~/.cache); se borra por escenario.
+    os.environ["DIOCESIS_ROUTE_MEMORY"] = os.path.join(tmp, "rutas-panel.json")
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def _in_order(expected: list[str], steps: list[str]) -> bool:
+    it = iter(steps)
+    return all(step in it for step in expected)
+
+
+def run_scenario(srv: ReplayServer, scenario: Scenario, runs: int, seed: bool, logger) -> dict:
+    import panel_selenium  # noqa: E402  (carga Selenium)
+    from panel_config import ROUTE_MEMORY_PATH, VIDEO_HEIGHT, VIDEO_WIDTH  # noqa: E402
+    from run_trace import TRACE  # noqa: E402
+
+    srv.use(scenario)
+    if os.path.exists(ROUTE_MEMORY_PATH):
+        os.unlink(ROUTE_MEMORY_PATH)
+    today = date.today().isoformat()
+    totals, phases, steps_ms = [], defaultdict(list), defaultdict(list)
+    failures: list[str] = []
+    for i in range(runs):
+        srv.reset({today: SEEDED} if seed else None)
+        TRACE.begin(escenario=scenario.name)
+        error = None
+        t0 = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                panel_selenium.run(Namespace(user_data_dir=None), logger, VIDEO_URL, VIDEO_ID)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}".splitlines()[0][:160]
+        totals.append((time.perf_counter() - t0) * 1000)
+        TRACE.finish("error" if error else "ok")
+        for name, ms in TRACE.to_json()["fases"].items():
+            phases[name].append(ms)
+        for name, ms in srv.step_timings():
+            steps_ms[name].append(ms)
+
+        problems = [error] if error else []
+        if not _in_order(scenario.expected_steps, srv.steps()):
+            problems.append(f"pasos={','.join(srv.steps()) or '-'}")
+        problems += check_reflection(srv.reflections.get(today) if srv.saves else None, VIDEO_ID, VIDEO_WIDTH, VIDEO_HEIGHT)
+        if problems:
+            failures.append(f"corrida {i + 1}: {'; '.join(problems)}")
+
+    return {
+        "escenario": scenario.name,
+        "corridas": runs,
+        "correctas": runs - len(failures),
+        "mediana_ms": round(statistics.median(totals), 1),
+        "p95_ms": round(_p95(totals), 1),
+        "fases": {name: round(statistics.median(v), 1) for name, v in phases.items()},
+        "pasos": {name: round(statistics.median(v), 1) for name, v in steps_ms.items()},
+        "fallas": failures,
+    }
+
+
+def compare(results: list[dict], baseline: dict, max_slowdown: float) -> list[str]:
+    """Lineas de regresion (vacia si todo esta dentro del margen)."""
+    reference = {r["escenario"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        ref = reference.get(r["escenario"])
+        if not ref:
+            continue
+        if r["correctas"] < r["corridas"] and ref["correctas"] == ref["corridas"]:
+            regressions.append(f"{r['escenario']}: correctas {r['correctas']}/{r['corridas']} (antes todas)")
+        ratio = r["mediana_ms"] / ref["mediana_ms"] if ref.get("mediana_ms") else 0
+        if ratio > max_slowdown:
+            regressions.append(f"{r['escenario']}: {ref['mediana_ms']:.0f}ms -> {r['mediana_ms']:.0f}ms (x{ratio:.2f})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fase 0 en Chrome contra paginas grabadas del panel.")
+    parser.add_argument("escenarios", nargs="*", help=f"Directorios de escenario (default: todos en {SCENARIOS})")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos de espera por request en el servidor")
+    parser.add_argument("--sembrar-video", action="store_true", help="La reflexion ya trae el video (normalizacion)")
+    parser.add_argument("--json", default=None, help="Ruta donde escribir los resultados en JSON")
+    parser.add_argument("--baseline", default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument("--max-slowdown", type=float, default=1.25, help="Factor tolerado frente al baseline")
+    args = parser.parse_args()
+
+    dirs = args.escenarios or sorted(os.path.dirname(p) for p in glob.glob(os.path.join(SCENARIOS, "*", "escenario.json")))
+    scenarios = [Scenario.load(d) for d in dirs]
+    if not scenarios:
+        print(f"sin escenarios en {SCENARIOS}", file=sys.stderr)
+        return 1
+
+    logger = logging.getLogger("bench_panel_replay")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    results = []
+    with tempfile.TemporaryDirectory(prefix="panel-replay-") as tmp, ReplayServer(
+        scenarios[0], latency=args.latency
+    ) as srv:
+        _configure(srv, tmp)
+        for scenario in scenarios:
+            r = run_scenario(srv, scenario, max(1, args.runs), args.sembrar_video, logger)
+            results.append(r)
+            print(
+                f"escenario={r['escenario']} corridas={r['corridas']} correctas={r['correctas']} "
+                f"mediana={r['mediana_ms']:.0f}ms p95={r['p95_ms']:.0f}ms"
+            )
+            for name, ms in r["fases"].items():
+                print(f"  fase {name:<28} {ms:>8.0f}ms")
+            for name, ms in r["pasos"].items():
+                print(f"  paso {name:<28} {ms:>8.0f}ms")
+            for failure in r["fallas"]:
+                print(f"  FALLA {failure}")
+
+    if args.json:
+        payload = {
+            "suite": "panel_replay",
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "runs": args.runs,
+            "latency": args.latency,
+            "sembrar_video": args.sembrar_video,
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    status = 0 if all(r["correctas"] == r["corridas"] for r in results) else 1
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_slowdown)
+        for line in regressions:
+            print(f"REGRESION {line}", file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: actualizar la reflexion del dia por HTTP (`panel_http`) vs en Chrome (`panel_selenium`).
+
+Ambos transportes corren contra el doble local del panel (benchmarks/panel_server.py), con una
+latencia artificial por request para simular la red. Por corrida se reporta el tiempo, los requests
+que recibio el servidor (por ruta) y si la reflexion quedo con el video. Antes de cada corrida se
+restaura la reflexion sin video, salvo en la corrida "sin_cambio" (el video ya estaba).
+
+El camino del navegador solo se mide con --browser (necesita Chrome y chromedriver).
+
+Uso:
+  python3 benchmarks/bench_panel_transport.py --runs 5 --latency 0.03
+  python3 benchmarks/bench_panel_transport.py --browser
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import statistics
+import sys
+import time
+from argparse import Namespace
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from panel_server import DEFAULT_REFLECTION, PanelServer  # noqa: E402
+
+VIDEO_ID = "dQw4w9WgXcQ"
+VIDEO_URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+
+def _configure(srv: PanelServer) -> None:
+    # panel_config lee el entorno al importarse: hay que fijarlo antes de importar los transportes.
+    os.environ["DIOCESIS_PANEL_BASE"] = srv.base_url
+    os.environ["DIOCESIS_USERNAME"] = srv.username
+    os.environ["DIOCESIS_PASSWORD"] = srv.password
+    os.environ.setdefault("DIOCESIS_LOG_DIR", os.path.join("/tmp", "bench-panel-transport"))
+
+
+def _routes(counts) -> str:
+    return ",".join(f"{route}:{n}" for route, n in sorted(counts.items()))
+
+
+def _measure(label: str, srv: PanelServer, runs: int, once, reset: bool = True) -> None:
+    today = date.today().isoformat()
+    times, requests = [], []
+    counts = None
+    for _ in range(runs):
+        if reset:
+            srv.day(today)["reflexion"] = DEFAULT_REFLECTION
+        srv.take_counts()
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            once()
+        times.append(time.perf_counter() - t0)
+        counts = srv.take_counts()
+        requests.append(sum(counts.values()))
+    ok = VIDEO_ID in srv.day(today)["reflexion"]
+    print(
+        f"{label} corridas={runs} mediana={statistics.median(times) * 1000:.0f}ms min={min(times) * 1000:.0f}ms "
+        f"requests={statistics.median(requests):.0f} video_guardado={ok} rutas={_routes(counts)}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Transporte HTTP vs navegador contra el doble del panel.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.03, help="Segundos de espera por request en el servidor")
+    parser.add_argument("--browser", action="store_true", help="Medir tambien el camino de Selenium (abre Chrome)")
+    args = parser.parse_args()
+    runs = max(1, args.runs)
+
+    with PanelServer(latency=args.latency) as srv:
+        _configure(srv)
+        import panel_http  # noqa: E402
+
+        from http_client import HttpClient  # noqa: E402
+
+        logger = logging.getLogger("bench_panel_transport")
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        today = date.today().isoformat()
+
+        def http_once() -> None:
+            # Cliente nuevo por corrida: incluye la conexion TCP, como una corrida real del workflow.
+            client = HttpClient()
+            try:
+                panel_http.run(logger, VIDEO_URL, VIDEO_ID, today, client=client)
+            finally:
+                client.close()
+
+        _measure("http", srv, runs, http_once)
+        _measure("http_sin_cambio", srv, runs, http_once, reset=False)
+
+        if args.browser:
+            import panel_selenium  # noqa: E402
+
+            _measure(
+                "browser",
+                srv,
+                runs,
+                lambda: panel_selenium.run(Namespace(user_data_dir=None), logger, VIDEO_URL, VIDEO_ID),
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark: polls del feed de YouTube de `get_latest_video_url`.
+
+Compara, contra un servidor local que sirve benchmarks/fixtures/youtube/feed.xml con `ETag`
+(y 304 a `If-None-Match`):
+- anterior: GET completo + `feedparser.parse` en cada poll.
+- cacheado: `youtube_feed.fetch_feed_entries` con `HttpCache` (primer poll en frio, luego polls en
+  el mismo proceso, y un proceso nuevo sobre la misma cache de disco = la corrida horaria siguiente).
+
+Reporta por modo: ms por poll, respuestas 200/304 del servidor, bytes y si hubo que parsear.
+
+Uso:
+  python3 benchmarks/bench_youtube_feed.py --polls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+sys.path.insert(0, SCRIPTS)
+
+import feedparser  # noqa: E402
+
+from http_cache import HttpCache  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+from youtube_feed import fetch_feed_entries  # noqa: E402
+
+FEED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "youtube", "feed.xml")
+
+_CHILD = r"""
+import sys, time
+sys.path.insert(0, sys.argv[1])
+t0 = time.perf_counter()
+from http_cache import HttpCache
+from youtube_feed import fetch_feed_entries
+fetch = fetch_feed_entries(sys.argv[2], cache=HttpCache(sys.argv[3]))
+print(f"{fetch.status} {fetch.parsed} {(time.perf_counter() - t0) * 1000:.2f} {'feedparser' in sys.modules}")
+"""
+
+
+class _FeedServer:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        self.counts = {200: 0, 304: 0}
+        self.bytes = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, fmt, *args):  # silencio en benchmarks
+                pass
+
+            def do_GET(self):
+                fresh = self.headers.get("If-None-Match") == server.etag
+                payload = b"" if fresh else server.body
+                with server._lock:
+                    server.counts[304 if fresh else 200] += 1
+                    server.bytes += len(payload)
+                self.send_response(304 if fresh else 200)
+                self.send_header("ETag", server.etag)
+                if not fresh:
+                    self.send_header("Content-Type", "application/atom+xml")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/feeds/videos.xml"
+
+    def take(self) -> str:
+        with self._lock:
+            out = f"200={self.counts[200]} 304={self.counts[304]} bytes={self.bytes}"
+            self.counts = {200: 0, 304: 0}
+            self.bytes = 0
+        return out
+
+
+def _ms(values: list[float]) -> str:
+    return f"mediana={statistics.median(values) * 1000:.2f}ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Polls del feed de YouTube: GET+parse vs GET condicional cacheado.")
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+    polls = max(1, args.polls)
+
+    with open(FEED, "rb") as f:
+        server = _FeedServer(f.read())
+    client = HttpClient()
+    try:
+        times = []
+        for _ in range(polls):
+            t0 = time.perf_counter()
+            feedparser.parse(client.get(server.url).body)
+            times.append(time.perf_counter() - t0)
+        print(f"anterior polls={polls} {_ms(times)} {server.take()} parseos={polls}")
+
+        cache_dir = tempfile.mkdtemp(prefix="bench-feed-")
+        cache = HttpCache(cache_dir)
+        first = fetch_feed_entries(server.url, cache=cache, client=client)
+        print(f"cacheado_frio {first.summary()} {server.take()}")
+        times, parsed = [], 0
+        for _ in range(polls):
+            fetch = fetch_feed_entries(server.url, cache=cache, client=client)
+            times.append(fetch.seconds)
+            parsed += fetch.parsed
+        print(f"cacheado_mismo_proceso polls={polls} {_ms(times)} {server.take()} parseos={parsed}")
+
+        child = subprocess.run(
+            [sys.executable, "-c", _CHILD, SCRIPTS, server.url, cache_dir], capture_output=True, text=True, check=True
+        )
+        status, parsed_child, ms, feedparser_loaded = child.stdout.split()
+        print(
+            f"cacheado_corrida_nueva status={status} parseado={parsed_child} ms={ms} "
+            f"feedparser_importado={feedparser_loaded} {server.take()}"
+        )
+    finally:
+        client.close()
+        server.httpd.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
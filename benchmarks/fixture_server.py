@@ -0,0 +1,162 @@
+"""
+Servidor HTTP local que imita el RSS y los articulos de CEC "Evangelio diario".
+
+Solo para benchmarks: genera N items (uno por dia desde `start`) y responde cada articulo con una
+latencia artificial para simular la red real desde los runners de Actions. Todas las respuestas
+llevan `ETag` y el servidor contesta 304 a `If-None-Match` coincidente.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MONTHS = [
+    "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+    "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre",
+]
+
+ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html lang="es"><head><title>{title}</title></head>
+<body>
+<header><nav><div class="menu"><a href="/">Inicio</a></div></nav></header>
+<article>
+<div property="schema:text" class="field--name-body">
+<p>Lectura del santo Evangelio según san Marcos</p>
+<p>En aquel tiempo, los apóstoles volvieron a reunirse con Jesús.<br/>Y él les dijo:</p>
+<div class="quote"><p>«Venid vosotros a solas a un lugar desierto.»</p></div>
+<p>Palabra del Señor.</p>
+</div>
+</article>
+<footer>{chrome}</footer>
+</body></html>
+"""
+
+
+def build_rss(base_url: str, start: date, count: int) -> bytes:
+    items = []
+    # Newest-first, como el feed real.
+    for i in reversed(range(count)):
+        d = start + timedelta(days=i)
+        pub = format_datetime(datetime.combine(d - timedelta(days=1), dtime(23, 0), tzinfo=timezone.utc))
+        title = f"{d.day:02d} de {MONTHS[d.month - 1]} | Lectura del Santo Evangelio según San Marcos Mc 6, 30-34"
+        items.append(
+            "<item>"
+            f"<title>{title}</title>"
+            f"<link>{base_url}/evangelio-diario/{d.isoformat()}</link>"
+            f"<pubDate>{pub}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss version="2.0"><channel><title>Evangelio diario</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def build_article(slug: str, chrome_bytes: int = 40_000) -> bytes:
+    return ARTICLE_TEMPLATE.format(title=slug, chrome="x" * chrome_bytes).encode("utf-8")
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Los clientes que cortan la descarga a proposito (streaming) cierran la conexion.
+        exc = sys.exc_info()[1]
+        if isinstance(exc, (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FixtureServer:
+    """Context manager: levanta el servidor en un puerto libre de 127.0.0.1."""
+
+    def __init__(self, start: date, count: int, latency: float = 0.05) -> None:
+        self.start = start
+        self.count = count
+        self.latency = latency
+        self.requests = 0
+        self.not_modified = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd: _QuietServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._httpd is not None
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rss_url(self) -> str:
+        return f"{self.base_url}/feed"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Sin Nagle: evita esperas de ~40 ms (delayed ACK) entre cabeceras y cuerpo en keep-alive.
+            disable_nagle_algorithm = True
+
+            def log_message(self, fmt, *args):  # silencio en benchmarks
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if self.path == "/feed":
+                    body = build_rss(server.base_url, server.start, server.count)
+                    ctype = "application/rss+xml; charset=utf-8"
+                elif self.path.startswith("/evangelio-diario/"):
+                    # Solo la "latencia" cuenta como request en vuelo (el cliente aun espera respuesta).
+                    with server._lock:
+                        server._in_flight += 1
+                        server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                    try:
+                        time.sleep(server.latency)
+                    finally:
+                        with server._lock:
+                            server._in_flight -= 1
+                    body = build_article(self.path.rsplit("/", 1)[-1])
+                    ctype = "text/html; charset=utf-8"
+                else:
+                    self.send_error(404)
+                    return
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self) -> "FixtureServer":
+        self._httpd = _QuietServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        assert self._httpd is not None
+        self._httpd.shutdown()
+        self._httpd.server_close()
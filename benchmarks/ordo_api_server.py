@@ -0,0 +1,193 @@
+"""
+Servidor HTTP local que imita `ediciones/obtener-contenido-completo` del API del Ordo.
+
+Solo para benchmarks/pruebas locales: genera un año liturgico (un registro por dia en `data`) con
+los mismos campos que el API real, incluidos los HTML largos (`misa`, `primera_lectura`,
+`reflexion`). Exige los headers API-KEY / API-TOKEN / API-NAME y responde 401 si no coinciden.
+
+Tambien sirve la consulta por fecha de `ordo_api.py` (DAY_ENDPOINT?fecha=YYYY-MM-DD, misma envoltura
+con un solo registro en `data`). Con `full_status` el endpoint del año responde ese codigo de error,
+para probar el respaldo por fecha.
+
+Uso:
+  with OrdoApiServer() as srv:
+      os.environ["ORDO_API_URL"] = srv.url
+      os.environ["ORDO_API_KEY"], os.environ["ORDO_API_TOKEN"] = srv.api_key, srv.api_token
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+from fixture_server import _QuietServer
+
+ENDPOINT = "/api-app/ediciones/obtener-contenido-completo"
+DAY_ENDPOINT = "/api-app/ediciones/obtener-contenido-dia"
+
+# Año liturgico 2025-2026: (inicio, tiempo, color).
+SEASONS = [
+    (date(2025, 11, 30), "ADVIENTO", "Morado"),
+    (date(2025, 12, 25), "NAVIDAD", "Blanco"),
+    (date(2026, 1, 12), "I TIEMPO ORDINARIO", "Verde"),
+    (date(2026, 2, 18), "CUARESMA", "Morado"),
+    (date(2026, 4, 2), "TRIDUO PASCUAL", "Rojo"),
+    (date(2026, 4, 5), "PASCUA", "Blanco"),
+    (date(2026, 5, 25), "II TIEMPO ORDINARIO", "Verde"),
+]
+WEEKDAYS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+ROMAN = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII", "XIII", "XIV", "XV",
+         "XVI", "XVII", "XVIII", "XIX", "XX", "XXI", "XXII", "XXIII", "XXIV", "XXV", "XXVI", "XXVII",
+         "XXVIII", "XXIX", "XXX", "XXXI", "XXXII", "XXXIII", "XXXIV"]
+GOSPELS = ["Mt 5,13-16", "Mc 6,30-34", "Lc 4,16-30", "Jn 10,27-30"]
+
+
+def _season(d: date) -> tuple[date, str, str]:
+    current = SEASONS[0]
+    for season in SEASONS:
+        if d >= season[0]:
+            current = season
+    return current
+
+
+def build_record(d: date, paragraphs: int = 12) -> dict:
+    start, tiempo, color = _season(d)
+    week = ROMAN[min(len(ROMAN) - 1, (d - start).days // 7)]
+    weekday = WEEKDAYS[d.weekday()]
+    sunday = d.weekday() == 6
+    celebracion = f"{week} Domingo de {tiempo.title()}" if sunday else ""
+    gospel = GOSPELS[d.toordinal() % len(GOSPELS)]
+    misa = (
+        f"<p><strong>{weekday}.</strong> {'Misa del domingo' if sunday else 'Misa de feria'}, "
+        f"prefacio común. Color {color.lower()}.</p>"
+        "<p>LECCIONARIO: <em>1 Re 3,4-13</em>; <em>Sal 118,9-14</em>; "
+        f"{'<em>1 Cor 2,1-5</em>; ' if sunday else ''}<em>{gospel}</em>.</p>"
+    )
+    parrafo = (
+        "<p>En aquel tiempo, Jesús recorría los pueblos enseñando en las sinagogas y anunciando el "
+        "Evangelio del Reino; al ver a las multitudes se compadecía de ellas.</p>"
+    )
+    return {
+        "id": d.toordinal(),
+        "fecha": d.isoformat(),
+        "tiempo_liturgico": tiempo,
+        "encabezado": f"{weekday} de la {week} semana de {tiempo.title()}. {color}",
+        "colores_dia": color if d.day % 9 else f"{color} o Blanco",
+        "celebracion": celebracion,
+        "nombre_celebracion": celebracion,
+        "misa": misa,
+        "primera_lectura": "<h3>Primera lectura</h3>" + parrafo * max(1, paragraphs // 2),
+        "segunda_lectura": ("<h3>Segunda lectura</h3>" + parrafo * max(1, paragraphs // 3)) if sunday else "",
+        "evangelio": "",
+        "salmo": "",
+        "aclamacion": "",
+        "reflexion": "<h3>Reflexión</h3>" + parrafo * paragraphs,
+        "reflexion_audio": f"https://ordo.example/audio/{d.isoformat()}.mp3",
+    }
+
+
+def build_payload(start: date = date(2025, 11, 30), days: int = 364, paragraphs: int = 12) -> bytes:
+    """`paragraphs` escala el tamaño de los HTML largos (reflexion, lecturas) de cada registro."""
+    data = [build_record(start + timedelta(days=i), paragraphs) for i in range(days)]
+    return json.dumps({"status": True, "message": "ok", "data": data}, ensure_ascii=False).encode("utf-8")
+
+
+class OrdoApiServer:
+    """Context manager: levanta el servidor en un puerto libre de 127.0.0.1."""
+
+    def __init__(
+        self,
+        start: date = date(2025, 11, 30),
+        days: int = 364,
+        api_key: str = "local-key",
+        api_token: str = "local-token",
+        api_name: str = "APP-ORDO",
+        paragraphs: int = 12,
+        full_status: int = 200,
+    ) -> None:
+        self.api_key = api_key
+        self.api_token = api_token
+        self.api_name = api_name
+        self.payload = build_payload(start, days, paragraphs)
+        self.records = {start + timedelta(days=i): build_record(start + timedelta(days=i), paragraphs) for i in range(days)}
+        self.full_status = full_status
+        self.requests = 0
+        self.day_requests = 0
+        self.unauthorized = 0
+        self._lock = threading.Lock()
+        self._server = _QuietServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{ENDPOINT}"
+
+    @property
+    def day_url(self) -> str:
+        """Plantilla para ORDO_API_DAY_URL."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{DAY_ENDPOINT}?fecha={{fecha}}"
+
+    def _handler(self):
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with srv._lock:
+                    srv.requests += 1
+                path, _, query = self.path.partition("?")
+                if path not in (ENDPOINT, DAY_ENDPOINT):
+                    self._reply(404, b'{"status":false,"message":"not found"}')
+                    return
+                if (
+                    self.headers.get("API-KEY") != srv.api_key
+                    or self.headers.get("API-TOKEN") != srv.api_token
+                    or self.headers.get("API-NAME") != srv.api_name
+                ):
+                    with srv._lock:
+                        srv.unauthorized += 1
+                    self._reply(401, b'{"status":false,"message":"unauthorized"}')
+                    return
+                if path == DAY_ENDPOINT:
+                    self._reply_day(parse_qs(query).get("fecha", [""])[0])
+                elif srv.full_status != 200:
+                    self._reply(srv.full_status, b'{"status":false,"message":"error"}')
+                else:
+                    self._reply(200, srv.payload)
+
+            def _reply_day(self, fecha: str) -> None:
+                with srv._lock:
+                    srv.day_requests += 1
+                try:
+                    record = srv.records.get(date.fromisoformat(fecha))
+                except ValueError:
+                    record = None
+                body = {"status": True, "message": "ok", "data": [record] if record else []}
+                self._reply(200, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+
+            def _reply(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self) -> "OrdoApiServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
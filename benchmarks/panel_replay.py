@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+
+"""
+Replay offline del panel de Dios Hoy: sirve paginas grabadas y redactadas (las mismas que guarda
+`dump_debug_artifacts` como debug-*.html) desde un servidor local, con cada paso del flujo escrito
+como una transicion de estados. Asi `panel_selenium` (login, calendario, `open_evangelio_santo`,
+dialogo de video, guardado) corre de verdad en Chrome sin tocar produccion.
+
+Un escenario es un directorio con `escenario.json` y las instantaneas HTML:
+
+  {
+    "descripcion": "...",
+    "paginas": {"/auth/login": {"html": "login.html", "publica": true},
+                "/espiritualidad/dios-hoy/{fecha}/evangelios-y-santo": {"html": "evangelio_santo.html"}},
+    "transiciones": {
+      "dios_hoy.html": [
+        {"paso": "seleccionar_dia", "evento": "click", "selector": "main button[data-dia]",
+         "acciones": [{"enlace": {"selector": "#dia", "href": "/espiritualidad/dios-hoy/{fecha}/evangelios-y-santo"}},
+                      {"mostrar": "#dia"}]}
+      ]
+    },
+    "pasos_esperados": ["login", "seleccionar_dia", ...]
+  }
+
+- `paginas`: ruta -> instantanea (`{fecha}` = YYYY-MM-DD). Sin `publica`, exige la cookie de sesion
+  (302 a /auth/login?callbackUrl=..., como el panel).
+- `transiciones`: por instantanea (el estado actual), reglas `evento` (click, submit, enter) sobre
+  `selector` con `acciones`: mostrar, ocultar, habilitar, enlace, ir_a, estado (cambia el body por
+  otra instantanea), login, insertar_video (como el blot de Quill) y guardar (manda el HTML del editor
+  al servidor y muestra un aviso `role=status`).
+- Un elemento con `data-replay="reflexion"` recibe la reflexion guardada (o sembrada) de esa fecha.
+
+Cada transicion que se dispara queda en la linea de tiempo del servidor (`timeline`) junto con las
+paginas servidas; `check_reflection` valida el HTML guardado. El benchmark es
+benchmarks/bench_panel_replay.py.
+
+Uso:
+  python3 benchmarks/panel_replay.py servir benchmarks/fixtures/panel_replay/basico --port 8766
+  python3 benchmarks/panel_replay.py importar logs/debug-*.html --escenario benchmarks/fixtures/panel_replay/nuevo
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from html.parser import HTMLParser
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+from fixture_server import _QuietServer
+
+SCENARIO_FILE = "escenario.json"
+SESSION_COOKIE = "replay-session"
+REPLAY_PREFIX = "/__replay/"
+ACTIONS = ("mostrar", "ocultar", "habilitar", "enlace", "ir_a", "estado", "login", "insertar_video", "guardar")
+EVENTS = ("click", "submit", "enter")
+NOT_FOUND = b"<html><head><title>404: This page could not be found.</title></head><body>404 This page could not be found.</body></html>"
+
+RUNTIME_JS = r"""
+(() => {
+  const cfg = window.__REPLAY__;
+  let state = cfg.estado;
+  let lastRange = null;
+  const all = (sel) => Array.from(document.querySelectorAll(sel));
+  const pageDate = () => (location.pathname.match(/\d{4}-\d{2}-\d{2}/) || [cfg.hoy])[0];
+  const fill = (text, ctx) => String(text).replace(/\{(\w+)\}/g, (m, k) => (k in ctx ? ctx[k] : m));
+  const post = (path, payload) => fetch('/__replay/' + path, {
+    method: 'POST', keepalive: true, headers: {'Content-Type': 'application/json'}, body: JSON.stringify(payload),
+  });
+  const restore = () => {
+    if (cfg.reflexion === null) return;
+    all('[data-replay="reflexion"]').forEach((el) => { el.innerHTML = cfg.reflexion; });
+  };
+  // Como Quill: el video va donde estaba el cursor del editor (el clic en la barra no lo mueve).
+  document.addEventListener('selectionchange', () => {
+    const sel = window.getSelection();
+    if (!sel.rangeCount) return;
+    const node = sel.getRangeAt(0).startContainer;
+    const el = node.nodeType === 1 ? node : node.parentElement;
+    if (el && el.closest('[contenteditable="true"]')) lastRange = sel.getRangeAt(0).cloneRange();
+  });
+  const actions = {
+    mostrar: (sel) => all(sel).forEach((el) => {
+      el.classList.remove('hidden'); el.removeAttribute('hidden'); el.style.display = '';
+    }),
+    ocultar: (sel) => all(sel).forEach((el) => el.classList.add('hidden')),
+    habilitar: (sel) => all(sel).forEach((el) => {
+      el.disabled = false; el.removeAttribute('disabled'); el.removeAttribute('aria-disabled');
+      el.classList.remove('text-gray-400', 'cursor-not-allowed', 'opacity-50');
+    }),
+    enlace: (a, ctx) => all(a.selector).forEach((el) => el.setAttribute('href', fill(a.href, ctx))),
+    ir_a: (path, ctx) => location.assign(fill(path, ctx)),
+    estado: async (name) => {
+      const resp = await fetch('/__replay/instantanea/' + encodeURIComponent(name));
+      const doc = new DOMParser().parseFromString(await resp.text(), 'text/html');
+      document.title = doc.title;
+      document.body.innerHTML = doc.body.innerHTML;
+      state = name;
+      restore();
+    },
+    login: async (a) => {
+      const next = new URLSearchParams(location.search).get('callbackUrl') || a.destino || '/dashboard';
+      const body = new URLSearchParams({
+        usuario: document.querySelector(a.usuario).value, clave: document.querySelector(a.clave).value, callbackUrl: next,
+      });
+      const resp = await fetch('/__replay/login', {method: 'POST', body});
+      if (resp.ok) {
+        location.assign((await resp.json()).url);
+      } else {
+        const msg = document.createElement('p');
+        msg.setAttribute('role', 'alert');
+        msg.textContent = 'Credenciales inválidas';
+        document.body.appendChild(msg);
+      }
+    },
+    insertar_video: (a) => {
+      const editor = document.querySelector(a.editor);
+      const input = document.querySelector(a.entrada);
+      const src = ((input && input.value) || '').trim();
+      if (!editor || !src) return;
+      const iframe = document.createElement('iframe');
+      iframe.className = 'ql-video';
+      iframe.setAttribute('frameborder', '0');
+      iframe.setAttribute('allowfullscreen', 'true');
+      iframe.setAttribute('src', src);
+      if (lastRange && editor.contains(lastRange.startContainer)) {
+        lastRange.insertNode(iframe);
+      } else {
+        editor.appendChild(iframe);
+      }
+      input.value = '';
+    },
+    guardar: async (a) => {
+      const editor = document.querySelector(a.editor);
+      const resp = await post('guardar', {fecha: pageDate(), html: editor ? editor.innerHTML : ''});
+      if (resp.ok && a.aviso !== false) {
+        const toast = document.createElement('div');
+        toast.setAttribute('role', 'status');
+        toast.textContent = a.aviso || 'Reflexión guardada';
+        document.body.appendChild(toast);
+      }
+    },
+  };
+  const run = async (rule, el) => {
+    post('paso', {paso: rule.paso, estado: state}).catch(() => {});
+    const dia = (el.dataset && el.dataset.dia) || (el.textContent || '').trim();
+    const fecha = /^\d{4}-\d{2}-\d{2}$/.test(dia) ? dia : cfg.hoy.slice(0, 8) + dia.padStart(2, '0');
+    const ctx = {dia: dia.slice(-2).replace(/^0/, ''), fecha};
+    for (const action of rule.acciones || []) {
+      const [name, arg] = Object.entries(action)[0];
+      await actions[name](arg, ctx);
+    }
+  };
+  const fire = (kind, event) => {
+    for (const rule of cfg.transiciones[state] || []) {
+      if (rule.evento !== kind) continue;
+      const el = event.target.closest && event.target.closest(rule.selector);
+      if (!el) continue;
+      // Sin backend real: submit y Enter no siguen su camino por defecto; el clic solo si la regla lo pide.
+      if (kind !== 'click' || rule.prevenir) event.preventDefault();
+      run(rule, el);
+      return;
+    }
+  };
+  document.addEventListener('click', (e) => fire('click', e), true);
+  document.addEventListener('submit', (e) => fire('submit', e), true);
+  document.addEventListener('keydown', (e) => { if (e.key === 'Enter') fire('enter', e); }, true);
+  restore();
+})();
+"""
+
+
+@dataclass
+class Scenario:
+    name: str
+    directory: str
+    pages: list[tuple[re.Pattern, str, dict[str, Any]]]
+    transitions: dict[str, list[dict[str, Any]]]
+    snapshots: set[str] = field(default_factory=set)
+    expected_steps: list[str] = field(default_factory=list)
+    description: str = ""
+
+    @classmethod
+    def load(cls, directory: str) -> "Scenario":
+        """Lee `escenario.json`; ValueError si referencia instantaneas o acciones que no existen."""
+        with open(os.path.join(directory, SCENARIO_FILE), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        pages = []
+        for route, page in (data.get("paginas") or {}).items():
+            pattern = re.escape(route).replace(re.escape("{fecha}"), r"\d{4}-\d{2}-\d{2}")
+            pages.append((re.compile(pattern + "/?"), page["html"], page))
+        transitions = data.get("transiciones") or {}
+        snapshots = {html for _, html, _ in pages} | set(transitions)
+        for rules in transitions.values():
+            for rule in rules:
+                if rule.get("evento") not in EVENTS or not rule.get("selector") or not rule.get("paso"):
+                    raise ValueError(f"{directory}: regla invalida {rule!r} (paso, evento {EVENTS}, selector)")
+                for action in rule.get("acciones") or []:
+                    (name, arg), = action.items()
+                    if name not in ACTIONS:
+                        raise ValueError(f"{directory}: accion desconocida {name!r} en el paso {rule['paso']!r}")
+                    if name == "estado":
+                        snapshots.add(arg)
+        missing = sorted(s for s in snapshots if not os.path.isfile(os.path.join(directory, s)))
+        if missing:
+            raise ValueError(f"{directory}: faltan instantaneas {missing}")
+        return cls(
+            name=os.path.basename(os.path.normpath(directory)),
+            directory=directory,
+            pages=pages,
+            transitions=transitions,
+            snapshots=snapshots,
+            expected_steps=list(data.get("pasos_esperados") or []),
+            description=data.get("descripcion", ""),
+        )
+
+    def page_for(self, path: str) -> Optional[tuple[str, dict[str, Any]]]:
+        for pattern, html, page in self.pages:
+            if pattern.fullmatch(path):
+                return html, page
+        return None
+
+    def snapshot(self, name: str) -> Optional[str]:
+        if name not in self.snapshots:
+            return None
+        with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+            return f.read()
+
+
+class ReplayServer:
+    """Context manager: sirve un escenario en 127.0.0.1 (se puede cambiar con `use` sin cambiar de puerto)."""
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        username: str = "bench",
+        password: str = "bench",
+        latency: float = 0.0,
+        port: int = 0,
+    ) -> None:
+        self.scenario = scenario
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.reset()
+        self._server = _QuietServer(("127.0.0.1", port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def use(self, scenario: Scenario) -> None:
+        with self._lock:
+            self.scenario = scenario
+        self.reset()
+
+    def reset(self, reflections: Optional[dict[str, str]] = None) -> None:
+        """Olvida sesiones, guardados y linea de tiempo; `reflections` siembra {fecha: html}."""
+        with self._lock:
+            self.sessions: set[str] = set()
+            self.reflections: dict[str, str] = dict(reflections or {})
+            self.saves: list[tuple[str, str]] = []
+            self.counts: Counter = Counter()
+            self.t0 = time.perf_counter()
+            self.events: list[tuple[float, str, str]] = []
+
+    def _event(self, kind: str, name: str) -> None:
+        with self._lock:
+            self.events.append((round((time.perf_counter() - self.t0) * 1000, 1), kind, name))
+
+    def timeline(self) -> list[tuple[float, str, str]]:
+        """[(ms desde reset, 'pagina' | 'paso', nombre)] en orden de llegada."""
+        with self._lock:
+            return list(self.events)
+
+    def steps(self) -> list[str]:
+        return [name for _, kind, name in self.timeline() if kind == "paso"]
+
+    def step_timings(self) -> list[tuple[str, float]]:
+        """(paso, ms desde el evento anterior: pagina servida o paso) para cada paso disparado."""
+        out, prev = [], 0.0
+        for t, kind, name in self.timeline():
+            if kind == "paso":
+                out.append((name, round(t - prev, 1)))
+            prev = t
+        return out
+
+    def _handler(self):
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _cookies(self) -> dict[str, str]:
+                jar = SimpleCookie()
+                try:
+                    jar.load(self.headers.get("Cookie", ""))
+                except Exception:
+                    return {}
+                return {k: m.value for k, m in jar.items()}
+
+            def _authed(self) -> bool:
+                with srv._lock:
+                    return self._cookies().get(SESSION_COOKIE) in srv.sessions
+
+            def _reply(self, status: int, body: bytes = b"", ctype: str = "text/html; charset=utf-8", headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, status: int, payload, headers=()) -> None:
+                self._reply(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                path = parts.path
+                if srv.latency:
+                    time.sleep(srv.latency)
+                if path == REPLAY_PREFIX + "runtime.js":
+                    self._reply(200, RUNTIME_JS.encode("utf-8"), "text/javascript; charset=utf-8")
+                    return
+                if path.startswith(REPLAY_PREFIX + "instantanea/"):
+                    html = srv.scenario.snapshot(path.rsplit("/", 1)[1])
+                    self._reply(200 if html is not None else 404, (html or "").encode("utf-8"))
+                    return
+                with srv._lock:
+                    srv.counts[f"GET {path}"] += 1
+                found = srv.scenario.page_for(path)
+                if found is None:
+                    srv._event("pagina", f"404 {path}")
+                    self._reply(404, NOT_FOUND)
+                    return
+                name, page = found
+                if not page.get("publica") and not self._authed():
+                    srv._event("pagina", f"302 {path}")
+                    self._reply(302, headers=(("Location", "/auth/login?callbackUrl=" + quote(path, safe="")),))
+                    return
+                srv._event("pagina", path)
+                day = (re.search(r"\d{4}-\d{2}-\d{2}", path) or [date.today().isoformat()])[0]
+                with srv._lock:
+                    config = {
+                        "estado": name,
+                        "hoy": date.today().isoformat(),
+                        "transiciones": srv.scenario.transitions,
+                        "reflexion": srv.reflections.get(day),
+                    }
+                self._reply(200, inject_runtime(srv.scenario.snapshot(name) or "", config).encode("utf-8"))
+
+            def do_POST(self) -> None:
+                path = urlsplit(self.path).path
+                body = self._body()
+                if path == REPLAY_PREFIX + "login":
+                    if srv.latency:
+                        time.sleep(srv.latency)
+                    form = {k: v[0] for k, v in parse_qs(body.decode("utf-8")).items()}
+                    if form.get("usuario") != srv.username or form.get("clave") != srv.password:
+                        self._json(401, {"url": "/auth/login?error=CredentialsSignin"})
+                        return
+                    token = secrets.token_hex(16)
+                    with srv._lock:
+                        srv.sessions.add(token)
+                    cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+                    self._json(200, {"url": form.get("callbackUrl") or "/dashboard"}, (("Set-Cookie", cookie),))
+                    return
+                try:
+                    payload = json.loads(body.decode("utf-8") or "{}")
+                except ValueError:
+                    payload = {}
+                if path == REPLAY_PREFIX + "paso":
+                    srv._event("paso", str(payload.get("paso", "?")))
+                    self._json(200, {})
+                elif path == REPLAY_PREFIX + "guardar":
+                    if srv.latency:
+                        time.sleep(srv.latency)
+                    if not self._authed():
+                        self._json(401, {"error": "unauthorized"})
+                        return
+                    fecha, html = str(payload.get("fecha", "")), str(payload.get("html", ""))
+                    with srv._lock:
+                        srv.reflections[fecha] = html
+                        srv.saves.append((fecha, html))
+                    self._json(200, {})
+                else:
+                    self._reply(404, NOT_FOUND)
+
+        return Handler
+
+    def __enter__(self) -> "ReplayServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def inject_runtime(html: str, config: dict[str, Any]) -> str:
+    data = json.dumps(config, ensure_ascii=False).replace("</", "<\\/")
+    # El CSS del build (Tailwind) no viene en la instantanea: `hidden` tiene que seguir ocultando.
+    tags = (
+        "<style>.hidden{display:none!important}</style>"
+        f'<script>window.__REPLAY__ = {data};</script><script src="{REPLAY_PREFIX}runtime.js"></script>'
+    )
+    idx = html.lower().rfind("</body>")
+    return html + tags if idx < 0 else html[:idx] + tags + html[idx:]
+
+
+class _ReflectionScan(HTMLParser):
+    def __init__(self, marker: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.marker = marker
+        self.text = ""
+        self.videos: list[tuple[dict[str, str], bool]] = []  # (atributos, despues del marcador)
+
+    def handle_starttag(self, tag, attrs) -> None:
+        attrs = {k: v or "" for k, v in attrs}
+        if tag == "iframe" and "ql-video" in attrs.get("class", "").split():
+            self.videos.append((attrs, self.marker in self.text))
+
+    def handle_data(self, data) -> None:
+        self.text += data
+
+
+def check_reflection(html: Optional[str], video_id: str, width: int, height: int, marker: str = "Reflexión del día") -> list[str]:
+    """Problemas del HTML guardado (vacia si la reflexion quedo bien): un solo video, el pedido, tamano y lugar."""
+    if html is None:
+        return ["no_guardado"]
+    scan = _ReflectionScan(marker)
+    scan.feed(html)
+    problems = []
+    if len(scan.videos) != 1:
+        problems.append(f"videos={len(scan.videos)}")
+    for attrs, after_marker in scan.videos[:1]:
+        if video_id not in attrs.get("src", ""):
+            problems.append(f"src={attrs.get('src', '')}")
+        if attrs.get("width") != str(width) or attrs.get("height") != str(height):
+            problems.append(f"tamano={attrs.get('width')}x{attrs.get('height')}")
+        if marker in scan.text and not after_marker:
+            problems.append("antes_del_marcador")
+    return problems
+
+
+# --- importar instantaneas de dump_debug_artifacts --------------------------------------------
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+# Recursos del build de Next.js: en local solo dan 404.
+_NEXT_ASSET_RE = re.compile(r"<link\b[^>]*href=\"/_next/[^\"]*\"[^>]*>", re.IGNORECASE)
+_DEBUG_NAME_RE = re.compile(r"^debug-(?P<label>.+)-\d{8}-\d{6}\.html$")
+
+
+def clean_snapshot(html: str) -> str:
+    """Sin scripts (hidratacion, payloads de Next.js) ni assets del build, y redactado otra vez."""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+    from panel_selenium import _redact_debug_html
+
+    return _redact_debug_html(_NEXT_ASSET_RE.sub("", _SCRIPT_RE.sub("", html)))
+
+
+def import_snapshots(paths: list[str], directory: str) -> list[str]:
+    """Copia los debug-*.html al escenario como `<label>.html`; crea un escenario.json base si falta."""
+    os.makedirs(directory, exist_ok=True)
+    names = []
+    for path in paths:
+        match = _DEBUG_NAME_RE.match(os.path.basename(path))
+        name = (match.group("label") if match else os.path.splitext(os.path.basename(path))[0]) + ".html"
+        with open(path, "r", encoding="utf-8") as f:
+            html = clean_snapshot(f.read())
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(html)
+        names.append(name)
+    scenario_path = os.path.join(directory, SCENARIO_FILE)
+    if not os.path.exists(scenario_path):
+        skeleton = {
+            "descripcion": "Importado de dump_debug_artifacts: completar rutas y transiciones.",
+            "paginas": {},
+            "transiciones": {name: [] for name in names},
+            "pasos_esperados": [],
+        }
+        with open(scenario_path, "w", encoding="utf-8") as f:
+            json.dump(skeleton, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    return names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay offline del panel de Dios Hoy.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    serve = sub.add_parser("servir", help="Servir un escenario para recorrerlo a mano")
+    serve.add_argument("escenario")
+    serve.add_argument("--port", type=int, default=8766)
+    serve.add_argument("--username", default="bench")
+    serve.add_argument("--password", default="bench")
+    serve.add_argument("--latency", type=float, default=0.0, help="Segundos de espera por request")
+    imp = sub.add_parser("importar", help="Agregar debug-*.html (dump_debug_artifacts) a un escenario")
+    imp.add_argument("html", nargs="+")
+    imp.add_argument("--escenario", required=True, help="Directorio del escenario")
+    args = parser.parse_args()
+
+    if args.cmd == "importar":
+        for name in import_snapshots(args.html, args.escenario):
+            print(f"instantanea {os.path.join(args.escenario, name)}")
+        return 0
+    scenario = Scenario.load(args.escenario)
+    with ReplayServer(scenario, args.username, args.password, args.latency, args.port) as srv:
+        print(f"DIOCESIS_PANEL_BASE={srv.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        for t, kind, name in srv.timeline():
+            print(f"{t:>9.1f}ms {kind:<7} {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+"""
+Servidor HTTP local que imita el panel de Dios Hoy (admin.diocesisdeneiva.org): login estilo
+NextAuth, las paginas que recorre `panel_selenium.py` y los endpoints JSON que usa `panel_http.py`.
+
+Solo para benchmarks/pruebas locales. Con DIOCESIS_PANEL_BASE apuntando a `srv.base_url` los dos
+transportes corren contra el mismo estado:
+- /api/auth/csrf, /api/auth/callback/credentials (form), /api/auth/session.
+- /auth/login, /dashboard, /espiritualidad/dios-hoy (calendario), .../{fecha}/evangelios-y-santo
+  (evangelio actual -> "Editar reflexión" -> editor con barra, dialogo de video y Guardar).
+- GET /api/dios-hoy?fecha=YYYY-MM-DD y PATCH /api/dios-hoy/{id} con {"reflexion": html}.
+
+Las paginas y la API exigen la cookie de sesion (HTML: 302 a /auth/login; API: 401). `latency`
+agrega una espera por request para simular la red; `counts` cuenta requests por ruta.
+
+Uso:
+  with PanelServer(username="bench", password="bench") as srv:
+      os.environ["DIOCESIS_PANEL_BASE"] = srv.base_url
+  python3 benchmarks/panel_server.py --port 8765   # para recorrerlo a mano
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import re
+import secrets
+import threading
+import time
+from calendar import monthrange
+from collections import Counter
+from datetime import date
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+from fixture_server import _QuietServer
+
+SESSION_COOKIE = "next-auth.session-token"
+CSRF_COOKIE = "next-auth.csrf-token"
+DEFAULT_REFLECTION = (
+    "<h2>Reflexión del día</h2>"
+    "<p>En aquel tiempo, Jesús recorría los pueblos enseñando en las sinagogas y anunciando el Evangelio "
+    "del Reino.</p>"
+)
+
+PAGE = """<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>{title}</title>
+<style>.hidden{{display:none}} button{{min-width:24px;min-height:24px}}</style></head>
+<body>
+<aside><nav><a href="/dashboard">Inicio</a> <a href="/espiritualidad/dios-hoy">Dios Hoy</a>
+<a href="/espiritualidad/evangelios">Evangelios</a></nav></aside>
+<main>{main}</main>
+<script>{script}</script>
+</body></html>
+"""
+
+LOGIN_MAIN = """
+<form method="post" action="/api/auth/callback/credentials">
+<input type="hidden" name="csrfToken" value="{csrf}">
+<input type="hidden" name="callbackUrl" value="{callback}">
+<input id="email" name="email" type="email"> <input id="password" name="password" type="password">
+<button type="submit">Ingresar</button>
+</form>
+"""
+
+CALENDAR_SCRIPT = """
+document.querySelectorAll('button[data-dia]').forEach((b) => b.addEventListener('click', () => {
+  const link = document.getElementById('dia');
+  link.href = '/espiritualidad/dios-hoy/' + b.dataset.dia + '/evangelios-y-santo';
+  link.classList.remove('hidden');
+}));
+"""
+
+EDITOR_MAIN = """
+<section><h2>Evangelios actuales</h2><div><button type="button" id="evangelio">{evangelio}</button></div></section>
+<button type="button" id="editar" disabled class="text-gray-400"><span>Editar reflexión</span></button>
+<form id="form" class="hidden">
+<div class="toolbar"><button type="button" class="ql-bold"></button><span role="button" class="ql-link"></span>
+<button type="button" class="ql-video"></button></div>
+<div class="ql-editor" contenteditable="true">{reflexion}</div>
+<div role="dialog" id="dialogo" class="hidden"><input type="url" placeholder="Embed URL">
+<button type="submit" id="ok">Insertar</button></div>
+<button type="submit" id="guardar">Guardar</button>
+</form>
+"""
+
+EDITOR_SCRIPT = """
+const id = %(id)s;
+const editor = document.querySelector('[contenteditable]');
+const dialog = document.getElementById('dialogo');
+const input = dialog.querySelector('input');
+let range = null;
+document.getElementById('evangelio').addEventListener('click', () => {
+  const edit = document.getElementById('editar');
+  edit.disabled = false;
+  edit.classList.remove('text-gray-400');
+});
+document.getElementById('editar').addEventListener('click', () => {
+  document.getElementById('form').classList.remove('hidden');
+});
+document.querySelector('.ql-video').addEventListener('click', () => {
+  // Como Quill: el video va donde estaba el cursor del editor al abrir el dialogo.
+  const sel = window.getSelection();
+  range = sel.rangeCount && editor.contains(sel.getRangeAt(0).startContainer) ? sel.getRangeAt(0).cloneRange() : null;
+  dialog.classList.remove('hidden');
+  input.focus();
+});
+function insertVideo() {
+  const iframe = document.createElement('iframe');
+  iframe.className = 'ql-video';
+  iframe.setAttribute('frameborder', '0');
+  iframe.setAttribute('allowfullscreen', 'true');
+  iframe.setAttribute('src', input.value);
+  if (range) {
+    range.insertNode(iframe);
+  } else {
+    editor.appendChild(iframe);
+  }
+  input.value = '';
+  dialog.classList.add('hidden');
+}
+input.addEventListener('keydown', (e) => {
+  if (e.key === 'Enter') { e.preventDefault(); insertVideo(); }
+});
+document.getElementById('ok').addEventListener('click', (e) => { e.preventDefault(); insertVideo(); });
+document.getElementById('form').addEventListener('submit', async (e) => {
+  e.preventDefault();
+  const resp = await fetch('/api/dios-hoy/' + id, {
+    method: 'PATCH',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify({reflexion: editor.innerHTML}),
+  });
+  document.body.dataset.guardado = String(resp.ok);
+  if (resp.ok) {
+    // Aviso tipo toast, como el del panel (lo espera el modo por lotes antes de cambiar de dia).
+    const toast = document.createElement('div');
+    toast.setAttribute('role', 'status');
+    toast.textContent = 'Reflexión guardada';
+    document.body.appendChild(toast);
+  }
+});
+"""
+
+
+class PanelServer:
+    """Context manager: levanta el doble del panel en 127.0.0.1 (puerto libre salvo que se indique)."""
+
+    def __init__(
+        self,
+        username: str = "bench",
+        password: str = "bench",
+        latency: float = 0.0,
+        port: int = 0,
+        reflection: str = DEFAULT_REFLECTION,
+    ) -> None:
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.default_reflection = reflection
+        self.days: dict[str, dict] = {}
+        self.sessions: set[str] = set()
+        self.counts: Counter = Counter()
+        self.logins = 0
+        self.updates = 0
+        self._lock = threading.Lock()
+        self._server = _QuietServer(("127.0.0.1", port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def day(self, iso_date: str) -> dict:
+        with self._lock:
+            if iso_date not in self.days:
+                self.days[iso_date] = {
+                    "id": date.fromisoformat(iso_date).toordinal(),
+                    "fecha": iso_date,
+                    "reflexion": self.default_reflection,
+                }
+            return self.days[iso_date]
+
+    def day_by_id(self, day_id: int):
+        with self._lock:
+            return next((d for d in self.days.values() if d["id"] == day_id), None)
+
+    def take_counts(self) -> Counter:
+        with self._lock:
+            out, self.counts = self.counts, Counter()
+        return out
+
+    def _handler(self):
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            # --- helpers ---------------------------------------------------------------------
+            def _cookies(self) -> dict[str, str]:
+                jar = SimpleCookie()
+                try:
+                    jar.load(self.headers.get("Cookie", ""))
+                except Exception:
+                    return {}
+                return {k: m.value for k, m in jar.items()}
+
+            def _authed(self) -> bool:
+                with srv._lock:
+                    return self._cookies().get(SESSION_COOKIE) in srv.sessions
+
+            def _reply(self, status: int, body: bytes = b"", ctype: str = "text/html; charset=utf-8", headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, status: int, payload, headers=()) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self._reply(status, body, "application/json; charset=utf-8", headers)
+
+            def _redirect(self, location: str, headers=()) -> None:
+                self._reply(302, b"", headers=(("Location", location), *headers))
+
+            def _page(self, title: str, main: str, script: str = "") -> None:
+                self._reply(200, PAGE.format(title=title, main=main, script=script).encode("utf-8"))
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+            def _route(self, method: str) -> None:
+                parts = urlsplit(self.path)
+                # Rutas agrupadas para los contadores (sin fecha ni id).
+                key = re.sub(r"/\d{4}-\d{2}-\d{2}/", "/{fecha}/", re.sub(r"/\d+$", "/{id}", parts.path))
+                with srv._lock:
+                    srv.counts[f"{method} {key}"] += 1
+                if srv.latency:
+                    time.sleep(srv.latency)
+                handler = getattr(self, "_" + method.lower() + "_" + _slug(parts.path), None)
+                if handler is None:
+                    self._reply(404, b"<title>404: This page could not be found.</title>This page could not be found")
+                    return
+                handler(parts.path, parse_qs(parts.query))
+
+            def do_GET(self) -> None:
+                self._route("GET")
+
+            def do_POST(self) -> None:
+                self._route("POST")
+
+            def do_PATCH(self) -> None:
+                self._route("PATCH")
+
+            def do_PUT(self) -> None:
+                self._route("PATCH")
+
+            # --- auth ------------------------------------------------------------------------
+            def _get_api_auth_csrf(self, path, query) -> None:
+                token = self._cookies().get(CSRF_COOKIE) or secrets.token_hex(16)
+                self._json(200, {"csrfToken": token}, (("Set-Cookie", f"{CSRF_COOKIE}={token}; Path=/; HttpOnly"),))
+
+            def _post_api_auth_callback_credentials(self, path, query) -> None:
+                form = {k: v[0] for k, v in parse_qs(self._body().decode("utf-8")).items()}
+                wants_json = form.get("json") == "true"
+                ok = (
+                    form.get("csrfToken")
+                    and form.get("csrfToken") == self._cookies().get(CSRF_COOKIE)
+                    and form.get("email") == srv.username
+                    and form.get("password") == srv.password
+                )
+                if not ok:
+                    if wants_json:
+                        self._json(401, {"url": "/auth/login?error=CredentialsSignin"})
+                    else:
+                        self._redirect("/auth/login?error=CredentialsSignin")
+                    return
+                token = secrets.token_hex(24)
+                with srv._lock:
+                    srv.sessions.add(token)
+                    srv.logins += 1
+                cookie = (("Set-Cookie", f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"),)
+                callback = form.get("callbackUrl") or "/dashboard"
+                if wants_json:
+                    self._json(200, {"url": callback}, cookie)
+                else:
+                    self._redirect(callback, cookie)
+
+            def _get_api_auth_session(self, path, query) -> None:
+                self._json(200, {"user": {"email": srv.username}} if self._authed() else {})
+
+            # --- paginas ---------------------------------------------------------------------
+            def _get_auth_login(self, path, query) -> None:
+                token = self._cookies().get(CSRF_COOKIE) or secrets.token_hex(16)
+                callback = html.escape((query.get("callbackUrl") or ["/dashboard"])[0])
+                body = PAGE.format(title="Iniciar sesion", main=LOGIN_MAIN.format(csrf=token, callback=callback), script="")
+                self._reply(200, body.encode("utf-8"), headers=(("Set-Cookie", f"{CSRF_COOKIE}={token}; Path=/"),))
+
+            def _need_session(self) -> bool:
+                if self._authed():
+                    return True
+                self._redirect("/auth/login?callbackUrl=" + self.path.replace("/", "%2F"))
+                return False
+
+            def _get_dashboard(self, path, query) -> None:
+                if self._need_session():
+                    self._page("Dashboard", "<h1>Dashboard</h1>")
+
+            def _get_espiritualidad_dios_hoy(self, path, query) -> None:
+                if not self._need_session():
+                    return
+                today = date.today()
+                buttons = "".join(
+                    f'<button type="button" data-dia="{today.replace(day=d).isoformat()}">{d}</button>'
+                    for d in range(1, monthrange(today.year, today.month)[1] + 1)
+                )
+                main = (
+                    f"<h1>Dios Hoy</h1><div class='calendario'>{buttons}</div>"
+                    "<a id='dia' class='hidden' href='#'>Evangelio y santo</a>"
+                )
+                self._page("Dios Hoy", main, CALENDAR_SCRIPT)
+
+            def _get_evangelios_y_santo(self, path, query) -> None:
+                if not self._need_session():
+                    return
+                iso_date = path.split("/")[3]
+                try:
+                    day = srv.day(iso_date)
+                except ValueError:
+                    self._reply(404, b"<title>404</title>This page could not be found")
+                    return
+                main = EDITOR_MAIN.format(evangelio="Mc 6,30-34", reflexion=day["reflexion"])
+                self._page("Evangelio y santo", main, EDITOR_SCRIPT % {"id": day["id"]})
+
+            # --- API -------------------------------------------------------------------------
+            def _get_api_dios_hoy(self, path, query) -> None:
+                if not self._authed():
+                    self._json(401, {"error": "unauthorized"})
+                    return
+                try:
+                    day = srv.day((query.get("fecha") or [""])[0])
+                except ValueError:
+                    self._json(400, {"error": "fecha invalida"})
+                    return
+                self._json(200, {"data": dict(day)})
+
+            def _patch_api_dios_hoy_id(self, path, query) -> None:
+                if not self._authed():
+                    self._json(401, {"error": "unauthorized"})
+                    return
+                day = srv.day_by_id(int(path.rsplit("/", 1)[1]))
+                try:
+                    payload = json.loads(self._body().decode("utf-8"))
+                except ValueError:
+                    payload = None
+                if day is None or not isinstance(payload, dict) or not isinstance(payload.get("reflexion"), str):
+                    self._json(404 if day is None else 400, {"error": "solicitud invalida"})
+                    return
+                with srv._lock:
+                    day["reflexion"] = payload["reflexion"]
+                    srv.updates += 1
+                self._json(200, {"data": dict(day)})
+
+        return Handler
+
+    def __enter__(self) -> "PanelServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _slug(path: str) -> str:
+    if re.fullmatch(r"/espiritualidad/dios-hoy/\d{4}-\d{2}-\d{2}/evangelios-y-santo", path):
+        return "evangelios_y_santo"
+    if re.fullmatch(r"/api/dios-hoy/\d+", path):
+        return "api_dios_hoy_id"
+    return re.sub(r"[^a-z0-9]+", "_", path.strip("/").lower())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Doble local del panel de Dios Hoy.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--username", default="bench")
+    parser.add_argument("--password", default="bench")
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos de espera por request")
+    args = parser.parse_args()
+    with PanelServer(args.username, args.password, args.latency, args.port) as srv:
+        print(f"DIOCESIS_PANEL_BASE={srv.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
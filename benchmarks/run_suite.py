@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+"""
+Suite offline de benchmarks de los caminos calientes de scraping, sobre fixtures guardados.
+
+Fixtures (benchmarks/fixtures/):
+- cec/feed.xml y cec/*.html: RSS "Evangelio diario" y articulos de la CEC.
+- youtube/feed.xml: feed Atom del canal (titulos con emojis y letras estilizadas).
+- ordo/lecturas-*.html: DOM de "Lecturas del dia" (guardados con `ordo_lecturas_selenium.py --save-dom`).
+- ordo/lecturas-*.json: respuesta JSON de lecturas del mismo dia (modo `--capture xhr`).
+
+Casos:
+- cec.extract_target_date_from_title: todos los titulos del RSS.
+- cec.extract_schema_text_div / cec.html_to_text: todos los articulos.
+- youtube.feedparser_parse: parseo del feed Atom.
+- youtube.normalize_titles / youtube.select_video_entry: la seleccion de `get_latest_video_url`.
+- ordo.extract_lecturas_html: equivalente offline de `_extract_lecturas` sobre los snapshots.
+- ordo.sections_from_json: `json.loads` + `ordo_xhr.sections_from_json` sobre las respuestas capturadas.
+
+Cada caso se calibra para durar al menos --min-time por repeticion; se reporta el mejor y la mediana
+por llamada (una llamada = todo el fixture del caso). Con --json se escribe el resultado y con
+--baseline se compara contra una corrida anterior: sale con codigo 1 si algun caso es mas lento que
+--max-slowdown veces la mediana de referencia.
+
+Uso:
+  python3 benchmarks/run_suite.py --json /tmp/bench.json
+  python3 benchmarks/run_suite.py --baseline /tmp/bench.json --max-slowdown 1.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from cec_evangelio_scraper import (  # noqa: E402
+    _extract_schema_text_div,
+    _extract_target_date_from_title,
+    _html_to_text,
+    _iter_feed_items,
+)
+from ordo_dom import extract_lecturas_html  # noqa: E402
+from ordo_xhr import sections_from_json  # noqa: E402
+from youtube_feed import normalize_title, parse_csv_tokens, select_video_entry  # noqa: E402
+
+try:
+    import feedparser  # type: ignore
+except Exception:  # pragma: no cover
+    feedparser = None
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SUITE_NAME = "scraping-hot-paths"
+# Mismo patron que usa el workflow (DIOCESIS_VIDEO_TITLE_REGEX).
+VIDEO_TITLE_REGEX = r"gotitas\s+de\s+esperanza"
+
+
+@dataclass
+class Case:
+    name: str
+    fn: Callable[[], Any]
+    items: int  # unidades procesadas por llamada (titulos, paginas, entradas...)
+
+
+@dataclass
+class CaseResult:
+    name: str
+    items: int
+    loops: int
+    best_us: float
+    median_us: float
+    per_item_us: float
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _fixture_paths(pattern: str) -> list[str]:
+    paths = sorted(glob.glob(os.path.join(FIXTURES, pattern)))
+    if not paths:
+        raise SystemExit(f"Falta fixture: {pattern} en {FIXTURES}")
+    return paths
+
+
+def build_cases() -> tuple[list[Case], list[str]]:
+    """Devuelve (casos, omitidos). Tambien valida que cada fixture produzca un resultado util."""
+    cases: list[Case] = []
+    skipped: list[str] = []
+
+    feed_bytes = _read(_fixture_paths("cec/feed.xml")[0])
+    titles = [title for title, _, _ in _iter_feed_items(io.BytesIO(feed_bytes))]
+    if not all(_extract_target_date_from_title(t, 2026) for t in titles):
+        raise SystemExit("cec/feed.xml: hay titulos sin fecha reconocible")
+    cases.append(
+        Case("cec.extract_target_date_from_title", lambda: [_extract_target_date_from_title(t, 2026) for t in titles], len(titles))
+    )
+
+    articles = [_read(p) for p in _fixture_paths("cec/*.html")]
+    blocks = [_extract_schema_text_div(a) for a in articles]
+    if not all(blocks):
+        raise SystemExit("cec/*.html: articulo sin bloque schema:text")
+    cases.append(Case("cec.extract_schema_text_div", lambda: [_extract_schema_text_div(a) for a in articles], len(articles)))
+    cases.append(Case("cec.html_to_text", lambda: [_html_to_text(b) for b in blocks], len(blocks)))
+
+    if feedparser is None:
+        skipped.append("youtube.* (feedparser no instalado)")
+    else:
+        atom = _read(_fixture_paths("youtube/feed.xml")[0])
+        entries = feedparser.parse(atom).entries
+        title_re = re.compile(VIDEO_TITLE_REGEX, re.IGNORECASE)
+        forbidden = parse_csv_tokens("en vivo, rosario")
+        _, matched = select_video_entry(entries, title_re, (), forbidden)
+        if not matched:
+            raise SystemExit("youtube/feed.xml: ninguna entrada coincide con el patron de titulo")
+        entry_titles = [e.title for e in entries]
+        cases.append(Case("youtube.feedparser_parse", lambda: feedparser.parse(atom), 1))
+        cases.append(Case("youtube.normalize_titles", lambda: [normalize_title(t) for t in entry_titles], len(entry_titles)))
+        cases.append(
+            Case("youtube.select_video_entry", lambda: select_video_entry(entries, title_re, (), forbidden), len(entries))
+        )
+
+    doms = [_read(p).decode("utf-8") for p in _fixture_paths("ordo/lecturas-*.html")]
+    if not all(extract_lecturas_html(d)[1].get("Evangelio") for d in doms):
+        raise SystemExit("ordo/lecturas-*.html: snapshot sin seccion Evangelio")
+    cases.append(Case("ordo.extract_lecturas_html", lambda: [extract_lecturas_html(d) for d in doms], len(doms)))
+
+    bodies = [(_read(p), os.path.basename(p)[len("lecturas-") : -len(".json")]) for p in _fixture_paths("ordo/lecturas-*.json")]
+    if not all((sections_from_json(json.loads(b), iso) or ("", {}))[1].get("Evangelio") for b, iso in bodies):
+        raise SystemExit("ordo/lecturas-*.json: respuesta sin seccion Evangelio")
+    cases.append(
+        Case("ordo.sections_from_json", lambda: [sections_from_json(json.loads(b), iso) for b, iso in bodies], len(bodies))
+    )
+
+    return cases, skipped
+
+
+def _calibrate(fn: Callable[[], Any], min_time: float) -> int:
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t0 >= min_time:
+            return loops
+        loops *= 2
+
+
+def run_case(case: Case, repeat: int, min_time: float) -> CaseResult:
+    loops = _calibrate(case.fn, min_time)
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            case.fn()
+        samples.append((time.perf_counter() - t0) / loops * 1e6)
+    median = statistics.median(samples)
+    return CaseResult(
+        name=case.name,
+        items=case.items,
+        loops=loops,
+        best_us=round(min(samples), 3),
+        median_us=round(median, 3),
+        per_item_us=round(median / max(1, case.items), 3),
+    )
+
+
+def compare(results: list[CaseResult], baseline: dict[str, Any], max_slowdown: float) -> list[str]:
+    """Lineas de regresion (vacia si todo esta dentro del margen)."""
+    reference = {r["name"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        ref = reference.get(r.name)
+        if not ref or not ref.get("median_us"):
+            continue
+        ratio = r.median_us / ref["median_us"]
+        if ratio > max_slowdown:
+            regressions.append(f"{r.name}: {ref['median_us']:.1f}us -> {r.median_us:.1f}us (x{ratio:.2f})")
+    return regressions
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmarks offline de parseo (CEC, YouTube, Ordo).")
+    ap.add_argument("--repeat", type=int, default=5, help="Repeticiones por caso (se reporta la mediana)")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Segundos minimos por repeticion")
+    ap.add_argument("--filter", default=None, help="Regex: solo casos cuyo nombre coincida")
+    ap.add_argument("--json", default=None, help="Ruta donde escribir los resultados en JSON ('-' = stdout)")
+    ap.add_argument("--baseline", default=None, help="JSON de una corrida anterior para comparar")
+    ap.add_argument("--max-slowdown", type=float, default=1.25, help="Factor tolerado frente al baseline")
+    args = ap.parse_args()
+
+    cases, skipped = build_cases()
+    if args.filter:
+        pattern = re.compile(args.filter)
+        cases = [c for c in cases if pattern.search(c.name)]
+
+    results: list[CaseResult] = []
+    log = sys.stderr if args.json == "-" else sys.stdout
+    print(f"{'caso':<36} {'items':>5} {'mediana_us':>12} {'mejor_us':>12} {'us/item':>10}", file=log)
+    for case in cases:
+        r = run_case(case, max(1, args.repeat), args.min_time)
+        results.append(r)
+        print(f"{r.name:<36} {r.items:>5} {r.median_us:>12.1f} {r.best_us:>12.1f} {r.per_item_us:>10.1f}", file=log)
+    for note in skipped:
+        print(f"omitido: {note}", file=log)
+
+    payload = {
+        "suite": SUITE_NAME,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "min_time": args.min_time,
+        "skipped": skipped,
+        "results": [asdict(r) for r in results],
+    }
+    if args.json == "-":
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_slowdown)
+        for line in regressions:
+            print(f"REGRESION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,148 +1,105 @@
+import argparse
 import os
-import ssl
 import re
 import time
-import certifi
-import feedparser
+
+# Inicio del proceso: la duracion de una corrida sin cambios se mide desde aqui.
+_T0 = time.perf_counter()
+
 import logging
 from logging.handlers import TimedRotatingFileHandler
-from datetime import datetime
-from urllib.parse import parse_qs, urlparse, urljoin, urlsplit, urlunsplit
+from datetime import date, datetime
+from urllib.parse import parse_qs, urlparse
 import sys
-import unicodedata
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from urllib3.exceptions import MaxRetryError, ReadTimeoutError
-
-# 1. Cargar credenciales y URLs desde variables de entorno
-USERNAME = os.getenv("DIOCESIS_USERNAME")
-PASSWORD = os.getenv("DIOCESIS_PASSWORD")
-LOGIN_URL = "https://admin.diocesisdeneiva.org/auth/login?callbackUrl=%2Fdashboard"
-DIOS_HOY_URL = "https://admin.diocesisdeneiva.org/espiritualidad/dios-hoy"
-YOUTUBE_FEED = "https://www.youtube.com/feeds/videos.xml?channel_id=UCydLv78Ybqcg2y74FR2VYIw"
-DEFAULT_TIMEOUT = int(os.getenv("DIOCESIS_TIMEOUT", "15"))
-PAGE_LOAD_TIMEOUT = int(os.getenv("DIOCESIS_PAGE_LOAD_TIMEOUT", "90"))
-PAGE_LOAD_STRATEGY = os.getenv("DIOCESIS_PAGE_LOAD_STRATEGY", "eager").strip().lower()
-GET_RETRIES = int(os.getenv("DIOCESIS_GET_RETRIES", "2"))
-GET_RETRY_WAIT = float(os.getenv("DIOCESIS_GET_RETRY_WAIT", "3"))
-LOGIN_TIMEOUT = int(os.getenv("DIOCESIS_LOGIN_TIMEOUT", "45"))
-EVANGELIO_TIMEOUT = int(os.getenv("DIOCESIS_EVANGELIO_TIMEOUT", "45"))
-EVANGELIO_RETRIES = int(os.getenv("DIOCESIS_EVANGELIO_RETRIES", "1"))
-EVANGELIO_DIRECT_URL = os.getenv(
-    "DIOCESIS_EVANGELIO_URL",
-    "https://admin.diocesisdeneiva.org/espiritualidad/evangelios",
+
+# Modulos compartidos (cliente HTTP, etc.) viven en scripts/.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from batch_days import batch_dates, batch_summary, plan_days, results_table  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from panel_config import (  # noqa: E402
+    FEED_CACHE_DIR,
+    LOG_DIR,
+    LOG_LEVEL,
+    PAGE_LOAD_STRATEGY,
+    PASSWORD,
+    TRACE_DIR,
+    USER_DATA_DIR,
+    USERNAME,
+    VALID_PAGE_LOAD_STRATEGIES,
+    YOUTUBE_FEED,
+    log_phase,
 )
-VIDEO_URL_SELECTOR = os.getenv(
-    "DIOCESIS_VIDEO_URL_SELECTOR",
-    "input[type='url'], input[placeholder*='Embed']",
+from run_state import load_state, save_state, state_path  # noqa: E402
+from run_trace import TRACE  # noqa: E402
+from youtube_feed import (  # noqa: E402
+    FeedParseError,
+    fetch_feed_entries,
+    select_video_entry,
+    title_filters,
+    videos_by_date,
 )
-VIDEO_BUTTON_INDEX = os.getenv("DIOCESIS_VIDEO_BUTTON_INDEX")
-VIDEO_WIDTH = int(os.getenv("DIOCESIS_VIDEO_WIDTH", "840"))
-VIDEO_HEIGHT = int(os.getenv("DIOCESIS_VIDEO_HEIGHT", "472"))
-LOG_DIR = os.getenv("DIOCESIS_LOG_DIR", "/Users/gabops/Downloads/Diocesis/logs")
-LOG_LEVEL = os.getenv("DIOCESIS_LOG_LEVEL", "INFO").upper()
-NAVIGATION_RETRY_EXCEPTIONS = (TimeoutException, WebDriverException, ReadTimeoutError, MaxRetryError, TimeoutError)
-VALID_PAGE_LOAD_STRATEGIES = {"normal", "eager", "none"}
+# Selenium (panel_selenium) se importa en main solo si hace falta.
 
-def get_latest_video_url():
-    """Devuelve la URL del vídeo más reciente del feed.
+_FEED_CACHE = None
 
-    Si hay un patrón de título, intenta elegir el último que coincida.
-    """
-    ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=certifi.where())
-    feed = feedparser.parse(YOUTUBE_FEED)
-    if feed.bozo:
-        raise RuntimeError(f"Error al leer el feed de YouTube: {feed.bozo_exception}")
-    if not feed.entries:
-        raise RuntimeError("El feed de YouTube no tiene entradas.")
+def _feed_cache():
+    global _FEED_CACHE
+    if _FEED_CACHE is None:
+        _FEED_CACHE = HttpCache(FEED_CACHE_DIR)
+    return _FEED_CACHE
 
-    def _norm(text: str) -> str:
-        """Normalize titles to make matching robust across emojis/accents/styled unicode."""
-        if not text:
-            return ""
-        # NFKC helps with compatibility chars (e.g. mathematical bold letters).
-        text = unicodedata.normalize("NFKC", text)
-        # Strip accents.
-        text = unicodedata.normalize("NFKD", text)
-        text = "".join(ch for ch in text if not unicodedata.combining(ch))
-        # Lowercase in a unicode-aware way.
-        text = text.casefold()
-        # Drop punctuation/emojis/symbols; keep alnum and spaces.
-        text = re.sub(r"[^a-z0-9]+", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    def _parse_csv_tokens(raw: str):
-        if not raw:
-            return []
-        parts = [p.strip() for p in raw.split(",")]
-        # Normalize tokens as well so callers can include accents/punctuation.
-        return [_norm(p) for p in parts if _norm(p)]
-
-    def _entry_ts(entry):
-        # Prefer published time; fallback to updated.
-        for attr in ("published_parsed", "updated_parsed"):
-            value = getattr(entry, attr, None)
-            if value:
-                try:
-                    return time.mktime(value)
-                except (TypeError, OverflowError, OSError, ValueError):
-                    pass
-        return None
-
-    title_pattern = os.getenv("DIOCESIS_VIDEO_TITLE_REGEX", r"gotitas\\s+de\\s+esperanza")
+def fetch_feed(logger):
+    """Entradas del feed de YouTube (no vacio); RuntimeError si no se puede leer."""
+    # Cliente compartido (SSL/certifi y gzip) con GET condicional: si el feed no cambio (304 o mismo
+    # cuerpo) se reutilizan las entradas ya parseadas, en memoria o en la cache de disco.
     try:
-        title_re = re.compile(title_pattern, re.IGNORECASE)
-    except re.error as exc:
-        raise RuntimeError("DIOCESIS_VIDEO_TITLE_REGEX invalido.") from exc
+        with TRACE.span("feed_youtube") as span:
+            fetch = fetch_feed_entries(YOUTUBE_FEED, cache=_feed_cache())
+            span.set(http_status=fetch.status, parseado=fetch.parsed)
+    except FeedParseError as exc:
+        raise RuntimeError(f"Error al leer el feed de YouTube: {exc}") from exc
+    except Exception as exc:
+        raise RuntimeError(f"Error al descargar el feed de YouTube: {exc}") from exc
+    logger.info("feed_youtube %s", fetch.summary())
+    if not fetch.entries:
+        raise RuntimeError("El feed de YouTube no tiene entradas.")
+    return fetch.entries
 
+def video_title_filters():
+    """(patron, regex, tokens requeridos, tokens prohibidos) de la configuracion."""
+    title_pattern = os.getenv("DIOCESIS_VIDEO_TITLE_REGEX", r"gotitas\s+de\s+esperanza")
     # Optional stable matching knobs:
     # - DIOCESIS_VIDEO_TITLE_REQUIRE: CSV tokens that must all be present.
     # - DIOCESIS_VIDEO_TITLE_FORBID: CSV tokens that must NOT be present.
-    required_tokens = _parse_csv_tokens(os.getenv("DIOCESIS_VIDEO_TITLE_REQUIRE", ""))
-    forbidden_tokens = _parse_csv_tokens(os.getenv("DIOCESIS_VIDEO_TITLE_FORBID", ""))
-
-    logger = logging.getLogger("diocesis")
-    chosen = None
-    # Sort by published/updated time to avoid relying on feed order.
-    indexed = []
-    for idx, entry in enumerate(feed.entries):
-        ts = _entry_ts(entry)
-        indexed.append((ts if ts is not None else -1, -idx, entry))
-    indexed.sort(reverse=True)
-    sorted_entries = [entry for _, __, entry in indexed]
-
-    for entry in sorted_entries:
-        title = getattr(entry, "title", "") or ""
-        normalized = _norm(title)
-        if required_tokens and not all(tok in normalized for tok in required_tokens):
-            continue
-        if forbidden_tokens and any(tok in normalized for tok in forbidden_tokens):
-            continue
-        if title_re.search(normalized):
-            chosen = entry
-            logger.info(
-                "video_seleccionado titulo=%s require=%s forbid=%s regex=%s",
-                title,
-                required_tokens,
-                forbidden_tokens,
-                title_pattern,
-            )
-            break
-    if chosen is None:
-        chosen = sorted_entries[0]
-        title = getattr(chosen, "title", "") or ""
-        logger.info(
-            "video_seleccionado_fallback titulo=%s require=%s forbid=%s regex=%s",
-            title,
-            required_tokens,
-            forbidden_tokens,
+    try:
+        title_re, required_tokens, forbidden_tokens = title_filters(
             title_pattern,
+            os.getenv("DIOCESIS_VIDEO_TITLE_REQUIRE", ""),
+            os.getenv("DIOCESIS_VIDEO_TITLE_FORBID", ""),
         )
+    except re.error as exc:
+        raise RuntimeError("DIOCESIS_VIDEO_TITLE_REGEX invalido.") from exc
+    return title_pattern, title_re, required_tokens, forbidden_tokens
+
+def get_latest_video_url():
+    """Devuelve la URL del vídeo más reciente del feed.
+
+    Si hay un patrón de título, intenta elegir el último que coincida.
+    """
+    logger = logging.getLogger("diocesis")
+    entries = fetch_feed(logger)
+    title_pattern, title_re, required_tokens, forbidden_tokens = video_title_filters()
+
+    # Ordena por published/updated (no depende del orden del feed) y cae en la mas reciente.
+    chosen, matched = select_video_entry(entries, title_re, required_tokens, forbidden_tokens)
+    logger.info(
+        "%s titulo=%s require=%s forbid=%s regex=%s",
+        "video_seleccionado" if matched else "video_seleccionado_fallback",
+        getattr(chosen, "title", "") or "",
+        list(required_tokens),
+        list(forbidden_tokens),
+        title_pattern,
+    )
 
     if not getattr(chosen, "link", None):
         raise RuntimeError("La entrada mas reciente no tiene enlace.")
@@ -216,647 +173,67 @@ class RedactFilter(logging.Filter):
         record.args = ()
         return True
 
-def log_phase(logger, message):
-    logger.info("fase=%s", message)
-
-def _redact_debug_html(html):
-    if not html:
-        return html
-    # Avoid leaking session/JWT tokens or similar secrets in uploaded artifacts.
-    html = re.sub(r'"token"\s*:\s*"[^"]+"', '"token":"***"', html)
-    html = re.sub(r'eyJ[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+', '***', html)
-    # Basic PII redaction (best-effort).
-    html = re.sub(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', '***@***', html)
-    html = re.sub(r'\b\d{7,}\b', '***', html)
-    return html
-
-def dump_debug_artifacts(driver, logger, label):
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    safe_label = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in label)
-    base = os.path.join(LOG_DIR, f"debug-{safe_label}-{timestamp}")
-    try:
-        driver.save_screenshot(f"{base}.png")
-    except WebDriverException as exc:
-        logger.warning("no_se_pudo_guardar_screenshot error=%s", exc)
-    try:
-        with open(f"{base}.html", "w", encoding="utf-8") as handle:
-            handle.write(_redact_debug_html(driver.page_source or ""))
-    except OSError as exc:
-        logger.warning("no_se_pudo_guardar_html error=%s", exc)
 
-def _navigation_reached_target(driver, target_url):
-    try:
-        current_url = driver.current_url
-    except WebDriverException:
-        return False, ""
-    if not current_url or current_url.startswith("about:"):
-        return False, current_url
-    try:
-        current = urlsplit(current_url)
-        target = urlsplit(target_url)
-    except ValueError:
-        return False, current_url
-    current_path = current.path.rstrip("/") or "/"
-    target_path = target.path.rstrip("/") or "/"
-    return (
-        current.scheme in {"http", "https"}
-        and current.netloc == target.netloc
-        and current_path == target_path
-    ), current_url
-
-def safe_get(driver, url, logger, label=None):
-    max_attempts = max(1, GET_RETRIES + 1)
-    for attempt in range(1, max_attempts + 1):
-        try:
-            logger.info("navegar url=%s intento=%s", label or url, attempt)
-            driver.get(url)
-            return
-        except NAVIGATION_RETRY_EXCEPTIONS as exc:
-            logger.warning(
-                "navegacion_fallo url=%s intento=%s/%s error=%s",
-                label or url,
-                attempt,
-                max_attempts,
-                type(exc).__name__,
-            )
-            try:
-                driver.execute_script("window.stop();")
-            except Exception:
-                pass
-            reached, current_url = _navigation_reached_target(driver, url)
-            if reached:
-                logger.warning(
-                    "navegacion_timeout_continuando url=%s intento=%s/%s current_url=%s",
-                    label or url,
-                    attempt,
-                    max_attempts,
-                    current_url,
-                )
-                return
-            if attempt >= max_attempts:
-                raise
-            time.sleep(GET_RETRY_WAIT)
-
-def safe_click(driver, element):
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-    try:
-        element.click()
-    except WebDriverException:
-        driver.execute_script("arguments[0].click();", element)
-
-def do_login(driver, wait, logger):
-    safe_get(driver, LOGIN_URL, logger, "login")
-    wait.until(EC.visibility_of_element_located((By.ID, "email"))).send_keys(USERNAME)
-    driver.find_element(By.ID, "password").send_keys(PASSWORD)
-    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-    login_wait = WebDriverWait(driver, LOGIN_TIMEOUT)
-    try:
-        login_wait.until(
-            EC.any_of(
-                EC.url_contains("/dashboard"),
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/espiritualidad']")),
-            )
-        )
-    except TimeoutException as exc:
-        current_url = driver.current_url
-        page_lower = (driver.page_source or "").lower()
-        if "captcha" in page_lower or "recaptcha" in page_lower:
-            logger.warning("posible_captcha_detectado url=%s", current_url)
-        dump_debug_artifacts(driver, logger, "login_timeout")
-        raise RuntimeError(f"No se pudo iniciar sesion en el panel. url={current_url}") from exc
-
-def find_day_button(driver, wait, day):
-    buttons = wait.until(
-        EC.presence_of_all_elements_located((By.XPATH, f"//button[normalize-space()='{day}']"))
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Actualiza la reflexion de Dios Hoy con el video mas reciente.")
+    parser.add_argument(
+        "--user-data-dir",
+        default=USER_DATA_DIR or None,
+        help="Perfil persistente de Chrome (sesion + cache HTTP) entre corridas (env DIOCESIS_USER_DATA_DIR)",
     )
-    for button in buttons:
-        if button.is_displayed() and button.is_enabled():
-            return button
-    raise RuntimeError(f"No se encontro el boton del dia {day}.")
-
-def infer_evangelio_url(driver):
-    """
-    Infer the day-specific 'Evangelio y santo' URL from visible anchors in Dios Hoy.
-
-    Important: do NOT regex page_source; Next.js pages often embed notFound/error payloads and
-    route strings in scripts that are not actually navigable. We only trust real <a href=...>.
-    """
-    anchors = driver.find_elements(By.CSS_SELECTOR, "a[href*='evangelios-y-santo']")
-    candidates = []
-    for a in anchors:
-        try:
-            if not a.is_displayed():
-                continue
-            if a.find_elements(By.XPATH, "ancestor::aside"):
-                continue
-            href = (a.get_attribute("href") or "").strip()
-            if not href:
-                continue
-            candidates.append(href)
-        except WebDriverException:
-            continue
-    for href in candidates:
-        if "dios-hoy" in href:
-            return href
-    return candidates[0] if candidates else None
-
-def _strip_url(url):
-    try:
-        parts = urlsplit(url)
-        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
-    except Exception:
-        return url
-
-def _is_not_found_page(driver):
-    # Avoid false-positives from Next.js serialized payloads in <script>.
-    try:
-        title = (driver.title or "").strip()
-        if title.startswith("404"):
-            return True
-    except WebDriverException:
-        pass
-    try:
-        text = driver.execute_script("return (document.body && document.body.innerText) || ''") or ""
-        text = text.strip()
-        if "This page could not be found" in text:
-            return True
-        if text.startswith("404") and "could not be found" in text:
-            return True
-    except WebDriverException:
-        pass
-    return False
-
-def _wait_for_evangelio_dios_hoy_page(driver, timeout):
-    local_wait = WebDriverWait(driver, timeout)
-    return local_wait.until(
-        EC.any_of(
-            EC.presence_of_element_located((By.XPATH, "//*[normalize-space()='Evangelios actuales']")),
-            EC.presence_of_element_located((By.XPATH, "//*[normalize-space()='Evangelios disponibles']")),
-        )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Abrir el panel aunque el registro local diga que hoy ya se guardo este video",
     )
-
-def wait_for_day_content_hint(driver, timeout=8):
-    try:
-        WebDriverWait(driver, timeout).until(
-            EC.any_of(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "main a[href*='evangelios-y-santo']")),
-                EC.presence_of_element_located((By.XPATH, "//*[not(ancestor::aside)]//*[contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelio') and contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'santo')]")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[contenteditable='true']")),
-            )
-        )
-    except TimeoutException:
-        pass
-
-def _log_candidate_evangelio_links(driver, logger, limit=25):
-    try:
-        links = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-    except WebDriverException:
-        return
-    out = []
-    for a in links:
-        try:
-            if not a.is_displayed():
-                continue
-            if a.find_elements(By.XPATH, "ancestor::aside"):
-                continue
-            href = (a.get_attribute("href") or "").strip()
-            txt = (a.text or "").strip()
-            if not href:
-                continue
-            hay = f"{txt} {href}".lower()
-            if "dios-hoy" not in hay and "evangel" not in hay and "santo" not in hay:
-                continue
-            out.append((txt[:80], _strip_url(href)))
-        except WebDriverException:
-            continue
-        if len(out) >= limit:
-            break
-    if out:
-        logger.info("links_candidatos_evangelio count=%s sample=%s", len(out), out[:10])
-
-def open_evangelio_santo(driver, wait, logger, day):
-    """
-    Open the day-specific 'Evangelio y santo' section from within Dios Hoy.
-
-    Avoids the common false positive: landing on /espiritualidad/evangelios (global list).
-    """
-    start_url_stripped = _strip_url(driver.current_url)
-
-    def _reset_context(tag):
-        logger.info("reset_contexto_dios_hoy intento=%s", tag)
-        safe_get(driver, DIOS_HOY_URL, logger, f"dios_hoy_reset_{tag}")
-        day_button = find_day_button(driver, wait, day)
-        safe_click(driver, day_button)
-        wait_for_day_content_hint(driver)
-
-    inferred = infer_evangelio_url(driver)
-    if inferred:
-        target = inferred
-        if target.startswith("/"):
-            target = urljoin(DIOS_HOY_URL, target)
-
-        targets = [target]
-        # Heuristic fallbacks: some installations expose different subroutes.
-        if "/evangelios-y-santo/evangelium" in target:
-            base = target.replace("/evangelios-y-santo/evangelium", "/evangelios-y-santo")
-            targets = [
-                base,
-                base + "/evangelios",
-                base + "/evangelio",
-                target,
-            ]
-
-        opened = False
-        for t in targets:
-            logger.info("evangelio_url_inferida url=%s", _strip_url(t))
-            safe_get(driver, t, logger, "evangelio_santo_inferida")
-            if _is_not_found_page(driver):
-                logger.warning("evangelio_url_inferida_404 url=%s", _strip_url(driver.current_url))
-                continue
-            try:
-                _wait_for_evangelio_dios_hoy_page(driver, EVANGELIO_TIMEOUT)
-                opened = True
-                break
-            except TimeoutException:
-                logger.warning("no_se_confirmo_evangelio intento=inferida url=%s", _strip_url(driver.current_url))
-                continue
-
-        if not opened:
-            _reset_context("inferida_fallida")
-
-        else:
-            cur = _strip_url(driver.current_url)
-            if "/espiritualidad/evangelios" in cur and "dios-hoy" not in cur:
-                logger.warning(
-                    "pagina_incorrecta_evangelios_listado intento=inferida url=%s start_url=%s",
-                    cur,
-                    start_url_stripped,
-                )
-                _reset_context("inferida_wrong_page")
-            else:
-                return
-
-    candidates = [
-        (By.CSS_SELECTOR, "main a[href*='evangelios-y-santo']"),
-        (By.XPATH, "//main//a[contains(@href,'dios-hoy') and contains(@href,'evangelios-y-santo') and not(ancestor::aside)]"),
-        (By.XPATH, "//main//a[contains(@href,'dios-hoy') and (contains(@href,'evangel') or contains(@href,'santo')) and not(ancestor::aside)]"),
-        (By.XPATH, "//*[not(ancestor::aside)]//*[self::a or self::button or self::span][contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelio') and contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'santo')]"),
-    ]
-
-    last = None
-    for idx, (by, sel) in enumerate(candidates, start=1):
-        try:
-            el = WebDriverWait(driver, 20).until(EC.element_to_be_clickable((by, sel)))
-            safe_click(driver, el)
-
-            cur = _strip_url(driver.current_url)
-            if "/espiritualidad/evangelios" in cur and "dios-hoy" not in cur:
-                logger.warning(
-                    "pagina_incorrecta_evangelios_listado intento=%s url=%s start_url=%s",
-                    idx,
-                    cur,
-                    start_url_stripped,
-                )
-                _reset_context(f"wrong_page_{idx}")
-                continue
-            if _is_not_found_page(driver):
-                logger.warning(
-                    "pagina_404_evangelio intento=%s url=%s start_url=%s",
-                    idx,
-                    _strip_url(driver.current_url),
-                    start_url_stripped,
-                )
-                _reset_context(f"404_{idx}")
-                continue
-
-            _wait_for_evangelio_dios_hoy_page(driver, EVANGELIO_TIMEOUT)
-            return
-        except TimeoutException as exc:
-            last = exc
-            logger.warning("no_se_confirmo_evangelio intento=%s url=%s", idx, _strip_url(driver.current_url))
-            _log_candidate_evangelio_links(driver, logger)
-            _reset_context(f"timeout_{idx}")
-
-    dump_debug_artifacts(driver, logger, "open_evangelio_santo")
-    raise last if last else TimeoutException("No se pudo abrir Evangelio y santo.")
-
-
-def find_evangelio_link(driver):
-    wait = WebDriverWait(driver, EVANGELIO_TIMEOUT)
-    selectors = [
-        (By.CSS_SELECTOR, "a[href*='/espiritualidad/evangelios']"),
-        (By.XPATH, "//a[contains(@href,'/espiritualidad/evangelios')]"),
-        (By.XPATH, "//*[self::a or self::button][normalize-space()='Evangelios']"),
-        (By.XPATH, "//*[normalize-space()='Evangelios']/ancestor::a[1]"),
-    ]
-    last_error = None
-    for by, selector in selectors:
-        try:
-            return wait.until(EC.presence_of_element_located((by, selector)))
-        except TimeoutException as exc:
-            last_error = exc
-    raise last_error if last_error else TimeoutException("No se encontro el enlace de evangelio.")
-
-def detect_evangelio_page(driver):
-    wait = WebDriverWait(driver, EVANGELIO_TIMEOUT)
-    def _check(_):
-        if find_visible_by_xpath(driver, "//*[normalize-space()='Evangelios actuales']"):
-            return 'dios_hoy'
-        if find_visible_by_xpath(driver, "//*[normalize-space()='Evangelios disponibles']"):
-            return 'dios_hoy'
-        if find_visible_by_xpath(driver, "//*[contains(normalize-space(),'Agregar evangelio')]"):
-            return 'list'
-        links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/espiritualidad/evangelios/'][href$='/editar']")
-        for link in links:
-            if link.is_displayed():
-                return 'list'
-        if find_visible_by_xpath(driver, "//h1[contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelios')]"):
-            return 'list'
-        return False
-    return wait.until(_check)
-
-def find_first_evangelio_edit_link(driver):
-    links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/espiritualidad/evangelios/'][href$='/editar']")
-    for link in links:
-        if link.is_displayed() and link.is_enabled():
-            return link
-    raise RuntimeError('No se encontro un enlace Editar en la lista de evangelios.')
-
-def log_evangelio_card_info(logger, link):
-    try:
-        card = link.find_element(By.XPATH, 'ancestor::li[1]')
-    except NoSuchElementException:
-        card = None
-    title = None
-    reference = None
-    if card:
-        try:
-            title = card.find_element(By.CSS_SELECTOR, 'h1, h2, h3, h4').text
-        except NoSuchElementException:
-            pass
-        try:
-            reference = card.find_element(By.CSS_SELECTOR, 'span.text-ecclesiaBlue').text
-        except NoSuchElementException:
-            pass
-    if title or reference:
-        logger.info('evangelio_seleccionado titulo=%s referencia=%s', title, reference)
-
-def find_editor_root(editor):
-    try:
-        return editor.find_element(
-            By.XPATH, "ancestor::*[.//button[@type='button'] or .//span[@role='button']][1]"
-        )
-    except NoSuchElementException:
-        return editor
-
-def find_visible_by_css(driver, selector):
-    for element in driver.find_elements(By.CSS_SELECTOR, selector):
-        if element.is_displayed():
-            return element
-    return None
-
-def find_visible_by_xpath(driver, xpath):
-    for element in driver.find_elements(By.XPATH, xpath):
-        if element.is_displayed():
-            return element
-    return None
-
-def open_video_dialog(driver, wait, editor):
-    url_input = find_visible_by_css(driver, VIDEO_URL_SELECTOR)
-    if url_input:
-        return url_input
-
-    root = find_editor_root(editor)
-    video_button = find_visible_by_css(root, ".ql-video")
-    if video_button:
-        safe_click(driver, video_button)
-        return wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, VIDEO_URL_SELECTOR)))
-    buttons = root.find_elements(By.CSS_SELECTOR, "button[type='button'], span[role='button']")
-    candidates = []
-    for button in buttons:
-        if not button.is_displayed() or not button.is_enabled():
-            continue
-        if button.text.strip():
-            continue
-        candidates.append(button)
-
-    if VIDEO_BUTTON_INDEX is not None:
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Modo por lotes: primera fecha (YYYY-MM-DD); cada dia recibe su video del feed con un solo login",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=1,
+        help="Modo por lotes: cantidad de dias desde --start-date (default 1)",
+    )
+    args = parser.parse_args(argv)
+    if args.days < 1:
+        parser.error("--days debe ser >= 1")
+    if args.start_date:
+        # El calendario del panel no cambia de mes: un lote que cruza de mes se rechaza aqui.
         try:
-            index = int(VIDEO_BUTTON_INDEX)
+            batch_dates(args.start_date, args.days, month=datetime.now().date())
         except ValueError as exc:
-            raise RuntimeError("DIOCESIS_VIDEO_BUTTON_INDEX debe ser un entero.") from exc
-        if index < 0 or index >= len(candidates):
-            raise RuntimeError("DIOCESIS_VIDEO_BUTTON_INDEX esta fuera de rango.")
-        safe_click(driver, candidates[index])
-        return wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, VIDEO_URL_SELECTOR)))
-
-    for button in candidates:
-        safe_click(driver, button)
-        try:
-            return WebDriverWait(driver, 1).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, VIDEO_URL_SELECTOR))
-            )
-        except TimeoutException:
-            try:
-                if button.get_attribute("aria-pressed") == "true":
-                    safe_click(driver, button)
-            except WebDriverException:
-                pass
-            try:
-                driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-            except WebDriverException:
-                pass
-            continue
-
-    raise RuntimeError("No se pudo abrir el dialogo para insertar video.")
-
-def find_modal_submit(url_input):
-    containers = [
-        "ancestor::*[@role='dialog'][1]",
-        "ancestor::*[@aria-modal='true'][1]",
-        "ancestor::*[contains(@class,'modal')][1]",
-        "ancestor::form[1]",
-    ]
-    container = None
-    for path in containers:
-        try:
-            container = url_input.find_element(By.XPATH, path)
-            break
-        except NoSuchElementException:
-            continue
-    if container is None:
-        raise RuntimeError("No se encontro el contenedor del dialogo de video.")
-
-    for button in container.find_elements(By.CSS_SELECTOR, "button"):
-        if not button.is_displayed() or not button.is_enabled():
-            continue
-        if button.get_attribute("type") == "submit":
-            return button
-    for button in container.find_elements(By.CSS_SELECTOR, "button"):
-        if not button.is_displayed() or not button.is_enabled():
-            continue
-        label = button.text.strip().lower()
-        if label and label not in ("cancelar", "cerrar"):
-            return button
-    raise RuntimeError("No se encontro un boton para confirmar el video.")
-
-def find_save_button(driver, editor):
-    try:
-        form = editor.find_element(By.XPATH, "ancestor::form[1]")
-        buttons = form.find_elements(By.CSS_SELECTOR, "button")
-        for button in buttons:
-            if not button.is_displayed() or not button.is_enabled():
-                continue
-            label = button.text.strip().lower()
-            if "guardar" in label or "actualizar" in label or "publicar" in label:
-                return button
-        for button in buttons:
-            if button.get_attribute("type") == "submit":
-                return button
-    except NoSuchElementException:
-        pass
-
-    for label in ("Guardar", "Guardar cambios", "Actualizar", "Publicar"):
-        matches = driver.find_elements(By.XPATH, f"//button[normalize-space()='{label}']")
-        for button in matches:
-            if button.is_displayed() and button.is_enabled():
-                return button
-
-    raise RuntimeError("No se encontro el boton de guardado.")
-
-def build_embed_url(video_id, fallback_url):
-    if video_id:
-        return f"https://www.youtube.com/embed/{video_id}"
-    return fallback_url
-
-def place_cursor_after_title(driver, editor):
-    script = """
-    const editor = arguments[0];
-    const marker = "Reflexión del día";
-    const blocks = Array.from(editor.querySelectorAll("p, h1, h2, h3, h4, h5, h6, div"));
-    let target = null;
-    for (const block of blocks) {
-      const text = (block.textContent || "").trim();
-      if (text.includes(marker)) {
-        target = block;
-        break;
-      }
-    }
-    if (!target) return false;
-    const range = document.createRange();
-    range.setStartAfter(target);
-    range.collapse(true);
-    const sel = window.getSelection();
-    sel.removeAllRanges();
-    sel.addRange(range);
-    editor.focus();
-    return true;
-    """
-    return driver.execute_script(script, editor)
-
-def place_cursor_end(driver, editor):
-    script = """
-    const editor = arguments[0];
-    const range = document.createRange();
-    range.selectNodeContents(editor);
-    range.collapse(false);
-    const sel = window.getSelection();
-    sel.removeAllRanges();
-    sel.addRange(range);
-    editor.focus();
-    """
-    driver.execute_script(script, editor)
-
-def format_inserted_video(driver, editor, video_id, width, height):
-    script = """
-    const editor = arguments[0];
-    const videoId = arguments[1];
-    const width = arguments[2];
-    const height = arguments[3];
-    const iframes = Array.from(editor.querySelectorAll("iframe.ql-video"));
-    const target = iframes.find((node) => {
-      const src = node.getAttribute("src") || "";
-      return !videoId || src.includes(videoId) || src.includes("youtube.com");
-    });
-    if (!target) return false;
-    target.setAttribute("width", String(width));
-    target.setAttribute("height", String(height));
-    target.style.width = `${width}px`;
-    target.style.height = `${height}px`;
-    target.style.maxWidth = "100%";
-    target.style.border = "0";
-    target.style.display = "block";
-    target.style.margin = "0 auto";
-    const block = target.closest("p, div");
-    if (block) {
-      block.classList.add("ql-align-center");
-      block.style.textAlign = "center";
-      block.style.width = "100%";
-    }
-    return true;
-    """
-    return driver.execute_script(script, editor, video_id, width, height)
-
-def normalize_existing_video(driver, editor, video_id, embed_url):
-    script = """
-    const editor = arguments[0];
-    const videoId = arguments[1];
-    const embedUrl = arguments[2];
-    const isYouTube = (src) => src.includes("youtube.com") || src.includes("youtu.be");
-    const iframes = Array.from(editor.querySelectorAll("iframe.ql-video"));
-    const matches = [];
-    const others = [];
-    for (const node of iframes) {
-      const src = node.getAttribute("src") || "";
-      const match = (videoId && src.includes(videoId)) || (embedUrl && src.includes(embedUrl));
-      if (match) {
-        matches.push(node);
-      } else if (isYouTube(src)) {
-        others.push(node);
-      }
-    }
-    if (matches.length) {
-      for (const node of matches.slice(1).concat(others)) {
-        node.remove();
-      }
-      return true;
-    }
-    for (const node of others) {
-      node.remove();
-    }
-    return false;
-    """
-    return driver.execute_script(script, editor, video_id, embed_url)
-
-def find_current_gospel_button(driver, wait):
-    header = wait.until(EC.presence_of_element_located((By.XPATH, "//*[normalize-space()='Evangelios actuales']")))
-    container = header.find_element(By.XPATH, "ancestor::*[self::div or self::section][1]")
-    buttons = container.find_elements(By.CSS_SELECTOR, "button")
-    for button in buttons:
-        if button.is_displayed() and button.is_enabled() and button.text.strip():
-            return button
-    raise RuntimeError("No se encontro un evangelio actual para seleccionar.")
-
-def find_edit_reflection_button(wait):
-    label = wait.until(EC.presence_of_element_located((By.XPATH, "//*[normalize-space()='Editar reflexión']")))
-    try:
-        return label.find_element(By.XPATH, "ancestor::button[1]")
-    except NoSuchElementException:
-        try:
-            return label.find_element(By.XPATH, "ancestor::a[1]")
-        except NoSuchElementException:
-            return label
-
-def wait_for_edit_enabled(wait, button):
-    def is_enabled(_):
-        classes = (button.get_attribute("class") or "").lower()
-        disabled = button.get_attribute("disabled")
-        return disabled is None and "text-gray-400" not in classes
-    wait.until(is_enabled)
-
-def main():
+            parser.error(str(exc))
+    return args
+
+def main(argv=None):
+    """Devuelve el resultado de la corrida: "ok", "sin_cambios", "parcial" (lote) o "error"."""
+    args = parse_args(argv)
     require_env()
     logger = setup_logger()
+    TRACE.begin(t0=_T0, force=args.force)
+    if args.start_date:
+        TRACE.annotate(lote_inicio=args.start_date.isoformat(), lote_dias=args.days)
+    result = "error"
+    try:
+        result = _run_batch(args, logger) if args.start_date else _run(args, logger)
+    except Exception:
+        # Igual que un dia fallido del lote: queda en el log y el codigo de salida lo refleja.
+        logger.exception("fin_ejecucion resultado=error")
+    finally:
+        TRACE.finish(result)
+        try:
+            trace_path, metrics_path = TRACE.write(TRACE_DIR)
+            logger.info("traza_corrida resultado=%s traza=%s metricas=%s", result, trace_path, metrics_path)
+        except OSError as exc:
+            logger.warning("no_se_guardo_traza dir=%s error=%s", TRACE_DIR, exc)
+    return result
+
+def _run(args, logger):
+    """Una corrida; devuelve el resultado para la traza ("ok" o "sin_cambios")."""
     logger.info(
         "timezone=%s utc_offset_seconds=%s now_local=%s now_utc=%s",
         time.tzname,
@@ -876,98 +253,84 @@ def main():
     video_id = extract_video_id(video_url)
     logger.info("video_url=%s", video_url)
 
-    # 3. Lanzar el navegador (asegurate de tener chromedriver instalado y en PATH)
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.page_load_strategy = PAGE_LOAD_STRATEGY
-    options.add_argument("--window-size=1400,900")
-    logger.info(
-        "browser_config page_load_strategy=%s page_load_timeout=%s get_retries=%s",
-        PAGE_LOAD_STRATEGY,
-        PAGE_LOAD_TIMEOUT,
-        GET_RETRIES,
-    )
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-    wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+    # Camino rapido: la reflexion de hoy ya se guardo con este video en una corrida anterior.
+    today_iso = datetime.now().date().isoformat()
+    state_file = state_path()
+    state = load_state(state_file)
+    if state is not None and state.covers(today_iso, video_id) and not args.force:
+        logger.info(
+            "fin_ejecucion sin_cambios fecha=%s video_id=%s estado=%s ms=%.0f",
+            today_iso,
+            video_id,
+            state_file,
+            (time.perf_counter() - _T0) * 1000,
+        )
+        print("La reflexion del dia ya tiene el video mas reciente (sin cambios).")
+        return "sin_cambios"
 
-    try:
-        # 4. Iniciar sesión en el panel
-        log_phase(logger, "login")
-        do_login(driver, wait, logger)
-
-        # 5. Navegar a Dios Hoy
-        log_phase(logger, "navegar_dios_hoy")
-        safe_get(driver, DIOS_HOY_URL, logger, "dios_hoy")
-
-        # 6. Seleccionar la fecha actual
-        today = datetime.now().day
-        # Esperar hasta que cargue el calendario y hacer clic en el día actual
-        log_phase(logger, "seleccionar_dia")
-        day_button = find_day_button(driver, wait, today)
-        safe_click(driver, day_button)
-        wait_for_day_content_hint(driver)
-        # 7. Acceder a "Evangelio y santo"
-        log_phase(logger, "abrir_evangelio_santo")
-        open_evangelio_santo(driver, wait, logger, today)
-
-        # 8. Seleccionar el evangelio actual y habilitar "Editar reflexion"
-        editor = find_visible_by_css(driver, "div[contenteditable='true']")
-        if editor is None:
-            log_phase(logger, "seleccionar_evangelio_actual")
-            try:
-                current_evangelio = find_current_gospel_button(driver, wait)
-            except TimeoutException:
-                dump_debug_artifacts(driver, logger, 'current_gospel_timeout')
-                raise
-            safe_click(driver, current_evangelio)
-
-            editar_reflexion_button = find_edit_reflection_button(wait)
-            wait_for_edit_enabled(wait, editar_reflexion_button)
-            safe_click(driver, editar_reflexion_button)
-
-            # 9. Insertar el vídeo en el editor:
-            # Esperar a que aparezca el área de edición
-            log_phase(logger, "abrir_editor")
-            editor = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div[contenteditable='true']")))
-        else:
-            log_phase(logger, "abrir_editor")
-        log_phase(logger, "insertar_video")
-        embed_url = build_embed_url(video_id, video_url)
-        if normalize_existing_video(driver, editor, video_id, embed_url):
-            wait.until(lambda d: format_inserted_video(d, editor, video_id, VIDEO_WIDTH, VIDEO_HEIGHT))
-        else:
-            if not place_cursor_after_title(driver, editor):
-                place_cursor_end(driver, editor)
-
-            url_input = open_video_dialog(driver, wait, editor)
-            url_input.clear()
-            url_input.send_keys(embed_url)
-            url_input.send_keys(Keys.ENTER)
-            try:
-                wait.until(lambda d: not find_visible_by_css(d, VIDEO_URL_SELECTOR))
-            except TimeoutException:
-                submit_button = find_modal_submit(url_input)
-                safe_click(driver, submit_button)
-                wait.until(lambda d: not find_visible_by_css(d, VIDEO_URL_SELECTOR))
+    import panel_selenium  # noqa: E402  (carga Selenium)
 
-            wait.until(lambda d: format_inserted_video(d, editor, video_id, VIDEO_WIDTH, VIDEO_HEIGHT))
+    panel_selenium.run(args, logger, video_url, video_id)
+    TRACE.annotate(video_id=video_id)
+    # Solo se llega aqui con el guardado confirmado (panel_selenium.run levanta SaveNotConfirmed).
+    if video_id:
+        try:
+            save_state(state_file, today_iso, video_id, saved_ok=True)
+        except OSError as exc:
+            logger.warning("no_se_guardo_estado path=%s error=%s", state_file, exc)
+    logger.info("duracion_total ms=%.0f", (time.perf_counter() - _T0) * 1000)
+    return "ok"
 
-        # 10. Guardar cambios
-        log_phase(logger, "guardar_cambios")
-        save_button = find_save_button(driver, editor)
-        safe_click(driver, save_button)
+def _run_batch(args, logger):
+    """
+    Modo por lotes (--start-date/--days): el video de cada dia sale del feed por la fecha del titulo
+    (o de publicacion) y todos los dias se actualizan con un solo login. Devuelve "ok" si todos los
+    dias abiertos quedaron bien, "parcial" si no.
+    """
+    t0 = time.perf_counter()
+    logger.info("inicio_ejecucion lote inicio=%s dias=%s", args.start_date.isoformat(), args.days)
+    if PAGE_LOAD_STRATEGY not in VALID_PAGE_LOAD_STRATEGIES:
+        raise RuntimeError(
+            "DIOCESIS_PAGE_LOAD_STRATEGY debe ser normal, eager o none."
+        )
 
-        logger.info("fin_ejecucion ok")
-        print("Reflexion del dia actualizada con el nuevo video.")
-    except Exception:
-        logger.exception("fin_ejecucion error")
-        raise
-    finally:
-        driver.quit()
+    log_phase(logger, "obtener_video")
+    entries = fetch_feed(logger)
+    _, title_re, required_tokens, forbidden_tokens = video_title_filters()
+    videos = videos_by_date(entries, title_re, required_tokens, forbidden_tokens)
+    tasks, results = plan_days(batch_dates(args.start_date, args.days), videos, extract_video_id)
+    for missing in results:
+        logger.warning("dia_sin_video fecha=%s", missing.day.isoformat())
+
+    setup_ms = 0.0
+    if tasks:
+        import panel_selenium  # noqa: E402  (carga Selenium)
+
+        browser_results, setup_ms = panel_selenium.run_batch(args, logger, tasks)
+        results += browser_results
+
+    total_ms = (time.perf_counter() - t0) * 1000
+    table = results_table(results)
+    print(table)
+    for line in table.splitlines():
+        logger.info("lote %s", line)
+    logger.info("lote %s", batch_summary(results, total_ms, setup_ms))
+    TRACE.annotate(lote_ok=sum(1 for r in results if r.ok), lote_total=len(results))
+
+    # El registro del camino rapido solo cubre hoy, y solo con el guardado de ese dia confirmado
+    # (`sin_confirmar` y `error` no son `ok`).
+    today = datetime.now().date()
+    for r in results:
+        if r.day == today and r.ok and r.video_id:
+            try:
+                save_state(state_path(), today.isoformat(), r.video_id, saved_ok=True)
+            except OSError as exc:
+                logger.warning("no_se_guardo_estado path=%s error=%s", state_path(), exc)
+    opened = [r for r in results if r.result != "sin_video"]
+    result = "ok" if opened and all(r.ok for r in opened) else "parcial"
+    logger.info("fin_ejecucion lote resultado=%s", result)
+    return result
 
 if __name__ == "__main__":
-    main()
+    # Cron/systemd ven un lote "parcial" o una corrida fallida como error.
+    raise SystemExit(0 if main() in ("ok", "sin_cambios") else 1)
@@ -0,0 +1,99 @@
+"""
+Modo por lotes de Dios Hoy (`import os.py --start-date YYYY-MM-DD --days N`): ponerse al dia despues
+de una caida con una sola sesion del panel.
+
+- `plan_days`: una `DayTask` por fecha con el video del feed que le corresponde (`youtube_feed.videos_by_date`);
+  las fechas sin video quedan como resultado `sin_video` y no se abren en el panel.
+- Los transportes (`panel_selenium.run_batch`, `panel_http.run_batch`) devuelven un `DayResult` por
+  tarea: `insertado`, `normalizado` (ya tenia el video), `sin_cambio` (http: HTML identico),
+  `sin_confirmar` (el panel no mostro el aviso de exito del guardado) o `error`.
+- `require_month`: el calendario del panel solo muestra el mes actual; un lote que cruza de mes se
+  rechaza antes de empezar (no a mitad de camino).
+- `results_table` / `batch_summary`: tabla por dia y costo amortizado por dia.
+
+Solo libreria estandar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Optional
+
+OK_RESULTS = ("insertado", "normalizado", "sin_cambio")
+
+
+@dataclass(frozen=True)
+class DayTask:
+    day: date
+    video_url: str
+    video_id: Optional[str]
+    title: str = ""
+
+
+@dataclass
+class DayResult:
+    day: date
+    video_id: Optional[str]
+    result: str
+    ms: float = 0.0
+    transport: str = "-"
+    detail: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.result in OK_RESULTS
+
+
+def batch_dates(start: date, days: int, month: Optional[date] = None) -> list[date]:
+    """Fechas del lote; con `month`, levanta ValueError si alguna cae fuera de ese mes."""
+    dates = [start + timedelta(days=i) for i in range(max(1, days))]
+    if month is not None:
+        require_month(dates, month)
+    return dates
+
+
+def require_month(dates: list[date], month: date) -> None:
+    """ValueError si alguna fecha no es del mes de `month` (el calendario del panel no cambia de mes)."""
+    outside = [d for d in dates if (d.year, d.month) != (month.year, month.month)]
+    if outside:
+        first = month.replace(day=1)
+        raise ValueError(
+            f"El calendario del panel solo muestra {first:%Y-%m}: {len(outside)} fecha(s) del lote caen en "
+            f"otro mes (primera: {outside[0].isoformat()}). Acotar --start-date/--days a {first:%Y-%m}."
+        )
+
+
+def plan_days(dates: list[date], videos: dict[date, Any], extract_video_id) -> tuple[list[DayTask], list[DayResult]]:
+    """(tareas con video, resultados `sin_video` para las fechas que no tienen)."""
+    tasks, missing = [], []
+    for day in dates:
+        entry = videos.get(day)
+        link = getattr(entry, "link", None) if entry is not None else None
+        if not link:
+            missing.append(DayResult(day=day, video_id=None, result="sin_video"))
+            continue
+        tasks.append(DayTask(day=day, video_url=link, video_id=extract_video_id(link), title=getattr(entry, "title", "")))
+    return tasks, missing
+
+
+def results_table(results: list[DayResult]) -> str:
+    rows = [("fecha", "video_id", "resultado", "transporte", "ms", "detalle")]
+    for r in sorted(results, key=lambda r: r.day):
+        rows.append((r.day.isoformat(), r.video_id or "-", r.result, r.transport, f"{r.ms:.0f}", r.detail[:60]))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1] for row in rows
+    ).rstrip()
+
+
+def batch_summary(results: list[DayResult], total_ms: float, setup_ms: float) -> str:
+    """Una linea key=value: dias, ok, costo total, arranque (navegador + login) y costo por dia."""
+    opened = [r for r in results if r.result != "sin_video"]
+    ok = sum(1 for r in results if r.ok)
+    per_day = total_ms / len(opened) if opened else 0.0
+    return (
+        f"dias={len(results)} abiertos={len(opened)} ok={ok} errores={sum(1 for r in results if r.result == 'error')} "
+        f"total_ms={total_ms:.0f} arranque_ms={setup_ms:.0f} por_dia_ms={per_day:.0f} "
+        f"por_dia_sin_arranque_ms={(total_ms - setup_ms) / len(opened) if opened else 0.0:.0f}"
+    )
@@ -0,0 +1,298 @@
+"""
+Bloqueo de recursos de red para las sesiones de Chrome headless (Ordo y panel de la Diocesis).
+
+Solo leemos texto y estado del DOM, asi que imagenes, fuentes, media, analitica y embeds de YouTube
+son carga inutil que alarga las paginas (y los timeouts de `DIOCESIS_PAGE_LOAD_TIMEOUT`). Dos capas:
+- `configure_options`: desactiva imagenes en blink (`imagesEnabled=false` + content setting) y activa
+  el log de performance para contar lo que se bloquea/descarga.
+- `apply_blocking`: CDP `Network.setBlockedURLs` con los patrones del sitio.
+
+Politica por sitio (`policy_for("ordo" | "panel")`): categorias de `CATEGORIES` menos la lista de
+permitidos del sitio, mas su lista de bloqueados. Variables de entorno (CSV de patrones con `*`):
+- `BROWSER_BLOCK=0` desactiva el bloqueo (las estadisticas siguen).
+- `BROWSER_BLOCK_CATEGORIES`: categorias activas (default: todas).
+- `<PREFIJO>_BLOCK_DENY` / `<PREFIJO>_BLOCK_ALLOW` con PREFIJO `ORDO` o `DIOCESIS`.
+
+`NetworkStats.collect` lee el log de performance y cuenta requests y bytes descargados y las requests
+bloqueadas por categoria. Los bytes ahorrados se estiman con el tamaño observado de esas mismas URLs
+en corridas sin bloqueo (`BROWSER_BLOCK=0`), guardado en `~/.cache/diocese-automation/bloqueo-tamanos.json`;
+las URLs sin dato se reportan aparte. Las imagenes que blink no pide no generan request y no se cuentan.
+
+`JsonResponseCapture` usa el mismo log para guardar los cuerpos JSON de las respuestas XHR/fetch
+(`Network.getResponseBody`); como `get_log` vacia el log, quien lo lea debe pasar los eventos a ambos.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import re
+import tempfile
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from selenium.common.exceptions import WebDriverException
+
+CATEGORIES: dict[str, tuple[str, ...]] = {
+    "imagenes": (
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*/_next/image*",
+    ),
+    "fuentes": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"),
+    "media": ("*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg"),
+    "analitica": (
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*connect.facebook.net*",
+        "*hotjar.com*", "*clarity.ms*", "*sentry.io*",
+    ),
+    "youtube": ("*youtube.com/embed*", "*youtube-nocookie.com*", "*ytimg.com*", "*googlevideo.com*"),
+}
+
+
+@dataclass(frozen=True)
+class SiteDefaults:
+    env_prefix: str
+    allow: tuple[str, ...] = ()
+    deny: tuple[str, ...] = ()
+
+
+SITES: dict[str, SiteDefaults] = {
+    # ion-icon descarga los SVG de los iconos (flechas, volver) con fetch; se dejan pasar.
+    "ordo": SiteDefaults(env_prefix="ORDO", allow=("*.svg",)),
+    "panel": SiteDefaults(env_prefix="DIOCESIS"),
+}
+
+DEFAULT_SIZES_PATH = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "bloqueo-tamanos.json")
+MAX_KNOWN_SIZES = 5000
+
+
+def _csv(value: Optional[str]) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+@lru_cache(maxsize=256)
+def _pattern_re(pattern: str) -> re.Pattern:
+    # Mismo comodin que Network.setBlockedURLs: `*` cualquier secuencia, el resto literal.
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")), re.IGNORECASE)
+
+
+def _strip_query(url: str) -> str:
+    try:
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    except ValueError:
+        return url
+
+
+@dataclass(frozen=True)
+class BlockingPolicy:
+    site: str
+    enabled: bool
+    rules: tuple[tuple[str, str], ...]  # (categoria, patron)
+    block_images: bool
+
+    @property
+    def patterns(self) -> list[str]:
+        return [pattern for _, pattern in self.rules]
+
+    def category_of(self, url: str) -> Optional[str]:
+        for category, pattern in self.rules:
+            if _pattern_re(pattern).fullmatch(url):
+                return category
+        return None
+
+
+def policy_for(site: str) -> BlockingPolicy:
+    defaults = SITES[site]
+    categories = _csv(os.getenv("BROWSER_BLOCK_CATEGORIES")) or list(CATEGORIES)
+    unknown = [c for c in categories if c not in CATEGORIES]
+    if unknown:
+        raise RuntimeError(f"BROWSER_BLOCK_CATEGORIES invalido: {', '.join(unknown)} (validas: {', '.join(CATEGORIES)})")
+    allow = set(defaults.allow) | set(_csv(os.getenv(f"{defaults.env_prefix}_BLOCK_ALLOW")))
+    rules = [(c, p) for c in categories for p in CATEGORIES[c] if p not in allow]
+    rules += [("sitio", p) for p in (*defaults.deny, *_csv(os.getenv(f"{defaults.env_prefix}_BLOCK_DENY")))]
+    enabled = os.getenv("BROWSER_BLOCK", "1") != "0"
+    # Si se permite algun patron de imagen no se puede apagar blink entero (p.ej. SVG del Ordo).
+    block_images = enabled and "imagenes" in categories and not (allow & set(CATEGORIES["imagenes"]))
+    return BlockingPolicy(site=site, enabled=enabled, rules=tuple(rules), block_images=block_images)
+
+
+def configure_options(options, policy: BlockingPolicy) -> None:
+    """Opciones de arranque: imagenes apagadas en blink y log de performance para las estadisticas."""
+    if policy.block_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def apply_blocking(driver, policy: BlockingPolicy) -> None:
+    """Activa `Network.setBlockedURLs` en la pestaña del driver (antes del primer `get`)."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    if policy.enabled and policy.rules:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.patterns})
+
+
+def read_performance_log(driver) -> list[dict[str, Any]]:
+    """Eventos CDP (`{"method", "params"}`) acumulados desde la ultima lectura (el log se vacia al leer)."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+    events = []
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if isinstance(message, dict) and "method" in message:
+            events.append(message)
+    return events
+
+
+@dataclass
+class NetworkStats:
+    policy: BlockingPolicy
+    sizes_path: str = DEFAULT_SIZES_PATH
+    requests: int = 0  # requests completadas (descargadas)
+    bytes_downloaded: int = 0
+    blocked: Counter = field(default_factory=Counter)
+    blocked_urls: list[str] = field(default_factory=list)
+    _urls: dict[str, str] = field(default_factory=dict, repr=False)
+    _observed: dict[str, int] = field(default_factory=dict, repr=False)  # URLs bloqueables, sin bloqueo
+
+    def feed(self, events: Iterable[dict[str, Any]]) -> None:
+        for event in events:
+            method = event.get("method")
+            params = event.get("params") or {}
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                url = (params.get("request") or {}).get("url") or ""
+                if url.startswith("data:"):
+                    continue
+                self._urls[request_id] = url
+            elif method == "Network.loadingFinished":
+                url = self._urls.get(request_id)
+                if url is None:
+                    continue
+                size = int(params.get("encodedDataLength") or 0)
+                self.requests += 1
+                self.bytes_downloaded += size
+                if url and not self.policy.enabled and self.policy.category_of(url):
+                    self._observed[_strip_query(url)] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                url = self._urls.get(request_id, "")
+                self.blocked[self.policy.category_of(url) or "otros"] += 1
+                self.blocked_urls.append(url)
+
+    def collect(self, driver) -> None:
+        self.feed(read_performance_log(driver))
+
+    def merge(self, other: "NetworkStats") -> None:
+        # Un NetworkStats por driver (p.ej. workers del Ordo); se combinan al final.
+        self.requests += other.requests
+        self.bytes_downloaded += other.bytes_downloaded
+        self.blocked.update(other.blocked)
+        self.blocked_urls.extend(other.blocked_urls)
+        self._observed.update(other._observed)
+
+    def _load_sizes(self) -> dict[str, int]:
+        try:
+            with open(self.sizes_path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {str(k): int(v) for k, v in data.items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def save_observed_sizes(self) -> None:
+        """Guarda los tamaños vistos sin bloqueo (base para estimar bytes ahorrados)."""
+        if not self._observed:
+            return
+        sizes = self._load_sizes()
+        sizes.update(self._observed)
+        if len(sizes) > MAX_KNOWN_SIZES:
+            sizes = dict(list(sizes.items())[-MAX_KNOWN_SIZES:])
+        os.makedirs(os.path.dirname(self.sizes_path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.sizes_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(sizes, f)
+            os.replace(tmp, self.sizes_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def bytes_saved(self) -> tuple[int, int]:
+        """(bytes estimados ahorrados, requests bloqueadas sin tamaño conocido)."""
+        sizes = self._load_sizes()
+        saved = unknown = 0
+        for url in self.blocked_urls:
+            size = sizes.get(_strip_query(url))
+            if size is None:
+                unknown += 1
+            else:
+                saved += size
+        return saved, unknown
+
+    def summary(self) -> str:
+        saved, unknown = self.bytes_saved()
+        by_category = ",".join(f"{c}:{n}" for c, n in sorted(self.blocked.items())) or "-"
+        return (
+            f"sitio={self.policy.site} bloqueo={'on' if self.policy.enabled else 'off'} "
+            f"requests={self.requests} bytes_descargados={self.bytes_downloaded} "
+            f"requests_bloqueadas={sum(self.blocked.values())} ({by_category}) "
+            f"bytes_ahorrados_estimados={saved} sin_tamano={unknown}"
+        )
+
+
+@dataclass(frozen=True)
+class CapturedJson:
+    url: str
+    data: Any
+    size: int
+
+
+class JsonResponseCapture:
+    """Cuerpos JSON de las respuestas XHR/fetch (las ultimas `max_items`), leidos del log de performance."""
+
+    def __init__(self, max_items: int = 50) -> None:
+        self.items: deque[CapturedJson] = deque(maxlen=max_items)
+        self.responses = 0
+        self.bytes = 0
+        self._pending: dict[str, str] = {}  # requestId -> url
+
+    def feed(self, driver, events: Iterable[dict[str, Any]]) -> list[CapturedJson]:
+        """Procesa eventos ya leidos; devuelve las respuestas JSON nuevas."""
+        new: list[CapturedJson] = []
+        for event in events:
+            method = event.get("method")
+            params = event.get("params") or {}
+            request_id = params.get("requestId")
+            if method == "Network.responseReceived":
+                response = params.get("response") or {}
+                if params.get("type") in ("XHR", "Fetch") and "json" in (response.get("mimeType") or "").lower():
+                    self._pending[request_id] = response.get("url") or ""
+            elif method == "Network.loadingFinished" and request_id in self._pending:
+                url = self._pending.pop(request_id)
+                try:
+                    result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                except WebDriverException:
+                    continue
+                body = result.get("body") or ""
+                raw = base64.b64decode(body) if result.get("base64Encoded") else body.encode("utf-8")
+                try:
+                    data = json.loads(raw)
+                except ValueError:
+                    continue
+                item = CapturedJson(url=url, data=data, size=len(raw))
+                self.items.append(item)
+                self.responses += 1
+                self.bytes += item.size
+                new.append(item)
+            elif method == "Network.loadingFailed":
+                self._pending.pop(request_id, None)
+        return new
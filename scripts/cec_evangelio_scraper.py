@@ -12,30 +12,67 @@ Salida:
 
 Uso:
   python3 scripts/cec_evangelio_scraper.py --start-date 2026-02-07 --days-ahead 3 --out /tmp/cec.json
+  python3 scripts/cec_evangelio_scraper.py --start-date 2026-02-07 --days-ahead 15 --format ndjson
+
+Los articulos se descargan en paralelo (--workers) con un limite de conexiones simultaneas por host
+(--per-host) para no saturar el sitio de la CEC.
+
+Cache HTTP en disco (por defecto ~/.cache/diocese-automation/http, ver scripts/http_cache.py):
+- Los articulos no cambian despues de publicados: si estan en cache no se descargan (salvo --refresh-cache).
+- El RSS se revalida con GET condicional (ETag / Last-Modified).
+- --cache-dir cambia la ubicacion; --no-cache la desactiva.
+
+Los articulos tambien se leen en streaming: el extractor recibe el HTML por trozos y la conexion se
+cierra apenas termina el bloque `schema:text`, sin descargar el resto de la pagina (--full-download
+desactiva el corte). Al final se reportan bytes descargados y tiempo hasta el resultado.
+
+Modo incremental (--incremental): los items se guardan en un SQLite local (--store, ver
+scripts/cec_item_store.py). Las fechas ya capturadas con el mismo articulo no se descargan; las nuevas
+o cambiadas se insertan/actualizan y la salida JSON se arma desde el almacen.
+
+El RSS se procesa en streaming (iterparse) a medida que llega del socket. Como el feed viene del mas
+reciente al mas antiguo, la lectura se corta en cuanto los items quedan fuera de la ventana.
 """
 
 from __future__ import annotations
 
 import argparse
-import html
+import contextlib
+import io
 import json
 import re
 import sys
-import urllib.request
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional
-
-import ssl
+from typing import BinaryIO, Iterator, Optional
+from urllib.parse import urlsplit
 
-try:
-    import certifi  # type: ignore
-except Exception:  # pragma: no cover
-    certifi = None
+from http_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, CacheEntry, HttpCache
+from cec_item_store import DEFAULT_STORE_PATH, CECItemStore
+from html_extract import BlockExtractor, ExtractedBlock, extract_block, html_to_text
+from http_client import get_client
+from scraper_output import OUTPUT_FORMATS, parse_fields, select_fields, write_document, write_ndjson
 
 CEC_RSS_URL = "https://www.cec.org.co/taxonomy/term/8097/feed"
 
+# Descarga concurrente de articulos: hilos totales y maximo de requests simultaneos al mismo host.
+DEFAULT_WORKERS = 4
+DEFAULT_PER_HOST = 2
+
+# El feed es "newest-first": al ver un pubDate anterior a start - este margen dejamos de leerlo.
+# El margen cubre que el articulo se publica la noche anterior (UTC) y algun desorden menor.
+FEED_EARLY_STOP_SLACK_DAYS = 2
+
+# Lectura del socket por trozos al descargar articulos (mas chico = corte mas temprano).
+ARTICLE_CHUNK_SIZE = 8 * 1024
+
+# Cache HTTP activa (None = sin cache). La configura main() o el llamador via configure_cache().
+_CACHE: Optional[HttpCache] = None
+
 
 MONTHS_ES = {
     "enero": 1,
@@ -75,27 +112,24 @@ class CECItem:
     content_text: str
 
 
+@dataclass(frozen=True)
+class ArticleFetch:
+    link: str
+    block: ExtractedBlock
+    source: str  # "network", "cache" o "304"
+    wire_bytes: int  # bytes recibidos por la red (0 si vino de cache)
+    total_bytes: Optional[int]  # tamaño anunciado (Content-Length), si el servidor lo envia
+    aborted: bool  # conexion cerrada antes del final de la pagina
+    seconds: float  # tiempo hasta tener el bloque extraido
+
+
 def _parse_iso(d: str) -> date:
     return datetime.strptime(d, "%Y-%m-%d").date()
 
 
-def _http_get(url: str, timeout: int = 60) -> bytes:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "diocese-automation/1.0 (+https://github.com/)",
-            "Accept": "*/*",
-        },
-    )
-    # macOS Python installs sometimes lack a working system CA bundle; prefer certifi when present.
-    ctx = None
-    if certifi is not None:
-        try:
-            ctx = ssl.create_default_context(cafile=certifi.where())
-        except Exception:
-            ctx = None
-    with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-        return resp.read()
+def configure_cache(cache: Optional[HttpCache]) -> None:
+    global _CACHE
+    _CACHE = cache
 
 
 def _parse_rfc2822(dt: str) -> datetime:
@@ -132,25 +166,13 @@ def _extract_abbr_and_ref(title: str) -> tuple[str, str]:
 
 
 def _extract_schema_text_div(html_bytes: bytes) -> str:
-    # Extract inner HTML of <div property="schema:text"> ... </div>
-    # Use regex for robustness (the page is Drupal; the block is stable in current HTML).
-    text = html_bytes.decode("utf-8", errors="ignore")
-    m = re.search(r'<div[^>]+property="schema:text"[^>]*>(.*?)</div>', text, re.DOTALL | re.IGNORECASE)
-    if not m:
-        return ""
-    return m.group(1).strip()
+    # Inner HTML of <div property="schema:text"> (nested <div>s included), see scripts/html_extract.py.
+    return extract_block(html_bytes).html
 
 
 def _html_to_text(block_html: str) -> str:
     # Minimal HTML to text, preserving line breaks.
-    s = block_html
-    s = re.sub(r"<\s*br\s*/?\s*>", "\n", s, flags=re.IGNORECASE)
-    s = re.sub(r"</\s*p\s*>", "\n\n", s, flags=re.IGNORECASE)
-    s = re.sub(r"<\s*p[^>]*>", "", s, flags=re.IGNORECASE)
-    s = re.sub(r"<[^>]+>", "", s)
-    s = html.unescape(s)
-    s = re.sub(r"\n{3,}", "\n\n", s).strip()
-    return s
+    return html_to_text(block_html)
 
 
 def _infer_according_to(text: str) -> str:
@@ -177,66 +199,358 @@ def _book_name_from_abbr(abbr: str) -> tuple[str, str]:
     return full
 
 
-def fetch_cec_items(start_iso: str, days_ahead: int) -> list[CECItem]:
-    start = _parse_iso(start_iso)
-    end = start + timedelta(days=days_ahead)
+def _fetch_article(link: str, stream: bool = True) -> ArticleFetch:
+    # Los articulos son inmutables: en cache se sirven sin red (salvo refresh). Al guardar en cache
+    # un articulo cortado se guarda solo el prefijo descargado, que ya contiene el bloque completo.
+    t0 = time.perf_counter()
+    cache = _CACHE
+    entry = cache.lookup(link) if cache is not None else None
+    if cache is not None and entry is not None and not cache.refresh:
+        cache.stats.bump("hits")
+        return ArticleFetch(link, extract_block(entry.body), "cache", 0, None, False, time.perf_counter() - t0)
+
+    headers = cache.conditional_headers(entry) if cache is not None else {}
+    parser = BlockExtractor()
+    received: list[bytes] = []
+    with get_client().open(link, headers=headers, chunk_size=ARTICLE_CHUNK_SIZE) as resp:
+        if resp.status == 304 and cache is not None and entry is not None:
+            resp.read()
+            cache.stats.bump("revalidated")
+            return ArticleFetch(link, extract_block(entry.body), "304", resp.wire_bytes, None, False, time.perf_counter() - t0)
+        while True:
+            chunk = resp.read(ARTICLE_CHUNK_SIZE)
+            if not chunk:
+                parser.feed_bytes(b"", final=True)
+                break
+            received.append(chunk)
+            if parser.feed_bytes(chunk) and stream:
+                break
+        aborted = not resp.complete
+        length = resp.headers.get("Content-Length")
+        total = int(length) if length and length.isdigit() and not resp.headers.get("Content-Encoding") else None
+        wire = resp.wire_bytes
+        etag = resp.headers.get("ETag") or ""
+        last_modified = resp.headers.get("Last-Modified") or ""
+    block = parser.result()
+    seconds = time.perf_counter() - t0
+    if cache is not None:
+        cache.stats.bump("misses")
+        cache.store(link, b"".join(received), etag=etag, last_modified=last_modified, complete=not aborted)
+    return ArticleFetch(link, block, "network", wire, total, aborted, seconds)
+
+
+def _iter_article_fetches(links: list[str], workers: int, per_host: int, stream: bool = True) -> Iterator[ArticleFetch]:
+    # Descarga los articulos en paralelo y los entrega en el orden de `links` apenas cada uno (y
+    # los anteriores) esta listo. Cada host tiene su propio semaforo para limitar la concurrencia
+    # real contra el mismo servidor, aunque haya mas hilos disponibles.
+    if not links:
+        return
+    per_host = max(1, per_host)
+    host_limits: dict[str, threading.BoundedSemaphore] = {}
+    for link in links:
+        host = urlsplit(link).netloc.lower()
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(per_host)
+
+    def _get(link: str) -> ArticleFetch:
+        with host_limits[urlsplit(link).netloc.lower()]:
+            return _fetch_article(link, stream=stream)
+
+    workers = max(1, min(workers, len(links)))
+    if workers == 1:
+        for link in links:
+            yield _get(link)
+        return
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cec-fetch")
+    try:
+        yield from pool.map(_get, links)
+    finally:
+        # Si el consumidor corta antes, no seguimos descargando lo que falta.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def summarize_fetches(fetches: list[ArticleFetch]) -> str:
+    network = [f for f in fetches if f.source == "network"]
+    wire = sum(f.wire_bytes for f in fetches)
+    known_total = sum(f.total_bytes for f in network if f.total_bytes is not None)
+    aborted = sum(1 for f in network if f.aborted)
+    ttr = sorted(f.seconds for f in fetches)
+    avg_ms = (sum(ttr) / len(ttr) * 1000) if ttr else 0.0
+    max_ms = (ttr[-1] * 1000) if ttr else 0.0
+    return (
+        f"articulos={len(fetches)} red={len(network)} cortados={aborted} bytes_descargados={wire} "
+        f"bytes_anunciados={known_total} ttr_ms_promedio={avg_ms:.1f} ttr_ms_max={max_ms:.1f}"
+    )
 
-    rss_bytes = _http_get(CEC_RSS_URL)
-    root = ET.fromstring(rss_bytes)
 
-    channel = root.find("channel")
-    if channel is None:
-        # Some feeds use namespaces; fallback search.
-        channel = root.find("{*}channel")
-    if channel is None:
-        raise RuntimeError("No se encontro <channel> en el RSS de CEC.")
+class _TeeReader:
+    # Lee del stream y guarda una copia de lo leido (lo que se guarda en la cache).
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._copy = io.BytesIO()
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._stream.read(n)
+        self._copy.write(data)
+        return data
+
+    def getvalue(self) -> bytes:
+        return self._copy.getvalue()
+
+
+class _PrefixReader:
+    # RSS revalidado (304) cuyo cuerpo en cache es solo el prefijo que leyo un escaneo cortado. Con la
+    # misma ventana el parser corta dentro del prefijo; si pide mas, se baja el feed de nuevo, se
+    # descartan los bytes ya servidos y se sigue desde ahi.
+    def __init__(self, entry: CacheEntry) -> None:
+        self._entry = entry
+        self._prefix = io.BytesIO(entry.body)
+        self._stack = contextlib.ExitStack()
+        self._stream = None
+        self.resumed = False
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._prefix.read(n)
+        if data or n == 0:
+            return data
+        if self._stream is None:
+            self._resume()
+        return self._stream.read(n)
+
+    def _resume(self) -> None:
+        self.resumed = True
+        stream = self._stack.enter_context(get_client().open(self._entry.url))
+        etag = stream.headers.get("ETag") or ""
+        if self._entry.etag and etag and etag != self._entry.etag:
+            raise RuntimeError("El RSS de CEC cambio durante el escaneo; volver a correr.")
+        skip = len(self._entry.body)
+        while skip > 0:
+            chunk = stream.read(min(skip, 64 * 1024))
+            if not chunk:
+                break
+            skip -= len(chunk)
+        self._stream = stream
+
+    def close(self) -> None:
+        self._stack.close()
+
+
+@contextlib.contextmanager
+def _open_feed(url: str) -> Iterator[BinaryIO]:
+    # Fuente del RSS para iterparse: el cuerpo en cache si el servidor responde 304, o el socket.
+    # Con corte temprano se guarda solo el prefijo leido (complete=False) con los validadores: la
+    # corrida siguiente igual recibe 304 y no se baja el resto del feed en ninguna de las dos.
+    cache = _CACHE
+    entry = cache.lookup(url) if cache is not None else None
+    headers = cache.conditional_headers(entry) if cache is not None else {}
+    with get_client().open(url, headers=headers) as stream:
+        if stream.status == 304 and cache is not None and entry is not None:
+            stream.read()  # 304 no trae cuerpo; leerlo devuelve la conexion al pool.
+            cache.stats.bump("revalidated")
+            if entry.complete:
+                yield io.BytesIO(entry.body)
+                return
+            prefix = _PrefixReader(entry)
+            try:
+                yield prefix
+            finally:
+                prefix.close()
+            return
+        if cache is None:
+            yield stream
+            return
+        cache.stats.bump("misses")
+        tee = _TeeReader(stream)
+        yield tee
+        cache.store(
+            url,
+            tee.getvalue(),
+            etag=stream.headers.get("ETag") or "",
+            last_modified=stream.headers.get("Last-Modified") or "",
+            complete=stream.complete,
+        )
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
 
-    items: list[CECItem] = []
-    for it in channel.findall("item"):
-        title = (it.findtext("title") or "").strip()
-        link = (it.findtext("link") or "").strip()
-        pub = (it.findtext("pubDate") or "").strip()
-        if not title or not link or not pub:
-            continue
 
-        pub_dt = _parse_rfc2822(pub)
-        year = pub_dt.year
-        target_iso = _extract_target_date_from_title(title, year)
-        if not target_iso:
+def _iter_feed_items(source: BinaryIO) -> Iterator[tuple[str, str, str]]:
+    # (title, link, pubDate) por <item>. Cada item se libera al procesarlo para que la memoria no
+    # crezca con el tamaño del feed.
+    channel = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag == "channel":
+                channel = elem
             continue
-        target_date = _parse_iso(target_iso)
-        if target_date < start or target_date > end:
+        if tag != "item":
             continue
+        fields = {_local(child.tag): (child.text or "").strip() for child in elem}
+        yield fields.get("title", ""), fields.get("link", ""), fields.get("pubDate", "")
+        elem.clear()
+        if channel is not None:
+            channel.remove(elem)
+    if channel is None:
+        raise RuntimeError("No se encontro <channel> en el RSS de CEC.")
+
+
+def _scan_feed(
+    rss_url: str,
+    start: date,
+    end: date,
+    early_stop: bool,
+    store: Optional[CECItemStore],
+) -> list[tuple[str, str, str, str, str, str, str]]:
+    # Filtra el RSS por ventana sin tocar la red (aparte del propio feed). Ordenado por fecha.
+    stop_before = start - timedelta(days=FEED_EARLY_STOP_SLACK_DAYS)
+    pending: list[tuple[str, str, str, str, str, str, str]] = []
+    with _open_feed(rss_url) as source:
+        for title, link, pub in _iter_feed_items(source):
+            if not title or not link or not pub:
+                continue
+
+            pub_dt = _parse_rfc2822(pub)
+            if early_stop and pub_dt.date() < stop_before:
+                break
+            year = pub_dt.year
+            target_iso = _extract_target_date_from_title(title, year)
+            if not target_iso:
+                continue
+            target_date = _parse_iso(target_iso)
+            if target_date < start or target_date > end:
+                continue
+
+            if store is not None and store.has(target_iso, link):
+                store.stats.skipped += 1
+                continue
+
+            abbr, citation_raw = _extract_abbr_and_ref(title)
+            book_name, according_to = _book_name_from_abbr(abbr)
+            pending.append((target_iso, title, link, abbr, citation_raw, book_name, according_to))
+
+    # Ensure stable order.
+    pending.sort(key=lambda p: p[0])
+    return pending
+
+
+def iter_cec_items(
+    start_iso: str,
+    days_ahead: int,
+    workers: int = DEFAULT_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    rss_url: str = CEC_RSS_URL,
+    early_stop: bool = True,
+    stream_articles: bool = True,
+    fetch_report: Optional[list[ArticleFetch]] = None,
+    store: Optional[CECItemStore] = None,
+) -> Iterator[CECItem]:
+    """Items de la ventana en orden de fecha, entregados apenas cada dia esta listo."""
+    start = _parse_iso(start_iso)
+    end = start + timedelta(days=days_ahead)
+
+    pending = _scan_feed(rss_url, start, end, early_stop, store)
 
-        abbr, citation_raw = _extract_abbr_and_ref(title)
-        book_name, according_to = _book_name_from_abbr(abbr)
+    # En modo incremental, las fechas ya capturadas salen del almacen intercaladas por fecha.
+    stored: list[CECItem] = []
+    if store is not None:
+        fetched_dates = {p[0] for p in pending}
+        stored = [
+            CECItem(**row)
+            for row in store.rows_between(start.isoformat(), end.isoformat())
+            if row["iso_date"] not in fetched_dates
+        ]
+    stored.reverse()  # pop() desde el final = fecha mas antigua primero
 
-        html_bytes = _http_get(link)
-        content_html = _extract_schema_text_div(html_bytes)
-        content_text = _html_to_text(content_html)
+    fetches = _iter_article_fetches([p[2] for p in pending], workers, per_host, stream=stream_articles)
+    for (target_iso, title, link, abbr, citation_raw, book_name, according_to), fetch in zip(pending, fetches):
+        if fetch_report is not None:
+            fetch_report.append(fetch)
+
+        # El extractor ya dejo el HTML del bloque y su texto.
+        content_html = fetch.block.html
+        content_text = fetch.block.text
 
         # Prefer "segun san X" from content, because title might differ in formatting.
         according_to_from_text = _infer_according_to(content_text)
         if according_to_from_text:
             according_to = according_to_from_text
 
-        items.append(
-            CECItem(
-                iso_date=target_iso,
-                title=title,
-                link=link,
-                citation_raw=citation_raw,
-                book_abbr=abbr,
-                book_name=book_name,
-                according_to=according_to,
-                content_html=content_html,
-                content_text=content_text,
-            )
+        item = CECItem(
+            iso_date=target_iso,
+            title=title,
+            link=link,
+            citation_raw=citation_raw,
+            book_abbr=abbr,
+            book_name=book_name,
+            according_to=according_to,
+            content_html=content_html,
+            content_text=content_text,
+        )
+        if store is not None:
+            store.upsert(item)
+        while stored and stored[-1].iso_date < item.iso_date:
+            yield stored.pop()
+        yield item
+    while stored:
+        yield stored.pop()
+
+
+def fetch_cec_items(
+    start_iso: str,
+    days_ahead: int,
+    workers: int = DEFAULT_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    rss_url: str = CEC_RSS_URL,
+    early_stop: bool = True,
+    stream_articles: bool = True,
+    fetch_report: Optional[list[ArticleFetch]] = None,
+    store: Optional[CECItemStore] = None,
+) -> list[CECItem]:
+    """Igual que iter_cec_items(), pero devuelve la lista completa."""
+    return list(
+        iter_cec_items(
+            start_iso,
+            days_ahead,
+            workers=workers,
+            per_host=per_host,
+            rss_url=rss_url,
+            early_stop=early_stop,
+            stream_articles=stream_articles,
+            fetch_report=fetch_report,
+            store=store,
         )
+    )
 
-    # Ensure stable order.
-    items.sort(key=lambda x: x.iso_date)
-    return items
+
+ITEM_FIELDS = (
+    "date",
+    "title",
+    "link",
+    "citation_raw",
+    "book_abbr",
+    "book_name",
+    "according_to",
+    "content_html",
+    "content_text",
+)
+# En NDJSON (consumo por la fase siguiente) el evangelio va una sola vez, como texto; el HTML se pide con --fields.
+NDJSON_DEFAULT_FIELDS = [name for name in ITEM_FIELDS if name != "content_html"]
+
+
+def _item_record(it: CECItem) -> dict[str, str]:
+    return {
+        "date": it.iso_date,
+        "title": it.title,
+        "link": it.link,
+        "citation_raw": it.citation_raw,
+        "book_abbr": it.book_abbr,
+        "book_name": it.book_name,
+        "according_to": it.according_to,
+        "content_html": it.content_html,
+        "content_text": it.content_text,
+    }
 
 
 def main() -> int:
@@ -244,36 +558,97 @@ def main() -> int:
     ap.add_argument("--start-date", required=True, help="YYYY-MM-DD")
     ap.add_argument("--days-ahead", type=int, default=3, help="Ventana (incluye start-date)")
     ap.add_argument("--out", default=None, help="Ruta JSON salida (default stdout)")
+    ap.add_argument("--rss-url", default=CEC_RSS_URL, help="Feed RSS (p.ej. una categoria para backfill)")
+    ap.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="json: un documento al final; ndjson: un registro compacto por dia apenas esta listo",
+    )
+    ap.add_argument(
+        "--fields",
+        default=None,
+        help=(
+            "Campos por registro, separados por coma, o 'all' "
+            "(default: todos en json; en ndjson todos menos content_html)"
+        ),
+    )
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Descargas de articulos en paralelo")
+    ap.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST,
+        help="Maximo de requests simultaneos al mismo host (cortesia con el servidor)",
+    )
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directorio de la cache HTTP en disco")
+    ap.add_argument("--no-cache", action="store_true", help="Desactiva la cache HTTP (siempre descarga)")
+    ap.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Tamaño maximo de la cache; al excederlo se expulsan las entradas menos usadas (LRU)",
+    )
+    ap.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Revalida tambien los articulos en cache (GET condicional) en vez de servirlos sin red",
+    )
+    ap.add_argument(
+        "--full-download",
+        action="store_true",
+        help="Descarga cada articulo completo (sin cortar la conexion al terminar el bloque schema:text)",
+    )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Usa el almacen local: solo descarga fechas nuevas o con articulo distinto",
+    )
+    ap.add_argument("--store", default=DEFAULT_STORE_PATH, help="Ruta del SQLite del modo incremental")
     args = ap.parse_args()
+    try:
+        fields = parse_fields(args.fields, ITEM_FIELDS)
+    except ValueError as exc:
+        ap.error(str(exc))
+    if args.fields is None and args.format == "ndjson":
+        fields = NDJSON_DEFAULT_FIELDS
+
+    if not args.no_cache:
+        configure_cache(
+            HttpCache(args.cache_dir, max_bytes=max(1, args.cache_max_mb) * 1024 * 1024, refresh=args.refresh_cache)
+        )
 
-    items = fetch_cec_items(args.start_date, max(0, int(args.days_ahead)))
-    payload = {
-        "source": "cec",
-        "rss": CEC_RSS_URL,
-        "start_date": args.start_date,
-        "days_ahead": int(args.days_ahead),
-        "items": [
-            {
-                "date": it.iso_date,
-                "title": it.title,
-                "link": it.link,
-                "citation_raw": it.citation_raw,
-                "book_abbr": it.book_abbr,
-                "book_name": it.book_name,
-                "according_to": it.according_to,
-                "content_html": it.content_html,
-                "content_text": it.content_text,
+    report: list[ArticleFetch] = []
+    store = CECItemStore(args.store) if args.incremental else None
+    items = iter_cec_items(
+        args.start_date,
+        max(0, int(args.days_ahead)),
+        workers=max(1, int(args.workers)),
+        per_host=max(1, int(args.per_host)),
+        rss_url=args.rss_url,
+        stream_articles=not args.full_download,
+        fetch_report=report,
+        store=store,
+    )
+    try:
+        if args.format == "ndjson":
+            write_ndjson(args.out, (_item_record(it) for it in items), fields)
+        else:
+            payload = {
+                "source": "cec",
+                "rss": args.rss_url,
+                "start_date": args.start_date,
+                "days_ahead": int(args.days_ahead),
+                "items": [select_fields(_item_record(it), fields) for it in items],
             }
-            for it in items
-        ],
-    }
-    out = json.dumps(payload, ensure_ascii=False, indent=2)
-    if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            f.write(out)
-            f.write("\n")
-    else:
-        sys.stdout.write(out + "\n")
+            write_document(args.out, payload)
+    finally:
+        if store is not None:
+            sys.stderr.write(f"store {store.stats.summary()}\n")
+            store.close()
+    sys.stderr.write(f"descargas {summarize_fetches(report)}\n")
+    sys.stderr.write(f"http {get_client().stats.summary()}\n")
+    if _CACHE is not None:
+        sys.stderr.write(f"cache {_CACHE.stats.summary()}\n")
     return 0
 
 
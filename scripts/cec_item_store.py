@@ -0,0 +1,160 @@
+"""
+Almacen local (SQLite) de items del scraper CEC para el modo incremental.
+
+Una fila por fecha (`iso_date`), con el hash del link del articulo y el hash del contenido:
+- Si la fecha ya esta con el mismo link y con contenido, el articulo no se vuelve a descargar.
+- Si el link cambio (la CEC reemplazo el articulo del dia) se descarga y se actualiza la fila.
+- El hash de contenido distingue un upsert con cambios de uno sin cambios.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Protocol
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "cec_items.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    iso_date TEXT PRIMARY KEY,
+    link TEXT NOT NULL,
+    link_hash TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    citation_raw TEXT NOT NULL,
+    book_abbr TEXT NOT NULL,
+    book_name TEXT NOT NULL,
+    according_to TEXT NOT NULL,
+    content_html TEXT NOT NULL,
+    content_text TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+_COLUMNS = (
+    "iso_date",
+    "title",
+    "link",
+    "citation_raw",
+    "book_abbr",
+    "book_name",
+    "according_to",
+    "content_html",
+    "content_text",
+)
+
+
+class _Item(Protocol):
+    iso_date: str
+    title: str
+    link: str
+    citation_raw: str
+    book_abbr: str
+    book_name: str
+    according_to: str
+    content_html: str
+    content_text: str
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StoreStats:
+    skipped: int = 0
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+
+    def summary(self) -> str:
+        return f"omitidos={self.skipped} nuevos={self.new} cambiados={self.changed} sin_cambios={self.unchanged}"
+
+
+class CECItemStore:
+    def __init__(self, path: str = DEFAULT_STORE_PATH) -> None:
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self.stats = StoreStats()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "CECItemStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def has(self, iso_date: str, link: str) -> bool:
+        """
+        True si la fecha ya esta capturada con el mismo articulo y con contenido (no hace falta
+        descargarlo). Una fila sin evangelio (bloque no encontrado, pagina cortada) se vuelve a bajar.
+        """
+        row = self._db.execute(
+            "SELECT link_hash, content_html FROM items WHERE iso_date = ?", (iso_date,)
+        ).fetchone()
+        return row is not None and row[0] == _sha256(link) and bool(row[1].strip())
+
+    def upsert(self, item: _Item) -> str:
+        """Inserta o actualiza la fila de la fecha. Devuelve "new", "changed" o "unchanged"."""
+        content_hash = _sha256(item.content_html)
+        row = self._db.execute(
+            "SELECT link_hash, content_hash FROM items WHERE iso_date = ?", (item.iso_date,)
+        ).fetchone()
+        if row is not None and row == (_sha256(item.link), content_hash):
+            self.stats.unchanged += 1
+            return "unchanged"
+        outcome = "new" if row is None else "changed"
+        self._db.execute(
+            """
+            INSERT INTO items (iso_date, link, link_hash, content_hash, title, citation_raw, book_abbr,
+                               book_name, according_to, content_html, content_text, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(iso_date) DO UPDATE SET
+                link = excluded.link,
+                link_hash = excluded.link_hash,
+                content_hash = excluded.content_hash,
+                title = excluded.title,
+                citation_raw = excluded.citation_raw,
+                book_abbr = excluded.book_abbr,
+                book_name = excluded.book_name,
+                according_to = excluded.according_to,
+                content_html = excluded.content_html,
+                content_text = excluded.content_text,
+                updated_at = excluded.updated_at
+            """,
+            (
+                item.iso_date,
+                item.link,
+                _sha256(item.link),
+                content_hash,
+                item.title,
+                item.citation_raw,
+                item.book_abbr,
+                item.book_name,
+                item.according_to,
+                item.content_html,
+                item.content_text,
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ),
+        )
+        self._db.commit()
+        setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+        return outcome
+
+    def rows_between(self, start_iso: str, end_iso: str) -> list[dict[str, str]]:
+        """Filas de la ventana ordenadas por fecha, con los campos de CECItem."""
+        rows = self._db.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM items WHERE iso_date BETWEEN ? AND ? ORDER BY iso_date",
+            (start_iso, end_iso),
+        ).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
@@ -0,0 +1,206 @@
+"""
+Localizacion de elementos del lado del navegador: una busqueda = un `execute_script`.
+
+Los helpers que iteran candidatos desde Python (`find_elements` + `is_displayed` / `is_enabled` /
+`.text` / `get_attribute` por elemento) hacen varios round trips HTTP a chromedriver por candidato.
+Aqui cada busqueda se describe con `strategy(...)` y el script filtra visibilidad, estado y texto en
+la pagina y devuelve solo el ganador (o la lista, con `locate_all`).
+
+`locate(driver, *strategies)` prueba las estrategias en orden y devuelve el primer elemento que cumple;
+`locate_all` devuelve todos los de la primera estrategia con resultados y `locate_props` una propiedad
+de cada uno (p.ej. `href`) sin un round trip por elemento. Si el contexto es un WebElement, es la raiz
+por defecto de las estrategias.
+Campos de una estrategia:
+- donde: `css` o `xpath` (relativos a `root`: el documento, un WebElement, o ese elemento subido con
+  `closest` (lista de selectores, gana el primero que tenga ancestro) o `root_xpath`); `scan_limit`
+  mira solo los primeros N candidatos; `exclude_closest` descarta los que estan dentro de ese selector.
+- filtros: `visible`, `enabled`, `text` (igual al texto con espacios colapsados), `text_in`
+  (contiene alguno, sin distinguir mayusculas), `text_empty`, `text_nonempty`, `text_not` (etiquetas
+  excluidas, en minusculas), `attr` (igualdad exacta), `attr_in` (contiene alguno). Si hay `text_in` y
+  `attr_in` basta con que se cumpla uno de los dos.
+
+`CommandCounter` cuenta los comandos que el driver manda a chromedriver, para medir el efecto.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any, Optional
+
+from selenium.webdriver.remote.webelement import WebElement
+
+_LOCATE_JS = r"""
+const strategies = arguments[0];
+const wantAll = arguments[1];
+const prop = arguments[2];
+const norm = (s) => (s || '').replace(/\s+/g, ' ').trim();
+function isVisible(el) {
+  if (!el.isConnected) return false;
+  const r = el.getBoundingClientRect();
+  if (r.width === 0 && r.height === 0) return false;
+  const s = getComputedStyle(el);
+  return s.visibility !== 'hidden' && s.display !== 'none' && s.opacity !== '0';
+}
+function isEnabled(el) {
+  return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+function rootOf(st) {
+  let root = st.root || document;
+  if (st.closest) {
+    let found = null;
+    for (const sel of st.closest) {
+      found = root.closest ? root.closest(sel) : null;
+      if (found) break;
+    }
+    if (!found) return null;
+    root = found;
+  }
+  if (st.root_xpath) {
+    root = document.evaluate(st.root_xpath, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return root;
+}
+function candidates(st, root) {
+  if (st.xpath) {
+    const r = document.evaluate(st.xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) {
+      const n = r.snapshotItem(i);
+      if (n.nodeType === 1) out.push(n);
+    }
+    return out;
+  }
+  return Array.from(root.querySelectorAll(st.css || '*'));
+}
+function matches(st, el) {
+  if (st.exclude_closest && el.closest(st.exclude_closest)) return false;
+  if (st.visible && !isVisible(el)) return false;
+  if (st.enabled && !isEnabled(el)) return false;
+  const text = norm(el.innerText !== undefined ? el.innerText : el.textContent);
+  if (st.text !== null && norm(el.textContent) !== st.text) return false;
+  if (st.text_empty && text) return false;
+  if (st.text_nonempty && !text) return false;
+  if (st.text_not && st.text_not.includes(text.toLowerCase())) return false;
+  if (st.attr) {
+    for (const [k, v] of Object.entries(st.attr)) if (el.getAttribute(k) !== v) return false;
+  }
+  const lower = text.toLowerCase();
+  const byText = st.text_in ? st.text_in.some((t) => lower.includes(t)) : null;
+  const byAttr = st.attr_in
+    ? Object.entries(st.attr_in).some(([k, vals]) => vals.some((v) => (el.getAttribute(k) || '').toLowerCase().includes(v)))
+    : null;
+  if (byText === false && byAttr !== true) return false;
+  if (byAttr === false && byText !== true) return false;
+  return true;
+}
+for (const st of strategies) {
+  const root = rootOf(st);
+  if (!root) continue;
+  let list = candidates(st, root);
+  if (st.scan_limit) list = list.slice(0, st.scan_limit);
+  const hits = list.filter((el) => matches(st, el));
+  if (wantAll) {
+    if (!hits.length) continue;
+    if (!prop) return hits;
+    return hits.map((el) => (Array.isArray(prop) ? prop.map((p) => el[p]) : el[prop]));
+  }
+  if (hits.length) return hits[0];
+}
+return wantAll ? [] : null;
+"""
+
+
+def strategy(
+    css: Optional[str] = None,
+    xpath: Optional[str] = None,
+    root: Optional[WebElement] = None,
+    closest: Optional[list[str]] = None,
+    root_xpath: Optional[str] = None,
+    scan_limit: Optional[int] = None,
+    exclude_closest: Optional[str] = None,
+    visible: bool = True,
+    enabled: bool = False,
+    text: Optional[str] = None,
+    text_in: Optional[list[str]] = None,
+    text_empty: bool = False,
+    text_nonempty: bool = False,
+    text_not: Optional[list[str]] = None,
+    attr: Optional[dict[str, str]] = None,
+    attr_in: Optional[dict[str, list[str]]] = None,
+) -> dict[str, Any]:
+    """Estrategia serializable para `locate` (ver docstring del modulo)."""
+    return {
+        "css": css,
+        "xpath": xpath,
+        "root": root,
+        "closest": closest,
+        "root_xpath": root_xpath,
+        "scan_limit": scan_limit,
+        "exclude_closest": exclude_closest,
+        "visible": visible,
+        "enabled": enabled,
+        "text": text,
+        "text_in": [t.lower() for t in text_in] if text_in else None,
+        "text_empty": text_empty,
+        "text_nonempty": text_nonempty,
+        "text_not": text_not,
+        "attr": attr,
+        "attr_in": {k: [v.lower() for v in vals] for k, vals in attr_in.items()} if attr_in else None,
+    }
+
+
+def _run(context, strategies: tuple[dict[str, Any], ...], want_all: bool, prop: Any = None):
+    # Acepta driver o WebElement (como `find_elements` sobre un elemento).
+    if isinstance(context, WebElement):
+        driver = context.parent
+        strategies = tuple(dict(st, root=context) if st.get("root") is None else st for st in strategies)
+    else:
+        driver = context
+    return driver.execute_script(_LOCATE_JS, list(strategies), want_all, prop)
+
+
+def locate(context, *strategies: dict[str, Any]) -> Optional[WebElement]:
+    """Primer elemento de la primera estrategia que encuentra algo; None si ninguna."""
+    return _run(context, strategies, False)
+
+
+def locate_all(context, *strategies: dict[str, Any]) -> list[WebElement]:
+    """Todos los elementos de la primera estrategia que encuentra algo (en orden del documento)."""
+    return _run(context, strategies, True) or []
+
+
+def locate_props(context, prop: str | list[str], *strategies: dict[str, Any]) -> list[Any]:
+    """Propiedad `prop` (o lista de propiedades) de cada elemento que devolveria `locate_all`."""
+    return _run(context, strategies, True, prop) or []
+
+
+class CommandCounter:
+    """
+    Cuenta los comandos WebDriver (round trips a chromedriver) por tipo, sumando todos los drivers
+    instalados (p.ej. los workers del Ordo).
+
+    `install` envuelve `driver.execute`, por donde pasan tambien los metodos de WebElement.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def install(self, driver) -> None:
+        original = driver.execute
+
+        def execute(command, params=None):
+            with self._lock:
+                self.counts[command] += 1
+            return original(command, params)
+
+        driver.execute = execute
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def summary(self, top: int = 6) -> str:
+        common = ",".join(f"{name}:{n}" for name, n in self.counts.most_common(top))
+        return f"comandos={self.total} ({common or '-'})"
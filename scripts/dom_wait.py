@@ -0,0 +1,296 @@
+"""
+Esperas de Selenium guiadas por eventos del DOM.
+
+`WebDriverWait` consulta la condicion cada 0.5 s (un round trip a chromedriver por intento) y los
+`time.sleep` fijos pagan siempre el peor caso. `DomWaiter.until` instala un `MutationObserver` en la
+pagina con `execute_async_script` y la promesa se resuelve en cuanto aparece (o desaparece) el
+selector, el texto o la URL esperada. Solo las condiciones con `url`, `url_changed_from` o `visible`
+agregan un sondeo de 100 ms dentro de la pagina, porque el History API y la visibilidad por CSS no
+siempre generan mutaciones. Un solo round trip por espera.
+
+Condiciones (`when`), se cumple la espera cuando se cumple cualquiera de ellas:
+- `css` / `xpath` / `locator=(By.X, sel)`: existe un elemento (opcional: `visible`, `enabled`, `text`).
+- `text` sin selector: el texto del ambito (`scope`, o body) contiene `text`.
+- `url`: la URL actual contiene `url` (se combina con las demas claves de la misma condicion).
+- `url_changed_from`: la URL actual es distinta.
+- `changed_from`: el texto del ambito (primeros 2000 caracteres) cambio respecto a ese valor.
+- `gone=True`: invierte la condicion de elemento (ningun elemento cumple).
+
+`scope` es un selector CSS; se usa el ultimo elemento que coincide (p.ej. la pagina Ionic activa) y si
+no hay ninguno, el body.
+
+Cada espera se registra (`espera_dom label=... ms=... ok=...`) y se acumula en `WaitStats`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+# Largo del texto del ambito que se compara en `changed_from` (igual en Python y en JS).
+SCOPE_TEXT_LIMIT = 2000
+
+_WAIT_JS = r"""
+const conds = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const t0 = performance.now();
+const LIMIT = arguments[2];
+const POLL = arguments[3];
+
+function scopeRoot(c) {
+  if (c.scope) {
+    const all = document.querySelectorAll(c.scope);
+    if (all.length) return all[all.length - 1];
+  }
+  return document.body || document.documentElement;
+}
+function isVisible(el) {
+  if (!el.isConnected) return false;
+  const r = el.getBoundingClientRect();
+  if (r.width === 0 && r.height === 0) return false;
+  const s = getComputedStyle(el);
+  return s.visibility !== 'hidden' && s.display !== 'none';
+}
+function elements(c, root) {
+  if (c.css) return Array.from(root.querySelectorAll(c.css));
+  if (c.xpath) {
+    const r = document.evaluate(c.xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) {
+      const n = r.snapshotItem(i);
+      if (n.nodeType === 1) out.push(n);
+    }
+    return out;
+  }
+  return [root];
+}
+// null: no se cumple; [el] o [null]: se cumple (con o sin elemento).
+function match(c) {
+  if (c.url !== null && !location.href.includes(c.url)) return null;
+  if (c.url_changed_from !== null && location.href === c.url_changed_from) return null;
+  const root = scopeRoot(c);
+  if (c.changed_from !== null) {
+    const text = ((root && root.innerText) || '').slice(0, LIMIT);
+    return text !== c.changed_from ? [null] : null;
+  }
+  if (!c.css && !c.xpath && c.text === null) return [null];
+  if (!root) return c.gone ? [null] : null;
+  for (const el of elements(c, root)) {
+    if (c.visible && !isVisible(el)) continue;
+    if (c.enabled && (el.disabled || el.getAttribute('aria-disabled') === 'true')) continue;
+    if (c.text !== null && !(el.innerText || el.textContent || '').includes(c.text)) continue;
+    return c.gone ? null : [el];
+  }
+  return c.gone ? [null] : null;
+}
+
+let finished = false, observer = null, poll = null, timer = null;
+function finish(res) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearInterval(poll);
+  clearTimeout(timer);
+  res.ms = performance.now() - t0;
+  done(res);
+}
+function tick() {
+  for (let i = 0; i < conds.length; i++) {
+    let m = null;
+    try { m = match(conds[i]); } catch (e) { m = null; }
+    if (m) return finish({ok: true, index: i, element: m[0]});
+  }
+}
+tick();
+if (!finished) {
+  observer = new MutationObserver(tick);
+  observer.observe(document.documentElement || document,
+                   {childList: true, subtree: true, characterData: true, attributes: true});
+  // URL (History API) y visibilidad por CSS no siempre generan mutaciones.
+  if (POLL) poll = setInterval(tick, 100);
+  timer = setTimeout(() => finish({ok: false, index: -1, element: null}), timeoutMs);
+}
+"""
+
+# Pausa antes de reintentar cuando la pagina navego durante la espera (el script se descarta).
+_RETRY_PAUSE = 0.05
+# Reinstalaciones por navegacion dentro de una misma espera; pasado el tope el error se propaga.
+_MAX_NAVIGATION_RETRIES = 10
+# Mensajes de chromedriver cuando el documento se descarta con el script en curso. Cualquier otro
+# WebDriverException (sesion cerrada, Chrome caido) se propaga de inmediato.
+_NAVIGATION_ERRORS = (
+    "document unloaded",
+    "navigated or closed",
+    "execution context was destroyed",
+    "cannot find context",
+)
+
+
+def _is_navigation_error(exc: WebDriverException) -> bool:
+    message = (exc.msg or str(exc)).lower()
+    return any(fragment in message for fragment in _NAVIGATION_ERRORS)
+
+
+def _needs_poll(conds: list[dict[str, Any]]) -> bool:
+    return any(c.get("url") is not None or c.get("url_changed_from") is not None or c.get("visible") for c in conds)
+
+
+def when(
+    css: Optional[str] = None,
+    xpath: Optional[str] = None,
+    locator: Optional[tuple[str, str]] = None,
+    text: Optional[str] = None,
+    url: Optional[str] = None,
+    url_changed_from: Optional[str] = None,
+    changed_from: Optional[str] = None,
+    scope: Optional[str] = None,
+    visible: bool = False,
+    enabled: bool = False,
+    gone: bool = False,
+) -> dict[str, Any]:
+    """Condicion serializable para `DomWaiter.until` (ver docstring del modulo)."""
+    if locator is not None:
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            css = value
+        elif by == By.XPATH:
+            xpath = value
+        elif by == By.ID:
+            css = f"[id='{value}']"
+        else:
+            raise ValueError(f"Localizador no soportado en DomWaiter: {by}")
+    return {
+        "css": css,
+        "xpath": xpath,
+        "text": text,
+        "url": url,
+        "url_changed_from": url_changed_from,
+        "changed_from": changed_from,
+        "scope": scope,
+        "visible": visible,
+        "enabled": enabled,
+        "gone": gone,
+    }
+
+
+@dataclass(frozen=True)
+class WaitResult:
+    ok: bool
+    element: Any  # WebElement o None
+    index: int  # condicion que se cumplio (-1 si expiro)
+    seconds: float
+
+
+@dataclass
+class WaitStats:
+    count: int = 0
+    timeouts: int = 0
+    seconds: float = 0.0
+    by_label: dict[str, list[float]] = field(default_factory=dict)
+
+    def add(self, label: str, seconds: float, ok: bool) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if not ok:
+            self.timeouts += 1
+        self.by_label.setdefault(label, []).append(seconds)
+
+    def merge(self, other: "WaitStats") -> None:
+        # Un WaitStats por hilo/driver; se combinan al final.
+        self.count += other.count
+        self.timeouts += other.timeouts
+        self.seconds += other.seconds
+        for label, values in other.by_label.items():
+            self.by_label.setdefault(label, []).extend(values)
+
+    def summary(self) -> str:
+        labels = " ".join(
+            f"{label}={sum(v) * 1000:.0f}ms/{len(v)}" for label, v in sorted(self.by_label.items())
+        )
+        return f"esperas={self.count} total={self.seconds:.2f}s timeouts={self.timeouts} {labels}".rstrip()
+
+
+class DomWaiter:
+    """
+    Esperas por eventos sobre un driver. `until` devuelve un WaitResult y, si `required`, levanta
+    TimeoutException al expirar (igual que WebDriverWait).
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeout: float = 15.0,
+        logger: Optional[logging.Logger] = None,
+        stats: Optional[WaitStats] = None,
+        tracer=None,
+    ) -> None:
+        self.driver = driver
+        # Opcional (run_trace.Tracer): cada espera queda ademas como span "espera_dom".
+        self.tracer = tracer
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger("dom_wait")
+        self.stats = stats if stats is not None else WaitStats()
+        self._script_timeout: Optional[float] = None
+
+    def _ensure_script_timeout(self, seconds: float) -> None:
+        # Un round trip extra solo cuando la espera es mas larga que la ultima configurada.
+        if self._script_timeout is None or self._script_timeout < seconds:
+            self.driver.set_script_timeout(seconds)
+            self._script_timeout = seconds
+
+    def until(
+        self,
+        *any_of: dict[str, Any],
+        timeout: Optional[float] = None,
+        label: str = "dom",
+        required: bool = True,
+        **condition: Any,
+    ) -> WaitResult:
+        conds = list(any_of)
+        if condition:
+            conds.append(when(**condition))
+        if not conds:
+            raise ValueError("DomWaiter.until requiere al menos una condicion.")
+        timeout = self.timeout if timeout is None else timeout
+        t0 = time.perf_counter()
+        deadline = t0 + timeout
+        poll = _needs_poll(conds)
+        retries = 0
+        result = None
+        while result is None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self._ensure_script_timeout(remaining + 2)
+            try:
+                raw = self.driver.execute_async_script(_WAIT_JS, conds, int(remaining * 1000), SCOPE_TEXT_LIMIT, poll)
+            except TimeoutException:
+                break
+            except WebDriverException as exc:
+                # La pagina navego (documento descargado) durante la espera: reinstalamos en la nueva.
+                if not _is_navigation_error(exc) or retries >= _MAX_NAVIGATION_RETRIES:
+                    raise
+                retries += 1
+                time.sleep(_RETRY_PAUSE)
+                continue
+            if isinstance(raw, dict) and raw.get("ok"):
+                result = raw
+            else:
+                break
+        seconds = time.perf_counter() - t0
+        ok = result is not None
+        self.stats.add(label, seconds, ok)
+        if self.tracer is not None:
+            self.tracer.record("espera_dom", t0, seconds, ok=ok, label=label)
+        self.logger.info("espera_dom label=%s ms=%.0f ok=%s", label, seconds * 1000, ok)
+        if not ok:
+            if required:
+                raise TimeoutException(f"Espera del DOM expirada: {label} ({timeout:.1f}s)")
+            return WaitResult(ok=False, element=None, index=-1, seconds=seconds)
+        return WaitResult(ok=True, element=result.get("element"), index=int(result.get("index", 0)), seconds=seconds)
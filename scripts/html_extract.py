@@ -0,0 +1,133 @@
+"""
+Extraccion de bloques HTML y conversion a texto, a nivel de bytes.
+
+Reemplaza la combinacion "regex DOTALL no-greedy sobre toda la pagina + varias pasadas `re.sub`":
+- Encuentra el tag de apertura del bloque objetivo (por defecto `<div property="schema:text">`) con
+  `find` del valor + una regex sobre el tag, y luego cuenta `<div` / `</div` (regex compilada sobre
+  bytes) hasta que la profundidad vuelve a 0: no se corta en el primer `</div>` interno.
+- Es incremental: `feed_bytes()` acepta bytes en trozos y devuelve `done` apenas el bloque cierra,
+  de modo que el llamador puede dejar de leer la respuesta. Antes del marcador solo se conserva una
+  cola corta; el cromo de la pagina no se decodifica ni se tokeniza.
+- Solo el bloque se decodifica (UTF-8) y pasa a texto (`html_to_text`: saltos por `<br>` y `</p>`,
+  sin etiquetas ni comentarios, entidades resueltas).
+
+Uso:
+  block = extract_block(html_bytes)
+  block.html, block.text
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_BR_RE = re.compile(r"<\s*br\s*/?\s*>", re.IGNORECASE)
+_P_END_RE = re.compile(r"</\s*p\s*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Cola conservada mientras se busca el marcador: debe cubrir los atributos previos dentro del tag.
+_PREFILTER_TAIL = 4 * 1024
+
+
+@dataclass(frozen=True)
+class ExtractedBlock:
+    found: bool
+    html: str
+    text: str
+
+
+class BlockExtractor:
+    """Extrae el HTML interno y el texto del primer `<tag attr="value">` de un documento en bytes."""
+
+    def __init__(self, tag: str = "div", attr: str = "property", value: str = "schema:text") -> None:
+        name = re.escape(tag.encode("ascii"))
+        self._marker = value.encode("utf-8")
+        self._open_re = re.compile(
+            rb"<" + name + rb"\b[^>]*?\b" + re.escape(attr.encode("ascii"))
+            + rb"""\s*=\s*(["'])""" + re.escape(self._marker) + rb"""\1[^>]*>""",
+            re.IGNORECASE,
+        )
+        # Comentarios primero: un `<div` comentado no cuenta.
+        self._depth_re = re.compile(rb"<!--.*?-->|<(/?)" + name + rb"\b[^>]*>", re.IGNORECASE | re.DOTALL)
+        self.found = False
+        self.done = False
+        self._buf = b""
+        self._start = 0  # inicio del HTML interno en _buf
+        self._end = -1  # fin del HTML interno (el `</div>` que cierra el bloque)
+        self._pos = 0  # hasta donde se contaron tags
+        self._depth = 0
+
+    def feed_bytes(self, chunk: bytes, final: bool = False) -> bool:
+        """Procesa un trozo de la pagina. Devuelve `done`."""
+        if self.done:
+            return True
+        buf = self._buf + chunk
+        if not self.found:
+            pos = buf.find(self._marker)
+            if pos < 0:
+                self._buf = buf[-_PREFILTER_TAIL:]
+                return False
+            # Retrocedemos al "<" del tag que contiene el marcador.
+            lt = buf.rfind(b"<", 0, pos)
+            match = self._open_re.match(buf, max(0, lt))
+            if match is None:
+                if buf.find(b">", pos) < 0 and not final:
+                    self._buf = buf[max(0, lt):]  # tag de apertura incompleto: esperar mas bytes
+                    return False
+                # El valor aparecio fuera del tag buscado (texto, otro atributo): seguir despues.
+                self._buf = b""
+                return self.feed_bytes(buf[pos + len(self._marker):], final)
+            buf = buf[match.start():]
+            self.found = True
+            self._start = self._pos = match.end() - match.start()
+            self._depth = 1
+        self._buf = buf
+        self._scan(final)
+        return self.done
+
+    def _scan(self, final: bool) -> None:
+        buf = self._buf
+        limit = len(buf)
+        if not final:
+            # Un comentario sin cerrar puede esconder tags: se cuenta hasta su inicio.
+            open_comment = buf.rfind(b"<!--", self._pos)
+            if open_comment >= 0 and buf.find(b"-->", open_comment) < 0:
+                limit = open_comment
+        for match in self._depth_re.finditer(buf, self._pos, limit):
+            self._pos = match.end()
+            if match.group(1) is None:  # comentario
+                continue
+            if match.group(1):
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = match.start()
+                    self.done = True
+                    return
+            elif not match.group(0).endswith(b"/>"):
+                self._depth += 1
+
+    def result(self) -> ExtractedBlock:
+        if not self.found:
+            return ExtractedBlock(found=False, html="", text="")
+        # Sin cierre (pagina cortada): todo lo recibido despues del tag de apertura.
+        end = self._end if self.done else len(self._buf)
+        inner = self._buf[self._start : end].decode("utf-8", errors="ignore").strip()
+        return ExtractedBlock(found=True, html=inner, text=html_to_text(inner))
+
+
+def extract_block(html_bytes: bytes, tag: str = "div", attr: str = "property", value: str = "schema:text") -> ExtractedBlock:
+    parser = BlockExtractor(tag=tag, attr=attr, value=value)
+    parser.feed_bytes(html_bytes, final=True)
+    return parser.result()
+
+
+def html_to_text(fragment: str) -> str:
+    """Texto de un fragmento HTML (saltos por <br> y </p>, sin etiquetas, entidades resueltas)."""
+    s = _COMMENT_RE.sub("", fragment)
+    s = _BR_RE.sub("\n", s)
+    s = _P_END_RE.sub("\n\n", s)
+    s = html.unescape(_TAG_RE.sub("", s))
+    return _MULTI_NEWLINE_RE.sub("\n\n", s).strip()
@@ -0,0 +1,166 @@
+"""
+Cache HTTP en disco con GET condicional y expulsion LRU acotada por tamaño.
+
+Cada URL se guarda como dos archivos bajo `cache_dir`:
+- `<sha256>.body`: cuerpo de la respuesta.
+- `<sha256>.json`: metadatos (`url`, `etag`, `last_modified`, `stored_at`, `last_used`, `size`, `complete`).
+
+`complete=False` marca un prefijo del cuerpo (lectura cortada a proposito, p.ej. el RSS de CEC con corte
+temprano): los validadores siguen sirviendo para el 304, pero quien lo usa tiene que saber que falta el resto.
+
+Politica:
+- Recursos inmutables (articulos CEC): si estan en cache se devuelven sin red, salvo `refresh=True`.
+- Resto (RSS): se revalidan con `If-None-Match` / `If-Modified-Since`; un 304 reutiliza el cuerpo.
+- Al superar `max_bytes` se eliminan las entradas con `last_used` mas antiguo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "http")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+    stored_at: float = 0.0
+    complete: bool = True
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evicted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def bump(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def summary(self) -> str:
+        return f"hits={self.hits} revalidated_304={self.revalidated} misses={self.misses} evicted={self.evicted}"
+
+
+class HttpCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES, refresh: bool = False) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max(0, int(max_bytes))
+        self.refresh = refresh
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + ".body", base + ".json"
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        body_path, meta_path = self._paths(url)
+        with self._lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(body_path, "rb") as f:
+                    body = f.read()
+            except (OSError, ValueError):
+                return None
+            if meta.get("url") != url:
+                return None
+            meta["last_used"] = time.time()
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        return CacheEntry(
+            url=url,
+            body=body,
+            etag=meta.get("etag") or "",
+            last_modified=meta.get("last_modified") or "",
+            stored_at=float(meta.get("stored_at") or 0.0),
+            complete=bool(meta.get("complete", True)),
+        )
+
+    def store(self, url: str, body: bytes, etag: str = "", last_modified: str = "", complete: bool = True) -> None:
+        body_path, meta_path = self._paths(url)
+        now = time.time()
+        meta = {
+            "url": url,
+            "etag": etag or "",
+            "last_modified": last_modified or "",
+            "stored_at": now,
+            "last_used": now,
+            "size": len(body),
+            "complete": bool(complete),
+        }
+        with self._lock:
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            self._evict_locked()
+
+    def conditional_headers(self, entry: Optional[CacheEntry]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _evict_locked(self) -> None:
+        if not self.max_bytes:
+            return
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.cache_dir, name)
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                size = int(meta.get("size") or 0)
+                last_used = float(meta.get("last_used") or 0.0)
+            except (OSError, ValueError):
+                size, last_used = 0, 0.0
+            total += size
+            entries.append((last_used, size, meta_path[: -len(".json")]))
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, base in entries:
+            if total <= self.max_bytes:
+                break
+            for suffix in (".body", ".json"):
+                try:
+                    os.unlink(base + suffix)
+                except OSError:
+                    pass
+            total -= size
+            self.stats.bump("evicted")
@@ -0,0 +1,390 @@
+"""
+Cliente HTTP(S) compartido con conexiones keep-alive por host.
+
+- Un solo `ssl.SSLContext` por proceso (el bundle de CA se parsea una vez; certifi si esta disponible).
+- Pool de conexiones ociosas por (scheme, host, port): requests sucesivos al mismo host reutilizan
+  la conexion TCP+TLS en vez de hacer un handshake nuevo.
+- `Accept-Encoding: gzip, deflate` y descompresion transparente (tambien incremental).
+- Sigue redirecciones (301/302/303/307/308); `request()` admite otros metodos con cuerpo y puede
+  devolver la redireccion sin seguirla (p.ej. para leer sus `Set-Cookie`). Si la redireccion lleva a
+  otro host, no se reenvian `Cookie` ni `Authorization`.
+- `open()` entrega el cuerpo en streaming y permite cortar la descarga antes de terminar.
+
+Es seguro usarlo desde varios hilos: cada request toma una conexion del pool en exclusiva.
+
+Uso:
+  from http_client import get_client
+  resp = get_client().get("https://www.cec.org.co/taxonomy/term/8097/feed")
+  resp.status, resp.headers.get("ETag"), resp.body
+
+  with get_client().open(url) as stream:
+      chunk = stream.read(16 * 1024)
+"""
+
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import zlib
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Optional
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import certifi  # type: ignore
+except Exception:  # pragma: no cover
+    certifi = None
+
+USER_AGENT = "diocese-automation/1.0 (+https://github.com/)"
+MAX_REDIRECTS = 5
+# Headers que no se reenvian a otro host al seguir una redireccion (como curl y los navegadores).
+_CREDENTIAL_HEADERS = ("cookie", "authorization")
+DEFAULT_MAX_IDLE_PER_HOST = 4
+
+# Errores tipicos de una conexion keep-alive que el servidor cerro mientras estaba ociosa.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_ssl_context_lock = threading.Lock()
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def default_ssl_context() -> ssl.SSLContext:
+    # macOS Python installs sometimes lack a working system CA bundle; prefer certifi when present.
+    global _ssl_context
+    with _ssl_context_lock:
+        if _ssl_context is None:
+            ctx = None
+            if certifi is not None:
+                try:
+                    ctx = ssl.create_default_context(cafile=certifi.where())
+                except Exception:
+                    ctx = None
+            _ssl_context = ctx or ssl.create_default_context()
+        return _ssl_context
+
+
+class HttpStatusError(RuntimeError):
+    def __init__(self, url: str, status: int, reason: str = "") -> None:
+        super().__init__(f"HTTP {status} {reason} url={url}".strip())
+        self.url = url
+        self.status = status
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    reason: str
+    headers: Message
+    body: bytes
+    wire_bytes: int
+
+
+@dataclass
+class ClientStats:
+    connections_opened: int = 0
+    requests: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, value in deltas.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def summary(self) -> str:
+        return (
+            f"connections={self.connections_opened} requests={self.requests} "
+            f"wire_bytes={self.wire_bytes} body_bytes={self.body_bytes}"
+        )
+
+
+class _StreamDecoder:
+    """Descompresion incremental de gzip/deflate (deflate con o sin cabecera zlib)."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = (encoding or "").strip().lower()
+        self._obj = None
+        if self.encoding == "gzip":
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def feed(self, chunk: bytes) -> bytes:
+        if self.encoding == "deflate" and self._obj is None and chunk:
+            # Cabecera zlib: CMF con metodo 8 y (CMF*256 + FLG) multiplo de 31.
+            has_header = len(chunk) >= 2 and (chunk[0] & 0x0F) == 8 and ((chunk[0] << 8) | chunk[1]) % 31 == 0
+            self._obj = zlib.decompressobj(zlib.MAX_WBITS if has_header else -zlib.MAX_WBITS)
+        if self._obj is None:
+            return chunk
+        return self._obj.decompress(chunk)
+
+    def flush(self) -> bytes:
+        return self._obj.flush() if self._obj is not None else b""
+
+
+class StreamingResponse:
+    """
+    Respuesta con cuerpo leido bajo demanda (ya descomprimido).
+
+    Si se lee hasta el final, la conexion vuelve al pool al cerrar. Si se cierra antes (p.ej. el
+    llamador ya encontro lo que buscaba), la conexion se descarta: el resto del cuerpo nunca se
+    descarga.
+    """
+
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(
+        self,
+        client: "HttpClient",
+        key,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        url: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self._client = client
+        self.chunk_size = max(1, chunk_size)
+        self._key = key
+        self._conn: Optional[http.client.HTTPConnection] = conn
+        self._resp = resp
+        self._decoder = _StreamDecoder(resp.headers.get("Content-Encoding", ""))
+        self._buffer = b""
+        self._eof = False
+        self.url = url
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+    @property
+    def complete(self) -> bool:
+        return self._eof and not self._buffer
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # read(amt) (no read1) marca la respuesta como cerrada al consumir Content-Length, lo que
+        # permite reutilizar la conexion.
+        raw = self._resp.read(self.chunk_size)
+        if not raw:
+            self._buffer += self._decoder.flush()
+            self._eof = True
+            return False
+        self.wire_bytes += len(raw)
+        self._buffer += self._decoder.feed(raw)
+        return True
+
+    def read(self, n: int = -1) -> bytes:
+        if n is None or n < 0:
+            while self._fill():
+                pass
+            out, self._buffer = self._buffer, b""
+        else:
+            while len(self._buffer) < n and self._fill():
+                pass
+            out, self._buffer = self._buffer[:n], self._buffer[n:]
+        self.body_bytes += len(out)
+        return out
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        self._client.stats.add(requests=1, wire_bytes=self.wire_bytes, body_bytes=self.body_bytes)
+        if self._eof and not self._resp.will_close:
+            self._client._checkin(self._key, conn)
+        else:
+            self._resp.close()
+            conn.close()
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HttpClient:
+    def __init__(
+        self,
+        timeout: float = 60,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+        user_agent: str = USER_AGENT,
+    ) -> None:
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.max_idle_per_host = max(0, max_idle_per_host)
+        self.user_agent = user_agent
+        self.stats = ClientStats()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, url: str) -> tuple[str, str, int]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Esquema no soportado: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        return scheme, (parts.hostname or "").lower(), port
+
+    def _checkout(self, key: tuple[str, str, int]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        if scheme == "https":
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self.ssl_context or default_ssl_context()
+            )
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        self.stats.add(connections_opened=1)
+        return conn, False
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, url: str, headers: dict[str, str], method: str = "GET", body: Optional[bytes] = None):
+        key = self._key(url)
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        req_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "*/*",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        req_headers.update(headers)
+
+        # Si una conexion reutilizada resulta estar cerrada, reintentamos una vez con una nueva.
+        for attempt in range(2):
+            conn, reused = self._checkout(key)
+            try:
+                conn.request(method, path, body=body, headers=req_headers)
+                return key, conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+        raise AssertionError("unreachable")
+
+    def open(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        allow_status: tuple[int, ...] = (),
+        chunk_size: int = StreamingResponse.CHUNK_SIZE,
+        method: str = "GET",
+        body: Optional[bytes] = None,
+        follow_redirects: bool = True,
+    ) -> StreamingResponse:
+        """Como get(), pero devuelve el cuerpo en streaming (ver StreamingResponse).
+
+        `chunk_size` es cuanto se lee del socket por vez: mas chico permite cortar antes.
+        """
+        headers = dict(headers or {})
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            key, conn, resp = self._send(current, headers, method, body)
+            stream = StreamingResponse(self, key, conn, resp, current, chunk_size=chunk_size)
+            location = resp.headers.get("Location")
+            if follow_redirects and resp.status in (301, 302, 303, 307, 308) and location:
+                stream.read()
+                stream.close()
+                target = urljoin(current, location)
+                if urlsplit(target).hostname != urlsplit(current).hostname:
+                    headers = {k: v for k, v in headers.items() if k.lower() not in _CREDENTIAL_HEADERS}
+                current = target
+                if resp.status not in (307, 308):
+                    # Como los navegadores: 301/302/303 siguen con GET y sin cuerpo.
+                    method, body = "GET", None
+                    headers.pop("Content-Type", None)
+                continue
+            if resp.status >= 400 and resp.status not in allow_status:
+                stream.close()
+                raise HttpStatusError(current, resp.status, resp.reason)
+            return stream
+        raise HttpStatusError(current, 310, "demasiadas redirecciones")
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None, allow_status: tuple[int, ...] = ()) -> HttpResponse:
+        """GET con redirecciones. Lanza HttpStatusError para status >= 400 no listados en `allow_status`."""
+        with self.open(url, headers=headers, allow_status=allow_status) as stream:
+            body = stream.read()
+        return HttpResponse(
+            url=stream.url,
+            status=stream.status,
+            reason=stream.reason,
+            headers=stream.headers,
+            body=body,
+            wire_bytes=stream.wire_bytes,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        allow_status: tuple[int, ...] = (),
+        follow_redirects: bool = True,
+    ) -> HttpResponse:
+        """Como get() con otro metodo y cuerpo; con follow_redirects=False devuelve la redireccion."""
+        with self.open(
+            url,
+            headers=headers,
+            allow_status=allow_status,
+            method=method,
+            body=body,
+            follow_redirects=follow_redirects,
+        ) as stream:
+            data = stream.read()
+        return HttpResponse(
+            url=stream.url,
+            status=stream.status,
+            reason=stream.reason,
+            headers=stream.headers,
+            body=data,
+            wire_bytes=stream.wire_bytes,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for idle in pools:
+            for conn in idle:
+                conn.close()
+
+
+_default_client_lock = threading.Lock()
+_default_client: Optional[HttpClient] = None
+
+
+def get_client() -> HttpClient:
+    """Cliente compartido del proceso (pool y contexto SSL comunes a todos los modulos)."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
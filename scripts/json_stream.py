@@ -0,0 +1,100 @@
+"""
+Lectura incremental de un array JSON grande (p.ej. `data` del API del Ordo) sin cargar todo el documento.
+
+`iter_array_items` recibe un stream binario (respuesta HTTP en streaming, archivo) y entrega los bytes
+crudos de cada elemento del array apenas se cierra; el llamador decide cuales decodificar con
+`json.loads`. Como el consumo es perezoso, dejar de iterar deja de leer el stream.
+
+El escaneo solo mira delimitadores estructurales (`{`, `}`, `[`, `]`) y salta los strings completos con
+una regex, asi que las llaves dentro de textos HTML no confunden la profundidad.
+
+Soporta el array en la raiz (`[...]`) o bajo una clave del objeto raiz (`{"data": [...]}`).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import BinaryIO, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# String JSON completo | comilla de un string que todavia no termino en el buffer | delimitador.
+_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|(")|([{}\[\]])', re.DOTALL)
+_COLON_BRACKET_RE = re.compile(rb"\s*:\s*(\[)?")
+
+
+class JSONStreamError(ValueError):
+    pass
+
+
+def iter_array_items(
+    source: BinaryIO, key: Optional[str] = "data", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Bytes de cada elemento del array raiz o de `raiz[key]` (elementos objeto o array)."""
+    key_token = b'"' + key.encode("utf-8") + b'"' if key is not None else None
+    buf = b""
+    pos = 0  # siguiente byte a escanear
+    depth = 0  # profundidad de {/[ antes de `pos`
+    array_depth: Optional[int] = None  # profundidad dentro del array buscado
+    item_start: Optional[int] = None
+    eof = False
+    while True:
+        if not eof:
+            chunk = source.read(chunk_size)
+            if chunk:
+                # Conservamos solo lo que aun se necesita (el elemento en curso).
+                keep = item_start if item_start is not None else pos
+                buf, pos = buf[keep:] + chunk, pos - keep
+                if item_start is not None:
+                    item_start = 0
+            else:
+                eof = True
+        while True:
+            m = _TOKEN_RE.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            if m.group(1) is not None:
+                # String cortado en el borde del buffer: esperar mas datos desde la comilla.
+                if eof:
+                    raise JSONStreamError("String JSON sin cerrar al final del stream.")
+                pos = m.start()
+                break
+            delim = m.group(2)
+            if delim is None:
+                # String completo: solo interesa la clave buscada en el objeto raiz.
+                if array_depth is None and depth == 1 and key_token is not None and m.group(0) == key_token:
+                    after = _COLON_BRACKET_RE.match(buf, m.end())
+                    pending = (after is None and not buf[m.end() :].strip()) or (
+                        after is not None and after.group(1) is None and after.end() == len(buf)
+                    )
+                    if pending and not eof:
+                        # Falta ver si despues viene ":" y "[" (o era un valor string).
+                        pos = m.start()
+                        break
+                    if after is not None and after.group(1) is not None:
+                        depth += 1
+                        array_depth = depth
+                        pos = after.end()
+                        continue
+                pos = m.end()
+                continue
+            if delim in b"{[":
+                if array_depth is None and depth == 0 and key_token is None and delim == b"[":
+                    array_depth = 1
+                elif array_depth is not None and depth == array_depth and item_start is None:
+                    item_start = m.start()
+                depth += 1
+            else:
+                depth -= 1
+                if array_depth is not None:
+                    if depth == array_depth and item_start is not None:
+                        yield buf[item_start : m.end()]
+                        item_start = None
+                    elif depth < array_depth:
+                        return
+            pos = m.end()
+        if eof:
+            if array_depth is None:
+                raise JSONStreamError(f"No se encontro el array {key!r} en el documento.")
+            raise JSONStreamError("Array JSON sin cerrar al final del stream.")
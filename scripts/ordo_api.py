@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+
+"""
+Ordo Colombiano via API: descarga el año liturgico completo (una vez por edicion) y responde por fecha.
+
+Fuente (ver docs/fuentes/ORDO_COLOMBIANO.md):
+- GET .../api-app/ediciones/obtener-contenido-completo con headers API-KEY, API-TOKEN y API-NAME.
+
+El contenido se guarda como un cache indexado por fecha (scripts/ordo_year_cache.py) en
+~/.cache/diocese-automation/ordo/. Mientras exista una edicion que cubra la fecha pedida no se vuelve
+a llamar al API (--refresh fuerza la descarga). Las consultas no abren navegador.
+
+Si el archivo de una edicion esta corrupto o es de otra version del formato, se borra y se vuelve a
+descargar. Si la descarga del año falla y ORDO_API_DAY_URL esta configurada, cada fecha que falte se
+pide por separado a ese endpoint (respaldo por fecha; ver docs/fuentes/ORDO_COLOMBIANO.md).
+
+La respuesta se procesa en streaming (scripts/json_stream.py): nunca se arma el documento completo en
+memoria. Con --window-only no se guarda la edicion: solo se decodifican los registros de la ventana y
+la descarga se corta apenas el array pasa la fecha final (el `data` viene en orden de fecha).
+
+Variables de entorno:
+- ORDO_API_KEY, ORDO_API_TOKEN (requeridas para descargar)
+- ORDO_API_NAME (default: APP-ORDO)
+- ORDO_API_URL (default: endpoint de produccion; util para apuntar a un servidor local)
+- ORDO_API_RETRIES (default: 2) reintentos ante 5xx
+- ORDO_API_DAY_URL (sin default) consulta por fecha para el respaldo, con `{fecha}` (YYYY-MM-DD)
+
+Uso:
+  python3 scripts/ordo_api.py --start-date 2026-02-07 --days-ahead 15 --out /tmp/ordo.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import http.client
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Iterator, Optional
+from urllib.parse import quote
+
+from http_client import HttpStatusError, StreamingResponse, get_client
+from json_stream import iter_array_items
+from ordo_year_cache import OrdoDay, OrdoYearCache, day_from_record, write_year_cache
+from scraper_output import OUTPUT_FORMATS, write_document, write_ndjson
+
+ORDO_API_URL = "https://74j2tngwfd.execute-api.us-east-1.amazonaws.com/api-app/ediciones/obtener-contenido-completo"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "ordo")
+
+# Con --window-only dejamos de leer al ver una fecha posterior a end + este margen (tolera desorden menor).
+WINDOW_EARLY_STOP_SLACK_DAYS = 2
+
+_EDITION_RE = re.compile(r"edicion-(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})\.ordoyc$")
+# Fecha de un registro crudo, sin decodificarlo entero.
+_FECHA_RE = re.compile(rb'"fecha"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+# Fallas de la descarga del año que habilitan el respaldo por fecha (HTTP, red, JSON o contenido invalido).
+_DOWNLOAD_ERRORS = (HttpStatusError, OSError, http.client.HTTPException, ValueError)
+
+
+@dataclass
+class IngestStats:
+    downloaded: bool = False
+    payload_bytes: int = 0  # bytes del JSON leidos (descomprimidos)
+    records: int = 0  # registros decodificados
+    stopped_early: bool = False
+    seconds: float = 0.0
+    day_requests: int = 0  # consultas del respaldo por fecha
+    rebuilt: int = 0  # ediciones en disco descartadas por invalidas
+
+    def summary(self) -> str:
+        origen = "descarga" if self.downloaded else "cache"
+        return (
+            f"origen={origen} bytes={self.payload_bytes} registros={self.records} "
+            f"corte_temprano={'si' if self.stopped_early else 'no'} segundos={self.seconds:.2f} "
+            f"consultas_por_fecha={self.day_requests} ediciones_invalidas={self.rebuilt}"
+        )
+
+
+def _api_headers() -> dict[str, str]:
+    key = os.getenv("ORDO_API_KEY")
+    token = os.getenv("ORDO_API_TOKEN")
+    missing = [name for name, value in (("ORDO_API_KEY", key), ("ORDO_API_TOKEN", token)) if not value]
+    if missing:
+        raise RuntimeError(f"Faltan variables de entorno para el API del Ordo: {', '.join(missing)}")
+    return {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "API-KEY": key or "",
+        "API-TOKEN": token or "",
+        "API-NAME": os.getenv("ORDO_API_NAME", "APP-ORDO"),
+    }
+
+
+def open_full_content(url: Optional[str] = None) -> StreamingResponse:
+    """Respuesta en streaming de `obtener-contenido-completo`, con reintentos y backoff ante 5xx."""
+    return _open_api(url or os.getenv("ORDO_API_URL", ORDO_API_URL))
+
+
+def _open_api(url: str) -> StreamingResponse:
+    headers = _api_headers()
+    retries = max(0, int(os.getenv("ORDO_API_RETRIES", "2")))
+    for attempt in range(retries + 1):
+        try:
+            return get_client().open(url, headers=headers)
+        except HttpStatusError as exc:
+            if exc.status < 500 or attempt == retries:
+                raise
+        time.sleep(2.0 * (attempt + 1))
+    raise AssertionError("unreachable")
+
+
+def iter_records(source) -> Iterator[dict[str, Any]]:
+    """Registros del array `data`, decodificados de a uno."""
+    for raw in iter_array_items(source, key="data"):
+        record = json.loads(raw)
+        if isinstance(record, dict):
+            yield record
+
+
+def iter_window_records(
+    source, start_iso: str, end_iso: str, early_stop: bool = True, stats: Optional[IngestStats] = None
+) -> Iterator[dict[str, Any]]:
+    """Solo decodifica los registros de [start, end]; con early_stop deja de leer al pasar la ventana."""
+    stop_after = (date.fromisoformat(end_iso) + timedelta(days=WINDOW_EARLY_STOP_SLACK_DAYS)).isoformat()
+    for raw in iter_array_items(source, key="data"):
+        m = _FECHA_RE.search(raw)
+        if m is None:
+            continue
+        fecha = m.group(1).decode("ascii")
+        if early_stop and fecha > stop_after:
+            if stats is not None:
+                stats.stopped_early = True
+            return
+        if start_iso <= fecha <= end_iso:
+            if stats is not None:
+                stats.records += 1
+            yield json.loads(raw)
+
+
+def fetch_day(iso_date: str, day_url: str, stats: Optional[IngestStats] = None) -> Optional[OrdoDay]:
+    """Un dia desde la consulta por fecha (misma envoltura `data` que el año); None si no viene."""
+    t0 = time.perf_counter()
+    found = None
+    with _open_api(day_url.replace("{fecha}", quote(iso_date))) as stream:
+        for record in iter_records(stream):
+            if str(record.get("fecha") or "")[:10] == iso_date:
+                found = day_from_record(record)
+        stream.read()
+    if stats is not None:
+        stats.day_requests += 1
+        stats.payload_bytes += stream.body_bytes
+        stats.records += found is not None
+        stats.seconds += time.perf_counter() - t0
+    return found
+
+
+def _edition_path(cache_dir: str, cache: OrdoYearCache) -> str:
+    return os.path.join(cache_dir, f"edicion-{cache.first_date.isoformat()}_{cache.last_date.isoformat()}.ordoyc")
+
+
+def find_edition(cache_dir: str, iso_date: str) -> Optional[str]:
+    """Archivo de una edicion ya descargada que cubre la fecha (por nombre, sin abrirlo)."""
+    for path in sorted(glob.glob(os.path.join(cache_dir, "edicion-*.ordoyc")), reverse=True):
+        m = _EDITION_RE.search(os.path.basename(path))
+        if m and m.group(1) <= iso_date <= m.group(2):
+            return path
+    return None
+
+
+def _open_cached(path: str, stats: Optional[IngestStats] = None) -> Optional[OrdoYearCache]:
+    """Edicion en disco; si esta corrupta o es de otro formato se borra y devuelve None (hay que descargar)."""
+    try:
+        return OrdoYearCache(path)
+    except ValueError as exc:
+        sys.stderr.write(f"ordo edicion_invalida path={path} error={exc}\n")
+        if stats is not None:
+            stats.rebuilt += 1
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+
+
+def ingest_edition(cache_dir: str = DEFAULT_CACHE_DIR, url: Optional[str] = None, stats: Optional[IngestStats] = None) -> str:
+    """Descarga el año completo y lo guarda como edicion indexada. Devuelve la ruta del archivo."""
+    t0 = time.perf_counter()
+    tmp_path = os.path.join(cache_dir, "edicion-nueva.ordoyc.part")
+    with open_full_content(url) as stream:
+        count = write_year_cache(tmp_path, iter_records(stream))
+        stream.read()  # cierre del objeto raiz: deja la conexion reutilizable
+    with OrdoYearCache(tmp_path) as cache:
+        path = _edition_path(cache_dir, cache)
+    os.replace(tmp_path, path)
+    if stats is not None:
+        stats.downloaded = True
+        stats.payload_bytes += stream.body_bytes
+        stats.records += count
+        stats.seconds += time.perf_counter() - t0
+    return path
+
+
+def open_edition(
+    iso_date: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    url: Optional[str] = None,
+    stats: Optional[IngestStats] = None,
+) -> OrdoYearCache:
+    """Edicion que cubre la fecha; solo descarga si no hay una valida en disco (o con refresh)."""
+    path = None if refresh else find_edition(cache_dir, iso_date)
+    cache = _open_cached(path, stats) if path else None
+    if cache is None:
+        cache = OrdoYearCache(ingest_edition(cache_dir, url=url, stats=stats))
+    return cache
+
+
+def iter_ordo_days(
+    start_iso: str,
+    days_ahead: int,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    url: Optional[str] = None,
+    stats: Optional[IngestStats] = None,
+    day_url: Optional[str] = None,
+) -> Iterator[OrdoDay]:
+    """Dias de la ventana presentes en el Ordo; si la ventana cruza de edicion, abre la siguiente.
+
+    El año se descarga a lo sumo una vez: si la edicion descargada no cubre una fecha, esa fecha se
+    omite. Si la descarga falla y hay `day_url` (o ORDO_API_DAY_URL), las fechas sin edicion se piden
+    de a una; sin consulta por fecha el error se propaga.
+    """
+    day_url = day_url or os.getenv("ORDO_API_DAY_URL") or None
+    start = date.fromisoformat(start_iso)
+    cache: Optional[OrdoYearCache] = None
+    downloaded = False
+    year_failed = False
+    try:
+        for i in range(days_ahead + 1):
+            current = (start + timedelta(days=i)).isoformat()
+            if cache is None or not cache.covers(current):
+                path = None if refresh and not downloaded else find_edition(cache_dir, current)
+                opened = _open_cached(path, stats) if path else None
+                if opened is None and not downloaded:
+                    downloaded = True
+                    try:
+                        opened = OrdoYearCache(ingest_edition(cache_dir, url=url, stats=stats))
+                    except _DOWNLOAD_ERRORS as exc:
+                        if day_url is None:
+                            raise
+                        year_failed = True
+                        sys.stderr.write(f"ordo descarga_anual_fallo error={type(exc).__name__}: {exc} (respaldo por fecha)\n")
+                if opened is None:
+                    if year_failed:
+                        day = fetch_day(current, day_url, stats)
+                        if day is not None:
+                            yield day
+                    continue
+                if cache is not None:
+                    cache.close()
+                cache = opened
+            day = cache.get(current)
+            if day is not None:
+                yield day
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def iter_window_days(
+    start_iso: str,
+    days_ahead: int,
+    url: Optional[str] = None,
+    early_stop: bool = True,
+    stats: Optional[IngestStats] = None,
+) -> Iterator[OrdoDay]:
+    """Dias de la ventana leidos directo del API (sin cache anual), cortando la descarga al pasarla."""
+    end_iso = (date.fromisoformat(start_iso) + timedelta(days=days_ahead)).isoformat()
+    t0 = time.perf_counter()
+    days: dict[str, OrdoDay] = {}
+    with open_full_content(url) as stream:
+        for record in iter_window_records(stream, start_iso, end_iso, early_stop=early_stop, stats=stats):
+            day = day_from_record(record)
+            days[day.fecha] = day
+    if stats is not None:
+        stats.downloaded = True
+        stats.payload_bytes += stream.body_bytes
+        stats.seconds += time.perf_counter() - t0
+    # Orden por fecha aunque el API no lo garantice.
+    for fecha in sorted(days):
+        yield days[fecha]
+
+
+def _day_record(day: OrdoDay) -> dict[str, Any]:
+    return {
+        "date": day.fecha,
+        "tiempo_liturgico": day.tiempo_liturgico,
+        "encabezado": day.encabezado,
+        "colores_dia": day.colores_dia,
+        "celebracion": day.celebracion,
+        "misa_referencias": day.misa_referencias,
+        "misa": day.misa,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Ordo Colombiano (API): datos liturgicos por fecha desde el cache anual.")
+    ap.add_argument("--start-date", default=None, help="YYYY-MM-DD (default: hoy)")
+    ap.add_argument("--days-ahead", type=int, default=15, help="Ventana (incluye start-date)")
+    ap.add_argument("--out", default=None, help="Ruta JSON salida (default stdout)")
+    ap.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="json: un documento al final; ndjson: un registro compacto por dia",
+    )
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directorio de las ediciones descargadas")
+    ap.add_argument("--refresh", action="store_true", help="Vuelve a descargar la edicion aunque este en disco")
+    ap.add_argument("--api-url", default=None, help="Endpoint obtener-contenido-completo (default: ORDO_API_URL)")
+    ap.add_argument(
+        "--api-day-url",
+        default=None,
+        help="Consulta por fecha con {fecha}, usada si falla la descarga del año (default: ORDO_API_DAY_URL)",
+    )
+    ap.add_argument(
+        "--window-only",
+        action="store_true",
+        help="No guarda la edicion: lee el API en streaming, conserva solo la ventana y corta al pasarla",
+    )
+    args = ap.parse_args()
+
+    start_iso = args.start_date or datetime.now().date().isoformat()
+    days_ahead = max(0, int(args.days_ahead))
+    stats = IngestStats()
+    if args.window_only:
+        days = iter_window_days(start_iso, days_ahead, url=args.api_url, stats=stats)
+    else:
+        days = iter_ordo_days(
+            start_iso,
+            days_ahead,
+            cache_dir=args.cache_dir,
+            refresh=args.refresh,
+            url=args.api_url,
+            stats=stats,
+            day_url=args.api_day_url,
+        )
+    records = (_day_record(d) for d in days)
+    if args.format == "ndjson":
+        write_ndjson(args.out, records)
+    else:
+        payload = {
+            "source": "ordo-api",
+            "start_date": start_iso,
+            "days_ahead": days_ahead,
+            "items": list(records),
+        }
+        write_document(args.out, payload)
+    sys.stderr.write(f"ordo {stats.summary()}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
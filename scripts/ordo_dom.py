@@ -0,0 +1,167 @@
+"""
+Extraccion de "Lecturas del dia" desde un snapshot HTML del Ordo (p.ej. `driver.page_source`).
+
+Equivalente en Python del script JS de `_extract_lecturas` (ordo_lecturas_selenium.py), para trabajar
+sin navegador sobre DOM guardados:
+- header: `ion-title h2` -> `ion-toolbar h2` -> primer `h2`.
+- secciones: cada `h2` de `ion-content` cuyo texto es una seccion conocida toma los hermanos
+  siguientes hasta el proximo `h2` (o un hermano que contenga un `h2` conocido).
+
+`innerText` se aproxima: espacios colapsados, saltos por `<br>` y por elementos de bloque.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Iterator, Optional, Union
+
+WANTED_SECTIONS = frozenset({"Primera lectura", "Salmo", "Segunda lectura", "Aclamación", "Evangelio"})
+
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+# Elementos que el navegador separa con salto de linea en innerText (p/h* con linea en blanco).
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "div", "dl", "dd", "dt", "fieldset", "figure", "footer",
+        "form", "header", "li", "main", "nav", "ol", "pre", "section", "table", "tr", "ul",
+        "ion-card", "ion-card-content", "ion-card-header", "ion-item", "ion-label", "ion-list", "ion-row",
+    }
+)
+_PARAGRAPH_TAGS = frozenset({"p", "h1", "h2", "h3", "h4", "h5", "h6"})
+_SKIP_TAGS = frozenset({"script", "style", "template", "noscript"})
+
+_WS_RE = re.compile(r"\s+")
+_LINE_EDGE_RE = re.compile(r" *\n *")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
+@dataclass(eq=False)
+class Element:
+    tag: str
+    parent: Optional["Element"] = None
+    children: list[Union["Element", str]] = field(default_factory=list)
+
+    def iter(self) -> Iterator["Element"]:
+        """Elementos descendientes en orden de documento (incluye self)."""
+        stack: list[Element] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(c for c in reversed(node.children) if isinstance(c, Element))
+
+    def find(self, tag: str) -> Optional["Element"]:
+        for node in self.iter():
+            if node is not self and node.tag == tag:
+                return node
+        return None
+
+    def find_all(self, tag: str) -> list["Element"]:
+        return [node for node in self.iter() if node is not self and node.tag == tag]
+
+    def next_element_sibling(self) -> Optional["Element"]:
+        if self.parent is None:
+            return None
+        siblings = self.parent.children
+        idx = next(i for i, c in enumerate(siblings) if c is self)
+        for c in siblings[idx + 1 :]:
+            if isinstance(c, Element):
+                return c
+        return None
+
+    def inner_text(self) -> str:
+        parts: list[str] = []
+        _collect_text(self, parts)
+        text = _LINE_EDGE_RE.sub("\n", "".join(parts))
+        return _MULTI_NEWLINE_RE.sub("\n\n", text).strip()
+
+
+def _collect_text(node: Element, parts: list[str]) -> None:
+    if node.tag in _SKIP_TAGS:
+        return
+    if node.tag == "br":
+        parts.append("\n")
+        return
+    brk = "\n\n" if node.tag in _PARAGRAPH_TAGS else "\n" if node.tag in _BLOCK_TAGS else ""
+    if brk:
+        parts.append(brk)
+    for child in node.children:
+        if isinstance(child, str):
+            parts.append(_WS_RE.sub(" ", child))
+        else:
+            _collect_text(child, parts)
+    if brk:
+        parts.append(brk)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document")
+        self._cur = self.root
+
+    def handle_starttag(self, tag, attrs):
+        el = Element(tag, parent=self._cur)
+        self._cur.children.append(el)
+        if tag not in _VOID_TAGS:
+            self._cur = el
+
+    def handle_startendtag(self, tag, attrs):
+        self._cur.children.append(Element(tag, parent=self._cur))
+
+    def handle_endtag(self, tag):
+        # Cierra hasta el ancestro con ese tag; cierres huerfanos se ignoran.
+        node: Optional[Element] = self._cur
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self._cur = node.parent
+
+    def handle_data(self, data):
+        self._cur.children.append(data)
+
+
+def parse_html(html_text: str) -> Element:
+    builder = _TreeBuilder()
+    builder.feed(html_text)
+    builder.close()
+    return builder.root
+
+
+def _first_h2_text(scope: Optional[Element]) -> str:
+    h2 = scope.find("h2") if scope is not None else None
+    return h2.inner_text() if h2 is not None else ""
+
+
+def extract_lecturas_html(html_text: str) -> tuple[str, dict[str, str]]:
+    """(header, secciones) con las mismas reglas y limpieza que `_extract_lecturas`."""
+    doc = parse_html(html_text)
+    header = (
+        _first_h2_text(doc.find("ion-title"))
+        or _first_h2_text(doc.find("ion-toolbar"))
+        or _first_h2_text(doc)
+    )
+
+    root = doc.find("ion-content") or doc.find("body") or doc
+    sections: dict[str, str] = {}
+    for h in root.find_all("h2"):
+        title = h.inner_text()
+        if title not in WANTED_SECTIONS:
+            continue
+        nodes = []
+        cur = h.next_element_sibling()
+        while cur is not None:
+            if cur.tag == "h2":
+                break
+            maybe_h2 = cur.find("h2")
+            if maybe_h2 is not None and maybe_h2.inner_text() in WANTED_SECTIONS:
+                break
+            nodes.append(cur)
+            cur = cur.next_element_sibling()
+        block = _MULTI_NEWLINE_RE.sub("\n\n", "\n".join(n.inner_text() for n in nodes)).strip()
+        sections[title] = block
+
+    cleaned = {k: v.strip() for k, v in sections.items() if v.strip()}
+    return header.strip(), cleaned
@@ -11,26 +11,124 @@ Motivacion:
 
 Este script reproduce el flujo:
 /inicio -> seleccionar fecha (flechas) -> click en la tarjeta del dia -> click "Lecturas del dia" -> extraer secciones.
+
+Navegacion (--navigation spa, default): la app se carga una sola vez. Se sigue el estado del SPA (ruta
+actual y fecha seleccionada); para el dia siguiente se vuelve a /inicio por el historial del SPA
+(`history.back()`, sin recargar: la fecha seleccionada se conserva) y se avanza una flecha, esperando
+a que la fecha mostrada cambie en vez de dormir un tiempo fijo. Solo si el estado se pierde se recarga
+/inicio y se recalcula la distancia desde la fecha que muestra la app. --navigation legacy conserva el
+flujo anterior (boton volver o recarga por dia) para comparar tiempos. Al final se reporta la latencia
+por dia en stderr.
+
+Las esperas usan scripts/dom_wait.py (MutationObserver via execute_async_script): se resuelven en cuanto
+el DOM muestra lo esperado, sin sleeps fijos ni el sondeo de 0.5 s de WebDriverWait. Cada espera se
+registra en stderr (`espera_dom label=... ms=...`) y al final se imprime el resumen `esperas_dom ...`.
+
+Con --workers N (solo spa) se abren N navegadores headless en paralelo: cada uno carga /inicio, va con
+las flechas directo a la fecha que le toca y extrae ese dia; los resultados se entregan en orden de
+fecha. N se limita por memoria disponible (ORDO_WORKER_MEMORY_MB por navegador, dejando
+ORDO_MEMORY_RESERVE_MB libres) para caber en el runner de GitHub (7 GB).
+
+Cada navegador bloquea imagenes, fuentes, media, analitica y embeds (scripts/browser_network.py, politica
+"ordo"); al final se imprime en stderr `red ...` con requests/bytes descargados y ahorrados.
+
+Captura (--capture xhr, default en spa): las secciones se arman desde el JSON que el SPA recibe de su
+backend (log de performance + Network.getResponseBody, ver scripts/ordo_xhr.py), sin esperar el render ni
+recorrer el DOM; si el dia ya llego en una respuesta anterior ni siquiera se abre la vista. La llegada
+de cada respuesta se espera como evento (hook de fetch/XHR en la pagina + DomWaiter), no sondeando el
+log. Si no aparece un JSON con el Evangelio del dia se vuelve a la extraccion del DOM (--capture dom la
+fuerza siempre).
+
+Las busquedas de tarjetas y botones se resuelven en el navegador con scripts/dom_locate.py (un
+`execute_script` por busqueda en vez de `is_displayed`/`.text` por candidato); al final se imprime en
+stderr `webdriver comandos=...` con los round trips a chromedriver de toda la corrida.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import logging
 import os
+import queue
+import re
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from typing import Iterator, Optional
 
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import WebDriverException
+
+from browser_network import BlockingPolicy, NetworkStats, apply_blocking, configure_options, policy_for
+from browser_network import JsonResponseCapture, read_performance_log
+from dom_locate import CommandCounter, locate, strategy
+from dom_wait import DomWaiter, WaitStats
+from ordo_xhr import sections_by_date
+from scraper_output import OUTPUT_FORMATS, write_document, write_ndjson
 
 
 INICIO_URL = "https://web-ordo-colombiano.cec.org.co/inicio"
+NAVIGATION_MODES = ("spa", "legacy")
+CAPTURE_MODES = ("xhr", "dom")
+
+MONTHS_ES = {
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7, "agosto": 8,
+    "septiembre": 9, "setiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
+}
+_CARD_DATE_RE = re.compile(r"\b(\d{1,2})\s+(?:de\s+)?([A-Za-z]+)(?:\s+(?:de\s+)?(\d{4}))?", re.IGNORECASE)
+
+# Estado visible del SPA en un solo round trip: ruta, texto de la pagina Ionic activa (las paginas
+# anteriores quedan en el DOM con .ion-page-hidden) y URL completa.
+ACTIVE_PAGE_CSS = ".ion-page:not(.ion-page-hidden)"
+_STATE_JS = r"""
+  const pages = Array.from(document.querySelectorAll('.ion-page:not(.ion-page-hidden)'));
+  const page = pages.length ? pages[pages.length - 1] : document.body;
+  return [location.pathname, (page.innerText || '').slice(0, 2000), location.href];
+"""
+# Espera maxima a que la UI refleje un click de flecha (la fecha cambia sin navegar).
+ARROW_TIMEOUT = float(os.getenv("ORDO_ARROW_TIMEOUT", "2"))
+# Espera maxima por el JSON de lecturas tras abrir la vista (luego se cae al DOM).
+XHR_TIMEOUT = float(os.getenv("ORDO_XHR_TIMEOUT", "3"))
+# Hook en la pagina (se instala antes de que cargue la app): cada respuesta JSON de fetch/XHR ya leida
+# incrementa `data-json-responses` en <html>. DomWaiter espera ese cambio de atributo (MutationObserver)
+# y recien entonces se lee el log de performance: un round trip por respuesta, sin sondeo.
+JSON_COUNTER_ATTR = "data-json-responses"
+_JSON_HOOK_JS = r"""
+(() => {
+  if (window.__jsonResponseHook) return;
+  window.__jsonResponseHook = true;
+  const ATTR = '%s';
+  const bump = () => {
+    const root = document.documentElement;
+    if (root) root.setAttribute(ATTR, String((+root.getAttribute(ATTR) || 0) + 1));
+  };
+  const isJson = (type) => (type || '').toLowerCase().includes('json');
+  const fetch0 = window.fetch;
+  if (fetch0) {
+    window.fetch = function (...args) {
+      return fetch0.apply(this, args).then((resp) => {
+        if (isJson(resp.headers.get('content-type'))) resp.clone().text().then(bump, bump);
+        return resp;
+      });
+    };
+  }
+  const send0 = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    this.addEventListener('loadend', () => {
+      if (this.status && isJson(this.getResponseHeader('content-type'))) bump();
+    });
+    return send0.apply(this, args);
+  };
+})();
+""" % JSON_COUNTER_ATTR
+_HEADER_CSS = "ion-title h2, ion-toolbar h2"
+
+# Guardia de memoria del modo --workers: consumo estimado por Chrome headless con la app Ionic y
+# memoria que se deja libre para el resto del job.
+WORKER_MEMORY_MB = int(os.getenv("ORDO_WORKER_MEMORY_MB", "700"))
+MEMORY_RESERVE_MB = int(os.getenv("ORDO_MEMORY_RESERVE_MB", "1024"))
 
 
 @dataclass(frozen=True)
@@ -40,6 +138,28 @@ class ReadingDay:
     sections: dict[str, str]
 
 
+@dataclass(frozen=True)
+class DayTiming:
+    iso_date: str
+    seconds: float  # desde que se empieza a navegar al dia hasta tener las secciones
+    transitions: int  # clicks/cambios de vista del SPA
+    reloads: int  # cargas completas de /inicio
+    source: str = "dom"  # de donde salieron las secciones: xhr (JSON capturado) o dom
+
+
+def summarize_timings(timings: list[DayTiming]) -> str:
+    if not timings:
+        return "dias=0"
+    total = sum(t.seconds for t in timings)
+    per_day = " ".join(f"{t.iso_date}={t.seconds:.2f}s" for t in timings)
+    xhr = sum(1 for t in timings if t.source == "xhr")
+    return (
+        f"dias={len(timings)} total={total:.2f}s promedio={total / len(timings):.2f}s "
+        f"transiciones={sum(t.transitions for t in timings)} recargas={sum(t.reloads for t in timings)} "
+        f"fuente_xhr={xhr} fuente_dom={len(timings) - xhr} {per_day}"
+    )
+
+
 def _parse_iso(d: str) -> date:
     return datetime.strptime(d, "%Y-%m-%d").date()
 
@@ -50,7 +170,7 @@ def _today_bogota_iso() -> str:
     return datetime.now().date().isoformat()
 
 
-def _new_driver(headless: bool = True) -> webdriver.Chrome:
+def _new_driver(headless: bool = True, policy: Optional[BlockingPolicy] = None) -> webdriver.Chrome:
     options = webdriver.ChromeOptions()
     if headless:
         options.add_argument("--headless=new")
@@ -59,60 +179,321 @@ def _new_driver(headless: bool = True) -> webdriver.Chrome:
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1400,900")
     options.page_load_strategy = "eager"
-    return webdriver.Chrome(options=options)
+    if policy is not None:
+        configure_options(options, policy)
+    driver = webdriver.Chrome(options=options)
+    if policy is not None:
+        apply_blocking(driver, policy)
+    return driver
+
+
+def _start_driver(
+    headless: bool, policy: Optional[BlockingPolicy] = None, commands: Optional[CommandCounter] = None
+) -> webdriver.Chrome:
+    driver = _new_driver(headless=headless, policy=policy)
+    if commands is not None:
+        commands.install(driver)
+    driver.set_page_load_timeout(int(os.getenv("ORDO_PAGE_LOAD_TIMEOUT", "90")))
+    return driver
 
 
-def _click_by_text(wait: WebDriverWait, text: str) -> None:
-    # XPath por texto visible. El Ordo usa componentes Ionic, asi que evitamos selectores fragiles.
-    el = wait.until(
-        EC.element_to_be_clickable(
-            (
-                By.XPATH,
-                f"//*[normalize-space()='{text}']"
-                f"|//*[self::ion-button or self::button or self::a][normalize-space()='{text}']"
-                f"|//*[contains(@class,'button')][normalize-space()='{text}']",
-            )
-        )
+def _close_driver(driver: webdriver.Chrome, network: Optional[NetworkStats]) -> None:
+    # El log de performance se lee antes de cerrar (se pierde con la sesion); Chrome se cierra igual.
+    try:
+        if network is not None:
+            network.collect(driver)
+    finally:
+        driver.quit()
+
+
+def _new_navigator(
+    driver: webdriver.Chrome,
+    wait_stats: Optional[WaitStats],
+    network: Optional[NetworkStats] = None,
+    capture: str = "dom",
+) -> "_OrdoNavigator":
+    waiter = DomWaiter(driver, timeout=float(os.getenv("ORDO_TIMEOUT", "30")), stats=wait_stats)
+    return _OrdoNavigator(
+        driver, waiter, network=network, capture=JsonResponseCapture() if capture == "xhr" else None
     )
+
+
+def _available_memory_mb() -> Optional[int]:
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def max_workers_for_memory(requested: int) -> int:
+    """Workers que caben en la memoria disponible (al menos 1; sin dato de memoria, los pedidos)."""
+    available = _available_memory_mb()
+    if available is None:
+        return max(1, requested)
+    fit = (available - MEMORY_RESERVE_MB) // max(1, WORKER_MEMORY_MB)
+    return max(1, min(requested, fit))
+
+
+def _click_by_text(waiter: DomWaiter, text: str) -> None:
+    # XPath por texto visible. El Ordo usa componentes Ionic, asi que evitamos selectores fragiles.
+    el = waiter.until(
+        xpath=(
+            f"//*[normalize-space()='{text}']"
+            f"|//*[self::ion-button or self::button or self::a][normalize-space()='{text}']"
+            f"|//*[contains(@class,'button')][normalize-space()='{text}']"
+        ),
+        visible=True,
+        enabled=True,
+        label=f"click_{text}",
+    ).element
     el.click()
 
 
-def _goto_day_by_arrows(driver: webdriver.Chrome, wait: WebDriverWait, delta_days: int) -> None:
+def _active_page_text(driver: webdriver.Chrome) -> str:
+    try:
+        return str(driver.execute_script(_STATE_JS)[1] or "")
+    except WebDriverException:
+        return ""
+
+
+def _goto_day_by_arrows(driver: webdriver.Chrome, waiter: DomWaiter, delta_days: int) -> None:
     if delta_days == 0:
         return
     label = "SIGUIENTE" if delta_days > 0 else "ANTERIOR"
     steps = abs(delta_days)
     for _ in range(steps):
-        _click_by_text(wait, label)
-        # Debounce: la UI actualiza header/estado sin navegar.
-        time.sleep(0.2)
+        before = _active_page_text(driver)
+        _click_by_text(waiter, label)
+        # La UI actualiza header/estado sin navegar: esperamos ese cambio en vez de un debounce fijo.
+        waiter.until(
+            changed_from=before, scope=ACTIVE_PAGE_CSS, timeout=ARROW_TIMEOUT, required=False, label="flecha"
+        )
 
 
-def _open_day_detail(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
+def _open_day_detail(driver: webdriver.Chrome) -> None:
     # En /inicio el "dia" se abre al hacer click en la tarjeta superior (fecha).
     # Selector robusto: primer elemento grande con la fecha (suele contener el icono de calendario).
-    candidates = driver.find_elements(By.CSS_SELECTOR, "ion-card, .card, .carta, div")
-    for el in candidates[:30]:
-        try:
-            if not el.is_displayed() or not el.is_enabled():
-                continue
-            txt = (el.text or "").strip()
-            # Heuristica: la tarjeta superior contiene el nombre del mes (Enero..Diciembre) o un numero + mes.
-            if any(m in txt for m in ("Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Setiembre", "Octubre", "Noviembre", "Diciembre")):
-                el.click()
-                return
-        except WebDriverException:
-            continue
+    # Heuristica: la tarjeta superior contiene el nombre del mes (Enero..Diciembre) o un numero + mes.
     # Fallback: click al header grande si existe.
-    header = driver.find_elements(By.CSS_SELECTOR, "ion-title, h1, h2")
-    if header:
-        header[0].click()
+    el = locate(
+        driver,
+        strategy(css="ion-card, .card, .carta, div", scan_limit=30, enabled=True, text_in=list(MONTHS_ES)),
+        strategy(css="ion-title, h1, h2", visible=False, scan_limit=1),
+    )
+    if el is not None:
+        el.click()
         return
     raise RuntimeError("No se pudo abrir el detalle del dia desde /inicio.")
 
 
-def _open_lecturas_del_dia(wait: WebDriverWait) -> None:
-    _click_by_text(wait, "Lecturas del día")
+def _open_lecturas_del_dia(waiter: DomWaiter) -> None:
+    _click_by_text(waiter, "Lecturas del día")
+
+
+def _displayed_date(text: str, around: date) -> Optional[date]:
+    """Primera fecha "7 de Febrero [de 2026]" del texto; sin año, la mas cercana a `around`."""
+    for m in _CARD_DATE_RE.finditer(text or ""):
+        month = MONTHS_ES.get(m.group(2).casefold())
+        if not month:
+            continue
+        day = int(m.group(1))
+        years = [int(m.group(3))] if m.group(3) else [around.year - 1, around.year, around.year + 1]
+        candidates = []
+        for year in years:
+            try:
+                candidates.append(date(year, month, day))
+            except ValueError:
+                continue
+        if candidates:
+            return min(candidates, key=lambda d: abs((d - around).days))
+    return None
+
+
+class _OrdoNavigator:
+    """
+    Sigue el estado del SPA para moverse entre dias con el minimo de transiciones.
+
+    `selected` es la fecha seleccionada en /inicio (None si no se pudo leer de la pantalla).
+    """
+
+    # Vistas que se apilan sobre /inicio (detalle del dia, lecturas) + margen.
+    MAX_BACK_STEPS = 3
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        waiter: DomWaiter,
+        quick_timeout: float = 5.0,
+        network: Optional[NetworkStats] = None,
+        capture: Optional[JsonResponseCapture] = None,
+    ) -> None:
+        self.driver = driver
+        self.waiter = waiter
+        self.network = network
+        self.capture = capture
+        self.json_seen = "0"  # ultimo valor visto de JSON_COUNTER_ATTR
+        if capture is not None:
+            self._install_json_hook()
+        # Lecturas encontradas en los JSON capturados: fecha ISO (None = sin fecha) -> (header, secciones).
+        self.xhr_days: dict[Optional[str], tuple[str, dict[str, str]]] = {}
+        self.quick_timeout = quick_timeout
+        self.selected: Optional[date] = None
+        self.transitions = 0
+        self.reloads = 0
+
+    def _install_json_hook(self) -> None:
+        # Para los documentos que se carguen desde ahora y para el actual (si ya hay uno).
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _JSON_HOOK_JS})
+            self.driver.execute_script(_JSON_HOOK_JS)
+        except WebDriverException:
+            pass
+
+    def _wait_json_response(self, timeout: float) -> bool:
+        """Espera a que el SPA termine de recibir otra respuesta JSON (o una que llego antes de esperar)."""
+        found = self.waiter.until(
+            css=f"html:not([{JSON_COUNTER_ATTR}='{self.json_seen}'])", timeout=timeout, required=False, label="json"
+        )
+        if not found.ok:
+            return False
+        try:
+            self.json_seen = found.element.get_attribute(JSON_COUNTER_ATTR) or "0"
+        except WebDriverException:
+            return False
+        return True
+
+    def _state(self) -> tuple[str, str, str]:
+        try:
+            path, text, href = self.driver.execute_script(_STATE_JS)
+            return str(path or ""), str(text or ""), str(href or "")
+        except WebDriverException:
+            return "", "", ""
+
+    def _read_selected(self, around: date) -> Optional[date]:
+        return _displayed_date(self._state()[1], around)
+
+    def load_inicio(self, around: date) -> None:
+        self.driver.get(INICIO_URL)
+        self.waiter.until(xpath="//*[contains(normalize-space(),'Inicio')]", label="inicio")
+        self.reloads += 1
+        # Tras una carga completa la app vuelve a "hoy".
+        self.selected = self._read_selected(around) or datetime.now().date()
+
+    def back_to_inicio(self, around: date) -> None:
+        # Historial del SPA: no recarga la app y conserva la fecha seleccionada. Paso a paso para no
+        # salir de la app si alguna vista no agrega entrada al historial.
+        for _ in range(self.MAX_BACK_STEPS):
+            path, _, href = self._state()
+            if path.rstrip("/").endswith("/inicio"):
+                return
+            self.driver.execute_script("window.history.back();")
+            self.transitions += 1
+            if not self.waiter.until(
+                url_changed_from=href, timeout=self.quick_timeout, required=False, label="historial"
+            ).ok:
+                break
+        self.load_inicio(around)
+
+    def step(self, delta_days: int) -> None:
+        label = "SIGUIENTE" if delta_days > 0 else "ANTERIOR"
+        for _ in range(abs(delta_days)):
+            before = self.selected
+            text = self._state()[1]
+            _click_by_text(self.waiter, label)
+            self.transitions += 1
+            expected = before + timedelta(days=1 if delta_days > 0 else -1) if before else None
+            # Esperamos a que la fecha mostrada cambie (en vez de un debounce fijo); el texto puede
+            # cambiar en varias mutaciones antes de mostrar la fecha nueva.
+            deadline = time.perf_counter() + (self.quick_timeout if expected else ARROW_TIMEOUT)
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self.waiter.until(
+                    changed_from=text, scope=ACTIVE_PAGE_CSS, timeout=remaining, required=False, label="flecha"
+                ).ok:
+                    break
+                text = self._state()[1]
+                if expected is None or _displayed_date(text, expected) == expected:
+                    break
+            # Solo damos la fecha por seleccionada si la pagina la muestra; si no (la espera expiro o
+            # la flecha no respondio), el proximo select() la vuelve a leer de la pagina.
+            confirmed = expected is not None and _displayed_date(text, expected) == expected
+            self.selected = expected if confirmed else None
+
+    def select(self, target: date) -> None:
+        if self.selected is None:
+            self.selected = self._read_selected(target) or datetime.now().date()
+        self.step((target - self.selected).days)
+
+    def poll_network(self) -> None:
+        # Un solo lector del log de performance: alimenta estadisticas de red y captura JSON.
+        events = read_performance_log(self.driver)
+        if self.network is not None:
+            self.network.feed(events)
+        if self.capture is not None:
+            for item in self.capture.feed(self.driver, events):
+                for key, value in sections_by_date(item.data).items():
+                    if key is None or key not in self.xhr_days or len(value[1]) > len(self.xhr_days[key][1]):
+                        self.xhr_days[key] = value
+
+    def _captured(self, iso_date: str, undated: bool = False) -> Optional[tuple[str, dict[str, str]]]:
+        if self.capture is None:
+            return None
+        self.poll_network()
+        found = self.xhr_days.get(iso_date)
+        if found is None and undated:
+            found = self.xhr_days.get(None)
+        # Sin Evangelio no sirve (p.ej. el año completo del API trae `evangelio` vacio).
+        return found if found is not None and "Evangelio" in found[1] else None
+
+    def _rendered_header(self) -> str:
+        found = self.waiter.until(
+            css=_HEADER_CSS, scope=ACTIVE_PAGE_CSS, timeout=self.quick_timeout, required=False, label="encabezado"
+        )
+        try:
+            return (found.element.text or "").strip() if found.ok else ""
+        except WebDriverException:
+            return ""
+
+    def read_lecturas(self, target: date, need_dom: bool = False) -> tuple[str, dict[str, str], str]:
+        """(header, secciones, fuente). Con captura, del JSON del SPA; si no llega, del DOM."""
+        iso = target.isoformat()
+        found = self._captured(iso)
+        if found is not None and found[0] and not need_dom:
+            # El SPA ya trajo este dia (p.ej. al seleccionar la fecha): no hace falta abrir la vista.
+            return found[0], found[1], "xhr"
+        # Las respuestas sin fecha solo valen si llegan al abrir la vista de este dia.
+        self.xhr_days.pop(None, None)
+        _open_day_detail(self.driver)
+        _open_lecturas_del_dia(self.waiter)
+        self.transitions += 2
+        if found is None and self.capture is not None:
+            deadline = time.perf_counter() + XHR_TIMEOUT
+            while found is None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._wait_json_response(remaining):
+                    break
+                found = self._captured(iso, undated=True)
+            if found is None:
+                # El log de performance puede llegar despues del evento en la pagina: una ultima lectura.
+                found = self._captured(iso, undated=True)
+        if found is not None and not need_dom:
+            return found[0] or self._rendered_header(), found[1], "xhr"
+        # Sin JSON (o hace falta el DOM para --save-dom): esperamos el render. Vista lista cuando aparece
+        # alguna de las secciones (ion-content ya existe en /inicio).
+        self.waiter.until(
+            text="Evangelio", scope=ACTIVE_PAGE_CSS, timeout=self.quick_timeout, required=False, label="lecturas"
+        )
+        if found is not None:
+            return found[0] or self._rendered_header(), found[1], "xhr"
+        header, sections = _extract_lecturas(self.driver)
+        return header, sections, "dom"
 
 
 def _extract_lecturas(driver: webdriver.Chrome) -> tuple[str, dict[str, str]]:
@@ -175,9 +556,155 @@ def _extract_lecturas(driver: webdriver.Chrome) -> tuple[str, dict[str, str]]:
     return header.strip(), cleaned
 
 
-def fetch_reading_days(start_iso: str, days_ahead: int, headless: bool = True) -> list[ReadingDay]:
+def _save_dom(driver: webdriver.Chrome, save_dom: str, iso_date: str) -> None:
+    # Snapshot del DOM ya renderizado: sirve de fixture para scripts/ordo_dom.py y los benchmarks.
+    os.makedirs(save_dom, exist_ok=True)
+    with open(os.path.join(save_dom, f"lecturas-{iso_date}.html"), "w", encoding="utf-8") as f:
+        f.write(driver.page_source)
+
+
+def _go_back_legacy(driver: webdriver.Chrome) -> None:
+    # Volver a inicio para continuar con el siguiente dia.
+    # El app suele tener un boton de volver (flecha) en la barra superior.
+    back = locate(
+        driver,
+        strategy(
+            css="ion-button, button",
+            scan_limit=25,
+            enabled=True,
+            text_in=["volver", "back"],
+            attr_in={"name": ["arrow-back"]},
+        ),
+    )
+    if back is not None:
+        back.click()
+        return
+    driver.get(INICIO_URL)
+
+
+def _read_day_spa(nav: _OrdoNavigator, target: date, save_dom: Optional[str]) -> tuple[ReadingDay, DayTiming]:
+    t0 = time.perf_counter()
+    transitions, reloads = nav.transitions, nav.reloads
+    nav.back_to_inicio(target)
+    nav.select(target)
+    header, sections, source = nav.read_lecturas(target, need_dom=bool(save_dom))
+    if save_dom:
+        _save_dom(nav.driver, save_dom, target.isoformat())
+    timing = DayTiming(
+        iso_date=target.isoformat(),
+        seconds=time.perf_counter() - t0,
+        transitions=nav.transitions - transitions,
+        reloads=nav.reloads - reloads,
+        source=source,
+    )
+    return ReadingDay(iso_date=target.isoformat(), header=header, sections=sections), timing
+
+
+def _iter_parallel(
+    targets: list[date],
+    workers: int,
+    headless: bool,
+    save_dom: Optional[str],
+    timings: Optional[list[DayTiming]],
+    wait_stats: Optional[WaitStats],
+    network: NetworkStats,
+    capture: str,
+    commands: Optional[CommandCounter] = None,
+) -> Iterator[ReadingDay]:
+    """
+    Pool de `workers` navegadores: cada hilo toma la siguiente fecha pendiente, navega desde /inicio
+    directo a esa fecha y extrae el dia. Se entrega en orden de fecha apenas esta listo el siguiente.
+    """
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for index, target in enumerate(targets):
+        pending.put((index, target))
+    results: dict[int, tuple[ReadingDay, DayTiming]] = {}
+    errors: list[BaseException] = []
+    ready = threading.Condition()
+    stop = threading.Event()
+    worker_stats = [WaitStats() for _ in range(workers)]
+    worker_network = [NetworkStats(network.policy) for _ in range(workers)]
+
+    def run(stats: WaitStats, net: NetworkStats) -> None:
+        driver = None
+        try:
+            driver = _start_driver(headless, net.policy, commands)
+            nav = _new_navigator(driver, stats, net, capture)
+            while not stop.is_set():
+                try:
+                    index, target = pending.get_nowait()
+                except queue.Empty:
+                    return
+                if not nav.reloads:
+                    nav.load_inicio(target)
+                result = _read_day_spa(nav, target, save_dom)
+                with ready:
+                    results[index] = result
+                    ready.notify_all()
+        except BaseException as exc:
+            with ready:
+                errors.append(exc)
+                ready.notify_all()
+        finally:
+            if driver is not None:
+                _close_driver(driver, net)
+
+    threads = [
+        threading.Thread(target=run, args=(stats, net), daemon=True)
+        for stats, net in zip(worker_stats, worker_network)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for index in range(len(targets)):
+            with ready:
+                while index not in results and not errors:
+                    ready.wait()
+                if index not in results:
+                    raise errors[0]
+                day, timing = results.pop(index)
+            if timings is not None:
+                timings.append(timing)
+            yield day
+    finally:
+        # Al cerrar el iterador (o ante error) los hilos terminan el dia en curso y cierran su driver.
+        stop.set()
+        for thread in threads:
+            thread.join()
+        if wait_stats is not None:
+            for stats in worker_stats:
+                wait_stats.merge(stats)
+        for net in worker_network:
+            network.merge(net)
+
+
+def iter_reading_days(
+    start_iso: str,
+    days_ahead: int,
+    headless: bool = True,
+    save_dom: Optional[str] = None,
+    navigation: str = "spa",
+    timings: Optional[list[DayTiming]] = None,
+    wait_stats: Optional[WaitStats] = None,
+    workers: int = 1,
+    network: Optional[NetworkStats] = None,
+    capture: str = "xhr",
+    commands: Optional[CommandCounter] = None,
+) -> Iterator[ReadingDay]:
+    """Entrega cada dia apenas se extrae (el navegador se cierra al agotar o cerrar el iterador).
+
+    Si se pasa `timings`, se agrega un DayTiming por dia (latencia de navegacion + extraccion);
+    `wait_stats` acumula la latencia de cada espera del DOM. Con `workers` > 1 (solo navegacion spa)
+    los dias se extraen en paralelo con un navegador por worker (ver `max_workers_for_memory`).
+    `network` acumula las estadisticas de red (default: politica "ordo" de browser_network).
+    `capture` ("xhr" | "dom") elige la fuente de las secciones en navegacion spa (legacy siempre usa DOM).
+    `commands` cuenta los comandos WebDriver de todos los navegadores.
+    """
     start = _parse_iso(start_iso)
-    out: list[ReadingDay] = []
+    if network is None:
+        network = NetworkStats(policy_for("ordo"))
+    if workers > 1 and navigation != "spa":
+        raise RuntimeError("--workers > 1 solo esta disponible con --navigation spa.")
 
     # Limitacion operativa confirmada por el equipo:
     # En la UI del Ordo las flechas suelen permitir navegar solo ~3 dias adelante/atras desde "hoy".
@@ -190,63 +717,85 @@ def fetch_reading_days(start_iso: str, days_ahead: int, headless: bool = True) -
             f"Usa --days-ahead {max_delta} o ajusta la estrategia de extraccion."
         )
 
-    driver = _new_driver(headless=headless)
-    driver.set_page_load_timeout(int(os.getenv("ORDO_PAGE_LOAD_TIMEOUT", "90")))
-    wait = WebDriverWait(driver, int(os.getenv("ORDO_TIMEOUT", "30")))
+    today = datetime.now().date()
+    delta = (start - today).days
+    if abs(delta) > max_delta:
+        raise RuntimeError(
+            f"El Ordo (UI) parece limitar la navegacion por flechas a +/- {max_delta} dias desde hoy. "
+            f"start_date={start_iso} delta={delta} esta fuera del rango."
+        )
 
-    try:
-        driver.get(INICIO_URL)
-        # Esperar a que cargue algo representativo.
-        wait.until(EC.presence_of_element_located((By.XPATH, "//*[contains(normalize-space(),'Inicio')]")))
-
-        today = datetime.now().date()
-        # Navegamos a start date desde "hoy" usando flechas.
-        delta = (start - today).days
-        if abs(delta) > max_delta:
-            raise RuntimeError(
-                f"El Ordo (UI) parece limitar la navegacion por flechas a +/- {max_delta} dias desde hoy. "
-                f"start_date={start_iso} delta={delta} esta fuera del rango."
-            )
-        _goto_day_by_arrows(driver, wait, delta)
+    targets = [start + timedelta(days=i) for i in range(days_ahead + 1)]
+    workers = min(max(1, workers), len(targets))
+    if workers > 1:
+        yield from _iter_parallel(
+            targets, workers, headless, save_dom, timings, wait_stats, network, capture, commands
+        )
+        return
+
+    driver = _start_driver(headless, network.policy, commands)
+    nav = _new_navigator(driver, wait_stats, network, capture if navigation == "spa" else "dom")
+    waiter = nav.waiter
 
-        for i in range(days_ahead + 1):
-            current = (start + timedelta(days=i)).isoformat()
-            _open_day_detail(driver, wait)
-            _open_lecturas_del_dia(wait)
+    try:
+        nav.load_inicio(start)
+        for i, target in enumerate(targets):
+            if navigation != "legacy":
+                day, timing = _read_day_spa(nav, target, save_dom)
+                if timings is not None:
+                    timings.append(timing)
+                yield day
+                continue
 
+            current = target.isoformat()
+            t0 = time.perf_counter()
+            transitions, reloads = nav.transitions, nav.reloads
+            if i == 0:
+                _goto_day_by_arrows(driver, waiter, delta)
+                nav.transitions += abs(delta)
+            _open_day_detail(driver)
+            _open_lecturas_del_dia(waiter)
+            nav.transitions += 2
             # Esperar header en lectura
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ion-content")))
-            except TimeoutException:
-                pass
+            waiter.until(css="ion-content", required=False, label="lecturas")
 
             header, sections = _extract_lecturas(driver)
-            out.append(ReadingDay(iso_date=current, header=header, sections=sections))
+            if save_dom:
+                _save_dom(driver, save_dom, current)
 
-            # Volver a inicio para continuar con el siguiente dia.
-            # El app suele tener un boton de volver (flecha) en la barra superior.
-            back = driver.find_elements(By.CSS_SELECTOR, "ion-button, button")
-            clicked = False
-            for b in back[:25]:
-                try:
-                    if not b.is_displayed() or not b.is_enabled():
-                        continue
-                    label = (b.text or "").strip().lower()
-                    icon = (b.get_attribute("name") or "").lower()
-                    if "volver" in label or "back" in label or "arrow-back" in icon:
-                        b.click()
-                        clicked = True
-                        break
-                except WebDriverException:
-                    continue
-            if not clicked:
-                driver.get(INICIO_URL)
+            _go_back_legacy(driver)
+            nav.transitions += 1
             # Avanzar un dia en inicio si falta
             if i < days_ahead:
-                _goto_day_by_arrows(driver, wait, 1)
+                _goto_day_by_arrows(driver, waiter, 1)
+                nav.transitions += 1
+            if timings is not None:
+                timings.append(
+                    DayTiming(
+                        iso_date=current,
+                        seconds=time.perf_counter() - t0,
+                        transitions=nav.transitions - transitions,
+                        reloads=nav.reloads - reloads,
+                    )
+                )
+            yield ReadingDay(iso_date=current, header=header, sections=sections)
     finally:
-        driver.quit()
-    return out
+        _close_driver(driver, network)
+
+
+def fetch_reading_days(
+    start_iso: str,
+    days_ahead: int,
+    headless: bool = True,
+    navigation: str = "spa",
+    workers: int = 1,
+    capture: str = "xhr",
+) -> list[ReadingDay]:
+    return list(
+        iter_reading_days(
+            start_iso, days_ahead, headless=headless, navigation=navigation, workers=workers, capture=capture
+        )
+    )
 
 
 def main() -> int:
@@ -255,28 +804,93 @@ def main() -> int:
     parser.add_argument("--days-ahead", type=int, default=15, help="Ventana futura (incluye start_date)")
     parser.add_argument("--headed", action="store_true", help="Mostrar navegador (no headless)")
     parser.add_argument("--out", default=None, help="Ruta de salida JSON (opcional; default stdout)")
+    parser.add_argument(
+        "--save-dom",
+        default=None,
+        help="Directorio donde guardar el DOM de cada dia (lecturas-YYYY-MM-DD.html) para benchmarks",
+    )
+    parser.add_argument(
+        "--navigation",
+        choices=NAVIGATION_MODES,
+        default="spa",
+        help="spa: una sola carga y vuelta por historial; legacy: flujo anterior (para comparar tiempos)",
+    )
+    parser.add_argument(
+        "--capture",
+        choices=CAPTURE_MODES,
+        default="xhr",
+        help="xhr: secciones desde el JSON que recibe el SPA (DOM como respaldo); dom: siempre desde el DOM",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("ORDO_WORKERS", "1")),
+        help="Navegadores en paralelo (solo spa); se limita por memoria disponible",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="json: un documento al final; ndjson: un registro compacto por dia apenas se extrae",
+    )
     args = parser.parse_args()
 
     start_iso = args.start_date or _today_bogota_iso()
     days_ahead = max(0, int(args.days_ahead))
-
-    data = fetch_reading_days(start_iso, days_ahead, headless=not args.headed)
-    payload = {
-        "source": "ordo-ui",
-        "start_date": start_iso,
-        "days_ahead": days_ahead,
-        "items": [
-            {"date": d.iso_date, "header": d.header, "sections": d.sections} for d in data
-        ],
-    }
-
-    encoded = json.dumps(payload, ensure_ascii=False, indent=2)
-    if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            f.write(encoded)
-            f.write("\n")
-    else:
-        sys.stdout.write(encoded + "\n")
+    workers = max(1, args.workers)
+    if workers > 1:
+        allowed = max_workers_for_memory(workers)
+        if allowed < workers:
+            sys.stderr.write(
+                f"workers={workers} limitado a {allowed} por memoria disponible "
+                f"({_available_memory_mb()} MB, {WORKER_MEMORY_MB} MB por navegador, reserva {MEMORY_RESERVE_MB} MB)\n"
+            )
+        workers = allowed
+
+    # Latencia de cada espera del DOM (dom_wait) en stderr.
+    logging.basicConfig(level=os.getenv("ORDO_LOG_LEVEL", "INFO").upper(), format="%(message)s", stream=sys.stderr)
+    timings: list[DayTiming] = []
+    wait_stats = WaitStats()
+    network = NetworkStats(policy_for("ordo"))
+    commands = CommandCounter()
+    days = iter_reading_days(
+        start_iso,
+        days_ahead,
+        headless=not args.headed,
+        save_dom=args.save_dom,
+        navigation=args.navigation,
+        timings=timings,
+        wait_stats=wait_stats,
+        workers=workers,
+        network=network,
+        capture=args.capture,
+        commands=commands,
+    )
+    records = ({"date": d.iso_date, "header": d.header, "sections": d.sections} for d in days)
+    t0 = time.perf_counter()
+    try:
+        if args.format == "ndjson":
+            write_ndjson(args.out, records)
+        else:
+            payload = {
+                "source": "ordo-ui",
+                "start_date": start_iso,
+                "days_ahead": days_ahead,
+                "items": list(records),
+            }
+            write_document(args.out, payload)
+    finally:
+        sys.stderr.write(
+            f"navegacion modo={args.navigation} captura={args.capture} workers={workers} pared={time.perf_counter() - t0:.2f}s "
+            f"{summarize_timings(timings)}\n"
+        )
+        sys.stderr.write(f"esperas_dom {wait_stats.summary()}\n")
+        try:
+            network.save_observed_sizes()
+        except OSError as exc:
+            sys.stderr.write(f"no se guardaron los tamaños de red: {exc}\n")
+        sys.stderr.write(f"red {network.summary()}\n")
+        sys.stderr.write(f"webdriver {commands.summary()}\n")
     return 0
 
 
@@ -0,0 +1,122 @@
+"""
+Secciones de "Lecturas del dia" a partir del JSON que el SPA del Ordo recibe de su backend.
+
+En modo captura (`ordo_lecturas_selenium.py --capture xhr`) se leen las respuestas XHR/fetch con
+`browser_network.JsonResponseCapture` y este modulo arma `ReadingDay.sections` sin esperar el render
+ni recorrer el DOM.
+
+El formato exacto de la respuesta no esta documentado, asi que el mapeo es tolerante:
+- claves con el nombre de la seccion (`primera_lectura`, `primeraLectura`, `Salmo responsorial`,
+  `aclamacion`, `evangelio`...), con texto/HTML o con un objeto que tenga el texto (`texto`, `contenido`...);
+- o listas de objetos `{titulo/nombre/tipo: "Primera lectura", texto/contenido: "..."}`.
+Si el objeto trae fecha (`fecha`, `date`, `dia`) debe coincidir con el dia pedido; por fecha se
+queda el objeto con mas secciones. El HTML se pasa a texto con `html_extract.html_to_text`.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Iterator, Optional
+
+from html_extract import html_to_text
+
+# Clave normalizada (sin tildes, minusculas, solo letras/numeros) -> seccion (como en ordo_dom.WANTED_SECTIONS).
+SECTION_KEYS = {
+    "primeralectura": "Primera lectura",
+    "lectura1": "Primera lectura",
+    "salmo": "Salmo",
+    "salmoresponsorial": "Salmo",
+    "segundalectura": "Segunda lectura",
+    "lectura2": "Segunda lectura",
+    "aclamacion": "Aclamación",
+    "aclamacionantesdelevangelio": "Aclamación",
+    "evangelio": "Evangelio",
+}
+TITLE_KEYS = ("titulo", "title", "nombre", "tipo", "seccion", "name")
+TEXT_KEYS = ("texto", "contenido", "content", "html", "cuerpo", "descripcion", "text", "body")
+DATE_KEYS = ("fecha", "date", "dia")
+HEADER_KEYS = ("encabezado", "header", "titulo_dia")
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TAG_RE = re.compile(r"<[a-zA-Z/!]")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _norm(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value)
+    return _NON_ALNUM_RE.sub("", "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower())
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, dict):
+        for key in TEXT_KEYS:
+            if isinstance(value.get(key), str):
+                return _text(value[key])
+        return ""
+    if not isinstance(value, str):
+        return ""
+    return (html_to_text(value) if _TAG_RE.search(value) else value).strip()
+
+
+def _iter_dicts(data: Any) -> Iterator[dict]:
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+
+
+def _obj_date(obj: dict) -> Optional[str]:
+    for key in DATE_KEYS:
+        value = obj.get(key)
+        if isinstance(value, str) and _ISO_DATE_RE.match(value):
+            return value[:10]
+    return None
+
+
+def _sections_of(obj: dict) -> dict[str, str]:
+    sections: dict[str, str] = {}
+    for key, value in obj.items():
+        section = SECTION_KEYS.get(_norm(str(key)))
+        if section and section not in sections:
+            text = _text(value)
+            if text:
+                sections[section] = text
+        elif isinstance(value, list):
+            for item in value:
+                if not isinstance(item, dict):
+                    continue
+                title = next((item[k] for k in TITLE_KEYS if isinstance(item.get(k), str)), "")
+                section = SECTION_KEYS.get(_norm(title))
+                if section and section not in sections:
+                    text = _text(item)
+                    if text:
+                        sections[section] = text
+    return sections
+
+
+def sections_by_date(data: Any) -> dict[Optional[str], tuple[str, dict[str, str]]]:
+    """{fecha ISO (None si el objeto no trae fecha): (header, secciones)} con el objeto mas completo."""
+    found: dict[Optional[str], tuple[str, dict[str, str]]] = {}
+    for obj in _iter_dicts(data):
+        sections = _sections_of(obj)
+        if not sections:
+            continue
+        key = _obj_date(obj)
+        if key in found and len(found[key][1]) >= len(sections):
+            continue
+        header = next((_text(obj[k]) for k in HEADER_KEYS if isinstance(obj.get(k), str)), "")
+        found[key] = (header, sections)
+    return found
+
+
+def sections_from_json(data: Any, iso_date: Optional[str] = None) -> Optional[tuple[str, dict[str, str]]]:
+    """(header, secciones) de `iso_date` (o de un objeto sin fecha); sin fecha pedida, el mas completo."""
+    found = sections_by_date(data)
+    if iso_date is not None:
+        return found.get(iso_date) or found.get(None)
+    return max(found.values(), key=lambda v: len(v[1]), default=None)
@@ -0,0 +1,182 @@
+"""
+Cache compacto del año liturgico del Ordo (una edicion) en un archivo indexado por fecha.
+
+El archivo se abre con `mmap` y cada consulta por fecha es O(1): el indice tiene un registro de
+tamaño fijo por dia (offset/largo de cada campo), asi que no hace falta parsear JSON ni cargar el
+año completo en memoria para responder una fecha.
+
+Formato (little-endian):
+- Cabecera: magic `ORDOYC1\\0`, ordinal del primer dia, cantidad de dias, cantidad de campos.
+- Indice: por dia y por campo, (offset, largo) en uint32 sobre la zona de textos. Un dia sin
+  registro tiene offset `MISSING` en el primer campo.
+- Textos: UTF-8 sin separadores; los valores repetidos (colores, tiempo liturgico) se guardan una vez.
+
+Uso:
+  write_year_cache(path, records)   # records: dicts del array `data` del API
+  with OrdoYearCache(path) as cache:
+      day = cache.get("2026-02-07")
+      day.tiempo_liturgico, day.colores_dia, day.misa_referencias
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import tempfile
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterable, Optional
+
+from html_extract import html_to_text
+
+MAGIC = b"ORDOYC1\0"
+FIELDS = ("tiempo_liturgico", "encabezado", "colores_dia", "celebracion", "misa")
+MISSING = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<8sIII")
+_DAY = struct.Struct("<" + "II" * len(FIELDS))
+
+# Citas biblicas del HTML `misa`: "1 Re 3,4-13", "Sal 118, 9. 10", "Mc 6,30-34".
+_REFERENCE_RE = re.compile(
+    r"(?<![\w])(?:[1-3]\s?)?[A-ZÁÉÍÓÚ][a-záéíóúñ]{0,4}\.?\s?\d{1,3}\s?,\s?\d{1,3}[a-d]?(?:\s?[-–.]\s?\d{1,3}[a-d]?)*"
+)
+
+
+@dataclass(frozen=True)
+class OrdoDay:
+    fecha: str
+    tiempo_liturgico: str
+    encabezado: str
+    colores_dia: str
+    celebracion: str
+    misa: str  # HTML tal como viene del API
+
+    @property
+    def misa_referencias(self) -> list[str]:
+        """Citas del leccionario en el orden del HTML `misa` (la del evangelio suele ser la ultima)."""
+        return misa_references(self.misa)
+
+
+def misa_references(misa_html: str) -> list[str]:
+    if not misa_html:
+        return []
+    return [m.group(0).strip(" .") for m in _REFERENCE_RE.finditer(html_to_text(misa_html))]
+
+
+def _record_fields(record: dict[str, Any]) -> tuple[str, ...]:
+    values = dict(record)
+    # El API usa `celebracion` o `nombre_celebracion` segun el dia.
+    values["celebracion"] = record.get("celebracion") or record.get("nombre_celebracion") or ""
+    return tuple(str(values.get(name) or "") for name in FIELDS)
+
+
+def day_from_record(record: dict[str, Any]) -> OrdoDay:
+    """OrdoDay desde un registro del array `data` (sin pasar por el archivo)."""
+    return OrdoDay(str(record.get("fecha") or "")[:10], *_record_fields(record))
+
+
+def write_year_cache(path: str, records: Iterable[dict[str, Any]]) -> int:
+    """Escribe el archivo (de forma atomica) y devuelve cuantos dias quedaron indexados."""
+    by_ordinal: dict[int, tuple[str, ...]] = {}
+    for record in records:
+        fecha = str(record.get("fecha") or "")[:10]
+        try:
+            ordinal = date.fromisoformat(fecha).toordinal()
+        except ValueError:
+            continue
+        by_ordinal[ordinal] = _record_fields(record)
+    if not by_ordinal:
+        raise ValueError("El contenido del Ordo no trae registros con `fecha` valida.")
+
+    first = min(by_ordinal)
+    days = max(by_ordinal) - first + 1
+    blob = bytearray()
+    interned: dict[str, tuple[int, int]] = {}
+    index = bytearray()
+    empty_day = [MISSING, 0] + [0, 0] * (len(FIELDS) - 1)
+    for ordinal in range(first, first + days):
+        values = by_ordinal.get(ordinal)
+        if values is None:
+            index += _DAY.pack(*empty_day)
+            continue
+        slots: list[int] = []
+        for value in values:
+            slot = interned.get(value)
+            if slot is None:
+                encoded = value.encode("utf-8")
+                slot = (len(blob), len(encoded))
+                blob += encoded
+                interned[value] = slot
+            slots.extend(slot)
+        index += _DAY.pack(*slots)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, first, days, len(FIELDS)))
+            f.write(index)
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return len(by_ordinal)
+
+
+class OrdoYearCache:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            # Un archivo vacio tambien levanta ValueError (mmap no mapea 0 bytes).
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"Archivo de cache del Ordo invalido: {path}")
+        magic, self._first, self.days, nfields = _HEADER.unpack_from(self._mm, 0)
+        self._index_at = _HEADER.size
+        self._blob_at = self._index_at + self.days * _DAY.size
+        # Otra version del formato o un archivo truncado (el indice no entra).
+        if magic != MAGIC or nfields != len(FIELDS) or len(self._mm) < self._blob_at:
+            self._mm.close()
+            raise ValueError(f"Archivo de cache del Ordo invalido: {path}")
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self._first)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self._first + self.days - 1)
+
+    def covers(self, iso_date: str) -> bool:
+        return 0 <= date.fromisoformat(iso_date).toordinal() - self._first < self.days
+
+    def get(self, iso_date: str) -> Optional[OrdoDay]:
+        """Datos del dia o None si la fecha no esta en la edicion (O(1), sin parsear el resto)."""
+        pos = date.fromisoformat(iso_date).toordinal() - self._first
+        if not 0 <= pos < self.days:
+            return None
+        slots = _DAY.unpack_from(self._mm, self._index_at + pos * _DAY.size)
+        if slots[0] == MISSING:
+            return None
+        values = []
+        for i in range(0, len(slots), 2):
+            start = self._blob_at + slots[i]
+            values.append(self._mm[start : start + slots[i + 1]].decode("utf-8"))
+        return OrdoDay(iso_date, *values)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "OrdoYearCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,80 @@
+"""
+Configuracion del panel de Dios Hoy (variables de entorno DIOCESIS_*), sin dependencias de Selenium.
+
+La comparten `import os.py` (feed de YouTube, logging, camino rapido sin navegador),
+`panel_selenium.py` (flujo en el navegador) y `panel_http.py` (flujo por HTTP contra el backend).
+"""
+
+import os
+
+from http_cache import DEFAULT_CACHE_DIR
+from route_memory import DEFAULT_ROUTE_MEMORY_PATH
+from run_trace import TRACE
+
+# 1. Cargar credenciales y URLs desde variables de entorno
+USERNAME = os.getenv("DIOCESIS_USERNAME")
+PASSWORD = os.getenv("DIOCESIS_PASSWORD")
+# Origen del panel; se cambia para apuntar al doble local (benchmarks/panel_server.py).
+PANEL_BASE = os.getenv("DIOCESIS_PANEL_BASE", "https://admin.diocesisdeneiva.org").rstrip("/")
+LOGIN_URL = f"{PANEL_BASE}/auth/login?callbackUrl=%2Fdashboard"
+DIOS_HOY_URL = f"{PANEL_BASE}/espiritualidad/dios-hoy"
+YOUTUBE_FEED = os.getenv(
+    "DIOCESIS_YOUTUBE_FEED",
+    "https://www.youtube.com/feeds/videos.xml?channel_id=UCydLv78Ybqcg2y74FR2VYIw",
+)
+# Cuerpo + ETag/Last-Modified del feed y entradas ya parseadas (GET condicional entre corridas).
+FEED_CACHE_DIR = os.getenv("DIOCESIS_FEED_CACHE_DIR", DEFAULT_CACHE_DIR)
+DEFAULT_TIMEOUT = int(os.getenv("DIOCESIS_TIMEOUT", "15"))
+PAGE_LOAD_TIMEOUT = int(os.getenv("DIOCESIS_PAGE_LOAD_TIMEOUT", "90"))
+PAGE_LOAD_STRATEGY = os.getenv("DIOCESIS_PAGE_LOAD_STRATEGY", "eager").strip().lower()
+GET_RETRIES = int(os.getenv("DIOCESIS_GET_RETRIES", "2"))
+GET_RETRY_WAIT = float(os.getenv("DIOCESIS_GET_RETRY_WAIT", "3"))
+LOGIN_TIMEOUT = int(os.getenv("DIOCESIS_LOGIN_TIMEOUT", "45"))
+EVANGELIO_TIMEOUT = int(os.getenv("DIOCESIS_EVANGELIO_TIMEOUT", "45"))
+EVANGELIO_RETRIES = int(os.getenv("DIOCESIS_EVANGELIO_RETRIES", "1"))
+EVANGELIO_DIRECT_URL = os.getenv(
+    "DIOCESIS_EVANGELIO_URL",
+    f"{PANEL_BASE}/espiritualidad/evangelios",
+)
+VIDEO_URL_SELECTOR = os.getenv(
+    "DIOCESIS_VIDEO_URL_SELECTOR",
+    "input[type='url'], input[placeholder*='Embed']",
+)
+VIDEO_BUTTON_INDEX = os.getenv("DIOCESIS_VIDEO_BUTTON_INDEX")
+# Contenedor del editor con la barra de herramientas (botones del Quill).
+EDITOR_ROOT_XPATH = "ancestor::*[.//button[@type='button'] or .//span[@role='button']][1]"
+# Espera por boton candidato del editor; la espera termina apenas aparece el dialogo.
+VIDEO_DIALOG_TIMEOUT = float(os.getenv("DIOCESIS_VIDEO_DIALOG_TIMEOUT", "1"))
+# Espera del aviso de guardado antes de cerrar Chrome o pasar al dia siguiente (lotes).
+SAVE_CONFIRM_TIMEOUT = float(os.getenv("DIOCESIS_SAVE_CONFIRM_TIMEOUT", "8"))
+# Texto del aviso de exito (role=status); los avisos de error del panel no lo llevan.
+SAVE_TOAST_TEXT = os.getenv("DIOCESIS_SAVE_TOAST_TEXT", "guardad")
+VIDEO_WIDTH = int(os.getenv("DIOCESIS_VIDEO_WIDTH", "840"))
+VIDEO_HEIGHT = int(os.getenv("DIOCESIS_VIDEO_HEIGHT", "472"))
+# Perfil persistente de Chrome (cookies/localStorage de la sesion + cache HTTP); vacio = navegador limpio.
+USER_DATA_DIR = os.getenv("DIOCESIS_USER_DATA_DIR", "").strip()
+PROFILE_CACHE_MB = int(os.getenv("DIOCESIS_PROFILE_CACHE_MB", "100"))
+# Memoria de rutas (route_memory): que estrategia abrio "Evangelio y santo" en corridas anteriores.
+ROUTE_MEMORY_PATH = os.getenv("DIOCESIS_ROUTE_MEMORY", "").strip() or DEFAULT_ROUTE_MEMORY_PATH
+ROUTE_MAX_FAILS = int(os.getenv("DIOCESIS_ROUTE_MAX_FAILS", "3"))
+# Endpoints del transporte HTTP experimental (panel_http, solo benchmarks): no estan documentados ni
+# verificados contra produccion.
+API_AUTH_URL = os.getenv("DIOCESIS_API_AUTH_URL", f"{PANEL_BASE}/api/auth").rstrip("/")
+API_DIOS_HOY_URL = os.getenv("DIOCESIS_API_DIOS_HOY_URL", f"{PANEL_BASE}/api/dios-hoy?fecha={{fecha}}")
+API_DIOS_HOY_UPDATE_URL = os.getenv("DIOCESIS_API_DIOS_HOY_UPDATE_URL", f"{PANEL_BASE}/api/dios-hoy/{{id}}")
+API_DIOS_HOY_UPDATE_METHOD = os.getenv("DIOCESIS_API_DIOS_HOY_UPDATE_METHOD", "PATCH").strip().upper()
+API_REFLEXION_FIELD = os.getenv("DIOCESIS_API_REFLEXION_FIELD", "reflexion")
+# Claves exactas del registro del dia; si el backend devuelve otra forma, panel_http no guarda.
+API_DIOS_HOY_KEYS = tuple(
+    key.strip() for key in os.getenv("DIOCESIS_API_DIOS_HOY_KEYS", f"id,fecha,{API_REFLEXION_FIELD}").split(",") if key.strip()
+)
+LOG_DIR = os.getenv("DIOCESIS_LOG_DIR", "/Users/gabops/Downloads/Diocesis/logs")
+LOG_LEVEL = os.getenv("DIOCESIS_LOG_LEVEL", "INFO").upper()
+# Traza JSON + metricas OpenMetrics de cada corrida (run_trace); el workflow sube el directorio.
+TRACE_DIR = os.getenv("DIOCESIS_TRACE_DIR", "").strip() or os.path.join(LOG_DIR, "metricas")
+VALID_PAGE_LOAD_STRATEGIES = {"normal", "eager", "none"}
+
+
+def log_phase(logger, message):
+    logger.info("fase=%s", message)
+    TRACE.phase(message)
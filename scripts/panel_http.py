@@ -0,0 +1,261 @@
+"""
+Flujo experimental del panel de Dios Hoy por HTTP: inicia sesion y lee/actualiza la reflexion del dia
+contra los endpoints del backend, sin navegador. No esta conectado a `import os.py`; hoy solo lo usa
+benchmarks/bench_panel_transport.py.
+
+Una corrida son 4 requests (6 si hay que guardar) sobre una conexion keep-alive (`http_client`):
+1. GET  {API_AUTH_URL}/csrf                    -> csrfToken (y cookie csrf)
+2. POST {API_AUTH_URL}/callback/credentials    -> cookie de sesion (form, como el login del panel)
+3. GET  {API_AUTH_URL}/session                 -> confirma que hay usuario
+4. GET  API_DIOS_HOY_URL (fecha)               -> registro del dia con el HTML de la reflexion
+5. PATCH API_DIOS_HOY_UPDATE_URL (id)          -> solo si el HTML cambio (`reflection_html.embed_video`)
+   + GET de verificacion.
+
+El backend del panel no tiene API documentada: las rutas por defecto siguen el esquema de NextAuth
+que usa el login y se cambian con DIOCESIS_API_* (panel_config). Este transporte solo se probo contra
+el doble local (benchmarks/panel_server.py), no contra el panel de produccion. Por eso, antes de
+guardar, la respuesta del dia tiene que ser JSON (Content-Type) con exactamente las claves de
+DIOCESIS_API_DIOS_HOY_KEYS y la fecha pedida; si no, no se manda el PATCH. Cualquier error levanta
+PanelHttpError (o HttpStatusError). Para usarlo en el cron primero hay que confirmar rutas y claves con
+la pestana Network del navegador y grabar una respuesta real para los tests.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from batch_days import DayResult, DayTask
+from http_client import MAX_REDIRECTS, HttpClient, HttpResponse, get_client
+from panel_config import (
+    API_AUTH_URL,
+    API_DIOS_HOY_KEYS,
+    API_DIOS_HOY_UPDATE_METHOD,
+    API_DIOS_HOY_UPDATE_URL,
+    API_DIOS_HOY_URL,
+    API_REFLEXION_FIELD,
+    PANEL_BASE,
+    PASSWORD,
+    USERNAME,
+    VIDEO_HEIGHT,
+    VIDEO_WIDTH,
+    log_phase,
+)
+from reflection_html import build_embed_url, embed_video
+from run_trace import TRACE
+
+
+class PanelHttpError(RuntimeError):
+    pass
+
+
+class PanelSession:
+    """
+    Sesion del panel sobre el cliente HTTP compartido: guarda las cookies (`Set-Cookie` de cada
+    respuesta, redirecciones incluidas) y las manda en cada request. Las redirecciones se siguen aqui
+    para no perder las cookies que fijan. Solo se aceptan y se mandan cookies de los hosts configurados
+    (panel y DIOCESIS_API_*): una redireccion a otro host no las recibe.
+    """
+
+    def __init__(self, base: str = PANEL_BASE, client: Optional[HttpClient] = None) -> None:
+        self.base = base.rstrip("/")
+        self.client = client or get_client()
+        self.cookies: dict[str, str] = {}
+        self.requests = 0
+        self._hosts = {
+            urlsplit(u).hostname for u in (self.base, API_AUTH_URL, API_DIOS_HOY_URL, API_DIOS_HOY_UPDATE_URL)
+        }
+
+    def _store_cookies(self, resp: HttpResponse) -> None:
+        for header in resp.headers.get_all("Set-Cookie") or []:
+            jar = SimpleCookie()
+            try:
+                jar.load(header)
+            except CookieError:
+                continue
+            for name, morsel in jar.items():
+                if morsel["max-age"] == "0" or not morsel.value:
+                    self.cookies.pop(name, None)
+                else:
+                    self.cookies[name] = morsel.value
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        allow_status: tuple[int, ...] = (),
+    ) -> HttpResponse:
+        headers = dict(headers or {})
+        current = urljoin(self.base + "/", url)
+        for _ in range(MAX_REDIRECTS + 1):
+            panel_host = urlsplit(current).hostname in self._hosts
+            headers.pop("Cookie", None)
+            if self.cookies and panel_host:
+                headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            # Un span por request (ruta sin ids) para la traza de la corrida.
+            route = re.sub(r"/\d+(?=/|$)", "/{id}", urlsplit(current).path)
+            with TRACE.span("http", label=f"{method} {route}") as span:
+                resp = self.client.request(
+                    method, current, body=body, headers=headers, allow_status=allow_status, follow_redirects=False
+                )
+                span.set(http_status=resp.status)
+            self.requests += 1
+            if panel_host:
+                self._store_cookies(resp)
+            location = resp.headers.get("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                current = urljoin(current, location)
+                if resp.status not in (307, 308):
+                    method, body = "GET", None
+                    headers.pop("Content-Type", None)
+                continue
+            return resp
+        raise PanelHttpError(f"Demasiadas redirecciones desde {url}")
+
+    def request_json(self, method: str, url: str, payload: Any = None, allow_status: tuple[int, ...] = ()) -> Any:
+        body = None
+        headers = {"Accept": "application/json"}
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        resp = self.request(method, url, body=body, headers=headers, allow_status=allow_status)
+        ctype = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        if resp.body.strip() and ctype != "application/json" and not ctype.endswith("+json"):
+            # Tipico de una sesion vencida: el backend redirige al HTML del login.
+            raise PanelHttpError(f"Respuesta {ctype or 'sin Content-Type'} de {resp.url} (status={resp.status}), no JSON")
+        try:
+            return json.loads(resp.body.decode("utf-8")) if resp.body.strip() else None
+        except ValueError as exc:
+            raise PanelHttpError(f"Respuesta no JSON de {resp.url} (status={resp.status})") from exc
+
+    def login(self, username: str, password: str) -> None:
+        csrf = (self.request_json("GET", f"{API_AUTH_URL}/csrf") or {}).get("csrfToken")
+        if not csrf:
+            raise PanelHttpError("El panel no entrego csrfToken.")
+        form = urlencode(
+            {
+                "csrfToken": csrf,
+                "email": username,
+                "password": password,
+                "callbackUrl": f"{self.base}/dashboard",
+                "json": "true",
+            }
+        ).encode("ascii")
+        self.request(
+            "POST",
+            f"{API_AUTH_URL}/callback/credentials",
+            body=form,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            allow_status=(401,),
+        )
+        session = self.request_json("GET", f"{API_AUTH_URL}/session") or {}
+        if not session.get("user"):
+            raise PanelHttpError("Login rechazado: la sesion no tiene usuario.")
+
+    def get_day(self, iso_date: str) -> dict[str, Any]:
+        payload = self.request_json("GET", API_DIOS_HOY_URL.format(fecha=iso_date))
+        if isinstance(payload, dict) and set(payload) == {"data"}:
+            payload = payload["data"]
+        _check_day(payload, iso_date)
+        return payload
+
+    def update_reflection(self, day: dict[str, Any], html: str) -> None:
+        url = API_DIOS_HOY_UPDATE_URL.format(id=day["id"], fecha=day.get("fecha", ""))
+        self.request_json(API_DIOS_HOY_UPDATE_METHOD, url, {API_REFLEXION_FIELD: html})
+
+
+def _check_day(payload: Any, iso_date: str) -> None:
+    """Forma exacta del registro del dia: cualquier diferencia corta antes de guardar."""
+    if not isinstance(payload, dict):
+        raise PanelHttpError(f"No hay registro de Dios Hoy para {iso_date}.")
+    if set(payload) != set(API_DIOS_HOY_KEYS):
+        raise PanelHttpError(
+            f"Registro de {iso_date} con otras claves: {sorted(payload)} (esperadas {sorted(API_DIOS_HOY_KEYS)}, "
+            "ver DIOCESIS_API_DIOS_HOY_KEYS)."
+        )
+    day_id = payload.get("id")
+    if isinstance(day_id, bool) or not isinstance(day_id, (int, str)) or day_id == "":
+        raise PanelHttpError(f"El registro de {iso_date} tiene un id invalido: {day_id!r}.")
+    if not isinstance(payload.get("fecha"), str) or payload["fecha"][:10] != iso_date:
+        raise PanelHttpError(f"El backend devolvio el registro de {payload.get('fecha')!r} al pedir {iso_date}.")
+    if not isinstance(payload.get(API_REFLEXION_FIELD), (str, type(None))):
+        raise PanelHttpError(f"El campo {API_REFLEXION_FIELD!r} del registro de {iso_date} no es texto.")
+
+
+def _update_day(session: PanelSession, logger, iso_date: str, video_url: str, video_id: Optional[str]) -> tuple[str, Any]:
+    """('insertado' | 'normalizado' | 'sin_cambio', id del dia) para la reflexion de `iso_date`."""
+    log_phase(logger, "leer_reflexion")
+    day = session.get_day(iso_date)
+    current = day[API_REFLEXION_FIELD] or ""
+    embed_url = build_embed_url(video_id, video_url)
+    html, changed = embed_video(current, video_id, embed_url, VIDEO_WIDTH, VIDEO_HEIGHT)
+    if not changed:
+        return "sin_cambio", day["id"]
+    log_phase(logger, "guardar_cambios")
+    session.update_reflection(day, html)
+    saved = session.get_day(iso_date)[API_REFLEXION_FIELD] or ""
+    if embed_url not in saved and not (video_id and video_id in saved):
+        raise PanelHttpError("El backend no conservo el video en la reflexion guardada.")
+    return ("normalizado" if video_id and video_id in current else "insertado"), day["id"]
+
+
+def run(
+    logger, video_url: str, video_id: Optional[str], today_iso: str, client: Optional[HttpClient] = None
+) -> bool:
+    """Deja la reflexion de `today_iso` con el video guardada por HTTP; True si hubo que guardar."""
+    t0 = time.perf_counter()
+    session = PanelSession(client=client)
+    log_phase(logger, "login")
+    session.login(USERNAME, PASSWORD)
+
+    outcome, day_id = _update_day(session, logger, today_iso, video_url, video_id)
+    changed = outcome != "sin_cambio"
+    logger.info(
+        "transporte_http requests=%d ms=%.0f cambio=%s id=%s",
+        session.requests,
+        (time.perf_counter() - t0) * 1000,
+        changed,
+        day_id,
+    )
+    logger.info("fin_ejecucion %s", "ok" if changed else "sin_cambios")
+    if changed:
+        print("Reflexion del dia actualizada con el nuevo video.")
+    else:
+        print("La reflexion del dia ya tiene el video mas reciente (sin cambios).")
+    return changed
+
+
+def run_batch(logger, tasks: list[DayTask], client: Optional[HttpClient] = None) -> tuple[list[DayResult], float]:
+    """
+    Varias `DayTask` (batch_days) con un solo login. Un dia que falla queda como `error` y el lote
+    sigue; si falla el login, levanta. Devuelve (resultados por dia, ms del login).
+    """
+    t0 = time.perf_counter()
+    session = PanelSession(client=client)
+    log_phase(logger, "login")
+    session.login(USERNAME, PASSWORD)
+    setup_ms = (time.perf_counter() - t0) * 1000
+
+    results = []
+    for task in tasks:
+        iso = task.day.isoformat()
+        t_day = time.perf_counter()
+        detail = ""
+        with TRACE.span("dia", label=iso) as span:
+            try:
+                outcome, _ = _update_day(session, logger, iso, task.video_url, task.video_id)
+            except Exception as exc:
+                logger.warning("dia_lote_error fecha=%s transporte=http error=%s", iso, exc)
+                outcome, detail = "error", f"{type(exc).__name__}: {exc}"
+            span.set(resultado=outcome)
+        ms = (time.perf_counter() - t_day) * 1000
+        logger.info("dia_lote fecha=%s video_id=%s resultado=%s ms=%.0f", iso, task.video_id, outcome, ms)
+        results.append(DayResult(task.day, task.video_id, outcome, ms, "http", detail))
+    logger.info("transporte_http requests=%d lote=%d", session.requests, len(tasks))
+    return results, setup_ms
@@ -0,0 +1,915 @@
+"""
+Flujo del panel de Dios Hoy en Chrome: login, seleccion del dia, "Evangelio y santo", editor de la
+reflexion e insercion del video.
+
+Se importa desde `import os.py` solo cuando hace falta el navegador (el camino rapido de una corrida
+sin cambios termina antes de cargar Selenium).
+"""
+
+import os
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+
+from batch_days import DayResult, require_month
+from browser_network import NetworkStats, apply_blocking, configure_options, policy_for
+from dom_locate import CommandCounter, locate, locate_all, locate_props, strategy
+from dom_wait import DomWaiter, WaitStats, when
+from panel_config import (
+    DEFAULT_TIMEOUT,
+    DIOS_HOY_URL,
+    EDITOR_ROOT_XPATH,
+    EVANGELIO_TIMEOUT,
+    GET_RETRIES,
+    GET_RETRY_WAIT,
+    LOG_DIR,
+    LOGIN_TIMEOUT,
+    LOGIN_URL,
+    PAGE_LOAD_STRATEGY,
+    PAGE_LOAD_TIMEOUT,
+    PASSWORD,
+    PROFILE_CACHE_MB,
+    ROUTE_MAX_FAILS,
+    ROUTE_MEMORY_PATH,
+    SAVE_CONFIRM_TIMEOUT,
+    SAVE_TOAST_TEXT,
+    USERNAME,
+    VIDEO_BUTTON_INDEX,
+    VIDEO_DIALOG_TIMEOUT,
+    VIDEO_HEIGHT,
+    VIDEO_URL_SELECTOR,
+    VIDEO_WIDTH,
+    log_phase,
+)
+from reflection_html import build_embed_url
+from route_memory import RouteMemory
+from run_trace import TRACE
+
+# Paso de la memoria de rutas (route_memory) para abrir 'Evangelio y santo'.
+EVANGELIO_ROUTE_STEP = "evangelio_santo"
+NAVIGATION_RETRY_EXCEPTIONS = (TimeoutException, WebDriverException, ReadTimeoutError, MaxRetryError, TimeoutError)
+
+
+class SaveNotConfirmed(RuntimeError):
+    """El panel no mostro la confirmacion del guardado: la reflexion puede no haber quedado guardada."""
+
+
+def _redact_debug_html(html):
+    if not html:
+        return html
+    # Avoid leaking session/JWT tokens or similar secrets in uploaded artifacts.
+    html = re.sub(r'"token"\s*:\s*"[^"]+"', '"token":"***"', html)
+    html = re.sub(r'eyJ[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+\.[a-zA-Z0-9_\-]+', '***', html)
+    # Basic PII redaction (best-effort).
+    html = re.sub(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', '***@***', html)
+    html = re.sub(r'\b\d{7,}\b', '***', html)
+    return html
+
+def dump_debug_artifacts(driver, logger, label):
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    safe_label = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in label)
+    base = os.path.join(LOG_DIR, f"debug-{safe_label}-{timestamp}")
+    try:
+        driver.save_screenshot(f"{base}.png")
+    except WebDriverException as exc:
+        logger.warning("no_se_pudo_guardar_screenshot error=%s", exc)
+    try:
+        with open(f"{base}.html", "w", encoding="utf-8") as handle:
+            handle.write(_redact_debug_html(driver.page_source or ""))
+    except OSError as exc:
+        logger.warning("no_se_pudo_guardar_html error=%s", exc)
+
+def _navigation_reached_target(driver, target_url):
+    try:
+        current_url = driver.current_url
+    except WebDriverException:
+        return False, ""
+    if not current_url or current_url.startswith("about:"):
+        return False, current_url
+    try:
+        current = urlsplit(current_url)
+        target = urlsplit(target_url)
+    except ValueError:
+        return False, current_url
+    current_path = current.path.rstrip("/") or "/"
+    target_path = target.path.rstrip("/") or "/"
+    return (
+        current.scheme in {"http", "https"}
+        and current.netloc == target.netloc
+        and current_path == target_path
+    ), current_url
+
+def safe_get(driver, url, logger, label=None):
+    with TRACE.span("safe_get", label=label or _strip_url(url)) as span:
+        _safe_get(driver, url, logger, label, span)
+
+def _safe_get(driver, url, logger, label, span):
+    max_attempts = max(1, GET_RETRIES + 1)
+    for attempt in range(1, max_attempts + 1):
+        span.set(intentos=attempt)
+        if attempt > 1:
+            TRACE.count("reintentos", operacion="safe_get", label=label or _strip_url(url))
+        try:
+            logger.info("navegar url=%s intento=%s", label or url, attempt)
+            driver.get(url)
+            span.set(resultado="ok")
+            return
+        except NAVIGATION_RETRY_EXCEPTIONS as exc:
+            logger.warning(
+                "navegacion_fallo url=%s intento=%s/%s error=%s",
+                label or url,
+                attempt,
+                max_attempts,
+                type(exc).__name__,
+            )
+            try:
+                driver.execute_script("window.stop();")
+            except Exception:
+                pass
+            reached, current_url = _navigation_reached_target(driver, url)
+            if reached:
+                logger.warning(
+                    "navegacion_timeout_continuando url=%s intento=%s/%s current_url=%s",
+                    label or url,
+                    attempt,
+                    max_attempts,
+                    current_url,
+                )
+                span.set(resultado="timeout_en_destino")
+                return
+            if attempt >= max_attempts:
+                span.set(resultado=type(exc).__name__)
+                raise
+            time.sleep(GET_RETRY_WAIT)
+
+def safe_click(driver, element):
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    try:
+        element.click()
+    except WebDriverException:
+        driver.execute_script("arguments[0].click();", element)
+
+def do_login(driver, waiter, logger):
+    safe_get(driver, LOGIN_URL, logger, "login")
+    waiter.until(css="#email", visible=True, label="login_form").element.send_keys(USERNAME)
+    driver.find_element(By.ID, "password").send_keys(PASSWORD)
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    try:
+        waiter.until(
+            when(url="/dashboard"),
+            when(css="a[href*='/espiritualidad']"),
+            timeout=LOGIN_TIMEOUT,
+            label="login",
+        )
+    except TimeoutException as exc:
+        current_url = driver.current_url
+        page_lower = (driver.page_source or "").lower()
+        if "captcha" in page_lower or "recaptcha" in page_lower:
+            logger.warning("posible_captcha_detectado url=%s", current_url)
+        dump_debug_artifacts(driver, logger, "login_timeout")
+        raise RuntimeError(f"No se pudo iniciar sesion en el panel. url={current_url}") from exc
+
+def prepare_profile_dir(path):
+    """Crea el directorio del perfil y devuelve 'warm' si ya tenia un perfil de Chrome, si no 'cold'."""
+    os.makedirs(path, exist_ok=True)
+    # Un perfil restaurado de cache (o de una corrida abortada) puede traer los locks de la sesion anterior.
+    for name in ("SingletonLock", "SingletonCookie", "SingletonSocket"):
+        lock = os.path.join(path, name)
+        if os.path.lexists(lock):
+            os.unlink(lock)
+    return "warm" if os.path.isdir(os.path.join(path, "Default")) else "cold"
+
+def ensure_session(driver, waiter, logger, use_profile):
+    """
+    Deja el navegador autenticado en Dios Hoy. Con perfil persistente se abre Dios Hoy directo y solo
+    se hace login si el panel redirige a /auth/login (sesion expirada). Devuelve 'reutilizada' o 'login'.
+    """
+    if use_profile:
+        safe_get(driver, DIOS_HOY_URL, logger, "dios_hoy_sesion")
+        found = waiter.until(
+            when(url="/auth/login"),
+            when(css="a[href*='/espiritualidad']"),
+            required=False,
+            label="validar_sesion",
+        )
+        if found.ok and found.index == 1:
+            return "reutilizada"
+        logger.info("sesion_expirada url=%s", _strip_url(driver.current_url))
+    do_login(driver, waiter, logger)
+    safe_get(driver, DIOS_HOY_URL, logger, "dios_hoy")
+    return "login"
+
+def first_paint_ms(driver):
+    """First contentful paint del documento actual (ms desde la navegacion) o None."""
+    try:
+        value = driver.execute_script(
+            "const e = performance.getEntriesByName('first-contentful-paint')[0]; return e ? e.startTime : null;"
+        )
+    except WebDriverException:
+        return None
+    return round(value) if isinstance(value, (int, float)) else None
+
+def find_day_button(driver, waiter, day):
+    xpath = f"//button[normalize-space()='{day}']"
+    found = waiter.until(xpath=xpath, visible=True, enabled=True, required=False, label="boton_dia")
+    if found.ok:
+        return found.element
+    if not driver.find_elements(By.XPATH, xpath):
+        raise TimeoutException(f"No cargo el calendario (boton del dia {day}).")
+    raise RuntimeError(f"No se encontro el boton del dia {day}.")
+
+def infer_evangelio_url(driver):
+    """
+    Infer the day-specific 'Evangelio y santo' URL from visible anchors in Dios Hoy.
+
+    Important: do NOT regex page_source; Next.js pages often embed notFound/error payloads and
+    route strings in scripts that are not actually navigable. We only trust real <a href=...>.
+    """
+    hrefs = locate_props(driver, "href", strategy(css="a[href*='evangelios-y-santo']", exclude_closest="aside"))
+    candidates = [href.strip() for href in hrefs if href and href.strip()]
+    for href in candidates:
+        if "dios-hoy" in href:
+            return href
+    return candidates[0] if candidates else None
+
+def _strip_url(url):
+    try:
+        parts = urlsplit(url)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    except Exception:
+        return url
+
+def _is_not_found_page(driver):
+    # Avoid false-positives from Next.js serialized payloads in <script>.
+    try:
+        title = (driver.title or "").strip()
+        if title.startswith("404"):
+            return True
+    except WebDriverException:
+        pass
+    try:
+        text = driver.execute_script("return (document.body && document.body.innerText) || ''") or ""
+        text = text.strip()
+        if "This page could not be found" in text:
+            return True
+        if text.startswith("404") and "could not be found" in text:
+            return True
+    except WebDriverException:
+        pass
+    return False
+
+def _wait_for_evangelio_dios_hoy_page(waiter, timeout):
+    return waiter.until(
+        when(xpath="//*[normalize-space()='Evangelios actuales']"),
+        when(xpath="//*[normalize-space()='Evangelios disponibles']"),
+        timeout=timeout,
+        label="evangelio_dios_hoy",
+    ).element
+
+def wait_for_day_content_hint(waiter, timeout=8):
+    waiter.until(
+        when(css="main a[href*='evangelios-y-santo']"),
+        when(xpath="//*[not(ancestor::aside)]//*[contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelio') and contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'santo')]"),
+        when(css="div[contenteditable='true']"),
+        timeout=timeout,
+        required=False,
+        label="contenido_dia",
+    )
+
+def _log_candidate_evangelio_links(driver, logger, limit=25):
+    try:
+        links = locate_props(driver, ["href", "innerText"], strategy(css="a[href]", exclude_closest="aside"))
+    except WebDriverException:
+        return
+    out = []
+    for href, txt in links:
+        href = (href or "").strip()
+        txt = (txt or "").strip()
+        if not href:
+            continue
+        hay = f"{txt} {href}".lower()
+        if "dios-hoy" not in hay and "evangel" not in hay and "santo" not in hay:
+            continue
+        out.append((txt[:80], _strip_url(href)))
+        if len(out) >= limit:
+            break
+    if out:
+        logger.info("links_candidatos_evangelio count=%s sample=%s", len(out), out[:10])
+
+def evangelio_route_key(url):
+    """Patron estable de una URL de 'Evangelio y santo' (sin origen, fecha ni ids) para la memoria de rutas."""
+    path = urlsplit(url).path or url
+    path = re.sub(r"\d{4}-\d{2}-\d{2}", "{fecha}", path)
+    return "url:" + re.sub(r"/\d+(?=/|$)", "/{n}", path)
+
+def open_evangelio_santo(driver, waiter, logger, day, routes=None):
+    """
+    Open the day-specific 'Evangelio y santo' section from within Dios Hoy.
+
+    Avoids the common false positive: landing on /espiritualidad/evangelios (global list).
+    Cada estrategia (URL inferida o selector) es un intento; `routes` (RouteMemory) decide el orden
+    segun corridas anteriores y registra el resultado y la latencia de cada intento.
+    """
+    start_url_stripped = _strip_url(driver.current_url)
+    routes = routes if routes is not None else RouteMemory()
+    last = None
+
+    def _reset_context(tag):
+        logger.info("reset_contexto_dios_hoy intento=%s", tag)
+        safe_get(driver, DIOS_HOY_URL, logger, f"dios_hoy_reset_{tag}")
+        day_button = find_day_button(driver, waiter, day)
+        safe_click(driver, day_button)
+        wait_for_day_content_hint(waiter)
+
+    def _wrong_page(tag):
+        cur = _strip_url(driver.current_url)
+        if "/espiritualidad/evangelios" in cur and "dios-hoy" not in cur:
+            logger.warning(
+                "pagina_incorrecta_evangelios_listado intento=%s url=%s start_url=%s", tag, cur, start_url_stripped
+            )
+            return True
+        return False
+
+    def _try_url(target):
+        logger.info("evangelio_url_inferida url=%s", _strip_url(target))
+        safe_get(driver, target, logger, "evangelio_santo_inferida")
+        if _is_not_found_page(driver):
+            logger.warning("evangelio_url_inferida_404 url=%s", _strip_url(driver.current_url))
+            return "404"
+        try:
+            _wait_for_evangelio_dios_hoy_page(waiter, EVANGELIO_TIMEOUT)
+        except TimeoutException:
+            logger.warning("no_se_confirmo_evangelio intento=inferida url=%s", _strip_url(driver.current_url))
+            return "timeout"
+        return "pagina_incorrecta" if _wrong_page("inferida") else "ok"
+
+    def _try_selector(idx, by, sel):
+        nonlocal last
+        try:
+            el = waiter.until(
+                locator=(by, sel), visible=True, enabled=True, timeout=20, label=f"enlace_evangelio_{idx}"
+            ).element
+            safe_click(driver, el)
+            if _wrong_page(idx):
+                return "pagina_incorrecta"
+            if _is_not_found_page(driver):
+                logger.warning(
+                    "pagina_404_evangelio intento=%s url=%s start_url=%s",
+                    idx,
+                    _strip_url(driver.current_url),
+                    start_url_stripped,
+                )
+                return "404"
+            _wait_for_evangelio_dios_hoy_page(waiter, EVANGELIO_TIMEOUT)
+            return "ok"
+        except TimeoutException as exc:
+            last = exc
+            logger.warning("no_se_confirmo_evangelio intento=%s url=%s", idx, _strip_url(driver.current_url))
+            _log_candidate_evangelio_links(driver, logger)
+            return "timeout"
+
+    attempts = {}
+    inferred = infer_evangelio_url(driver)
+    if inferred:
+        target = inferred
+        if target.startswith("/"):
+            target = urljoin(DIOS_HOY_URL, target)
+
+        targets = [target]
+        # Heuristic fallbacks: some installations expose different subroutes.
+        if "/evangelios-y-santo/evangelium" in target:
+            base = target.replace("/evangelios-y-santo/evangelium", "/evangelios-y-santo")
+            targets = [
+                base,
+                base + "/evangelios",
+                base + "/evangelio",
+                target,
+            ]
+        for t in targets:
+            attempts.setdefault(evangelio_route_key(t), lambda t=t: _try_url(t))
+
+    candidates = [
+        (By.CSS_SELECTOR, "main a[href*='evangelios-y-santo']"),
+        (By.XPATH, "//main//a[contains(@href,'dios-hoy') and contains(@href,'evangelios-y-santo') and not(ancestor::aside)]"),
+        (By.XPATH, "//main//a[contains(@href,'dios-hoy') and (contains(@href,'evangel') or contains(@href,'santo')) and not(ancestor::aside)]"),
+        (By.XPATH, "//*[not(ancestor::aside)]//*[self::a or self::button or self::span][contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelio') and contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'santo')]"),
+    ]
+    for idx, (by, sel) in enumerate(candidates, start=1):
+        attempts[f"selector:{idx}"] = lambda idx=idx, by=by, sel=sel: _try_selector(idx, by, sel)
+
+    # Los selectores necesitan Dios Hoy con el dia seleccionado; despues de un intento fallido se recarga.
+    on_day_page = True
+    tried = []
+    for key in routes.order(EVANGELIO_ROUTE_STEP, list(attempts)):
+        if key.startswith("selector:") and not on_day_page:
+            _reset_context(f"antes_{key.replace(':', '_')}")
+        t0 = time.perf_counter()
+        outcome = attempts[key]()
+        ms = (time.perf_counter() - t0) * 1000
+        on_day_page = False
+        tried.append(f"{key}={outcome}:{ms:.0f}ms")
+        TRACE.record("ruta_evangelio", t0, ms / 1000, ok=outcome == "ok", label=key, resultado=outcome)
+        if routes.record(EVANGELIO_ROUTE_STEP, key, outcome == "ok", ms):
+            logger.info("ruta_olvidada paso=%s ruta=%s", EVANGELIO_ROUTE_STEP, key)
+        if outcome == "ok":
+            logger.info("evangelio_rutas ganadora=%s intentos=%s", key, ",".join(tried))
+            return
+
+    logger.info("evangelio_rutas ganadora=- intentos=%s", ",".join(tried))
+    dump_debug_artifacts(driver, logger, "open_evangelio_santo")
+    raise last if last else TimeoutException("No se pudo abrir Evangelio y santo.")
+
+
+def find_evangelio_link(waiter):
+    # Una sola espera para los cuatro selectores (antes: hasta 4 x EVANGELIO_TIMEOUT en serie).
+    return waiter.until(
+        when(css="a[href*='/espiritualidad/evangelios']"),
+        when(xpath="//*[self::a or self::button][normalize-space()='Evangelios']"),
+        when(xpath="//*[normalize-space()='Evangelios']/ancestor::a[1]"),
+        timeout=EVANGELIO_TIMEOUT,
+        label="enlace_evangelio",
+    ).element
+
+# Orden de `detect_evangelio_page`: la primera condicion que se cumple decide el tipo de pagina.
+_EVANGELIO_PAGE_KINDS = ("dios_hoy", "dios_hoy", "list", "list", "list")
+
+def detect_evangelio_page(waiter):
+    return _EVANGELIO_PAGE_KINDS[waiter.until(
+        when(xpath="//*[normalize-space()='Evangelios actuales']", visible=True),
+        when(xpath="//*[normalize-space()='Evangelios disponibles']", visible=True),
+        when(xpath="//*[contains(normalize-space(),'Agregar evangelio')]", visible=True),
+        when(css="a[href*='/espiritualidad/evangelios/'][href$='/editar']", visible=True),
+        when(xpath="//h1[contains(translate(normalize-space(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'evangelios')]", visible=True),
+        timeout=EVANGELIO_TIMEOUT,
+        label="pagina_evangelio",
+    ).index]
+
+def find_first_evangelio_edit_link(driver):
+    link = locate(driver, strategy(css="a[href*='/espiritualidad/evangelios/'][href$='/editar']", enabled=True))
+    if link:
+        return link
+    raise RuntimeError('No se encontro un enlace Editar en la lista de evangelios.')
+
+def log_evangelio_card_info(logger, link):
+    try:
+        card = link.find_element(By.XPATH, 'ancestor::li[1]')
+    except NoSuchElementException:
+        card = None
+    title = None
+    reference = None
+    if card:
+        try:
+            title = card.find_element(By.CSS_SELECTOR, 'h1, h2, h3, h4').text
+        except NoSuchElementException:
+            pass
+        try:
+            reference = card.find_element(By.CSS_SELECTOR, 'span.text-ecclesiaBlue').text
+        except NoSuchElementException:
+            pass
+    if title or reference:
+        logger.info('evangelio_seleccionado titulo=%s referencia=%s', title, reference)
+
+def editor_strategies(css, **filters):
+    # Busca en la barra del editor (ancestro con botones); si no hay tal ancestro, en el editor.
+    return (strategy(css=css, root_xpath=EDITOR_ROOT_XPATH, **filters), strategy(css=css, **filters))
+
+def find_visible_by_css(driver, selector):
+    return locate(driver, strategy(css=selector))
+
+def find_visible_by_xpath(driver, xpath):
+    return locate(driver, strategy(xpath=xpath))
+
+def open_video_dialog(driver, waiter, editor):
+    url_input = find_visible_by_css(driver, VIDEO_URL_SELECTOR)
+    if url_input:
+        return url_input
+
+    video_button = locate(editor, *editor_strategies(".ql-video"))
+    if video_button:
+        safe_click(driver, video_button)
+        return waiter.until(css=VIDEO_URL_SELECTOR, visible=True, label="dialogo_video").element
+    candidates = locate_all(
+        editor, *editor_strategies("button[type='button'], span[role='button']", enabled=True, text_empty=True)
+    )
+
+    if VIDEO_BUTTON_INDEX is not None:
+        try:
+            index = int(VIDEO_BUTTON_INDEX)
+        except ValueError as exc:
+            raise RuntimeError("DIOCESIS_VIDEO_BUTTON_INDEX debe ser un entero.") from exc
+        if index < 0 or index >= len(candidates):
+            raise RuntimeError("DIOCESIS_VIDEO_BUTTON_INDEX esta fuera de rango.")
+        safe_click(driver, candidates[index])
+        return waiter.until(css=VIDEO_URL_SELECTOR, visible=True, label="dialogo_video").element
+
+    for button in candidates:
+        safe_click(driver, button)
+        found = waiter.until(
+            css=VIDEO_URL_SELECTOR,
+            visible=True,
+            timeout=VIDEO_DIALOG_TIMEOUT,
+            required=False,
+            label="dialogo_video_candidato",
+        )
+        if found.ok:
+            return found.element
+        try:
+            if button.get_attribute("aria-pressed") == "true":
+                safe_click(driver, button)
+        except WebDriverException:
+            pass
+        try:
+            driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+        except WebDriverException:
+            pass
+
+    raise RuntimeError("No se pudo abrir el dialogo para insertar video.")
+
+def find_modal_submit(url_input):
+    containers = ["[role='dialog']", "[aria-modal='true']", "[class*='modal']", "form"]
+    button = locate(
+        url_input,
+        strategy(css="button", closest=containers, enabled=True, attr={"type": "submit"}),
+        strategy(css="button", closest=containers, enabled=True, text_nonempty=True, text_not=["cancelar", "cerrar"]),
+    )
+    if button is None:
+        raise RuntimeError("No se encontro un boton para confirmar el video (ni en su contenedor).")
+    return button
+
+def find_save_button(driver, editor):
+    button = locate(
+        driver,
+        strategy(css="button", root=editor, closest=["form"], enabled=True, text_in=["guardar", "actualizar", "publicar"]),
+        strategy(css="button", root=editor, closest=["form"], visible=False, attr={"type": "submit"}),
+        *(strategy(css="button", text=label, enabled=True) for label in ("Guardar", "Guardar cambios", "Actualizar", "Publicar")),
+    )
+    if button is None:
+        raise RuntimeError("No se encontro el boton de guardado.")
+    return button
+
+def place_cursor_after_title(driver, editor):
+    script = """
+    const editor = arguments[0];
+    const marker = "Reflexión del día";
+    const blocks = Array.from(editor.querySelectorAll("p, h1, h2, h3, h4, h5, h6, div"));
+    let target = null;
+    for (const block of blocks) {
+      const text = (block.textContent || "").trim();
+      if (text.includes(marker)) {
+        target = block;
+        break;
+      }
+    }
+    if (!target) return false;
+    const range = document.createRange();
+    range.setStartAfter(target);
+    range.collapse(true);
+    const sel = window.getSelection();
+    sel.removeAllRanges();
+    sel.addRange(range);
+    editor.focus();
+    return true;
+    """
+    return driver.execute_script(script, editor)
+
+def place_cursor_end(driver, editor):
+    script = """
+    const editor = arguments[0];
+    const range = document.createRange();
+    range.selectNodeContents(editor);
+    range.collapse(false);
+    const sel = window.getSelection();
+    sel.removeAllRanges();
+    sel.addRange(range);
+    editor.focus();
+    """
+    driver.execute_script(script, editor)
+
+def format_inserted_video(driver, editor, video_id, width, height):
+    script = """
+    const editor = arguments[0];
+    const videoId = arguments[1];
+    const width = arguments[2];
+    const height = arguments[3];
+    const iframes = Array.from(editor.querySelectorAll("iframe.ql-video"));
+    const target = iframes.find((node) => {
+      const src = node.getAttribute("src") || "";
+      return !videoId || src.includes(videoId) || src.includes("youtube.com");
+    });
+    if (!target) return false;
+    target.setAttribute("width", String(width));
+    target.setAttribute("height", String(height));
+    target.style.width = `${width}px`;
+    target.style.height = `${height}px`;
+    target.style.maxWidth = "100%";
+    target.style.border = "0";
+    target.style.display = "block";
+    target.style.margin = "0 auto";
+    const block = target.closest("p, div");
+    if (block) {
+      block.classList.add("ql-align-center");
+      block.style.textAlign = "center";
+      block.style.width = "100%";
+    }
+    return true;
+    """
+    return driver.execute_script(script, editor, video_id, width, height)
+
+def normalize_existing_video(driver, editor, video_id, embed_url):
+    script = """
+    const editor = arguments[0];
+    const videoId = arguments[1];
+    const embedUrl = arguments[2];
+    const isYouTube = (src) => src.includes("youtube.com") || src.includes("youtu.be");
+    const iframes = Array.from(editor.querySelectorAll("iframe.ql-video"));
+    const matches = [];
+    const others = [];
+    for (const node of iframes) {
+      const src = node.getAttribute("src") || "";
+      const match = (videoId && src.includes(videoId)) || (embedUrl && src.includes(embedUrl));
+      if (match) {
+        matches.push(node);
+      } else if (isYouTube(src)) {
+        others.push(node);
+      }
+    }
+    if (matches.length) {
+      for (const node of matches.slice(1).concat(others)) {
+        node.remove();
+      }
+      return true;
+    }
+    for (const node of others) {
+      node.remove();
+    }
+    return false;
+    """
+    return driver.execute_script(script, editor, video_id, embed_url)
+
+def find_current_gospel_button(driver, waiter):
+    header = waiter.until(xpath="//*[normalize-space()='Evangelios actuales']", label="evangelios_actuales").element
+    button = locate(
+        header,
+        strategy(css="button", root_xpath="ancestor::*[self::div or self::section][1]", enabled=True, text_nonempty=True),
+    )
+    if button:
+        return button
+    raise RuntimeError("No se encontro un evangelio actual para seleccionar.")
+
+EDIT_REFLECTION_XPATH = "//*[normalize-space()='Editar reflexión']"
+# El boton se habilita quitando `disabled` y la clase gris.
+_EDIT_ENABLED = "[not(@disabled) and not(contains(@class,'text-gray-400'))]"
+
+def find_edit_reflection_button(waiter):
+    """'Editar reflexion' (su boton, o su enlace) ya habilitado: una espera por eventos del DOM."""
+    label = EDIT_REFLECTION_XPATH
+    return waiter.until(
+        when(xpath=f"{label}/ancestor-or-self::button[1]{_EDIT_ENABLED}", enabled=True),
+        when(xpath=f"{label}[not(ancestor-or-self::button)]/ancestor-or-self::a[1]{_EDIT_ENABLED}", enabled=True),
+        when(xpath=f"{label}[not(ancestor-or-self::button) and not(ancestor-or-self::a)]{_EDIT_ENABLED}"),
+        label="editar_reflexion",
+    ).element
+
+
+def format_video_when_ready(driver, waiter, editor, video_id):
+    """Espera el iframe del video en el editor y le da tamano y centrado."""
+    waiter.until(css="div[contenteditable='true'] iframe.ql-video", label="video_insertado")
+    if not format_inserted_video(driver, editor, video_id, VIDEO_WIDTH, VIDEO_HEIGHT):
+        raise TimeoutException("No se encontro el video insertado para darle formato.")
+
+
+def wait_for_save(waiter, label="guardado"):
+    """
+    Espera la confirmacion del guardado (aviso de exito o cierre del editor); False si no se vio.
+    Los avisos de error usan el mismo contenedor (`role=alert`, toast sin variante): solo cuenta la
+    variante de exito o un `role=status` con el texto de guardado.
+    """
+    return waiter.until(
+        when(css="[data-sonner-toast][data-type='success'], .Toastify__toast--success", visible=True),
+        when(css="[role='status']", visible=True, text=SAVE_TOAST_TEXT),
+        when(css="div[contenteditable='true']", visible=True, gone=True),
+        timeout=SAVE_CONFIRM_TIMEOUT,
+        required=False,
+        label=label,
+    ).ok
+
+
+@contextmanager
+def panel_session(args, logger):
+    """Chrome con sesion iniciada en Dios Hoy; al salir registra las estadisticas y cierra el navegador."""
+    # 3. Lanzar el navegador (asegurate de tener chromedriver instalado y en PATH)
+    t_start = time.perf_counter()
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    options.add_argument("--window-size=1400,900")
+    profile_state = "sin_perfil"
+    if args.user_data_dir:
+        profile_dir = os.path.abspath(os.path.expanduser(args.user_data_dir))
+        profile_state = prepare_profile_dir(profile_dir)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-size={PROFILE_CACHE_MB * 1024 * 1024}")
+        # Cookies cifradas con clave fija: el perfil se puede restaurar en otro runner.
+        options.add_argument("--password-store=basic")
+        logger.info("perfil_chrome dir=%s estado=%s", profile_dir, profile_state)
+    # Bloqueo de imagenes, fuentes, media, analitica y embeds: solo leemos DOM (scripts/browser_network.py).
+    network = NetworkStats(policy_for("panel"))
+    configure_options(options, network.policy)
+    logger.info(
+        "browser_config page_load_strategy=%s page_load_timeout=%s get_retries=%s bloqueo=%s patrones=%s",
+        PAGE_LOAD_STRATEGY,
+        PAGE_LOAD_TIMEOUT,
+        GET_RETRIES,
+        network.policy.enabled,
+        len(network.policy.rules),
+    )
+    # Lo que no necesita el navegador se arma antes, para que el resumen del finally siempre exista.
+    # Round trips a chromedriver de toda la corrida (se registran al final).
+    commands = CommandCounter()
+    wait_stats = WaitStats()
+    # Orden de las estrategias de "Evangelio y santo" aprendido en corridas anteriores.
+    routes = RouteMemory.load(ROUTE_MEMORY_PATH, ROUTE_MAX_FAILS)
+    driver = webdriver.Chrome(options=options)
+    try:
+        commands.install(driver)
+        apply_blocking(driver, network.policy)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        # Esperas por eventos del DOM (MutationObserver); cada una registra su latencia en el log.
+        waiter = DomWaiter(driver, timeout=DEFAULT_TIMEOUT, logger=logger, stats=wait_stats, tracer=TRACE)
+
+        # 4-5. Iniciar sesión (o reutilizar la del perfil) y navegar a Dios Hoy
+        log_phase(logger, "login")
+        t_session = time.perf_counter()
+        session = ensure_session(driver, waiter, logger, bool(args.user_data_dir))
+        logger.info(
+            "arranque perfil=%s sesion=%s login_ms=%.0f primer_render_ms=%s",
+            profile_state,
+            session,
+            (time.perf_counter() - t_session) * 1000,
+            first_paint_ms(driver),
+        )
+        yield SimpleNamespace(
+            driver=driver,
+            waiter=waiter,
+            routes=routes,
+            setup_ms=(time.perf_counter() - t_start) * 1000,
+        )
+    finally:
+        try:
+            # Primero lo que no toca el navegador: si la sesion de Chrome murio, network.collect falla.
+            logger.info("esperas_dom %s", wait_stats.summary())
+            logger.info("webdriver %s", commands.summary())
+            TRACE.count("webdriver_comandos", commands.total)
+            TRACE.count("esperas_dom_expiradas", wait_stats.timeouts)
+            logger.info("rutas_evangelio %s", routes.summary(EVANGELIO_ROUTE_STEP))
+            try:
+                routes.save()
+            except OSError as exc:
+                logger.warning("no_se_guardo_memoria_rutas path=%s error=%s", routes.path, exc)
+            network.collect(driver)
+            try:
+                network.save_observed_sizes()
+            except OSError as exc:
+                logger.warning("no_se_guardaron_tamanos_red error=%s", exc)
+            logger.info("red %s", network.summary())
+        except Exception as exc:
+            # Las metricas no pueden dejar Chrome abierto ni tapar el error de la corrida.
+            logger.warning("resumen_sesion_fallo error=%s: %s", type(exc).__name__, exc)
+        finally:
+            driver.quit()
+
+
+def update_day(ctx, logger, day, video_url, video_id):
+    """
+    Desde Dios Hoy: selecciona el dia `day` (1-31) del calendario y deja su reflexion con el video
+    guardada. Devuelve 'normalizado' (ya tenia el video) o 'insertado'; levanta `SaveNotConfirmed` si
+    el panel no confirmo el guardado.
+    """
+    driver, waiter = ctx.driver, ctx.waiter
+    # 6. Seleccionar la fecha
+    # Esperar hasta que cargue el calendario y hacer clic en el día
+    log_phase(logger, "seleccionar_dia")
+    day_button = find_day_button(driver, waiter, day)
+    safe_click(driver, day_button)
+    wait_for_day_content_hint(waiter)
+    # 7. Acceder a "Evangelio y santo"
+    log_phase(logger, "abrir_evangelio_santo")
+    open_evangelio_santo(driver, waiter, logger, day, ctx.routes)
+
+    # 8. Seleccionar el evangelio actual y habilitar "Editar reflexion"
+    editor = find_visible_by_css(driver, "div[contenteditable='true']")
+    if editor is None:
+        log_phase(logger, "seleccionar_evangelio_actual")
+        try:
+            current_evangelio = find_current_gospel_button(driver, waiter)
+        except TimeoutException:
+            dump_debug_artifacts(driver, logger, 'current_gospel_timeout')
+            raise
+        safe_click(driver, current_evangelio)
+
+        editar_reflexion_button = find_edit_reflection_button(waiter)
+        safe_click(driver, editar_reflexion_button)
+
+        # 9. Insertar el vídeo en el editor:
+        # Esperar a que aparezca el área de edición
+        log_phase(logger, "abrir_editor")
+        editor = waiter.until(css="div[contenteditable='true']", visible=True, label="editor").element
+    else:
+        log_phase(logger, "abrir_editor")
+    log_phase(logger, "insertar_video")
+    embed_url = build_embed_url(video_id, video_url)
+    if normalize_existing_video(driver, editor, video_id, embed_url):
+        outcome = "normalizado"
+        format_video_when_ready(driver, waiter, editor, video_id)
+    else:
+        outcome = "insertado"
+        if not place_cursor_after_title(driver, editor):
+            place_cursor_end(driver, editor)
+
+        with TRACE.span("dialogo_video"):
+            url_input = open_video_dialog(driver, waiter, editor)
+        url_input.clear()
+        url_input.send_keys(embed_url)
+        url_input.send_keys(Keys.ENTER)
+        try:
+            waiter.until(css=VIDEO_URL_SELECTOR, visible=True, gone=True, label="cerrar_dialogo_video")
+        except TimeoutException:
+            submit_button = find_modal_submit(url_input)
+            safe_click(driver, submit_button)
+            waiter.until(css=VIDEO_URL_SELECTOR, visible=True, gone=True, label="cerrar_dialogo_video")
+
+        format_video_when_ready(driver, waiter, editor, video_id)
+
+    # 10. Guardar cambios
+    log_phase(logger, "guardar_cambios")
+    save_button = find_save_button(driver, editor)
+    safe_click(driver, save_button)
+    # Antes de cerrar Chrome o pasar al dia siguiente hay que dejar terminar el guardado.
+    if not wait_for_save(waiter):
+        logger.warning("guardado_sin_confirmar dia=%s", day)
+        dump_debug_artifacts(driver, logger, f"guardado_sin_confirmar_{day}")
+        raise SaveNotConfirmed(f"no se vio la confirmacion del guardado (dia {day})")
+    return outcome
+
+
+def run(args, logger, video_url, video_id):
+    """Abre Chrome y deja la reflexion del dia con el video `video_id` guardada; levanta si falla."""
+    try:
+        with panel_session(args, logger) as ctx:
+            update_day(ctx, logger, datetime.now().day, video_url, video_id)
+        logger.info("fin_ejecucion ok")
+        print("Reflexion del dia actualizada con el nuevo video.")
+    except Exception:
+        logger.exception("fin_ejecucion error")
+        raise
+
+
+def run_batch(args, logger, tasks):
+    """
+    Una sesion de Chrome para varias `DayTask` (batch_days): login una vez y, por dia, vuelta a Dios
+    Hoy y clic en el calendario. Devuelve (resultados por dia, ms de arranque + login).
+
+    El calendario muestra el mes actual: con dias de otros meses levanta ValueError antes de abrir
+    Chrome (batch_days.require_month).
+    """
+    require_month([t.day for t in tasks], datetime.now().date())
+    results = []
+    if not tasks:
+        return results, 0.0
+    with panel_session(args, logger) as ctx:
+        for i, task in enumerate(tasks):
+            if i:
+                safe_get(ctx.driver, DIOS_HOY_URL, logger, "dios_hoy")
+            t0 = time.perf_counter()
+            detail = ""
+            with TRACE.span("dia", label=task.day.isoformat()) as span:
+                try:
+                    outcome = update_day(ctx, logger, task.day.day, task.video_url, task.video_id)
+                except SaveNotConfirmed as exc:
+                    # Sin aviso de exito no se sabe si quedo guardado: el dia no cuenta como hecho.
+                    outcome, detail = "sin_confirmar", str(exc)
+                except Exception as exc:
+                    # Un dia fallido no corta el lote: el siguiente vuelve a cargar Dios Hoy.
+                    logger.exception("dia_lote_error fecha=%s", task.day.isoformat())
+                    dump_debug_artifacts(ctx.driver, logger, f"lote_{task.day.isoformat()}")
+                    outcome, detail = "error", f"{type(exc).__name__}: {exc}"
+                span.set(resultado=outcome)
+            ms = (time.perf_counter() - t0) * 1000
+            logger.info(
+                "dia_lote fecha=%s video_id=%s resultado=%s ms=%.0f", task.day.isoformat(), task.video_id, outcome, ms
+            )
+            results.append(DayResult(task.day, task.video_id, outcome, ms, "browser", detail))
+        setup_ms = ctx.setup_ms
+    return results, setup_ms
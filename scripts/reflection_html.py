@@ -0,0 +1,89 @@
+"""
+Edicion del HTML de la reflexion de Dios Hoy (formato Quill) sin navegador.
+
+Replica sobre el HTML guardado lo que `panel_selenium.py` hace en el editor:
+- `normalize_existing_video`: deja un solo `iframe.ql-video` con el video del dia y quita los demas
+  embeds de YouTube;
+- si no estaba, lo inserta despues del bloque "Reflexión del día" (`place_cursor_after_title`) o al
+  final (`place_cursor_end`);
+- `format_inserted_video`: ancho/alto y estilos del iframe.
+
+`embed_video` devuelve el HTML nuevo y si cambio; si no cambio no hace falta guardar.
+"""
+
+from __future__ import annotations
+
+import html as html_lib
+import re
+from typing import Optional
+
+TITLE_MARKER = "Reflexión del día"
+
+_IFRAME_RE = re.compile(r"<iframe\b[^>]*>\s*</iframe\s*>", re.IGNORECASE)
+_CLASS_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_SRC_RE = re.compile(r"""\bsrc\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_BLOCK_RE = re.compile(r"<(p|h[1-6]|div)\b[^>]*>(.*?)</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def build_embed_url(video_id: Optional[str], fallback_url: str) -> str:
+    if video_id:
+        return f"https://www.youtube.com/embed/{video_id}"
+    return fallback_url
+
+
+def _attr(regex: re.Pattern, tag: str) -> str:
+    m = regex.search(tag)
+    if not m:
+        return ""
+    return html_lib.unescape(m.group(1) if m.group(1) is not None else m.group(2))
+
+
+def _is_youtube(src: str) -> bool:
+    return "youtube.com" in src or "youtu.be" in src
+
+
+def video_iframe(src: str, width: int, height: int) -> str:
+    """iframe de Quill con el formato de `format_inserted_video`."""
+    style = f"width: {width}px; height: {height}px; max-width: 100%; border: 0; display: block; margin: 0 auto;"
+    return (
+        f'<iframe class="ql-video" frameborder="0" allowfullscreen="true" src="{html_lib.escape(src)}" '
+        f'width="{width}" height="{height}" style="{style}"></iframe>'
+    )
+
+
+def _title_block_end(content: str) -> Optional[int]:
+    for m in _BLOCK_RE.finditer(content):
+        text = html_lib.unescape(_TAG_RE.sub("", m.group(2)))
+        if TITLE_MARKER in text:
+            return m.end()
+    return None
+
+
+def embed_video(content: str, video_id: Optional[str], embed_url: str, width: int, height: int) -> tuple[str, bool]:
+    """(HTML con un solo iframe del video del dia, cambio). Ver docstring del modulo."""
+    content = content or ""
+    kept: Optional[str] = None
+    pieces: list[str] = []
+    last = 0
+    for m in _IFRAME_RE.finditer(content):
+        tag = m.group(0)
+        if "ql-video" not in _attr(_CLASS_RE, tag).split():
+            continue
+        src = _attr(_SRC_RE, tag)
+        matches = bool((video_id and video_id in src) or (embed_url and embed_url in src))
+        if not matches and not _is_youtube(src):
+            continue
+        pieces.append(content[last : m.start()])
+        last = m.end()
+        if matches and kept is None:
+            kept = video_iframe(src, width, height)
+            pieces.append(kept)
+    pieces.append(content[last:])
+    updated = "".join(pieces)
+
+    if kept is None:
+        iframe = video_iframe(embed_url, width, height)
+        at = _title_block_end(updated)
+        updated = updated + iframe if at is None else updated[:at] + iframe + updated[at:]
+    return updated, updated != content
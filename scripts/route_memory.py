@@ -0,0 +1,133 @@
+"""
+Memoria de rutas entre corridas: que estrategia abrio una pagina del panel, cuantas veces fallo y
+cuanto tardo.
+
+`open_evangelio_santo` (panel_selenium) prueba URLs inferidas y varios selectores, cada uno con su
+espera; en un mal dia los intentos fallidos suman minutos. Con esta memoria la corrida siguiente
+prueba primero la ultima estrategia ganadora (si no fallo despues) y ordena el resto por tasa de
+exito y luego por latencia; las que no conoce quedan en su orden original con una tasa neutra. Una
+estrategia que falla `max_failures` veces seguidas se olvida (vuelve a ser desconocida).
+
+Claves: strings estables elegidas por el llamador, p.ej. `url:/espiritualidad/dios-hoy/{fecha}/...`
+o `selector:2`. El archivo es JSON (`~/.cache/diocese-automation/rutas-panel.json`, o
+DIOCESIS_ROUTE_MEMORY); ausente o corrupto equivale a memoria vacia.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+DEFAULT_ROUTE_MEMORY_PATH = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "rutas-panel.json")
+DEFAULT_MAX_FAILURES = 3
+# Peso de la ultima latencia en el promedio movil.
+_EMA_ALPHA = 0.3
+
+
+@dataclass
+class RouteStats:
+    ok: int = 0
+    fail: int = 0
+    fail_streak: int = 0
+    avg_ms: float = 0.0
+    last_ms: float = 0.0
+    last_ok_at: float = 0.0  # epoch
+
+    @property
+    def success_rate(self) -> float:
+        # Suavizado de Laplace: una estrategia nueva queda en 0.5.
+        return (self.ok + 1) / (self.ok + self.fail + 2)
+
+
+@dataclass
+class RouteMemory:
+    path: Optional[str] = None  # None = solo en memoria (no se guarda)
+    max_failures: int = DEFAULT_MAX_FAILURES
+    routes: dict[str, dict[str, RouteStats]] = field(default_factory=dict)
+    winners: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Optional[str], max_failures: int = DEFAULT_MAX_FAILURES) -> "RouteMemory":
+        memory = cls(path=path, max_failures=max(1, max_failures))
+        if not path:
+            return memory
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for step, entries in data.get("routes", {}).items():
+                memory.routes[step] = {key: RouteStats(**stats) for key, stats in entries.items()}
+            memory.winners = {str(k): str(v) for k, v in data.get("winners", {}).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls(path=path, max_failures=memory.max_failures)
+        return memory
+
+    def order(self, step: str, keys: list[str]) -> list[str]:
+        """`keys` (en su orden por defecto) reordenadas: ganadora, tasa de exito, latencia promedio."""
+        entries = self.routes.get(step, {})
+        winner = self.winners.get(step)
+        default: dict[str, int] = {}
+        for i, key in enumerate(keys):
+            default.setdefault(key, i)  # una clave repetida conserva su primer lugar
+
+        def rank(key: str):
+            stats = entries.get(key)
+            if stats is None:
+                return (key != winner, -0.5, 0.0, default[key])
+            return (key != winner, -stats.success_rate, stats.avg_ms if stats.ok else 0.0, default[key])
+
+        return sorted(dict.fromkeys(keys), key=rank)
+
+    def record(self, step: str, key: str, ok: bool, ms: float) -> bool:
+        """Registra un intento; devuelve True si la estrategia se olvido por fallos seguidos."""
+        stats = self.routes.setdefault(step, {}).setdefault(key, RouteStats())
+        stats.last_ms = round(ms, 1)
+        if ok:
+            stats.ok += 1
+            stats.fail_streak = 0
+            stats.avg_ms = round(ms if stats.ok == 1 else (1 - _EMA_ALPHA) * stats.avg_ms + _EMA_ALPHA * ms, 1)
+            stats.last_ok_at = time.time()
+            self.winners[step] = key
+            return False
+        stats.fail += 1
+        stats.fail_streak += 1
+        # Una ganadora que falla deja de ir primero; vuelve a competir por tasa de exito.
+        if self.winners.get(step) == key:
+            del self.winners[step]
+        if stats.fail_streak < self.max_failures:
+            return False
+        del self.routes[step][key]
+        return True
+
+    def summary(self, step: str) -> str:
+        entries = self.routes.get(step, {})
+        parts = [
+            f"{key}:ok={s.ok}/fail={s.fail}/avg={s.avg_ms:.0f}ms"
+            for key, s in sorted(entries.items(), key=lambda kv: -kv[1].success_rate)
+        ]
+        return f"ganadora={self.winners.get(step, '-')} rutas={len(entries)} ({','.join(parts) or '-'})"
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "routes": {step: {key: asdict(s) for key, s in entries.items()} for step, entries in self.routes.items()},
+            "winners": self.winners,
+        }
+        # Escritura atomica, como run_state.
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".rutas-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,71 @@
+"""
+Registro local de la ultima corrida exitosa del panel de Dios Hoy: `(fecha, video_id, saved_ok)`.
+
+`import os.py` lo escribe despues de guardar la reflexion y lo consulta apenas conoce el video mas
+reciente: si la reflexion de hoy ya se guardo con ese video, la corrida termina sin abrir Chrome (ni
+importar Selenium). Solo usa la libreria estandar para que ese camino sea corto.
+
+El archivo es JSON (`~/.cache/diocese-automation/dios-hoy-estado.json`, o DIOCESIS_RUN_STATE); el
+workflow lo conserva entre corridas con `actions/cache`. Un archivo ausente o corrupto equivale a "sin
+registro" (se hace la corrida completa).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+DEFAULT_STATE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "diocese-automation", "dios-hoy-estado.json")
+
+
+@dataclass(frozen=True)
+class RunState:
+    date: str  # YYYY-MM-DD (fecha local de la corrida, la misma que el dia seleccionado en el panel)
+    video_id: str
+    saved_ok: bool
+    saved_at: float = 0.0  # epoch
+
+    def covers(self, iso_date: str, video_id: Optional[str]) -> bool:
+        """True si ya se guardo la reflexion de `iso_date` con `video_id`."""
+        return self.saved_ok and bool(video_id) and self.date == iso_date and self.video_id == video_id
+
+
+def state_path() -> str:
+    return os.getenv("DIOCESIS_RUN_STATE", "").strip() or DEFAULT_STATE_PATH
+
+
+def load_state(path: str) -> Optional[RunState]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return RunState(
+            date=str(data["date"]),
+            video_id=str(data["video_id"]),
+            saved_ok=bool(data["saved_ok"]),
+            saved_at=float(data.get("saved_at", 0.0)),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_state(path: str, iso_date: str, video_id: str, saved_ok: bool = True) -> RunState:
+    state = RunState(date=iso_date, video_id=video_id, saved_ok=saved_ok, saved_at=time.time())
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # Escritura atomica: una corrida cortada no deja un JSON a medias.
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".estado-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(state), f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return state
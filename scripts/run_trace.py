@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+"""
+Trazas livianas de una corrida de Dios Hoy: spans con tiempo y atributos, contadores, y al final una
+traza JSON y un archivo de metricas OpenMetrics.
+
+- `TRACE.phase(nombre)` (lo llama `panel_config.log_phase`) cierra la fase anterior y abre otra: las
+  fases son secuenciales y cubren la corrida.
+- `with TRACE.span("safe_get", label="login") as span: ... span.set(intentos=2)` mide un tramo dentro
+  de la fase actual (o del span que lo contiene, en el mismo hilo). Si el bloque levanta, el span queda
+  con `status="error"` y el tipo de la excepcion.
+- `TRACE.record(...)` agrega un span ya medido (p.ej. las esperas de `DomWaiter`).
+- `TRACE.count("reintentos", operacion="safe_get", label=...)` suma a un contador con etiquetas.
+- `TRACE.finish(resultado)` + `TRACE.write(dir)` escriben `traza.json` y `metricas.prom`.
+
+Solo libreria estandar (lo usa tambien el camino rapido sin navegador).
+
+Informe de varias corridas (p50/p95 por fase y reintentos), p.ej. con las trazas bajadas de los
+artifacts del workflow:
+  python3 scripts/run_trace.py corridas/*/traza.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Optional
+
+TRACE_FILE = "traza.json"
+METRICS_FILE = "metricas.prom"
+METRIC_PREFIX = "diocesis"
+
+
+@dataclass
+class Span:
+    id: int
+    name: str
+    parent: Optional[int]
+    start_ms: float
+    duration_ms: Optional[float] = None
+    status: str = "ok"
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    def __init__(self, service: str = "dios-hoy") -> None:
+        self.service = service
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.begin()
+
+    def begin(self, t0: Optional[float] = None, **attrs: Any) -> None:
+        """Reinicia la traza; `t0` (perf_counter) permite contar desde el inicio del proceso."""
+        with self._lock:
+            self.t0 = time.perf_counter() if t0 is None else t0
+            self.started_at = datetime.now(timezone.utc) - timedelta(seconds=time.perf_counter() - self.t0)
+            self.attrs: dict[str, Any] = dict(attrs)
+            self.spans: list[Span] = []
+            self.counters: Counter = Counter()
+            self.result: Optional[str] = None
+            self.duration_ms: Optional[float] = None
+            self._phase: Optional[Span] = None
+            self._next_id = 1
+        self._local = threading.local()
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _new_span(self, name: str, start_ms: float, attrs: dict[str, Any], root: bool = False) -> Span:
+        stack = self._stack()
+        with self._lock:
+            parent = None if root else stack[-1].id if stack else (self._phase.id if self._phase else None)
+            span = Span(id=self._next_id, name=name, parent=parent, start_ms=round(start_ms, 1), attrs=attrs)
+            self._next_id += 1
+            self.spans.append(span)
+        return span
+
+    def phase(self, name: str) -> None:
+        now = self._now_ms()
+        with self._lock:
+            if self._phase is not None:
+                self._phase.duration_ms = round(now - self._phase.start_ms, 1)
+        # Las fases no van en la pila: son el padre por defecto de los spans de cualquier hilo.
+        span = self._new_span("fase", now, {"fase": name}, root=True)
+        with self._lock:
+            self._phase = span
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        span = self._new_span(name, self._now_ms(), attrs)
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.status = "error"
+            span.attrs.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            stack.pop()
+            span.duration_ms = round(self._now_ms() - span.start_ms, 1)
+
+    def record(self, name: str, start: float, seconds: float, ok: bool = True, **attrs: Any) -> Span:
+        """Span ya medido: `start` es un perf_counter, `seconds` su duracion."""
+        span = self._new_span(name, (start - self.t0) * 1000, attrs)
+        span.duration_ms = round(seconds * 1000, 1)
+        span.status = "ok" if ok else "error"
+        return span
+
+    def count(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self.counters[key] += value
+
+    def annotate(self, **attrs: Any) -> None:
+        """Atributos de la corrida (van en `atributos` de la traza)."""
+        with self._lock:
+            self.attrs.update(attrs)
+
+    def finish(self, result: str, **attrs: Any) -> None:
+        now = self._now_ms()
+        with self._lock:
+            if self._phase is not None and self._phase.duration_ms is None:
+                self._phase.duration_ms = round(now - self._phase.start_ms, 1)
+            self.result = result
+            self.duration_ms = round(now, 1)
+            self.attrs.update(attrs)
+
+    # --- salida ----------------------------------------------------------------------------------
+    def to_json(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "servicio": self.service,
+                "inicio": self.started_at.isoformat(timespec="milliseconds"),
+                "duracion_ms": self.duration_ms,
+                "resultado": self.result,
+                "atributos": dict(self.attrs),
+                "fases": _phase_totals(self.spans),
+                "contadores": [
+                    {"nombre": name, "etiquetas": dict(labels), "valor": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "spans": [asdict(s) for s in self.spans],
+            }
+
+    def openmetrics(self) -> str:
+        data = self.to_json()
+        p = METRIC_PREFIX
+        lines = [
+            f"# TYPE {p}_corrida_segundos gauge",
+            f"{p}_corrida_segundos{_labels(resultado=data['resultado'] or 'desconocido')} "
+            f"{_num((data['duracion_ms'] or 0) / 1000)}",
+            f"# TYPE {p}_corrida_exito gauge",
+            f"{p}_corrida_exito {1 if data['resultado'] in ('ok', 'sin_cambios') else 0}",
+            f"# TYPE {p}_fase_segundos gauge",
+        ]
+        for name, ms in data["fases"].items():
+            lines.append(f"{p}_fase_segundos{_labels(fase=name)} {_num(ms / 1000)}")
+
+        groups: dict[tuple[str, str], list[float]] = defaultdict(list)
+        errors: Counter = Counter()
+        for span in self.spans:
+            if span.name == "fase" or span.duration_ms is None:
+                continue
+            key = (span.name, str(span.attrs.get("label", "")))
+            groups[key].append(span.duration_ms / 1000)
+            if span.status != "ok":
+                errors[key] += 1
+        lines.append(f"# TYPE {p}_span_segundos summary")
+        for (name, label), values in sorted(groups.items()):
+            labels = _labels(span=name, label=label)
+            lines.append(f"{p}_span_segundos_sum{labels} {_num(sum(values))}")
+            lines.append(f"{p}_span_segundos_count{labels} {len(values)}")
+        lines.append(f"# TYPE {p}_span_errores counter")
+        for (name, label), n in sorted(errors.items()):
+            lines.append(f"{p}_span_errores_total{_labels(span=name, label=label)} {n}")
+
+        by_name: dict[str, list] = defaultdict(list)
+        for counter in data["contadores"]:
+            by_name[counter["nombre"]].append(counter)
+        for name, samples in sorted(by_name.items()):
+            lines.append(f"# TYPE {p}_{name} counter")
+            for sample in samples:
+                lines.append(f"{p}_{name}_total{_labels(**sample['etiquetas'])} {_num(sample['valor'])}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: str) -> tuple[str, str]:
+        os.makedirs(directory, exist_ok=True)
+        trace_path = os.path.join(directory, TRACE_FILE)
+        metrics_path = os.path.join(directory, METRICS_FILE)
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=1)
+        with open(metrics_path, "w", encoding="utf-8") as f:
+            f.write(self.openmetrics())
+        return trace_path, metrics_path
+
+
+def _phase_totals(spans: list[Span]) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for span in spans:
+        if span.name == "fase" and span.duration_ms is not None:
+            name = span.attrs["fase"]
+            totals[name] = round(totals.get(name, 0.0) + span.duration_ms, 1)
+    return totals
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _num(value: float) -> str:
+    return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+
+TRACE = Tracer()
+
+
+# --- informe de varias corridas -------------------------------------------------------------------
+def _percentile(values: list[float], q: float) -> float:
+    # Rango mas cercano: con pocas corridas no se interpola.
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def report(traces: list[dict[str, Any]]) -> str:
+    phases: dict[str, list[float]] = defaultdict(list)
+    totals: list[float] = []
+    results: Counter = Counter()
+    retries: Counter = Counter()
+    for trace in traces:
+        results[trace.get("resultado") or "desconocido"] += 1
+        if trace.get("duracion_ms") is not None:
+            totals.append(trace["duracion_ms"])
+        for name, ms in (trace.get("fases") or {}).items():
+            phases[name].append(ms)
+        for counter in trace.get("contadores") or []:
+            if counter["nombre"] == "reintentos":
+                retries[counter["etiquetas"].get("label") or counter["etiquetas"].get("operacion", "-")] += counter["valor"]
+
+    def row(name: str, values: list[float]) -> str:
+        return (
+            f"{name:<32} n={len(values):<4} p50={_percentile(values, 0.5):>9.0f}ms "
+            f"p95={_percentile(values, 0.95):>9.0f}ms max={max(values):>9.0f}ms"
+        )
+
+    out = [f"corridas={len(traces)} " + " ".join(f"{k}={v}" for k, v in sorted(results.items()))]
+    if totals:
+        out.append(row("corrida", totals))
+    out += [row(name, values) for name, values in sorted(phases.items())]
+    if retries:
+        out.append("reintentos " + " ".join(f"{k}={v:g}" for k, v in retries.most_common()))
+    return "\n".join(out)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="p50/p95 por fase de varias trazas de Dios Hoy (traza.json).")
+    parser.add_argument("trazas", nargs="+", help="Archivos traza.json")
+    args = parser.parse_args(argv)
+    traces = []
+    for path in args.trazas:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                traces.append(json.load(f))
+        except (OSError, ValueError) as exc:
+            print(f"ignorada {path}: {exc}", file=sys.stderr)
+    if not traces:
+        return 1
+    print(report(traces))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
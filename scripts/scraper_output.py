@@ -0,0 +1,66 @@
+"""
+Escritura de la salida de los scrapers: documento JSON (indentado) o NDJSON (un registro por linea).
+
+En NDJSON cada registro se escribe compacto y se hace flush al momento, para que la fase siguiente
+pueda consumir el dia 1 mientras el scraper sigue con los demas.
+
+`fields` (opcion --fields de los scrapers) deja solo esos campos de cada registro, en ese orden; sirve
+para no repetir el mismo contenido como HTML y como texto cuando la fase siguiente usa uno solo.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+from typing import Any, Iterable, Iterator, Optional, Sequence, TextIO
+
+OUTPUT_FORMATS = ("json", "ndjson")
+
+
+@contextlib.contextmanager
+def open_output(path: Optional[str]) -> Iterator[TextIO]:
+    if not path:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        yield f
+
+
+def parse_fields(spec: Optional[str], allowed: Sequence[str]) -> Optional[list[str]]:
+    """Lista de --fields ("a,b"); None si no se pidio o es "all". ValueError si hay campos desconocidos."""
+    if not spec or spec.strip() == "all":
+        return None
+    fields = [name.strip() for name in spec.split(",") if name.strip()]
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Campos desconocidos: {', '.join(unknown)} (validos: {', '.join(allowed)})")
+    return fields
+
+
+def select_fields(record: dict[str, Any], fields: Optional[Sequence[str]]) -> dict[str, Any]:
+    if fields is None:
+        return record
+    return {name: record.get(name) for name in fields}
+
+
+def write_document(path: Optional[str], payload: dict[str, Any]) -> None:
+    encoded = json.dumps(payload, ensure_ascii=False, indent=2)
+    with open_output(path) as f:
+        f.write(encoded)
+        f.write("\n")
+
+
+def write_ndjson(
+    path: Optional[str], records: Iterable[dict[str, Any]], fields: Optional[Sequence[str]] = None
+) -> int:
+    """Escribe cada registro apenas llega (solo `fields`, si se indican). Devuelve cuantos se escribieron."""
+    count = 0
+    with open_output(path) as f:
+        for record in records:
+            f.write(json.dumps(select_fields(record, fields), ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            f.flush()
+            count += 1
+    return count
@@ -0,0 +1,319 @@
+"""
+Seleccion del video del dia a partir de las entradas del feed Atom de YouTube (ya parseado).
+
+Extraido de `get_latest_video_url` (import os.py) para poder medirlo y reutilizarlo sin Selenium:
+- `normalize_title`: titulos comparables aunque traigan emojis, tildes o letras "estilizadas".
+- `parse_csv_tokens`: tokens REQUIRE/FORBID normalizados igual que los titulos.
+- `select_video_entry`: ordena por fecha (published/updated) y elige la primera entrada que cumple
+  tokens + regex; si ninguna cumple, la mas reciente.
+- `title_filters`: regex compilada + tokens normalizados, memoizados por valor de configuracion.
+- `entry_video_date` / `videos_by_date`: fecha de cada video (la del titulo, "7 de febrero de 2026" o
+  "6/2/2026"; si no trae, la de publicacion) para el modo por lotes (`--start-date/--days`).
+
+Descarga (`fetch_feed_entries`): GET condicional (`If-None-Match` / `If-Modified-Since`) con el cuerpo
+y los validadores en `http_cache.HttpCache`, y las entradas ya parseadas (`FeedEntry`) en la misma
+cache bajo `<url>#entradas`, atadas al sha256 del cuerpo. Un 304 (o un cuerpo identico) no vuelve a
+parsear: dentro del proceso se reutiliza la lista en memoria y entre corridas el JSON de disco.
+feedparser se importa solo si hay que parsear.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Pattern, Sequence
+
+from http_cache import HttpCache
+from http_client import HttpClient, get_client
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SPACES_RE = re.compile(r"\s+")
+
+
+def normalize_title(text: str) -> str:
+    """Normalize titles to make matching robust across emojis/accents/styled unicode."""
+    if not text:
+        return ""
+    # NFKC helps with compatibility chars (e.g. mathematical bold letters).
+    text = unicodedata.normalize("NFKC", text)
+    # Strip accents.
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    # Lowercase in a unicode-aware way.
+    text = text.casefold()
+    # Drop punctuation/emojis/symbols; keep alnum and spaces.
+    text = _NON_ALNUM_RE.sub(" ", text)
+    text = _SPACES_RE.sub(" ", text).strip()
+    return text
+
+
+def parse_csv_tokens(raw: str) -> list[str]:
+    if not raw:
+        return []
+    # Normalize tokens as well so callers can include accents/punctuation.
+    tokens = (normalize_title(p.strip()) for p in raw.split(","))
+    return [tok for tok in tokens if tok]
+
+
+@functools.lru_cache(maxsize=32)
+def title_filters(pattern: str, require_csv: str = "", forbid_csv: str = "") -> tuple[Pattern[str], tuple[str, ...], tuple[str, ...]]:
+    """(regex, tokens requeridos, tokens prohibidos) para `select_video_entry`; re.error si la regex es invalida."""
+    return (
+        re.compile(pattern, re.IGNORECASE),
+        tuple(parse_csv_tokens(require_csv)),
+        tuple(parse_csv_tokens(forbid_csv)),
+    )
+
+
+def entry_timestamp(entry: Any) -> Optional[float]:
+    # Prefer published time; fallback to updated.
+    for attr in ("published_parsed", "updated_parsed"):
+        value = getattr(entry, attr, None)
+        if value:
+            try:
+                return time.mktime(value)
+            except (TypeError, OverflowError, OSError, ValueError):
+                pass
+    return None
+
+
+def sort_entries(entries: Sequence[Any]) -> list[Any]:
+    """Mas reciente primero; sin fecha al final; empates conservan el orden del feed."""
+    indexed = []
+    for idx, entry in enumerate(entries):
+        ts = entry_timestamp(entry)
+        indexed.append((ts if ts is not None else -1, -idx, entry))
+    indexed.sort(key=lambda t: (t[0], t[1]), reverse=True)
+    return [entry for _, __, entry in indexed]
+
+
+def title_matches(
+    normalized: str,
+    title_re: Pattern[str],
+    required_tokens: Sequence[str] = (),
+    forbidden_tokens: Sequence[str] = (),
+) -> bool:
+    if required_tokens and not all(tok in normalized for tok in required_tokens):
+        return False
+    if forbidden_tokens and any(tok in normalized for tok in forbidden_tokens):
+        return False
+    return title_re.search(normalized) is not None
+
+
+def select_video_entry(
+    entries: Sequence[Any],
+    title_re: Pattern[str],
+    required_tokens: Sequence[str] = (),
+    forbidden_tokens: Sequence[str] = (),
+) -> tuple[Any, bool]:
+    """Devuelve (entrada, coincidio). Sin coincidencias cae en la mas reciente con coincidio=False."""
+    if not entries:
+        raise ValueError("No hay entradas para seleccionar.")
+    sorted_entries = sort_entries(entries)
+    for entry in sorted_entries:
+        title = getattr(entry, "title", "") or ""
+        if title_matches(normalize_title(title), title_re, required_tokens, forbidden_tokens):
+            return entry, True
+    return sorted_entries[0], False
+
+
+MONTHS_ES = {
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7,
+    "agosto": 8, "septiembre": 9, "setiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
+}
+_TITLE_DATE_WORDS_RE = re.compile(r"\b(\d{1,2})\s+de\s+([a-z]+)(?:\s+(?:de|del)\s+(\d{4}))?\b")
+_TITLE_DATE_NUMERIC_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+
+
+def _date_text(title: str) -> str:
+    # Como normalize_title pero conservando "/" (fechas 6/2/2026).
+    text = unicodedata.normalize("NFKD", unicodedata.normalize("NFKC", title or ""))
+    return "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+
+
+def _closest_year(day: int, month: int, reference: Optional[date]) -> Optional[date]:
+    # Titulo sin año: el año que deja la fecha mas cerca de la publicacion (videos de fin/inicio de año).
+    ref = reference or date.today()
+    candidates = []
+    for year in (ref.year - 1, ref.year, ref.year + 1):
+        try:
+            candidates.append(date(year, month, day))
+        except ValueError:
+            pass
+    return min(candidates, key=lambda d: abs((d - ref).days)) if candidates else None
+
+
+def entry_video_date(entry: Any) -> Optional[date]:
+    """Fecha de la reflexion de un video: la del titulo, o la de publicacion (hora local) si no trae."""
+    ts = entry_timestamp(entry)
+    published = datetime.fromtimestamp(ts).date() if ts is not None else None
+    text = _date_text(getattr(entry, "title", "") or "")
+    m = _TITLE_DATE_NUMERIC_RE.search(text)
+    if m:
+        try:
+            return date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+        except ValueError:
+            pass
+    m = _TITLE_DATE_WORDS_RE.search(text)
+    if m and m.group(2) in MONTHS_ES:
+        day, month = int(m.group(1)), MONTHS_ES[m.group(2)]
+        if m.group(3):
+            try:
+                return date(int(m.group(3)), month, day)
+            except ValueError:
+                return None
+        return _closest_year(day, month, published)
+    return published
+
+
+def videos_by_date(
+    entries: Sequence[Any],
+    title_re: Pattern[str],
+    required_tokens: Sequence[str] = (),
+    forbidden_tokens: Sequence[str] = (),
+) -> dict[date, Any]:
+    """{fecha: entrada mas reciente que cumple los filtros de titulo para esa fecha}."""
+    out: dict[date, Any] = {}
+    for entry in sort_entries(entries):
+        if not title_matches(normalize_title(getattr(entry, "title", "") or ""), title_re, required_tokens, forbidden_tokens):
+            continue
+        day = entry_video_date(entry)
+        if day is not None and day not in out:
+            out[day] = entry
+    return out
+
+
+class FeedParseError(ValueError):
+    """El feed no se pudo parsear (feedparser marco `bozo`)."""
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    # Lo que `select_video_entry` y `get_latest_video_url` leen de una entrada de feedparser.
+    title: str
+    link: str
+    published_parsed: Optional[time.struct_time] = None
+    updated_parsed: Optional[time.struct_time] = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "title": self.title,
+            "link": self.link,
+            "published_parsed": list(self.published_parsed) if self.published_parsed else None,
+            "updated_parsed": list(self.updated_parsed) if self.updated_parsed else None,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "FeedEntry":
+        published = data.get("published_parsed")
+        updated = data.get("updated_parsed")
+        return cls(
+            title=data.get("title") or "",
+            link=data.get("link") or "",
+            published_parsed=time.struct_time(published) if published else None,
+            updated_parsed=time.struct_time(updated) if updated else None,
+        )
+
+
+@dataclass(frozen=True)
+class FeedFetch:
+    entries: list[FeedEntry]
+    status: int  # 200 o 304
+    parsed: bool  # True si en esta llamada se corrio feedparser
+    wire_bytes: int
+    seconds: float
+
+    def summary(self) -> str:
+        return (
+            f"status={self.status} parseado={self.parsed} entradas={len(self.entries)} "
+            f"bytes={self.wire_bytes} ms={self.seconds * 1000:.0f}"
+        )
+
+
+# url -> (sha256 del cuerpo, etag, last_modified, entradas): polls repetidos dentro del proceso.
+_MEMO: dict[str, tuple[str, str, str, list[FeedEntry]]] = {}
+_ENTRIES_SUFFIX = "#entradas"
+
+
+def parse_feed_entries(body: bytes) -> list[FeedEntry]:
+    import feedparser  # solo cuando hay un cuerpo nuevo que parsear
+
+    feed = feedparser.parse(body)
+    if feed.bozo:
+        raise FeedParseError(str(feed.bozo_exception))
+    return [
+        FeedEntry(
+            title=getattr(e, "title", "") or "",
+            link=getattr(e, "link", "") or "",
+            published_parsed=getattr(e, "published_parsed", None),
+            updated_parsed=getattr(e, "updated_parsed", None),
+        )
+        for e in feed.entries
+    ]
+
+
+def _cached_entries(cache: HttpCache, url: str, digest: str) -> Optional[list[FeedEntry]]:
+    entry = cache.lookup(url + _ENTRIES_SUFFIX)
+    # El etag de la entrada derivada es el sha256 del cuerpo del que salio.
+    if entry is None or entry.etag != digest:
+        return None
+    try:
+        return [FeedEntry.from_json(item) for item in json.loads(entry.body)]
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _entries_for(cache: Optional[HttpCache], url: str, body: bytes) -> tuple[str, list[FeedEntry], bool]:
+    digest = hashlib.sha256(body).hexdigest()
+    memo = _MEMO.get(url)
+    if memo is not None and memo[0] == digest:
+        return digest, memo[3], False
+    entries = _cached_entries(cache, url, digest) if cache is not None else None
+    if entries is not None:
+        return digest, entries, False
+    entries = parse_feed_entries(body)
+    if cache is not None:
+        payload = json.dumps([e.to_json() for e in entries], ensure_ascii=False).encode("utf-8")
+        cache.store(url + _ENTRIES_SUFFIX, payload, etag=digest)
+    return digest, entries, True
+
+
+def fetch_feed_entries(url: str, cache: Optional[HttpCache] = None, client: Optional[HttpClient] = None) -> FeedFetch:
+    """
+    Entradas del feed con GET condicional. Levanta FeedParseError si el cuerpo nuevo no se puede
+    parsear y HttpStatusError / OSError si falla la descarga.
+    """
+    t0 = time.perf_counter()
+    client = client or get_client()
+    memo = _MEMO.get(url)
+    stored = cache.lookup(url) if cache is not None and memo is None else None
+    if memo is not None:
+        headers = {k: v for k, v in (("If-None-Match", memo[1]), ("If-Modified-Since", memo[2])) if v}
+    else:
+        headers = cache.conditional_headers(stored) if cache is not None else {}
+
+    resp = client.get(url, headers=headers)
+    if resp.status == 304 and (memo is not None or stored is not None):
+        if memo is not None:
+            entries, parsed = memo[3], False
+        else:
+            digest, entries, parsed = _entries_for(cache, url, stored.body)
+            _MEMO[url] = (digest, stored.etag, stored.last_modified, entries)
+        if cache is not None:
+            cache.stats.bump("revalidated")
+        return FeedFetch(entries, 304, parsed, resp.wire_bytes, time.perf_counter() - t0)
+
+    etag = resp.headers.get("ETag") or ""
+    last_modified = resp.headers.get("Last-Modified") or ""
+    digest, entries, parsed = _entries_for(cache, url, resp.body)
+    if cache is not None:
+        cache.stats.bump("misses")
+        cache.store(url, resp.body, etag=etag, last_modified=last_modified)
+    _MEMO[url] = (digest, etag, last_modified, entries)
+    return FeedFetch(entries, resp.status, parsed, resp.wire_bytes, time.perf_counter() - t0)
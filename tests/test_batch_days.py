@@ -0,0 +1,72 @@
+"""Modo por lotes: plan por fecha, rechazo de lotes que cruzan de mes, tabla y resumen de costos."""
+
+import os
+import sys
+import unittest
+from datetime import date
+from types import SimpleNamespace
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from batch_days import DayResult, batch_dates, batch_summary, plan_days, require_month, results_table  # noqa: E402
+
+
+def _video_id(url):
+    return url.rsplit("=", 1)[-1]
+
+
+class BatchDaysTest(unittest.TestCase):
+    def test_batch_dates_stay_in_the_panel_month(self):
+        february = date(2026, 2, 10)
+        self.assertEqual(batch_dates(date(2026, 2, 27), 2, month=february), [date(2026, 2, 27), date(2026, 2, 28)])
+        self.assertEqual(batch_dates(date(2026, 2, 7), 0), [date(2026, 2, 7)])
+        with self.assertRaisesRegex(ValueError, r"solo muestra 2026-02: 2 fecha\(s\).*primera: 2026-03-01"):
+            batch_dates(date(2026, 2, 28), 3, month=february)
+        with self.assertRaisesRegex(ValueError, "primera: 2026-01-31"):
+            require_month([date(2026, 1, 31), date(2026, 2, 1)], february)
+        require_month([], february)
+
+    def test_plan_days_skips_dates_without_video(self):
+        dates = batch_dates(date(2026, 2, 6), 3)
+        videos = {
+            date(2026, 2, 6): SimpleNamespace(link="https://www.youtube.com/watch?v=a6", title="Gotitas 6"),
+            date(2026, 2, 7): SimpleNamespace(link="", title="sin enlace"),
+        }
+        tasks, missing = plan_days(dates, videos, _video_id)
+        self.assertEqual([(t.day, t.video_id, t.title) for t in tasks], [(date(2026, 2, 6), "a6", "Gotitas 6")])
+        self.assertEqual([(r.day, r.result, r.ok) for r in missing], [
+            (date(2026, 2, 7), "sin_video", False),
+            (date(2026, 2, 8), "sin_video", False),
+        ])
+
+    def test_summary_counts_opened_days_only(self):
+        results = [
+            DayResult(date(2026, 2, 6), "a6", "insertado", ms=1200),
+            DayResult(date(2026, 2, 7), "a7", "sin_confirmar", ms=3000, detail="sin aviso"),
+            DayResult(date(2026, 2, 8), "a8", "error", ms=800),
+            DayResult(date(2026, 2, 9), None, "sin_video"),
+        ]
+        self.assertEqual([r.ok for r in results], [True, False, False, False])
+        self.assertEqual(
+            batch_summary(results, total_ms=9000, setup_ms=3000),
+            "dias=4 abiertos=3 ok=1 errores=1 total_ms=9000 arranque_ms=3000 "
+            "por_dia_ms=3000 por_dia_sin_arranque_ms=2000",
+        )
+        self.assertTrue(batch_summary([], 0, 0).endswith("por_dia_ms=0 por_dia_sin_arranque_ms=0"))
+
+    def test_results_table_is_sorted_by_date(self):
+        results = [
+            DayResult(date(2026, 2, 8), None, "sin_video"),
+            DayResult(date(2026, 2, 6), "a6", "normalizado", ms=1234.4, transport="navegador", detail="x" * 80),
+        ]
+        lines = results_table(results).splitlines()
+        self.assertEqual(lines[0].split(), ["fecha", "video_id", "resultado", "transporte", "ms", "detalle"])
+        self.assertEqual(lines[1].split(), ["2026-02-06", "a6", "normalizado", "navegador", "1234", "x" * 60])
+        self.assertEqual(lines[2].split(), ["2026-02-08", "-", "sin_video", "-", "0"])
+        # Columnas alineadas: cada celda empieza donde su titulo.
+        self.assertEqual(lines[1].index("a6"), lines[0].index("video_id"))
+
+
+if __name__ == "__main__":
+    unittest.main()
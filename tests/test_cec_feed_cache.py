@@ -0,0 +1,68 @@
+"""El RSS de CEC queda en la cache HTTP aunque el escaneo corte temprano (GET condicional -> 304)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import cec_evangelio_scraper as cec  # noqa: E402
+from fixture_server import FixtureServer, build_rss  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from http_client import get_client  # noqa: E402
+
+FEED_START = date(2025, 1, 1)
+FEED_ITEMS = 400
+# Ventana cerca del comienzo del feed (newest-first): el escaneo corta mucho antes del final.
+RECENT = FEED_START + timedelta(days=FEED_ITEMS - 10)
+# Ventana cerca del final: hay que leer casi todo el feed.
+OLD = FEED_START + timedelta(days=30)
+
+
+class FeedCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = HttpCache(self.tmp.name)
+        cec.configure_cache(self.cache)
+        self.addCleanup(cec.configure_cache, None)
+
+    def _scan(self, srv, start):
+        return cec._scan_feed(srv.rss_url, start, start + timedelta(days=2), early_stop=True, store=None)
+
+    def test_second_run_revalidates_feed_after_early_stop(self):
+        stats = get_client().stats
+        with FixtureServer(FEED_START, FEED_ITEMS, latency=0) as srv:
+            full = len(build_rss(srv.base_url, FEED_START, FEED_ITEMS))
+            body_before = stats.body_bytes
+            first = self._scan(srv, RECENT)
+            entry = self.cache.lookup(srv.rss_url)
+            self.assertIsNotNone(entry)
+            self.assertFalse(entry.complete)
+            second = self._scan(srv, RECENT)
+            self.assertEqual(srv.not_modified, 1)
+            self.assertEqual(srv.requests, 2)
+            # Ni la primera corrida termina de bajar el feed ni la segunda lo vuelve a pedir.
+            self.assertLess(stats.body_bytes - body_before, full // 2)
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(self.cache.stats.misses, 1)
+        self.assertEqual(self.cache.stats.revalidated, 1)
+
+    def test_wider_scan_resumes_past_the_cached_prefix(self):
+        with FixtureServer(FEED_START, FEED_ITEMS, latency=0) as srv:
+            self._scan(srv, RECENT)
+            old = self._scan(srv, OLD)
+            self.assertEqual(srv.not_modified, 1)
+            self.assertEqual(srv.requests, 3)  # 200 (prefijo), 304 y la descarga para seguir leyendo
+            cec.configure_cache(None)
+            self.assertEqual(old, self._scan(srv, OLD))
+        self.assertEqual([p[0] for p in old], [(OLD + timedelta(days=n)).isoformat() for n in range(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
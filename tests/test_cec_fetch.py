@@ -0,0 +1,61 @@
+"""Descarga de articulos CEC en paralelo contra el servidor local (benchmarks/fixture_server.py)."""
+
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import cec_evangelio_scraper as cec  # noqa: E402
+from fixture_server import FixtureServer, build_article  # noqa: E402
+
+START = date(2026, 2, 7)
+COUNT = 12
+
+
+class CECFetchTest(unittest.TestCase):
+    def setUp(self):
+        cec.configure_cache(None)
+
+    def _fetch(self, srv, **kwargs):
+        return cec.fetch_cec_items(START.isoformat(), COUNT - 1, rss_url=srv.rss_url, **kwargs)
+
+    def test_parallel_fetch_respects_per_host_limit(self):
+        with FixtureServer(START, COUNT, latency=0.05) as srv:
+            items = self._fetch(srv, workers=8, per_host=3)
+            self.assertLessEqual(srv.max_in_flight, 3)
+            self.assertGreater(srv.max_in_flight, 1)
+            self.assertEqual(srv.requests, COUNT + 1)  # feed + un articulo por dia
+        self.assertEqual([it.iso_date for it in items], [(START + timedelta(days=n)).isoformat() for n in range(COUNT)])
+        for it in items:
+            self.assertTrue(it.link.endswith(it.iso_date))
+            self.assertIn("Venid vosotros a solas", it.content_text)
+            self.assertEqual(it.according_to, "San Marcos")
+
+    def test_sequential_and_parallel_agree(self):
+        with FixtureServer(START, COUNT, latency=0) as srv:
+            sequential = self._fetch(srv, workers=1, per_host=1)
+            self.assertEqual(srv.max_in_flight, 1)
+            parallel = self._fetch(srv, workers=6, per_host=6)
+        self.assertEqual(sequential, parallel)
+
+    def test_article_download_stops_after_the_gospel_block(self):
+        with FixtureServer(START, 1, latency=0) as srv:
+            link = f"{srv.base_url}/evangelio-diario/{START.isoformat()}"
+            cut = cec._fetch_article(link)
+            full = cec._fetch_article(link, stream=False)
+        size = len(build_article(START.isoformat()))
+        self.assertTrue(cut.aborted)
+        self.assertLess(cut.wire_bytes, size // 2)
+        self.assertFalse(full.aborted)
+        self.assertEqual((full.wire_bytes, full.total_bytes), (size, size))
+        self.assertEqual(cut.block, full.block)
+        self.assertTrue(cut.block.text.startswith("Lectura del santo Evangelio"))
+        self.assertTrue(cut.block.text.endswith("Palabra del Señor."))
+
+
+if __name__ == "__main__":
+    unittest.main()
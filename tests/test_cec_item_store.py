@@ -0,0 +1,50 @@
+"""Modo incremental de CEC: que filas del almacen evitan volver a descargar el articulo."""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from cec_item_store import CECItemStore  # noqa: E402
+
+LINK = "https://www.cec.org.co/evangelio-diario/2026-02-07"
+
+
+def _item(content_html="<p>En aquel tiempo...</p>", link=LINK):
+    return SimpleNamespace(
+        iso_date="2026-02-07",
+        title="07 de febrero | Mc 6, 30-34",
+        link=link,
+        citation_raw="Mc 6, 30-34",
+        book_abbr="Mc",
+        book_name="Marcos",
+        according_to="San Marcos",
+        content_html=content_html,
+        content_text=content_html.replace("<p>", "").replace("</p>", ""),
+    )
+
+
+class CECItemStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = CECItemStore(":memory:")
+        self.addCleanup(self.store.close)
+
+    def test_same_link_with_content_is_skipped(self):
+        self.assertFalse(self.store.has("2026-02-07", LINK))
+        self.assertEqual(self.store.upsert(_item()), "new")
+        self.assertTrue(self.store.has("2026-02-07", LINK))
+        self.assertFalse(self.store.has("2026-02-07", LINK + "-v2"))
+        self.assertEqual(self.store.upsert(_item()), "unchanged")
+
+    def test_row_without_content_is_fetched_again(self):
+        self.store.upsert(_item(content_html=""))
+        self.assertFalse(self.store.has("2026-02-07", LINK))
+        self.assertEqual(self.store.upsert(_item()), "changed")
+        self.assertTrue(self.store.has("2026-02-07", LINK))
+
+
+if __name__ == "__main__":
+    unittest.main()
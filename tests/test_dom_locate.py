@@ -0,0 +1,195 @@
+"""dom_locate: una busqueda = un execute_script; filtros de las estrategias sobre un DOM falso (node)."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import dom_locate  # noqa: E402
+from dom_locate import CommandCounter, locate, locate_all, locate_props, strategy  # noqa: E402
+from selenium.webdriver.remote.webelement import WebElement  # noqa: E402
+
+# DOM minimo para correr _LOCATE_JS en node: selectores `tag`, `[attr='v']`, `tag[attr*='v']` (y listas
+# con coma); los elementos devueltos se traducen a su `id`.
+_HARNESS_JS = r"""
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const byId = {};
+function build(spec, parent) {
+  const el = {
+    id: spec.id, tagName: spec.tag.toUpperCase(), attrs: spec.attrs || {}, own: spec.text || '',
+    hidden: !!spec.hidden, disabled: !!spec.disabled, parent, isConnected: true, children: [],
+  };
+  el.children = (spec.children || []).map((c) => build(c, el));
+  el.getAttribute = (k) => (k in el.attrs ? el.attrs[k] : null);
+  el.getBoundingClientRect = () => (el.hidden ? {width: 0, height: 0} : {width: 10, height: 10});
+  el.querySelectorAll = (sel) => descendants(el).filter((d) => matchesSelector(d, sel));
+  el.closest = (sel) => { for (let n = el; n; n = n.parent) if (matchesSelector(n, sel)) return n; return null; };
+  Object.defineProperty(el, 'textContent', {get: () => el.own + el.children.map((c) => c.textContent).join('')});
+  Object.defineProperty(el, 'innerText', {get: () => el.textContent});
+  Object.defineProperty(el, 'href', {get: () => el.getAttribute('href')});
+  byId[spec.id] = el;
+  return el;
+}
+function descendants(el) { return el.children.flatMap((c) => [c, ...descendants(c)]); }
+function matchesSelector(el, sel) {
+  return sel.split(',').some((part) => {
+    const m = part.trim().match(/^(\w+)?(?:\[([\w-]+)(?:([*$]?=)'([^']*)')?\])?$/);
+    if (!m) throw new Error('selector no soportado: ' + part);
+    if (m[1] && el.tagName !== m[1].toUpperCase()) return false;
+    if (!m[2]) return true;
+    const v = el.getAttribute(m[2]);
+    if (v === null) return false;
+    if (!m[3]) return true;
+    return m[3] === '=' ? v === m[4] : m[3] === '*=' ? v.includes(m[4]) : v.endsWith(m[4]);
+  });
+}
+const root = build(input.dom, null);
+globalThis.document = root;
+globalThis.getComputedStyle = () => ({visibility: 'visible', display: 'block', opacity: '1'});
+const strategies = input.strategies.map((st) => Object.assign({}, st, {root: st.root ? byId[st.root] : null}));
+const out = new Function(input.script)(strategies, input.want_all, input.prop);
+const ids = (v) => (v && typeof v === 'object' && v.id ? v.id : v);
+process.stdout.write(JSON.stringify(Array.isArray(out) ? out.map(ids) : ids(out)));
+"""
+
+NODE = shutil.which("node")
+
+
+def _el(id_, tag, text="", children=(), **kwargs):
+    return {"id": id_, "tag": tag, "text": text, "children": list(children), **kwargs}
+
+
+# Formulario del editor con toolbar, un modal de video y un aside con enlaces que no cuentan.
+DOM = _el("body", "body", children=[
+    _el("aside", "aside", children=[
+        _el("a-aside", "a", "Evangelio y santo", attrs={"href": "/aside/evangelios-y-santo"}),
+    ]),
+    _el("main", "main", children=[
+        _el("a-otro", "a", "Evangelio y santo", attrs={"href": "/otro/evangelios-y-santo"}),
+        _el("a-dios", "a", "Evangelio y santo", attrs={"href": "/dios-hoy/evangelios-y-santo"}),
+        _el("form", "form", children=[
+            _el("b-bold", "button", "B", attrs={"type": "button"}),
+            _el("b-video", "button", "", attrs={"type": "button", "aria-label": "Insertar VIDEO"}),
+            _el("b-link", "button", "", attrs={"type": "button"}, disabled=True),
+            _el("b-hidden", "button", "Guardar", hidden=True),
+            _el("b-save", "button", "  Guardar \n cambios ", attrs={"type": "submit"}),
+        ]),
+        _el("modal", "div", attrs={"role": "dialog"}, children=[
+            _el("input", "input", attrs={"type": "url"}),
+            _el("b-cancel", "button", "Cancelar"),
+            _el("b-ok", "button", "Insertar"),
+        ]),
+    ]),
+])
+
+
+@unittest.skipUnless(NODE, "node no esta instalado")
+class LocateScriptTest(unittest.TestCase):
+    def _run(self, *strategies, want_all=False, prop=None):
+        payload = {
+            "script": dom_locate._LOCATE_JS,
+            "dom": DOM,
+            "strategies": list(strategies),
+            "want_all": want_all,
+            "prop": prop,
+        }
+        proc = subprocess.run([NODE, "-e", _HARNESS_JS], input=json.dumps(payload), capture_output=True, text=True, timeout=30)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        return json.loads(proc.stdout)
+
+    def test_first_strategy_with_hits_wins(self):
+        self.assertEqual(self._run(strategy(css="button", text="Publicar"), strategy(css="button", text="Guardar cambios")), "b-save")
+        self.assertIsNone(self._run(strategy(css="button", text="Publicar"), strategy(css="textarea")))
+        self.assertEqual(self._run(strategy(css="textarea"), want_all=True), [])
+
+    def test_visible_and_enabled_filters(self):
+        self.assertEqual(self._run(strategy(css="button", text_in=["GUARDAR"])), "b-save")
+        self.assertEqual(self._run(strategy(css="button", text_in=["guardar"], visible=False)), "b-hidden")
+        enabled_empty = strategy(css="button[type='button']", enabled=True, text_empty=True)
+        self.assertEqual(self._run(enabled_empty, want_all=True), ["b-video"])
+
+    def test_text_or_attribute_keywords(self):
+        by_label = strategy(css="button", text_in=["video"], attr_in={"aria-label": ["Video"]})
+        self.assertEqual(self._run(by_label), "b-video")
+        self.assertEqual(self._run(strategy(css="button", attr={"type": "submit"})), "b-save")
+        self.assertIsNone(self._run(strategy(css="button", attr={"type": "reset"})))
+
+    def test_closest_container_and_excluded_labels(self):
+        submit = strategy(css="button", root="input", closest=["[role='dialog']", "form"], enabled=True, attr={"type": "submit"})
+        confirm = strategy(
+            css="button", root="input", closest=["[role='dialog']", "form"], enabled=True, text_nonempty=True,
+            text_not=["cancelar", "cerrar"],
+        )
+        self.assertEqual(self._run(submit, confirm), "b-ok")
+        # Sin ancestro que coincida, la estrategia se salta.
+        self.assertIsNone(self._run(strategy(css="button", root="input", closest=["table"])))
+
+    def test_props_skip_excluded_containers_and_scan_limit(self):
+        links = strategy(css="a[href*='evangelios-y-santo']", exclude_closest="aside")
+        self.assertEqual(
+            self._run(links, want_all=True, prop="href"), ["/otro/evangelios-y-santo", "/dios-hoy/evangelios-y-santo"]
+        )
+        self.assertEqual(self._run(strategy(css="button", scan_limit=2), want_all=True), ["b-bold", "b-video"])
+
+
+class _FakeDriver:
+    """Driver minimo: `execute` es el unico camino a chromedriver (como en selenium)."""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.scripts = []
+
+    def execute(self, command, params=None):
+        if command == "executeScript":
+            self.scripts.append(params["args"])
+            return {"value": self.value}
+        return {"value": f"{command}-ok"}
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script, "args": list(args)})["value"]
+
+
+class LocateDriverTest(unittest.TestCase):
+    def test_strategy_lowercases_keywords(self):
+        st = strategy(css="button", text_in=["Guardar"], attr_in={"aria-label": ["Video"]})
+        self.assertEqual(st["text_in"], ["guardar"])
+        self.assertEqual(st["attr_in"], {"aria-label": ["video"]})
+        self.assertTrue(st["visible"])
+        self.assertIsNone(st["root"])
+
+    def test_one_round_trip_for_all_strategies(self):
+        driver = _FakeDriver()
+        first, second = strategy(css="a"), strategy(xpath="//button")
+        self.assertIsNone(locate(driver, first, second))
+        self.assertEqual(driver.scripts, [[[first, second], False, None]])
+        self.assertEqual(locate_all(driver, first), [])
+        self.assertEqual(locate_props(driver, ["href", "innerText"], first), [])
+        self.assertEqual(driver.scripts[-1], [[first], True, ["href", "innerText"]])
+
+    def test_element_context_is_the_default_root(self):
+        driver = _FakeDriver(value=["x"])
+        element = WebElement(driver, "el-1")
+        other = WebElement(driver, "el-2")
+        self.assertEqual(locate_all(element, strategy(css="button"), strategy(css="a", root=other)), ["x"])
+        (strategies, want_all, _), = driver.scripts
+        self.assertEqual([st["root"] for st in strategies], [element, other])
+        self.assertTrue(want_all)
+
+    def test_command_counter_sees_element_commands(self):
+        driver = _FakeDriver()
+        counter = CommandCounter()
+        counter.install(driver)
+        locate(driver, strategy(css="a"))
+        self.assertEqual(WebElement(driver, "el-1").text, "getElementText-ok")
+        self.assertEqual(counter.total, 2)
+        self.assertEqual(counter.summary(), "comandos=2 (executeScript:1,getElementText:1)")
+        self.assertEqual(CommandCounter().summary(), "comandos=0 (-)")
+
+
+if __name__ == "__main__":
+    unittest.main()
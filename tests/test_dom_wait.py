@@ -0,0 +1,72 @@
+"""DomWaiter.until: solo reintenta cuando la pagina navego; los demas errores del driver se propagan."""
+
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import dom_wait  # noqa: E402
+from selenium.common.exceptions import InvalidSessionIdException, JavascriptException  # noqa: E402
+
+
+class _FakeDriver:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _waiter(driver):
+    logger = logging.getLogger("test_dom_wait")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return dom_wait.DomWaiter(driver, timeout=5, logger=logger)
+
+
+@mock.patch.object(dom_wait, "_RETRY_PAUSE", 0)
+class DomWaiterTest(unittest.TestCase):
+    def test_retries_after_navigation(self):
+        unloaded = JavascriptException("javascript error: document unloaded while waiting for result")
+        driver = _FakeDriver([unloaded, {"ok": True, "index": 0, "element": None}])
+        result = _waiter(driver).until(css="ion-content")
+        self.assertTrue(result.ok)
+        self.assertEqual(len(driver.calls), 2)
+
+    def test_dead_session_is_raised(self):
+        driver = _FakeDriver([InvalidSessionIdException("invalid session id")])
+        with self.assertRaises(InvalidSessionIdException):
+            _waiter(driver).until(css="ion-content")
+        self.assertEqual(len(driver.calls), 1)
+
+    def test_navigation_retries_are_capped(self):
+        unloaded = JavascriptException("javascript error: document unloaded while waiting for result")
+        driver = _FakeDriver([unloaded] * (dom_wait._MAX_NAVIGATION_RETRIES + 1))
+        with self.assertRaises(JavascriptException):
+            _waiter(driver).until(css="ion-content")
+        self.assertEqual(len(driver.calls), dom_wait._MAX_NAVIGATION_RETRIES + 1)
+
+    def test_interval_only_for_url_and_visibility(self):
+        ok = {"ok": True, "index": 0, "element": None}
+        driver = _FakeDriver([ok, ok, ok])
+        waiter = _waiter(driver)
+        waiter.until(css="ion-content", text="Evangelio")
+        waiter.until(css="ion-content", visible=True)
+        waiter.until(dom_wait.when(css="ion-card"), dom_wait.when(url_changed_from="http://x/inicio"))
+        self.assertEqual([call[-1] for call in driver.calls], [False, True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
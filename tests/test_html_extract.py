@@ -0,0 +1,48 @@
+"""El bloque `schema:text` se extrae completo (divs anidados) igual en una pasada que en trozos."""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from html_extract import BlockExtractor, extract_block, html_to_text  # noqa: E402
+
+FIXTURE = os.path.join(ROOT, "benchmarks", "fixtures", "cec", "articulo-2026-02-07.html")
+
+
+class HtmlExtractTest(unittest.TestCase):
+    def test_nested_divs_and_comments(self):
+        page = (
+            b'<html><div property="schema:text-x">no</div>'
+            b'<div class="c" property="schema:text"><div>a<!-- <div> --></div>b&amp;c</div><div>fuera</div>'
+        )
+        block = extract_block(page)
+        self.assertTrue(block.found)
+        self.assertEqual(block.html, "<div>a<!-- <div> --></div>b&amp;c")
+        self.assertEqual(block.text, "ab&c")
+
+    def test_missing_block(self):
+        self.assertFalse(extract_block(b"<html><body>nada</body></html>").found)
+
+    def test_chunked_feed_matches_single_pass(self):
+        with open(FIXTURE, "rb") as f:
+            page = f.read()
+        whole = extract_block(page)
+        self.assertTrue(whole.text.endswith("Palabra del Señor."))
+        for size in (1, 13, 1024):
+            parser = BlockExtractor()
+            for i in range(0, len(page), size):
+                if parser.feed_bytes(page[i : i + size]):
+                    break
+            else:
+                parser.feed_bytes(b"", final=True)
+            self.assertEqual(parser.result(), whole, size)
+
+    def test_html_to_text(self):
+        self.assertEqual(html_to_text("<p>a<br>b</p><p>c</p>\n\n\n"), "a\nb\n\nc")
+
+
+if __name__ == "__main__":
+    unittest.main()
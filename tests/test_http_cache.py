@@ -0,0 +1,75 @@
+"""Cache HTTP en disco: GET condicional, articulos servidos sin red y expulsion LRU."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import cec_evangelio_scraper as cec  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+
+START = date(2026, 2, 7)
+
+
+class HttpCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_entry_round_trip_and_conditional_headers(self):
+        cache = HttpCache(self.tmp.name)
+        self.assertIsNone(cache.lookup("http://x/feed"))
+        self.assertEqual(cache.conditional_headers(None), {})
+        cache.store("http://x/feed", b"<rss/>", etag='"abc"', last_modified="Sat, 07 Feb 2026 05:00:00 GMT")
+        entry = HttpCache(self.tmp.name).lookup("http://x/feed")
+        self.assertEqual(entry.body, b"<rss/>")
+        self.assertTrue(entry.complete)
+        self.assertEqual(
+            cache.conditional_headers(entry),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Sat, 07 Feb 2026 05:00:00 GMT"},
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = HttpCache(self.tmp.name, max_bytes=250)
+        for name in ("a", "b"):
+            cache.store(f"http://x/{name}", b"x" * 100)
+            time.sleep(0.01)
+        cache.lookup("http://x/a")  # "a" pasa a ser la mas reciente
+        time.sleep(0.01)
+        cache.store("http://x/c", b"x" * 100)
+        self.assertIsNotNone(cache.lookup("http://x/a"))
+        self.assertIsNone(cache.lookup("http://x/b"))
+        self.assertIsNotNone(cache.lookup("http://x/c"))
+        self.assertEqual(cache.stats.evicted, 1)
+
+    def test_articles_come_from_cache_and_revalidate_on_refresh(self):
+        self.addCleanup(cec.configure_cache, None)
+        with FixtureServer(START, 3, latency=0) as srv:
+            link = f"{srv.base_url}/evangelio-diario/{START.isoformat()}"
+            cache = HttpCache(self.tmp.name)
+            cec.configure_cache(cache)
+            first = cec._fetch_article(link)
+            second = cec._fetch_article(link)
+            self.assertEqual(srv.requests, 1)
+
+            # --refresh-cache: GET condicional, el servidor responde 304 y se usa el cuerpo guardado.
+            cec.configure_cache(HttpCache(self.tmp.name, refresh=True))
+            third = cec._fetch_article(link)
+            self.assertEqual(srv.requests, 2)
+            self.assertEqual(srv.not_modified, 1)
+        self.assertEqual([f.source for f in (first, second, third)], ["network", "cache", "304"])
+        self.assertEqual(second.wire_bytes, 0)
+        self.assertEqual(first.block, second.block)
+        self.assertEqual(first.block, third.block)
+        self.assertEqual((cache.stats.misses, cache.stats.hits), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Cliente HTTP con pool keep-alive: reuso de conexiones, reintento en conexion vieja y redirecciones."""
+
+import gzip
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from fixture_server import _QuietServer  # noqa: E402
+from http_client import MAX_REDIRECTS, HttpClient, HttpStatusError  # noqa: E402
+
+BODY = b"Lectura del santo Evangelio " * 200
+
+
+class _Server:
+    """Rutas fijas; guarda los headers recibidos por ruta. `drop_idle` cierra el socket tras responder
+    sin avisar (`Connection: close`), como un servidor que corta conexiones keep-alive ociosas."""
+
+    def __init__(self):
+        self.seen = {}
+        self.methods = {}
+        self.drop_idle = False
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=b"", headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                if srv.drop_idle:
+                    self.close_connection = True
+
+            def _route(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                path = self.path
+                srv.seen[path] = self.headers
+                srv.methods[path] = self.command
+                other = f"http://localhost:{srv.port}"
+                if path == "/texto":
+                    self._reply(200, BODY)
+                elif path == "/gzip":
+                    self._reply(200, gzip.compress(BODY), [("Content-Encoding", "gzip")])
+                elif path == "/mismo":
+                    self._reply(302, headers=[("Location", "/fin")])
+                elif path == "/otro":
+                    self._reply(302, headers=[("Location", f"{other}/fin")])
+                elif path == "/form":
+                    self._reply(303, headers=[("Location", "/fin")])
+                elif path == "/bucle":
+                    self._reply(302, headers=[("Location", "/bucle")])
+                elif path == "/fin":
+                    self._reply(200, b"ok")
+                else:
+                    self._reply(404, b"no")
+
+            do_GET = do_POST = _route
+
+        self._server = _QuietServer(("127.0.0.1", 0), Handler)
+        self.port = self._server.server_address[1]
+        self.base = f"http://127.0.0.1:{self.port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class HttpClientTest(unittest.TestCase):
+    def setUp(self):
+        self.srv = _Server()
+        self.addCleanup(self.srv.close)
+        self.client = HttpClient(timeout=5)
+        self.addCleanup(self.client.close)
+
+    def test_keep_alive_connection_is_reused(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get(f"{self.srv.base}/texto").body, BODY)
+        self.assertEqual(self.client.stats.connections_opened, 1)
+        self.assertEqual(self.client.stats.requests, 3)
+
+    def test_gzip_body_is_decoded(self):
+        resp = self.client.get(f"{self.srv.base}/gzip")
+        self.assertEqual(resp.body, BODY)
+        self.assertLess(resp.wire_bytes, len(BODY))
+        self.assertIn("gzip", self.srv.seen["/gzip"]["Accept-Encoding"])
+
+    def test_stale_pooled_connection_is_retried(self):
+        self.srv.drop_idle = True
+        self.client.get(f"{self.srv.base}/texto")
+        # La conexion quedo en el pool pero el servidor ya la cerro: se reintenta con una nueva.
+        self.assertEqual(self.client.get(f"{self.srv.base}/texto").body, BODY)
+        self.assertEqual(self.client.stats.connections_opened, 2)
+
+    def test_stream_closed_early_drops_the_connection(self):
+        with self.client.open(f"{self.srv.base}/texto", chunk_size=64) as stream:
+            self.assertEqual(len(stream.read(10)), 10)
+            self.assertFalse(stream.complete)
+        self.client.get(f"{self.srv.base}/texto")
+        self.assertEqual(self.client.stats.connections_opened, 2)
+
+    def test_credentials_only_follow_same_host_redirects(self):
+        creds = {"Cookie": "sesion=1", "Authorization": "Bearer x", "X-Extra": "1"}
+        self.client.get(f"{self.srv.base}/mismo", headers=creds)
+        self.assertEqual(self.srv.seen["/fin"]["Cookie"], "sesion=1")
+        self.assertEqual(self.srv.seen["/fin"]["Authorization"], "Bearer x")
+
+        resp = self.client.get(f"{self.srv.base}/otro", headers=creds)
+        self.assertEqual(resp.url, f"http://localhost:{self.srv.port}/fin")
+        self.assertIsNone(self.srv.seen["/fin"]["Cookie"])
+        self.assertIsNone(self.srv.seen["/fin"]["Authorization"])
+        self.assertEqual(self.srv.seen["/fin"]["X-Extra"], "1")
+
+    def test_see_other_switches_to_get(self):
+        resp = self.client.request(
+            "POST", f"{self.srv.base}/form", body=b"a=1", headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        self.assertEqual(resp.body, b"ok")
+        self.assertEqual(self.srv.methods["/form"], "POST")
+        self.assertEqual(self.srv.methods["/fin"], "GET")
+        self.assertIsNone(self.srv.seen["/fin"]["Content-Type"])
+
+        raw = self.client.request("POST", f"{self.srv.base}/form", body=b"a=1", follow_redirects=False)
+        self.assertEqual((raw.status, raw.headers["Location"]), (303, "/fin"))
+
+    def test_errors_and_redirect_limit(self):
+        with self.assertRaises(HttpStatusError) as ctx:
+            self.client.get(f"{self.srv.base}/falta")
+        self.assertEqual(ctx.exception.status, 404)
+        self.assertEqual(self.client.get(f"{self.srv.base}/falta", allow_status=(404,)).body, b"no")
+        with self.assertRaises(HttpStatusError) as ctx:
+            self.client.get(f"{self.srv.base}/bucle")
+        self.assertEqual(ctx.exception.status, 310)
+        self.assertEqual(self.client.stats.requests, 2 + MAX_REDIRECTS + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Lectura incremental del array `data`: trozos chicos, strings con llaves, ventana de fechas y cortes."""
+
+import io
+import json
+import os
+import sys
+import unittest
+from datetime import date, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import ordo_api  # noqa: E402
+from json_stream import JSONStreamError, iter_array_items  # noqa: E402
+from ordo_api_server import build_payload  # noqa: E402
+
+START = date(2025, 11, 30)
+
+
+class _CountingReader(io.BytesIO):
+    """BytesIO que cuenta los bytes entregados, para ver donde dejo de leer el consumidor."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def _items(data: bytes, **kwargs) -> list:
+    return [json.loads(raw) for raw in iter_array_items(io.BytesIO(data), **kwargs)]
+
+
+class JsonStreamTest(unittest.TestCase):
+    def test_items_match_json_loads_at_any_chunk_size(self):
+        doc = {
+            "status": True,
+            "note": "data",
+            "meta": {"data": [9]},
+            "data": [
+                {"fecha": "2026-02-07", "html": '<p>{ "}" [ ] \\" }</p>'},
+                [1, {"a": [2, 3]}],
+                {"vacio": {}},
+            ],
+            "tail": [0],
+        }
+        data = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+        for size in (1, 2, 7, 64, 64 * 1024):
+            self.assertEqual(_items(data, chunk_size=size), doc["data"], size)
+
+    def test_root_array_and_scalars_are_skipped(self):
+        data = b'[{"a": 1}, 2, "x", [3], {"b": "]"}]'
+        self.assertEqual(_items(data, key=None, chunk_size=3), [{"a": 1}, [3], {"b": "]"}])
+
+    def test_truncated_or_missing_array_raises(self):
+        full = build_payload(START, days=3, paragraphs=1)
+        cases = {
+            "array": full[: full.rindex(b"]")],
+            "string": full[: full.index(b'"primera_lectura"') + 5],
+            "clave": b'{"status": true, "otra": []}',
+        }
+        for name, data in cases.items():
+            with self.assertRaises(JSONStreamError, msg=name):
+                _items(data, chunk_size=16)
+
+    def test_stopping_early_leaves_the_rest_unread(self):
+        data = build_payload(START, days=60, paragraphs=2)
+        source = _CountingReader(data)
+        items = iter_array_items(source, key="data", chunk_size=1024)
+        first = json.loads(next(items))
+        items.close()
+        self.assertEqual(first["fecha"], START.isoformat())
+        self.assertLess(source.consumed, len(data) // 10)
+
+    def test_window_records_stop_after_the_slack(self):
+        # Varias veces el trozo por defecto (64 KiB), para que el corte se note en lo leido.
+        data = build_payload(START, days=60, paragraphs=12)
+        source = _CountingReader(data)
+        stats = ordo_api.IngestStats()
+        records = list(ordo_api.iter_window_records(source, "2025-12-02", "2025-12-04", stats=stats))
+        self.assertEqual([r["fecha"] for r in records], ["2025-12-02", "2025-12-03", "2025-12-04"])
+        self.assertEqual(stats.records, 3)
+        self.assertTrue(stats.stopped_early)
+        self.assertLess(source.consumed, len(data) // 2)
+
+        # Sin early_stop se recorre todo el array y no se marca el corte.
+        stats = ordo_api.IngestStats()
+        source = _CountingReader(data)
+        last = (START + timedelta(days=59)).isoformat()
+        records = list(ordo_api.iter_window_records(source, last, last, early_stop=False, stats=stats))
+        self.assertEqual([r["fecha"] for r in records], [last])
+        self.assertFalse(stats.stopped_early)
+        self.assertEqual(source.consumed, len(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
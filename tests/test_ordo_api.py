@@ -0,0 +1,118 @@
+"""Cache anual del Ordo contra el servidor local (benchmarks/ordo_api_server.py)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import ordo_api  # noqa: E402
+from http_client import HttpStatusError  # noqa: E402
+from ordo_api_server import OrdoApiServer, build_record  # noqa: E402
+from ordo_year_cache import OrdoYearCache, write_year_cache  # noqa: E402
+
+START = date(2025, 11, 30)
+
+
+class OrdoApiTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = self.tmp.name
+
+    def _serve(self, **kwargs) -> OrdoApiServer:
+        srv = OrdoApiServer(start=START, days=60, paragraphs=2, **kwargs)
+        srv.__enter__()
+        self.addCleanup(srv.__exit__, None, None, None)
+        env = {
+            "ORDO_API_URL": srv.url,
+            "ORDO_API_KEY": srv.api_key,
+            "ORDO_API_TOKEN": srv.api_token,
+            "ORDO_API_RETRIES": "0",
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return srv
+
+    def _days(self, start_iso: str, days_ahead: int, **kwargs) -> list:
+        return list(ordo_api.iter_ordo_days(start_iso, days_ahead, cache_dir=self.cache_dir, **kwargs))
+
+    def test_builds_year_cache_and_answers_from_mmap(self):
+        srv = self._serve()
+        stats = ordo_api.IngestStats()
+        days = self._days("2025-12-24", 2, stats=stats)
+        self.assertEqual([d.fecha for d in days], ["2025-12-24", "2025-12-25", "2025-12-26"])
+        self.assertEqual(days[1].tiempo_liturgico, "NAVIDAD")
+        self.assertTrue(stats.downloaded)
+        self.assertEqual(stats.records, 60)
+
+        path = ordo_api.find_edition(self.cache_dir, "2026-01-15")
+        self.assertTrue(path.endswith("edicion-2025-11-30_2026-01-28.ordoyc"))
+        with OrdoYearCache(path) as cache:
+            day = cache.get("2026-01-15")
+        self.assertEqual(day.tiempo_liturgico, "I TIEMPO ORDINARIO")
+        self.assertEqual(day.colores_dia, "Verde")
+        self.assertEqual(day.misa_referencias[:2], ["1 Re 3,4-13", "Sal 118,9-14"])
+
+        # Segunda consulta: sale del archivo, sin volver al API.
+        again = self._days("2026-01-15", 0)
+        self.assertEqual(again, [day])
+        self.assertEqual(srv.requests, 1)
+
+    def test_corrupt_or_stale_edition_is_rebuilt(self):
+        srv = self._serve()
+        path = os.path.join(self.cache_dir, "edicion-2025-11-30_2026-01-28.ordoyc")
+        stats = ordo_api.IngestStats()
+        for n, content in enumerate((b"ORDOYC1\0" + b"\x01" * 5, b"ORDOYC0\0" + b"\0" * 64), start=1):
+            # Primero un archivo truncado, despues uno de una version anterior del formato.
+            with open(path, "wb") as f:
+                f.write(content)
+            with ordo_api.open_edition("2025-12-01", cache_dir=self.cache_dir, stats=stats) as cache:
+                self.assertEqual(cache.get("2025-12-01").tiempo_liturgico, "ADVIENTO")
+            self.assertEqual(stats.rebuilt, n)
+            self.assertEqual(srv.requests, n)
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(path)])
+        self.assertEqual([d.fecha for d in self._days("2025-12-01", 0)], ["2025-12-01"])
+        self.assertEqual(srv.requests, 2)
+
+    def test_day_missing_from_year_is_skipped(self):
+        srv = self._serve()
+        days = self._days("2026-01-27", 4)
+        # La edicion termina el 2026-01-28: las fechas posteriores no estan y no se vuelve a descargar.
+        self.assertEqual([d.fecha for d in days], ["2026-01-27", "2026-01-28"])
+        self.assertEqual(srv.requests, 1)
+        with ordo_api.open_edition("2026-01-27", cache_dir=self.cache_dir) as cache:
+            self.assertIsNone(cache.get("2026-01-29"))
+            self.assertIsNone(cache.get("2025-11-29"))
+
+    def test_day_missing_inside_the_year(self):
+        records = [build_record(date(2026, 2, d)) for d in (6, 8)]  # sin el 7 de febrero
+        path = os.path.join(self.cache_dir, "edicion.ordoyc")
+        self.assertEqual(write_year_cache(path, records), 2)
+        with OrdoYearCache(path) as cache:
+            self.assertTrue(cache.covers("2026-02-07"))
+            self.assertIsNone(cache.get("2026-02-07"))
+            self.assertEqual(cache.get("2026-02-08").fecha, "2026-02-08")
+
+    def test_single_day_fallback_when_year_endpoint_fails(self):
+        srv = self._serve(full_status=503)
+        with self.assertRaises(HttpStatusError):
+            self._days("2026-01-10", 1)
+
+        stats = ordo_api.IngestStats()
+        days = self._days("2026-01-10", 1, stats=stats, day_url=srv.day_url)
+        self.assertEqual([d.fecha for d in days], ["2026-01-10", "2026-01-11"])
+        self.assertEqual(days[0].tiempo_liturgico, "NAVIDAD")
+        self.assertEqual(srv.day_requests, 2)
+        self.assertEqual(stats.day_requests, 2)
+        self.assertFalse(os.listdir(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Pool --workers del Ordo con drivers falsos: orden de entrega, errores, cierre de drivers y guardia de memoria."""
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import ordo_lecturas_selenium as ordo  # noqa: E402
+from browser_network import NetworkStats, policy_for  # noqa: E402
+from dom_wait import WaitStats  # noqa: E402
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def get_log(self, kind):
+        # Un request terminado por navegador, para ver que las estadisticas de red se combinan.
+        events = [
+            {"method": "Network.requestWillBeSent", "params": {"requestId": "1", "request": {"url": "https://x/a"}}},
+            {"method": "Network.loadingFinished", "params": {"requestId": "1", "encodedDataLength": 10}},
+        ]
+        return [{"message": json.dumps({"message": e})} for e in events]
+
+    def quit(self) -> None:
+        self.closed = True
+
+
+class _FakeNavigator:
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.reloads = 0
+        self.days = []
+
+    def load_inicio(self, target) -> None:
+        self.reloads += 1
+
+
+class OrdoWorkersTest(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+        self.navigators = []
+        self.lock = threading.Lock()
+        self.fail_on = None
+        self.slow = None  # fecha -> segundos
+
+        def start_driver(headless, policy=None, commands=None):
+            driver = _FakeDriver()
+            with self.lock:
+                self.drivers.append(driver)
+            return driver
+
+        def new_navigator(driver, wait_stats, network=None, capture="dom"):
+            nav = _FakeNavigator(driver)
+            with self.lock:
+                self.navigators.append(nav)
+            return nav
+
+        def read_day(nav, target, save_dom):
+            iso = target.isoformat()
+            if iso == self.fail_on:
+                raise RuntimeError(f"fallo {iso}")
+            time.sleep((self.slow or {}).get(target, 0.0))
+            nav.days.append(iso)
+            day = ordo.ReadingDay(iso_date=iso, header=f"h {iso}", sections={"Evangelio": iso})
+            return day, ordo.DayTiming(iso_date=iso, seconds=0.0, transitions=2, reloads=0)
+
+        for name, fake in (("_start_driver", start_driver), ("_new_navigator", new_navigator), ("_read_day_spa", read_day)):
+            patcher = mock.patch.object(ordo, name, side_effect=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.start = datetime.now().date()
+
+    def _iter(self, days_ahead: int, workers: int, **kwargs):
+        return ordo.iter_reading_days(self.start.isoformat(), days_ahead, workers=workers, **kwargs)
+
+    def test_days_come_in_date_order_and_drivers_are_closed(self):
+        # El primer dia es el mas lento: los siguientes terminan antes y deben esperar su turno.
+        self.slow = {self.start: 0.05}
+        timings, network = [], NetworkStats(policy_for("ordo"))
+        days = list(self._iter(3, workers=3, timings=timings, wait_stats=WaitStats(), network=network))
+        expected = [(self.start + timedelta(days=i)).isoformat() for i in range(4)]
+        self.assertEqual([d.iso_date for d in days], expected)
+        self.assertEqual([t.iso_date for t in timings], expected)
+        self.assertEqual(len(self.drivers), 3)
+        self.assertTrue(all(d.closed for d in self.drivers))
+        # Cada dia se extrae una sola vez y cada navegador carga /inicio una sola vez.
+        self.assertEqual(sorted(day for nav in self.navigators for day in nav.days), expected)
+        self.assertTrue(all(nav.reloads == 1 for nav in self.navigators))
+        self.assertEqual(network.requests, 3)
+
+    def test_workers_are_capped_by_the_number_of_days(self):
+        self.assertEqual(len(list(self._iter(1, workers=5))), 2)
+        self.assertEqual(len(self.drivers), 2)
+
+    def test_worker_error_is_raised_after_the_days_before_it(self):
+        self.fail_on = (self.start + timedelta(days=2)).isoformat()
+        seen = []
+        with self.assertRaisesRegex(RuntimeError, "fallo"):
+            for day in self._iter(3, workers=2):
+                seen.append(day.iso_date)
+        self.assertLessEqual(len(seen), 2)
+        self.assertNotIn(self.fail_on, seen)
+        self.assertTrue(all(d.closed for d in self.drivers))
+
+    def test_closing_the_iterator_stops_the_pool(self):
+        self.slow = {self.start + timedelta(days=i): 0.05 for i in range(1, 4)}
+        days = self._iter(3, workers=2)
+        self.assertEqual(next(days).iso_date, self.start.isoformat())
+        days.close()
+        self.assertTrue(all(d.closed for d in self.drivers))
+        self.assertLess(sum(len(nav.days) for nav in self.navigators), 4)
+
+    def test_workers_require_spa_navigation(self):
+        with self.assertRaisesRegex(RuntimeError, "--workers"):
+            list(self._iter(1, workers=2, navigation="legacy"))
+        self.assertEqual(self.drivers, [])
+
+
+class MemoryGuardTest(unittest.TestCase):
+    def test_workers_fit_in_available_memory(self):
+        cases = [(None, 4, 4), (None, 0, 1), (4000, 7, 4), (4000, 2, 2), (500, 3, 1)]
+        for available, requested, expected in cases:
+            with mock.patch.object(ordo, "_available_memory_mb", return_value=available), mock.patch.multiple(
+                ordo, WORKER_MEMORY_MB=700, MEMORY_RESERVE_MB=1024
+            ):
+                self.assertEqual(ordo.max_workers_for_memory(requested), expected, (available, requested))
+
+
+if __name__ == "__main__":
+    unittest.main()
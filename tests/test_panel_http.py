@@ -0,0 +1,104 @@
+"""Resguardos del transporte HTTP: forma exacta del registro antes del PATCH y cookies entre hosts."""
+
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import panel_http  # noqa: E402
+from fixture_server import _QuietServer  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+
+
+class _Server:
+    """Responde `routes[path] = (status, headers, body)` y guarda el Cookie recibido por ruta."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.cookies = {}
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                srv.cookies[self.path] = self.headers.get("Cookie")
+                status, headers, body = srv.routes[self.path]
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value.format(port=srv.port))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = _QuietServer(("127.0.0.1", 0), Handler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class PanelHttpTest(unittest.TestCase):
+    def test_day_record_must_have_exact_shape(self):
+        good = {"id": 7, "fecha": "2026-02-07", "reflexion": "<p>x</p>"}
+        panel_http._check_day(good, "2026-02-07")
+        panel_http._check_day(dict(good, reflexion=None), "2026-02-07")
+        for bad in (
+            None,
+            [good],
+            dict(good, estado="borrador"),
+            {"id": 7, "fecha": "2026-02-07"},
+            dict(good, id=True),
+            dict(good, fecha="2026-02-08"),
+            dict(good, reflexion={"html": ""}),
+        ):
+            with self.assertRaises(panel_http.PanelHttpError, msg=repr(bad)):
+                panel_http._check_day(bad, "2026-02-07")
+
+    def test_non_json_response_is_rejected(self):
+        srv = _Server({"/api/dios-hoy": (200, [("Content-Type", "text/html")], b"<html>login</html>")})
+        self.addCleanup(srv.close)
+        client = HttpClient(timeout=5)
+        self.addCleanup(client.close)
+        session = panel_http.PanelSession(base=f"http://127.0.0.1:{srv.port}", client=client)
+        with self.assertRaises(panel_http.PanelHttpError):
+            session.request_json("GET", "/api/dios-hoy")
+
+    def test_cookie_not_forwarded_to_other_host(self):
+        srv = _Server(
+            {
+                "/mismo": (302, [("Location", "http://127.0.0.1:{port}/fin")], b""),
+                "/otro": (302, [("Location", "http://localhost:{port}/fin")], b""),
+                "/fin": (200, [("Content-Type", "text/plain")], b"ok"),
+            }
+        )
+        self.addCleanup(srv.close)
+        client = HttpClient(timeout=5)
+        self.addCleanup(client.close)
+        base = f"http://127.0.0.1:{srv.port}"
+
+        client.request("GET", f"{base}/mismo", headers={"Cookie": "sesion=1"})
+        self.assertEqual(srv.cookies["/fin"], "sesion=1")
+        client.request("GET", f"{base}/otro", headers={"Cookie": "sesion=1", "Authorization": "Bearer x"})
+        self.assertIsNone(srv.cookies["/fin"])
+
+        # PanelSession sigue las redirecciones por su cuenta: tampoco manda su cookie a otro host.
+        session = panel_http.PanelSession(base=base, client=client)
+        session.cookies["sesion"] = "2"
+        session.request("GET", "/otro")
+        self.assertEqual(srv.cookies["/otro"], "sesion=2")
+        self.assertIsNone(srv.cookies["/fin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
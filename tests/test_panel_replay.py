@@ -0,0 +1,177 @@
+"""Replay offline del panel sin Chrome: escenario, sesion, pasos, guardado e importacion de instantaneas."""
+
+import http.client
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from urllib.parse import quote, urlencode
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from panel_replay import (  # noqa: E402
+    REPLAY_PREFIX,
+    SCENARIO_FILE,
+    SESSION_COOKIE,
+    ReplayServer,
+    Scenario,
+    check_reflection,
+    import_snapshots,
+    inject_runtime,
+)
+
+BASICO = os.path.join(ROOT, "benchmarks", "fixtures", "panel_replay", "basico")
+DAY = "2026-02-07"
+EVANGELIO = f"/espiritualidad/dios-hoy/{DAY}/evangelios-y-santo"
+
+
+class ScenarioTest(unittest.TestCase):
+    def test_load_basic_scenario(self):
+        scenario = Scenario.load(BASICO)
+        self.assertEqual(scenario.name, "basico")
+        self.assertEqual(scenario.expected_steps[0], "login")
+        self.assertEqual(scenario.expected_steps[-1], "guardar")
+        self.assertEqual(scenario.page_for(EVANGELIO)[0], "evangelio_santo.html")
+        self.assertEqual(scenario.page_for("/dashboard/")[0], "dashboard.html")
+        self.assertTrue(scenario.page_for("/auth/login")[1]["publica"])
+        self.assertIsNone(scenario.page_for("/espiritualidad/dios-hoy/ayer/evangelios-y-santo"))
+        self.assertIn("<", scenario.snapshot("login.html"))
+        self.assertIsNone(scenario.snapshot("../escenario.json"))
+
+    def test_invalid_scenarios_are_rejected(self):
+        rule = {"paso": "x", "evento": "click", "selector": "button", "acciones": [{"mostrar": "#a"}]}
+        cases = {
+            "instantanea": {"paginas": {"/a": {"html": "falta.html"}}},
+            "estado": {"transiciones": {"a.html": [dict(rule, acciones=[{"estado": "falta.html"}])]}},
+            "accion": {"transiciones": {"a.html": [dict(rule, acciones=[{"volar": "#a"}])]}},
+            "evento": {"transiciones": {"a.html": [dict(rule, evento="hover")]}},
+        }
+        for name, data in cases.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                with open(os.path.join(tmp, "a.html"), "w", encoding="utf-8") as f:
+                    f.write("<html></html>")
+                with open(os.path.join(tmp, SCENARIO_FILE), "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                with self.assertRaises(ValueError, msg=name):
+                    Scenario.load(tmp)
+
+
+class ReplayServerTest(unittest.TestCase):
+    def setUp(self):
+        self.srv = ReplayServer(Scenario.load(BASICO), username="u", password="p")
+        self.srv.__enter__()
+        self.addCleanup(self.srv.__exit__, None, None, None)
+        self.cookie = ""
+
+    def _request(self, method, path, body=None, ctype="application/json"):
+        host, port = self.srv._server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        self.addCleanup(conn.close)
+        headers = {"Cookie": self.cookie} if self.cookie else {}
+        if body is not None:
+            headers["Content-Type"] = ctype
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        return resp.status, resp.headers, resp.read().decode("utf-8")
+
+    def _login(self, password="p"):
+        form = urlencode({"usuario": "u", "clave": password, "callbackUrl": EVANGELIO})
+        status, headers, body = self._request(
+            "POST", REPLAY_PREFIX + "login", form, "application/x-www-form-urlencoded"
+        )
+        if status == 200:
+            self.cookie = headers["Set-Cookie"].split(";")[0]
+        return status, json.loads(body)
+
+    def _save(self, html):
+        return self._request("POST", REPLAY_PREFIX + "guardar", json.dumps({"fecha": DAY, "html": html}))[0]
+
+    def test_private_pages_need_a_session(self):
+        status, headers, _ = self._request("GET", EVANGELIO)
+        self.assertEqual(status, 302)
+        self.assertEqual(headers["Location"], "/auth/login?callbackUrl=" + quote(EVANGELIO, safe=""))
+        self.assertEqual(self._request("GET", "/auth/login")[0], 200)
+        self.assertEqual(self._login(password="mal"), (401, {"url": "/auth/login?error=CredentialsSignin"}))
+
+        self.assertEqual(self._login(), (200, {"url": EVANGELIO}))
+        self.assertTrue(self.cookie.startswith(SESSION_COOKIE + "="))
+        status, _, html = self._request("GET", EVANGELIO)
+        self.assertEqual(status, 200)
+        self.assertIn(f'<script src="{REPLAY_PREFIX}runtime.js"></script>', html)
+        self.assertIn('"estado": "evangelio_santo.html"', html)
+        self.assertEqual(self._request("GET", "/no-existe")[0], 404)
+        pages = [name for _, kind, name in self.srv.timeline() if kind == "pagina"]
+        self.assertEqual(pages, [f"302 {EVANGELIO}", "/auth/login", EVANGELIO, "404 /no-existe"])
+
+    def test_steps_and_saves_are_recorded(self):
+        self.srv.reset(reflections={DAY: "<p>sembrada</p>"})
+        self.assertEqual(self._save("x"), 401)
+        self._login()
+        self.assertIn('"reflexion": "<p>sembrada<\\/p>"', self._request("GET", EVANGELIO)[2])
+        for step in ("editar_reflexion", "guardar"):
+            self.assertEqual(self._request("POST", REPLAY_PREFIX + "paso", json.dumps({"paso": step}))[0], 200)
+        saved = '<p>Reflexión del día</p><iframe class="ql-video" src="https://www.youtube.com/embed/abc"></iframe>'
+        self.assertEqual(self._save(saved), 200)
+        self.assertEqual(self.srv.steps(), ["editar_reflexion", "guardar"])
+        self.assertEqual([name for name, _ in self.srv.step_timings()], ["editar_reflexion", "guardar"])
+        self.assertEqual(self.srv.saves, [(DAY, saved)])
+        self.assertEqual(self.srv.reflections[DAY], saved)
+
+        status, _, html = self._request("GET", REPLAY_PREFIX + "instantanea/login.html")
+        self.assertEqual(status, 200)
+        self.assertNotIn("__REPLAY__", html)
+        self.assertEqual(self._request("GET", REPLAY_PREFIX + "instantanea/escenario.json")[0], 404)
+
+
+class ReflectionCheckTest(unittest.TestCase):
+    def _video(self, src="https://www.youtube.com/embed/abc", width=560, height=315):
+        return f'<iframe class="ql-video" src="{src}" width="{width}" height="{height}"></iframe>'
+
+    def test_problems_in_saved_html(self):
+        marker = "<p>Reflexión del día</p>"
+        self.assertEqual(check_reflection(marker + self._video(), "abc", 560, 315), [])
+        self.assertEqual(check_reflection(None, "abc", 560, 315), ["no_guardado"])
+        self.assertEqual(check_reflection(marker, "abc", 560, 315), ["videos=0"])
+        self.assertEqual(check_reflection(marker + self._video() * 2, "abc", 560, 315), ["videos=2"])
+        self.assertEqual(
+            check_reflection(self._video(src="https://x/otro", width=100) + marker, "abc", 560, 315),
+            ["src=https://x/otro", "tamano=100x315", "antes_del_marcador"],
+        )
+
+    def test_runtime_config_cannot_close_the_script(self):
+        html = inject_runtime("<html><body><main></main></body></html>", {"reflexion": "</script><b>"})
+        self.assertTrue(html.endswith("</body></html>"))
+        self.assertIn('"reflexion": "<\\/script><b>"', html)
+        self.assertTrue(inject_runtime("<p>sin body</p>", {}).startswith("<p>sin body</p><style>"))
+
+
+class ImportSnapshotsTest(unittest.TestCase):
+    def test_debug_dumps_become_clean_snapshots(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = os.path.join(tmp, "debug-editor_abierto-20260207-053000.html")
+            with open(dump, "w", encoding="utf-8") as f:
+                f.write(
+                    '<html><head><link rel="stylesheet" href="/_next/static/a.css"><script>self.__next_f=[]</script>'
+                    "</head><body><p>admin@diocesis.org 1234567890</p></body></html>"
+                )
+            directory = os.path.join(tmp, "nuevo")
+            self.assertEqual(import_snapshots([dump], directory), ["editor_abierto.html"])
+            with open(os.path.join(directory, "editor_abierto.html"), encoding="utf-8") as f:
+                html = f.read()
+            self.assertEqual(html, "<html><head></head><body><p>***@*** ***</p></body></html>")
+            with open(os.path.join(directory, SCENARIO_FILE), encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["transiciones"], {"editor_abierto.html": []})
+
+            # Un escenario existente no se pisa.
+            shutil.copy(dump, os.path.join(tmp, "otra.html"))
+            import_snapshots([os.path.join(tmp, "otra.html")], directory)
+            with open(os.path.join(directory, SCENARIO_FILE), encoding="utf-8") as f:
+                self.assertEqual(list(json.load(f)["transiciones"]), ["editor_abierto.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Memoria de rutas del panel: orden (ganadora, tasa de exito, latencia), olvido por fallos y archivo JSON."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from route_memory import RouteMemory  # noqa: E402
+
+STEP = "evangelio_santo"
+KEYS = ["url:inferida", "selector:0", "selector:1", "selector:2"]
+
+
+class RouteMemoryTest(unittest.TestCase):
+    def test_unknown_routes_keep_their_default_order(self):
+        memory = RouteMemory()
+        self.assertEqual(memory.order(STEP, KEYS), KEYS)
+        self.assertEqual(memory.order(STEP, ["b", "a", "b"]), ["b", "a"])
+        self.assertEqual(memory.summary(STEP), "ganadora=- rutas=0 (-)")
+
+    def test_winner_first_then_success_rate_then_latency(self):
+        memory = RouteMemory()
+        memory.record(STEP, "selector:1", ok=True, ms=900)
+        memory.record(STEP, "selector:2", ok=True, ms=300)
+        memory.record(STEP, "url:inferida", ok=False, ms=5000)
+        # Ganadora: la ultima que funciono; despues la otra conocida con exito; las desconocidas (tasa
+        # neutra 0.5) en su orden; al final la que fallo.
+        self.assertEqual(memory.order(STEP, KEYS), ["selector:2", "selector:1", "selector:0", "url:inferida"])
+
+        # Una ganadora que falla pierde el primer lugar; entre iguales decide la latencia promedio.
+        memory.record(STEP, "selector:2", ok=False, ms=5000)
+        memory.record(STEP, "selector:2", ok=True, ms=300)
+        memory.record(STEP, "selector:1", ok=True, ms=900)
+        memory.record(STEP, "selector:1", ok=False, ms=5000)
+        self.assertNotIn(STEP, memory.winners)
+        self.assertEqual(memory.order(STEP, KEYS), ["selector:2", "selector:1", "selector:0", "url:inferida"])
+        memory.record(STEP, "selector:1", ok=True, ms=100)
+        self.assertEqual(memory.order(STEP, KEYS)[0], "selector:1")
+
+    def test_latency_is_a_moving_average(self):
+        memory = RouteMemory()
+        memory.record(STEP, "selector:0", ok=True, ms=1000)
+        memory.record(STEP, "selector:0", ok=True, ms=0)
+        stats = memory.routes[STEP]["selector:0"]
+        self.assertEqual((stats.avg_ms, stats.last_ms, stats.ok), (700.0, 0.0, 2))
+
+    def test_route_is_forgotten_after_consecutive_failures(self):
+        memory = RouteMemory(max_failures=2)
+        memory.record(STEP, "selector:0", ok=True, ms=100)
+        self.assertFalse(memory.record(STEP, "selector:0", ok=False, ms=100))
+        memory.record(STEP, "selector:0", ok=True, ms=100)  # un exito corta la racha
+        self.assertFalse(memory.record(STEP, "selector:0", ok=False, ms=100))
+        self.assertTrue(memory.record(STEP, "selector:0", ok=False, ms=100))
+        self.assertNotIn("selector:0", memory.routes[STEP])
+        self.assertEqual(memory.order(STEP, KEYS), KEYS)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sub", "rutas.json")
+            memory = RouteMemory.load(path, max_failures=0)
+            self.assertEqual((memory.routes, memory.max_failures), ({}, 1))
+            memory.record(STEP, "selector:2", ok=True, ms=250)
+            memory.record(STEP, "url:inferida", ok=False, ms=4000)
+            memory.save()
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["rutas.json"])
+
+            loaded = RouteMemory.load(path)
+            self.assertEqual(loaded.routes, memory.routes)
+            self.assertEqual(loaded.winners, {STEP: "selector:2"})
+            self.assertEqual(loaded.order(STEP, KEYS), memory.order(STEP, KEYS))
+
+            for content in ("{", '{"routes": {"x": {"k": {"desconocido": 1}}}}', "[]"):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                broken = RouteMemory.load(path, max_failures=4)
+                self.assertEqual((broken.routes, broken.winners, broken.max_failures), ({}, {}, 4), content)
+
+        RouteMemory().save()  # sin ruta: no escribe nada
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Registro de la ultima corrida: ida y vuelta del JSON, `covers()` y el camino rapido de `import os.py`."""
+
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import panel_selenium  # noqa: E402
+from run_state import RunState, load_state, save_state, state_path  # noqa: E402
+
+
+def _load_entrypoint():
+    # El punto de entrada no es importable por nombre ("import os.py").
+    spec = importlib.util.spec_from_file_location("dios_hoy_main", os.path.join(ROOT, "import os.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class RunStateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "sub", "estado.json")
+
+    def test_round_trip_and_atomic_write(self):
+        saved = save_state(self.path, "2026-02-07", "abc123")
+        self.assertEqual(load_state(self.path), saved)
+        self.assertTrue(saved.saved_ok)
+        self.assertGreater(saved.saved_at, 0)
+        # Sin temporales sueltos junto al archivo.
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["estado.json"])
+
+    def test_missing_or_corrupt_file_is_no_state(self):
+        self.assertIsNone(load_state(self.path))
+        os.makedirs(os.path.dirname(self.path))
+        bad_time = {"date": "2026-02-07", "video_id": "abc", "saved_ok": True, "saved_at": "ayer"}
+        for content in ("{", "[]", json.dumps({"date": "2026-02-07"}), json.dumps(bad_time)):
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(content)
+            self.assertIsNone(load_state(self.path), content)
+
+    def test_covers(self):
+        state = RunState(date="2026-02-07", video_id="abc", saved_ok=True)
+        self.assertTrue(state.covers("2026-02-07", "abc"))
+        self.assertFalse(state.covers("2026-02-08", "abc"))
+        self.assertFalse(state.covers("2026-02-07", "otro"))
+        self.assertFalse(state.covers("2026-02-07", None))
+        self.assertFalse(RunState(date="2026-02-07", video_id="abc", saved_ok=False).covers("2026-02-07", "abc"))
+        self.assertFalse(RunState(date="2026-02-07", video_id="", saved_ok=True).covers("2026-02-07", ""))
+
+    def test_state_path_from_env(self):
+        with mock.patch.dict(os.environ, {"DIOCESIS_RUN_STATE": self.path}):
+            self.assertEqual(state_path(), self.path)
+        with mock.patch.dict(os.environ, {"DIOCESIS_RUN_STATE": "  "}):
+            self.assertTrue(state_path().endswith("dios-hoy-estado.json"))
+
+
+class FastPathTest(unittest.TestCase):
+    VIDEO_URL = "https://www.youtube.com/watch?v=abc123"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "estado.json")
+        patcher = mock.patch.dict(os.environ, {"DIOCESIS_RUN_STATE": self.path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.main = _load_entrypoint()
+        self.logger = logging.getLogger("test_run_state")
+        self.logger.addHandler(logging.NullHandler())
+        self.logger.propagate = False
+        self.today = datetime.now().date().isoformat()
+
+    def _run(self, argv, panel_run=None):
+        args = self.main.parse_args(argv)
+        with mock.patch.object(self.main, "get_latest_video_url", return_value=self.VIDEO_URL), mock.patch.object(
+            panel_selenium, "run", side_effect=panel_run
+        ) as run, mock.patch("builtins.print"):
+            result = self.main._run(args, self.logger)
+        return result, run
+
+    def test_saved_video_skips_the_panel(self):
+        save_state(self.path, self.today, "abc123")
+        result, run = self._run([])
+        self.assertEqual(result, "sin_cambios")
+        run.assert_not_called()
+
+    def test_force_opens_the_panel_again(self):
+        save_state(self.path, self.today, "abc123")
+        result, run = self._run(["--force"])
+        self.assertEqual(result, "ok")
+        run.assert_called_once()
+        self.assertEqual(run.call_args.args[2:], (self.VIDEO_URL, "abc123"))
+
+    def test_new_video_or_day_runs_and_records_the_save(self):
+        for date_iso, video_id in (("2020-01-01", "abc123"), (self.today, "viejo")):
+            save_state(self.path, date_iso, video_id)
+            result, run = self._run([])
+            self.assertEqual(result, "ok")
+            run.assert_called_once()
+            state = load_state(self.path)
+            self.assertEqual((state.date, state.video_id), (self.today, "abc123"))
+
+    def test_unconfirmed_save_is_not_recorded(self):
+        save_state(self.path, "2020-01-01", "abc123")
+        with self.assertRaises(panel_selenium.SaveNotConfirmed):
+            self._run([], panel_run=panel_selenium.SaveNotConfirmed("sin toast"))
+        self.assertEqual(load_state(self.path).date, "2020-01-01")
+
+
+if __name__ == "__main__":
+    unittest.main()
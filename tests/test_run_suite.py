@@ -0,0 +1,75 @@
+"""Suite offline de benchmarks (benchmarks/run_suite.py) sobre los fixtures guardados."""
+
+import json
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import run_suite  # noqa: E402
+from ordo_dom import extract_lecturas_html  # noqa: E402
+from ordo_xhr import sections_from_json  # noqa: E402
+from run_suite import CaseResult, build_cases, compare, run_case  # noqa: E402
+
+ORDO = os.path.join(ROOT, "benchmarks", "fixtures", "ordo")
+
+
+def _result(name: str, median_us: float) -> CaseResult:
+    return CaseResult(name=name, items=1, loops=1, best_us=median_us, median_us=median_us, per_item_us=median_us)
+
+
+class RunSuiteTest(unittest.TestCase):
+    def test_every_fixture_builds_its_case(self):
+        cases, skipped = build_cases()
+        names = [c.name for c in cases]
+        expected = [
+            "cec.extract_target_date_from_title",
+            "cec.extract_schema_text_div",
+            "cec.html_to_text",
+            "ordo.extract_lecturas_html",
+            "ordo.sections_from_json",
+        ]
+        for name in expected:
+            self.assertIn(name, names)
+        if run_suite.feedparser is not None:
+            self.assertEqual(skipped, [])
+            self.assertIn("youtube.select_video_entry", names)
+        for case in cases:
+            self.assertGreater(case.items, 0, case.name)
+            self.assertIsNotNone(case.fn(), case.name)
+
+    def test_run_case_reports_per_item_time(self):
+        cases, _ = build_cases()
+        case = next(c for c in cases if c.name == "cec.extract_target_date_from_title")
+        result = run_case(case, repeat=2, min_time=0.001)
+        self.assertEqual(result.items, case.items)
+        self.assertGreaterEqual(result.loops, 1)
+        self.assertLessEqual(result.best_us, result.median_us)
+        self.assertAlmostEqual(result.per_item_us, round(result.median_us / case.items, 3), places=3)
+
+    def test_ordo_dom_and_json_fixtures_agree(self):
+        with open(os.path.join(ORDO, "lecturas-2026-02-07.html"), encoding="utf-8") as f:
+            header, sections = extract_lecturas_html(f.read())
+        with open(os.path.join(ORDO, "lecturas-2026-02-07.json"), encoding="utf-8") as f:
+            json_header, json_sections = sections_from_json(json.load(f), "2026-02-07")
+        self.assertEqual(header, json_header)
+        self.assertEqual(list(sections), ["Primera lectura", "Salmo", "Aclamación", "Evangelio"])
+        self.assertEqual(list(sections), list(json_sections))
+        # El DOM y el JSON difieren en saltos de linea en blanco, no en el texto.
+        for title, text in sections.items():
+            self.assertEqual(text.split(), json_sections[title].split(), title)
+
+    def test_compare_flags_only_cases_over_the_margin(self):
+        baseline = {"results": [{"name": "a", "median_us": 100.0}, {"name": "b", "median_us": 100.0}]}
+        results = [_result("a", 120.0), _result("b", 130.0), _result("nuevo", 999.0)]
+        regressions = compare(results, baseline, max_slowdown=1.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b: 100.0us -> 130.0us"))
+        self.assertEqual(compare(results, {}, max_slowdown=1.0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
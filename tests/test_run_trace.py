@@ -0,0 +1,135 @@
+"""Trazas de la corrida: fases y spans anidados, JSON, metricas OpenMetrics e informe de varias corridas."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import run_trace  # noqa: E402
+from run_trace import METRICS_FILE, TRACE_FILE, Tracer, report  # noqa: E402
+
+
+def _traced_run() -> Tracer:
+    tracer = Tracer()
+    tracer.begin(force=False)
+    tracer.phase("obtener_video")
+    with tracer.span("feed_youtube") as span:
+        span.set(http_status=304)
+    tracer.phase("login")
+    with tracer.span("safe_get", label="login"):
+        with tracer.span("espera"):
+            pass
+    try:
+        with tracer.span("safe_get", label="login"):
+            raise TimeoutError("lento")
+    except TimeoutError:
+        pass
+    tracer.record("espera_dom", time.perf_counter(), 0.25, ok=False, label='editor "quill"')
+    tracer.count("reintentos", operacion="safe_get", label="login")
+    tracer.count("reintentos", 2, operacion="safe_get", label="login")
+    tracer.annotate(video_id="abc")
+    tracer.finish("ok")
+    return tracer
+
+
+class RunTraceTest(unittest.TestCase):
+    def test_spans_nest_under_the_current_phase_or_span(self):
+        tracer = _traced_run()
+        spans = {(s.name, s.attrs.get("label"), s.status): s for s in tracer.spans}
+        fases = [s for s in tracer.spans if s.name == "fase"]
+        self.assertEqual([f.attrs["fase"] for f in fases], ["obtener_video", "login"])
+        self.assertTrue(all(f.parent is None and f.duration_ms is not None for f in fases))
+        self.assertEqual(spans[("feed_youtube", None, "ok")].parent, fases[0].id)
+        outer = spans[("safe_get", "login", "ok")]
+        self.assertEqual(outer.parent, fases[1].id)
+        self.assertEqual(spans[("espera", None, "ok")].parent, outer.id)
+        failed = spans[("safe_get", "login", "error")]
+        self.assertEqual(failed.attrs["error"], "TimeoutError")
+        self.assertEqual(spans[("espera_dom", 'editor "quill"', "error")].duration_ms, 250.0)
+
+    def test_spans_from_other_threads_hang_from_the_phase(self):
+        tracer = Tracer()
+
+        def work():
+            with tracer.span("worker"):
+                pass
+
+        tracer.phase("lote")
+        with tracer.span("principal"):
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+        phase, main, other = tracer.spans
+        self.assertEqual((main.parent, other.parent), (phase.id, phase.id))
+
+    def test_json_summary(self):
+        data = _traced_run().to_json()
+        self.assertEqual(data["resultado"], "ok")
+        self.assertEqual(data["atributos"], {"force": False, "video_id": "abc"})
+        self.assertEqual(set(data["fases"]), {"obtener_video", "login"})
+        self.assertEqual(
+            data["contadores"],
+            [{"nombre": "reintentos", "etiquetas": {"label": "login", "operacion": "safe_get"}, "valor": 3}],
+        )
+        self.assertEqual(len(data["spans"]), 7)
+        json.dumps(data)  # serializable tal cual
+
+    def test_openmetrics_output(self):
+        text = _traced_run().openmetrics()
+        lines = text.splitlines()
+        self.assertEqual(lines[-1], "# EOF")
+        self.assertIn("diocesis_corrida_exito 1", lines)
+        self.assertIn('diocesis_span_segundos_count{span="safe_get",label="login"} 2', lines)
+        self.assertIn('diocesis_span_errores_total{span="safe_get",label="login"} 1', lines)
+        self.assertIn('diocesis_span_errores_total{span="espera_dom",label="editor \\"quill\\""} 1', lines)
+        self.assertIn('diocesis_reintentos_total{label="login",operacion="safe_get"} 3', lines)
+        self.assertTrue(any(line.startswith('diocesis_fase_segundos{fase="login"} ') for line in lines))
+        # Cada familia se declara una vez, antes de sus muestras.
+        types = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+        self.assertEqual(len(types), len(set(types)))
+
+        failed = Tracer()
+        failed.finish("error")
+        self.assertIn("diocesis_corrida_exito 0", failed.openmetrics().splitlines())
+
+    def test_write_and_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for n, result in enumerate(("ok", "sin_cambios", "error")):
+                tracer = _traced_run()
+                tracer.result = result
+                trace_path, metrics_path = tracer.write(os.path.join(tmp, str(n)))
+                self.assertEqual(os.path.basename(trace_path), TRACE_FILE)
+                self.assertEqual(os.path.basename(metrics_path), METRICS_FILE)
+                paths.append(trace_path)
+            traces = []
+            for path in paths:
+                with open(path, encoding="utf-8") as f:
+                    traces.append(json.load(f))
+            text = report(traces)
+            self.assertTrue(text.startswith("corridas=3 error=1 ok=1 sin_cambios=1"))
+            self.assertIn("reintentos login=9", text)
+            self.assertIn("obtener_video", text)
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(run_trace.main(paths), 0)
+            self.assertEqual(out.getvalue().strip(), text)
+
+    def test_percentile_is_nearest_rank(self):
+        values = [float(v) for v in range(1, 11)]
+        self.assertEqual(run_trace._percentile(values, 0.5), 5.0)
+        self.assertEqual(run_trace._percentile(values, 0.95), 10.0)
+        self.assertEqual(run_trace._percentile([7.0], 0.95), 7.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Feed de YouTube: GET condicional con entradas parseadas reutilizadas, y fechas de los titulos."""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from http.server import BaseHTTPRequestHandler
+from types import SimpleNamespace
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import youtube_feed  # noqa: E402
+from fixture_server import _QuietServer  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+from youtube_feed import FeedParseError, entry_video_date, fetch_feed_entries, title_filters, videos_by_date  # noqa: E402
+
+with open(os.path.join(ROOT, "benchmarks", "fixtures", "youtube", "feed.xml"), "rb") as _f:
+    FEED = _f.read()
+
+
+class _FeedServer:
+    """Sirve `body` en /feed con ETag (si `etag`); responde 304 cuando If-None-Match coincide."""
+
+    def __init__(self):
+        self.body = FEED
+        self.etag = '"v1"'
+        self.statuses = []
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if srv.etag and self.headers.get("If-None-Match") == srv.etag:
+                    status, body = 304, b""
+                else:
+                    status, body = 200, srv.body
+                srv.statuses.append(status)
+                self.send_response(status)
+                if srv.etag:
+                    self.send_header("ETag", srv.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = _QuietServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/feed"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FetchFeedTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.srv = _FeedServer()
+        self.addCleanup(self.srv.close)
+        self.client = HttpClient(timeout=5)
+        self.addCleanup(self.client.close)
+        # La memoria del proceso empieza vacia en cada prueba.
+        patcher = mock.patch.dict(youtube_feed._MEMO, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fetch(self, cache):
+        return fetch_feed_entries(self.srv.url, cache=cache, client=self.client)
+
+    def test_not_modified_reuses_entries_in_process(self):
+        cache = HttpCache(self.tmp.name)
+        first = self._fetch(cache)
+        self.assertEqual((first.status, first.parsed), (200, True))
+        self.assertTrue(first.entries)
+        with mock.patch.object(youtube_feed, "parse_feed_entries") as parse:
+            second = self._fetch(cache)
+        parse.assert_not_called()
+        self.assertEqual((second.status, second.parsed), (304, False))
+        self.assertIs(second.entries, first.entries)
+        self.assertEqual(self.srv.statuses, [200, 304])
+        self.assertEqual((cache.stats.misses, cache.stats.revalidated), (1, 1))
+
+    def test_next_run_reads_parsed_entries_from_disk(self):
+        first = self._fetch(HttpCache(self.tmp.name))
+        youtube_feed._MEMO.clear()  # otra corrida: solo queda la cache de disco
+        with mock.patch.object(youtube_feed, "parse_feed_entries") as parse:
+            again = self._fetch(HttpCache(self.tmp.name))
+        parse.assert_not_called()
+        self.assertEqual((again.status, again.parsed), (304, False))
+        self.assertEqual(again.entries, first.entries)
+        self.assertEqual(again.entries[0].published_parsed, first.entries[0].published_parsed)
+
+    def test_changed_or_identical_body_without_etag(self):
+        cache = HttpCache(self.tmp.name)
+        first = self._fetch(cache)
+        # Sin validadores el servidor responde 200 con el mismo cuerpo: no se vuelve a parsear.
+        self.srv.etag = ""
+        same = self._fetch(cache)
+        self.assertEqual((same.status, same.parsed), (200, False))
+        self.assertEqual(same.entries, first.entries)
+
+        self.srv.body = FEED.replace(b"Gotitas", b"Gotas", 1)
+        changed = self._fetch(cache)
+        self.assertEqual((changed.status, changed.parsed), (200, True))
+        self.assertNotEqual(changed.entries, first.entries)
+
+    def test_unparseable_body_raises(self):
+        self.srv.body = b"<feed><entry><title>cortado"
+        with self.assertRaises(FeedParseError):
+            self._fetch(HttpCache(self.tmp.name))
+
+
+def _entry(title, published=None):
+    parsed = time.strptime(published, "%Y-%m-%d") if published else None
+    return SimpleNamespace(title=title, published_parsed=parsed, updated_parsed=None, link=f"https://x/{title}")
+
+
+class VideoDateTest(unittest.TestCase):
+    def test_date_from_title_or_publication(self):
+        cases = [
+            ("Gotitas de Esperanza | 7 de febrero de 2026", "2026-02-08", date(2026, 2, 7)),
+            ("Gotitas de Esperanza 6/2/2026", "2026-02-07", date(2026, 2, 6)),
+            # Sin año: el mas cercano a la publicacion (video del 31 de diciembre subido en enero).
+            ("Gotitas de Esperanza 31 de diciembre", "2026-01-01", date(2025, 12, 31)),
+            ("Gotitas de Esperanza", "2026-02-05", date(2026, 2, 5)),
+            ("Gotitas de Esperanza 31 de febrero de 2026", "2026-02-05", None),
+        ]
+        for title, published, expected in cases:
+            self.assertEqual(entry_video_date(_entry(title, published)), expected, title)
+
+    def test_latest_matching_entry_per_day(self):
+        title_re, required, forbidden = title_filters(r"gotitas\s+de\s+esperanza", "", "en vivo")
+        entries = [
+            _entry("Gotitas de Esperanza 7 de febrero de 2026", "2026-02-07"),
+            _entry("Gotitas de Esperanza 7 de febrero de 2026 (nuevo)", "2026-02-08"),
+            _entry("EN VIVO Gotitas de Esperanza 9 de febrero de 2026", "2026-02-09"),
+            _entry("Santo Rosario 8 de febrero de 2026", "2026-02-08"),
+        ]
+        by_day = videos_by_date(entries, title_re, required, forbidden)
+        self.assertEqual(list(by_day), [date(2026, 2, 7)])
+        self.assertTrue(by_day[date(2026, 2, 7)].title.endswith("(nuevo)"))
+
+
+if __name__ == "__main__":
+    unittest.main()